@@ -0,0 +1,93 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : bench_batch_js.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Batch javascript over many tabs: total time, GUI responsiveness and unresponsive tabs
+# -------------------------------------------------------------------------------------------------------------------- #
+# usage: QT_QPA_PLATFORM=offscreen python Benchmark/bench_batch_js.py [--tabs=40] [--hung=5] [--timeout_ms=2000]
+# tabs are stand-ins answering after 10~500 ms ('hung' tabs never answer). the GUI thread runs a 10 ms heartbeat
+# timer during the run, its largest gap is the longest time the GUI was blocked
+import os
+import sys
+import time
+import json
+import random
+from PyQt5.QtCore import QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication, QWidget
+from PyQt5.QtWebEngineWidgets import QWebEnginePage
+CURPATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(CURPATH), 'Include'))
+from BatchJavaScript import BatchScriptWidget
+
+
+class FakePage:
+    def __init__(self, delay_ms: int):
+        self._delay_ms = delay_ms
+
+    def setLifecycleState(self, _):
+        pass
+
+    def runJavaScript(self, _: str, callback):
+        if self._delay_ms >= 0:
+            QTimer.singleShot(self._delay_ms, lambda: callback({'status': 'healthy'}))
+
+
+class FakeTab(QWidget):
+    def __init__(self, index: int, delay_ms: int):
+        super().__init__()
+        self._index = index
+        self._page = FakePage(delay_ms)
+
+    def lifecycleState(self):
+        return QWebEnginePage.Active
+
+    def view(self):
+        return self
+
+    def page(self):
+        return self._page
+
+    def title(self) -> str:
+        return f'Dashboard {self._index}'
+
+    def url(self):
+        from PyQt5.QtCore import QUrl
+        return QUrl(f'http://127.0.0.1/dashboard/{self._index}')
+
+
+if __name__ == '__main__':
+    tabs_, hung_, timeout_ms_ = 40, 5, 2000
+    for argv in sys.argv:
+        if '--tabs' in argv:
+            tabs_ = int(argv.split('=')[-1])
+        if '--hung' in argv:
+            hung_ = int(argv.split('=')[-1])
+        if '--timeout_ms' in argv:
+            timeout_ms_ = int(argv.split('=')[-1])
+    app_ = QApplication(sys.argv)
+    random.seed(0)
+    fake_tabs_ = [FakeTab(i, -1 if i < hung_ else random.randint(10, 500)) for i in range(tabs_)]
+    widget_ = BatchScriptWidget(tabs=lambda: fake_tabs_)
+    widget_._spinTimeout.setValue(timeout_ms_)
+    widget_.resize(800, 600)
+    widget_.show()
+
+    beats_ = [time.perf_counter()]
+    heartbeat_ = QTimer()
+    heartbeat_.timeout.connect(lambda: beats_.append(time.perf_counter()))
+    heartbeat_.start(10)
+    loop_ = QEventLoop()
+    widget_._runner.sig_finished.connect(loop_.quit)
+    t_ = time.perf_counter()
+    widget_.run('document.title')
+    call_ms_ = (time.perf_counter() - t_) * 1000
+    loop_.exec_()
+    total_ms_ = (time.perf_counter() - t_) * 1000
+    heartbeat_.stop()
+    gaps_ = [(b - a) * 1000 for a, b in zip(beats_, beats_[1:])]
+    statuses_ = {}
+    for result_ in widget_._runner.results():
+        statuses_[result_['status']] = statuses_.get(result_['status'], 0) + 1
+    print(f'{tabs_} tabs ({hung_} hung), timeout {timeout_ms_} ms')
+    print(f'run() returned in {call_ms_:.1f} ms, finished in {total_ms_:.1f} ms, max GUI gap {max(gaps_):.1f} ms')
+    print(f'results: {statuses_}, export {len(json.loads(widget_._runner.toJson("document.title"))["results"])} rows')
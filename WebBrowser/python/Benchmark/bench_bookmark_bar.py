@@ -0,0 +1,100 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : bench_bookmark_bar.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Bookmark toolbar build and incremental insert/remove/move with many bookmarks
+# -------------------------------------------------------------------------------------------------------------------- #
+# usage: python Benchmark/bench_bookmark_bar.py [--items=5000] [--repeat=200]
+# build: 'items' bookmarks are loaded in one update and the toolbar is drawn. insert/remove/move: bookmarks are
+# inserted, removed and moved at the front (visible buttons), in the middle and at the end (overflow menu),
+# 'repeat' times each. menu: the overflow menu is filled. favicon requests issued by each step are counted
+# (the loader does not download anything here)
+import os
+import sys
+import time
+import shutil
+import tempfile
+from typing import List
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PyQt5.QtWidgets import QApplication
+CURPATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(CURPATH), 'Include'))
+from BookMarkWidget import BookMarkManager, BookMarkToolBar
+from FaviconLoader import FaviconLoader
+from FaviconCache import FaviconCache
+from LoadTiming import percentile
+
+
+class CountingLoader(FaviconLoader):
+    def __init__(self, cache: FaviconCache):
+        super().__init__(cache)
+        self.requests = 0
+
+    def request(self, url: str):
+        self.requests += 1
+
+
+def timeit(func, repeat: int) -> List[float]:
+    values = list()
+    for i in range(repeat):
+        start = time.perf_counter()
+        func(i)
+        values.append((time.perf_counter() - start) * 1e6)
+    return values
+
+
+def report(name: str, values: List[float], requests: int):
+    print(f'{name:<16} p50 {percentile(values, 50):9.1f} us  p90 {percentile(values, 90):9.1f} us  '
+          f'favicon requests {requests}')
+
+
+if __name__ == '__main__':
+    items_, repeat_ = 5000, 200
+    for argv in sys.argv:
+        if '--items' in argv:
+            items_ = int(argv.split('=')[-1])
+        if '--repeat' in argv:
+            repeat_ = int(argv.split('=')[-1])
+    app_ = QApplication(sys.argv)
+    tempdir_ = tempfile.mkdtemp()
+    loader_ = CountingLoader(FaviconCache(tempdir_))
+    FaviconLoader._instance = loader_
+    manager_ = BookMarkManager()
+    toolbar_ = BookMarkToolBar(manager_)
+    toolbar_.resize(1280, 32)
+    toolbar_.show()
+    app_.processEvents()
+
+    start_ = time.perf_counter()
+    manager_.beginUpdate()
+    for i_ in range(items_):
+        manager_.add(f'https://site{i_}.example/page', f'Bookmark {i_}', f'https://site{i_}.example/favicon.ico')
+    manager_.endUpdate()  # reset draws the toolbar
+    report('build', [(time.perf_counter() - start_) * 1e6], loader_.requests)
+    print(f'{items_} bookmarks, {len(toolbar_._buttons)} buttons')
+
+    for name_, position_ in [('front', lambda: 0), ('middle', lambda: len(manager_.bookmarks) // 2),
+                             ('end', lambda: -1)]:
+        loader_.requests = 0
+        added_ = list()
+        values_ = timeit(lambda i: added_.append(manager_.add(f'https://new{i}.example/', f'New {i}',
+                                                              f'https://new{i}.example/favicon.ico',
+                                                              index=position_())), repeat_)
+        report(f'insert {name_}', values_, loader_.requests)
+        loader_.requests = 0
+        values_ = timeit(lambda i: manager_.removeNode(added_[i]), repeat_)
+        report(f'remove {name_}', values_, loader_.requests)
+    loader_.requests = 0
+    values_ = timeit(lambda i: manager_.move(manager_.bookmarks[0], index=-1), repeat_)
+    report('move front>end', values_, loader_.requests)
+    loader_.requests = 0
+    values_ = timeit(lambda i: manager_.move(manager_.bookmarks[-1], index=0), repeat_)
+    report('move end>front', values_, loader_.requests)
+
+    loader_.requests = 0
+    start_ = time.perf_counter()
+    toolbar_.onMenuOverflowAboutToShow()
+    report('overflow menu', [(time.perf_counter() - start_) * 1e6], loader_.requests)
+    print(f'{len(toolbar_._menuOverflow.actions())} menu entries, {len(toolbar_._buttons)} buttons')
+    toolbar_.close()
+    shutil.rmtree(tempdir_)
@@ -0,0 +1,132 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : bench_bookmark_index.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Bookmark manager lookup, removal and ordering cost vs number of bookmarks (list vs url index)
+# -------------------------------------------------------------------------------------------------------------------- #
+# usage: python Benchmark/bench_bookmark_index.py [--sizes=1000,10000,100000] [--repeat=1000]
+# for each size N, N bookmarks are added to the root folder (and N / 10 to a nested folder). measured per call:
+# isExist (the check of every navigation, with a url differing in case/port/fragment), star toggle (add + remove at
+# the end), remove and re-insert at the front and in the middle, indexOf of a node behind the last change, moving a
+# node between folders, then indexOf and re-insert at the front after 99% of the root folder was removed at random
+# (churn). the former list implementation (url list rebuilt per lookup) is measured for isExist and remove
+import os
+import sys
+import time
+import random
+from typing import List, Tuple
+from PyQt5.QtCore import QCoreApplication
+CURPATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(CURPATH), 'Include'))
+from BookMarkWidget import BookMarkManager, BookMarkItem
+from LoadTiming import percentile
+
+
+class LegacyBookMarkManager:
+    # former implementation: flat list, membership by rebuilt url list, removal by filter
+    def __init__(self):
+        self.bookmarks: List[BookMarkItem] = list()
+
+    def urlList(self) -> List[str]:
+        return [x.url for x in self.bookmarks]
+
+    def isExist(self, url: str) -> bool:
+        return url in self.urlList()
+
+    def add(self, url: str, title: str, icon_url: str):
+        if not self.isExist(url):
+            self.bookmarks.append(BookMarkItem(url, title, icon_url))
+
+    def remove(self, url: str):
+        self.bookmarks = list(filter(lambda x: x.url != url, self.bookmarks))
+
+
+def timeit(func, repeat: int) -> float:
+    values = list()
+    for i in range(repeat):
+        start = time.perf_counter()
+        func(i)
+        values.append((time.perf_counter() - start) * 1e6)
+    return percentile(values, 50)
+
+
+def url(i: int) -> str:
+    return f'https://site{i}.example/page/{i}'
+
+
+def run(size: int, repeat: int) -> Tuple[dict, int]:
+    manager = BookMarkManager()
+    manager.beginUpdate()
+    for i in range(size):
+        manager.add(url(i), f'Bookmark {i}', '')
+    folder = manager.addFolder('Folder')
+    for i in range(size, size + size // 10):
+        manager.add(url(i), f'Bookmark {i}', '', folder=folder)
+    manager.endUpdate()
+    root = manager.root
+    rand = random.Random(size)
+    result = dict()
+    result['isExist'] = timeit(lambda i: manager.isExist(url(rand.randrange(size)).upper().replace(
+        'HTTPS://', 'https://').replace('.EXAMPLE', '.example:443') + '#top'), repeat)
+
+    def toggle(i: int):
+        manager.add('https://toggle.example/', 'Toggle', '')
+        manager.remove('https://toggle.example/')
+    result['toggle'] = timeit(toggle, repeat)
+
+    def reinsert(index: int):
+        def func(i: int):
+            node = root.children[index]
+            manager.removeNode(node)
+            manager.add(node.url, node.title, node.icon_url, index=index)
+        return func
+    result['reinsert front'] = timeit(reinsert(0), repeat)
+    result['reinsert middle'] = timeit(reinsert(size // 2), repeat)
+
+    def lookup(i: int):
+        node = manager.add(f'https://new{i}.example/', 'New', '', index=size // 2)
+        root.indexOf(root.children[-2])
+        root.indexOf(node)
+    result['insert + indexOf'] = timeit(lookup, repeat)
+
+    def move(i: int):
+        node = root.children[rand.randrange(size)]
+        manager.move(node, folder, rand.randrange(len(folder.children)))
+        manager.move(node, None, rand.randrange(len(root.children)))
+    result['move'] = timeit(move, repeat)
+
+    for node in rand.sample(root.children, len(root.children) * 99 // 100):
+        manager.removeNode(node)
+    result['churn indexOf'] = timeit(lambda i: root.indexOf(root.children[rand.randrange(len(root.children))]),
+                                     repeat)
+    result['churn reinsert'] = timeit(reinsert(0), repeat)
+
+    legacy = LegacyBookMarkManager()
+    for i in range(size):
+        legacy.add(url(i), f'Bookmark {i}', '') if size <= 1000 else legacy.bookmarks.append(
+            BookMarkItem(url(i), f'Bookmark {i}', ''))
+    legacy_repeat = max(10, repeat // max(1, size // 1000))
+    result['legacy isExist'] = timeit(lambda i: legacy.isExist(url(rand.randrange(size))), legacy_repeat)
+
+    def legacy_toggle(i: int):
+        legacy.add('https://toggle.example/', 'Toggle', '')
+        legacy.remove('https://toggle.example/')
+    result['legacy toggle'] = timeit(legacy_toggle, legacy_repeat)
+    return result, len(root._blocks)
+
+
+if __name__ == '__main__':
+    sizes_, repeat_ = [1000, 10000, 100000], 1000
+    for argv in sys.argv:
+        if '--sizes' in argv:
+            sizes_ = [int(x) for x in argv.split('=')[-1].split(',')]
+        if '--repeat' in argv:
+            repeat_ = int(argv.split('=')[-1])
+    app_ = QCoreApplication(sys.argv)
+    results_, blocks_ = dict(), dict()
+    for size_ in sizes_:
+        results_[size_], blocks_[size_] = run(size_, repeat_)
+    print(f'{"p50 [us]":<18}' + ''.join(f'{size_:>12}' for size_ in sizes_))
+    for name_ in results_[sizes_[0]]:
+        print(f'{name_:<18}' + ''.join(f'{results_[size_][name_]:>12.1f}' for size_ in sizes_))
+    print(f'{"blocks after churn":<18}' + ''.join(f'{blocks_[size_]:>12}' for size_ in sizes_))
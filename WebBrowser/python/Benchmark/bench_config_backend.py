@@ -0,0 +1,106 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : bench_config_backend.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Load and save of the browser configuration with N bookmarks, xml vs sqlite backend
+# -------------------------------------------------------------------------------------------------------------------- #
+# usage: python Benchmark/bench_config_backend.py [--sizes=1000,10000,100000]
+# for each size N, a configuration with N bookmarks (a tenth of them in folders) is written to a temporary
+# directory. measured for both backends: load into a new bookmark manager, saving after adding one bookmark, and
+# saving after removing one, plus the initial import of config.xml into config.db and the file sizes
+import os
+import sys
+import time
+import shutil
+import tempfile
+from PyQt5.QtCore import QCoreApplication
+CURPATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(CURPATH), 'Include'))
+from BookMarkWidget import BookMarkManager
+from ConfigUtil import WebBrowserConfig
+
+
+class BenchConfig(WebBrowserConfig):
+    # configuration files in 'path' instead of the Config directory of the browser
+    def __init__(self, bookmarkManager: BookMarkManager, backend: str, path: str):
+        self.bench_path = path
+        super().__init__(bookmarkManager, backend)
+
+    def load(self):
+        self.xml_path = os.path.join(self.bench_path, 'config.xml')
+        self.db_path = os.path.join(self.bench_path, 'config.db')
+        super().load()
+
+    def close(self):
+        self._saver.stop()
+        if self._store is not None:
+            self._store.close()
+
+
+def fill(manager: BookMarkManager, size: int):
+    manager.beginUpdate()
+    folder = None
+    for i in range(size):
+        if i % 100 == 0 and i % 1000 >= 900:
+            folder = manager.addFolder(f'Folder {i}')
+        elif i % 1000 == 0:
+            folder = None
+        manager.add(f'https://site{i}.example/page?id={i}', f'Bookmark {i}', f'https://site{i}.example/favicon.ico',
+                    folder=folder)
+    manager.endUpdate()
+
+
+def elapsed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start) * 1000
+
+
+def fileSize(path: str) -> float:
+    return sum(os.path.getsize(os.path.join(path, x)) for x in os.listdir(path)
+               if os.path.isfile(os.path.join(path, x))) / 1024
+
+
+def run(size: int, tempdir: str) -> dict:
+    result = dict()
+    xml_dir = os.path.join(tempdir, f'xml{size}')
+    db_dir = os.path.join(tempdir, f'db{size}')
+    os.makedirs(xml_dir)
+    config = BenchConfig(BookMarkManager(), 'xml', xml_dir)
+    fill(config.bookmarkManager, size)
+    result['xml save all'] = elapsed(config.save)
+    config.close()
+    os.makedirs(db_dir)
+    shutil.copyfile(os.path.join(xml_dir, 'config.xml'), os.path.join(db_dir, 'config.xml'))
+    configs = list()
+    result['sqlite import'] = elapsed(lambda: configs.append(BenchConfig(BookMarkManager(), 'sqlite', db_dir)))
+    configs[-1].close()
+
+    for backend, path in [('xml', xml_dir), ('sqlite', db_dir)]:
+        manager = BookMarkManager()
+        configs.clear()
+        result[f'{backend} load'] = elapsed(lambda: configs.append(BenchConfig(manager, backend, path)))
+        config = configs[-1]
+        if manager.count() != size:
+            print(f'{backend}: {manager.count()} of {size} bookmarks loaded')
+        item = manager.add('https://new.example/', 'New', '', index=size // 2)
+        result[f'{backend} add + save'] = elapsed(config.save)
+        manager.removeNode(item)
+        result[f'{backend} remove + save'] = elapsed(config.save)
+        result[f'{backend} size [kB]'] = fileSize(path)
+        config.close()
+    return result
+
+
+if __name__ == '__main__':
+    sizes_ = [1000, 10000, 100000]
+    for argv in sys.argv:
+        if '--sizes' in argv:
+            sizes_ = [int(x) for x in argv.split('=')[-1].split(',')]
+    app_ = QCoreApplication(sys.argv)
+    tempdir_ = tempfile.mkdtemp()
+    results_ = {size_: run(size_, tempdir_) for size_ in sizes_}
+    shutil.rmtree(tempdir_)
+    print(f'{"[ms]":<22}' + ''.join(f'{size_:>12}' for size_ in sizes_))
+    for name_ in results_[sizes_[0]]:
+        print(f'{name_:<22}' + ''.join(f'{results_[size_][name_]:>12.1f}' for size_ in sizes_))
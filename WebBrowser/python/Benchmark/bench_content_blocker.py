@@ -0,0 +1,147 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : bench_content_blocker.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Compile time, cache load time and per-request check latency of the content blocker
+# -------------------------------------------------------------------------------------------------------------------- #
+# usage: python Benchmark/bench_content_blocker.py [--rules=100000] [--requests=50000] [--list=easylist.txt]
+# without --list, EasyList style rules are generated (host anchors, path parts, options, exceptions). decisions of
+# the token index are compared with a check of every rule for a sample of requests. requests are checked once the
+# worker thread has compiled the regular expressions of the rules (steady state)
+import os
+import sys
+import time
+import random
+import shutil
+import threading
+import tempfile
+from PyQt5.QtCore import QCoreApplication, QEventLoop, QTimer
+CURPATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(CURPATH), 'Include'))
+from ContentBlocker import ContentBlocker, TOKEN, TYPE_BITS, hostOf, siteOf
+from LoadTiming import percentile
+
+WORDS = ['ad', 'ads', 'banner', 'track', 'pixel', 'analytics', 'promo', 'sponsor', 'beacon', 'stats', 'tag',
+         'metric', 'count', 'widget', 'popup', 'affiliate', 'click', 'impression', 'video', 'img', 'static', 'cdn']
+TLDS = ['com', 'net', 'org', 'io', 'co.uk', 'de', 'jp']
+TYPES = ['script', 'image', 'stylesheet', 'xmlhttprequest', 'subdocument', 'font', 'media', 'other']
+
+
+def randomDomain() -> str:
+    return f'{random.choice(WORDS)}{random.randint(0, 99999)}.{random.choice(TLDS)}'
+
+
+def generateRules(count: int) -> list:
+    lines = ['[Adblock Plus 2.0]', '! Title: generated', 'example.com##.ad-banner', '##div[id^="ad-"]']
+    for i in range(count):
+        kind = random.random()
+        if kind < 0.6:
+            line = f'||{randomDomain()}^' + random.choice(['', '', '$third-party', '$script,third-party'])
+        elif kind < 0.8:
+            line = random.choice(['/', '-', '_', '.']) + random.choice(WORDS) + random.choice(['/', '-', '_']) + \
+                   random.choice(WORDS) + str(random.randint(0, 9999)) + random.choice(['.', '/', '^', '?'])
+        elif kind < 0.93:
+            line = f'/{random.choice(WORDS)}/{random.choice(WORDS)}{i}/*$' + random.choice(TYPES[:4]) + \
+                   f',domain={randomDomain()}|~{randomDomain()}'
+        elif kind < 0.995:
+            line = f'@@||{randomDomain()}/{random.choice(WORDS)}^'
+        else:
+            line = f'/{random.choice(WORDS)}{i}[0-9]+\\.js/$script'
+        lines.append(line)
+    return lines
+
+
+def generateRequests(count: int, rules: list) -> list:
+    hosts = [x[2:].split('^')[0].split('/')[0] for x in rules if x.startswith('||')]
+    requests = list()
+    for _ in range(count):
+        site = randomDomain()
+        kind = random.random()
+        if kind < 0.1 and hosts:
+            url = f'https://{random.choice(hosts)}/{random.choice(WORDS)}.js?v={random.randint(0, 999)}'
+        elif kind < 0.15:
+            url = f'https://cdn.{site}/{random.choice(WORDS)}-{random.choice(WORDS)}{random.randint(0, 9999)}.gif'
+        else:
+            url = f'https://{random.choice(["www", "static", "api"])}.{site}/assets/app{random.randint(0, 999)}' \
+                  f'/main.{random.choice(["js", "css", "png"])}?q={random.randint(0, 99999)}'
+        requests.append((url, site, random.choice(TYPES)))
+    return requests
+
+
+def bruteForce(blocker: ContentBlocker, url: str, site: str, type_name: str) -> bool:
+    filters = blocker._filters
+    type_bit = TYPE_BITS.get(type_name, TYPE_BITS['other'])
+    third_party = siteOf(hostOf(url)) != siteOf(site)
+    if not any(filters.blocking.check(i, url, type_bit, third_party, site) for i in range(len(filters.blocking))):
+        return False
+    return not any(filters.exceptions.check(i, url, type_bit, third_party, site)
+                   for i in range(len(filters.exceptions)))
+
+
+def waitReady(blocker: ContentBlocker) -> float:
+    start = time.perf_counter()
+    blocker.load()
+    loop = QEventLoop()
+    blocker.sig_compiled.connect(lambda _: QTimer.singleShot(0, loop.quit))
+    loop.exec_()
+    return time.perf_counter() - start
+
+
+def waitRegexes() -> float:
+    # regular expressions are compiled by the worker thread after the filters are ready
+    start = time.perf_counter()
+    for thread in threading.enumerate():
+        if thread.name == 'ContentBlocker':
+            thread.join()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    rules_, requests_, lists_ = 100000, 50000, list()
+    for argv in sys.argv:
+        if '--rules' in argv:
+            rules_ = int(argv.split('=')[-1])
+        if '--requests' in argv:
+            requests_ = int(argv.split('=')[-1])
+        if '--list' in argv:
+            lists_.append(argv.split('=')[-1])
+    app_ = QCoreApplication(sys.argv)
+    random.seed(0)
+    tempdir_ = tempfile.mkdtemp()
+    os.makedirs(os.path.join(tempdir_, 'filters'))
+    lines_ = list()
+    for i_, path_ in enumerate(lists_):
+        shutil.copy(path_, os.path.join(tempdir_, 'filters', f'{i_}.txt'))
+        with open(path_, 'r', encoding='utf-8', errors='replace') as fp_:
+            lines_.extend(fp_.read().splitlines())
+    if not lists_:
+        lines_ = generateRules(rules_)
+        with open(os.path.join(tempdir_, 'filters', 'generated.txt'), 'w') as fp_:
+            fp_.write('\n'.join(lines_) + '\n')
+
+    blocker_ = ContentBlocker(tempdir_)
+    print(f'compile {len(lines_)} lines: {waitReady(blocker_) * 1000:.0f} ms, {blocker_.ruleCount()} rules, '
+          f'cache {os.path.getsize(blocker_.cachePath()) / 1024 / 1024:.1f} MB')
+    waitRegexes()
+    blocker_ = ContentBlocker(tempdir_)
+    print(f'load from cache: {waitReady(blocker_) * 1000:.0f} ms')
+    regexes_ = sum(x is None for x in blocker_._filters.blocking.plain + blocker_._filters.exceptions.plain)
+    print(f'regular expressions: {regexes_} compiled in {waitRegexes() * 1000:.0f} ms more on the worker thread')
+
+    requests_list_ = generateRequests(requests_, lines_)
+    latencies_ = list()
+    blocked_ = 0
+    for url_, site_, type_ in requests_list_:
+        t_ = time.perf_counter()
+        blocked_ += blocker_.check(url_, site_, type_)
+        latencies_.append((time.perf_counter() - t_) * 1e6)
+    print(f'check: p50 {percentile(latencies_, 50):.1f} us, p99 {percentile(latencies_, 99):.1f} us, '
+          f'max {max(latencies_):.0f} us, mean {sum(latencies_) / len(latencies_):.1f} us, '
+          f'{blocked_} of {len(requests_list_)} blocked')
+
+    sample_ = requests_list_[:300]
+    mismatch_ = [x for x in sample_ if blocker_.check(*x) != bruteForce(blocker_, *x)]
+    print(f'index vs. every rule: {len(sample_) - len(mismatch_)} / {len(sample_)} same decisions')
+    for x_ in mismatch_[:5]:
+        print('  mismatch:', x_)
+    shutil.rmtree(tempdir_)
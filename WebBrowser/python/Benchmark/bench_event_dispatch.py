@@ -0,0 +1,80 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : bench_event_dispatch.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Cost of application-wide event filtering with many open tabs (per-view filter vs dispatcher)
+# -------------------------------------------------------------------------------------------------------------------- #
+# usage: QT_QPA_PLATFORM=offscreen python Benchmark/bench_event_dispatch.py [--events=20000]
+import os
+import sys
+import time
+from PyQt5.QtCore import Qt, QObject, QEvent, QPoint, QPointF
+from PyQt5.QtGui import QMouseEvent, QWheelEvent
+from PyQt5.QtWidgets import QApplication, QWidget
+CURPATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(CURPATH), 'Include'))
+from ViewEventDispatcher import ViewEventDispatcher
+
+
+class FakeView(QWidget):
+    # stand-in for WebView (web engine is not required): events are delivered to a child widget
+    def __init__(self, legacy: bool):
+        super().__init__()
+        self.child = QWidget(self)
+        self.handled = 0
+        self.legacy = legacy
+        if legacy:
+            QApplication.instance().installEventFilter(self)
+        else:
+            ViewEventDispatcher.instance().register(self)
+
+    def release(self):
+        if self.legacy:
+            QApplication.instance().removeEventFilter(self)
+        else:
+            ViewEventDispatcher.instance().unregister(self)
+
+    def eventFilter(self, a0: QObject, a1: QEvent) -> bool:
+        # same checks as the former WebView.eventFilter
+        if a0.parent() == self:
+            if a1.type() == QEvent.MouseButtonPress or a1.type() == QEvent.Wheel:
+                return self.dispatchEvent(a1)
+        return False
+
+    def dispatchEvent(self, a0: QEvent) -> bool:
+        self.handled += 1
+        return False
+
+
+def run(tabs: int, legacy: bool, events: int) -> dict:
+    views = [FakeView(legacy) for _ in range(tabs)]
+    target = views[-1].child
+    move = QMouseEvent(QEvent.MouseMove, QPointF(5, 5), Qt.NoButton, Qt.NoButton, Qt.NoModifier)
+    wheel = QWheelEvent(QPointF(5, 5), QPointF(5, 5), QPoint(0, 0), QPoint(0, 120), Qt.NoButton,
+                        Qt.ControlModifier, Qt.NoScrollPhase, False)
+    result = dict()
+    for name, event in [('move', move), ('wheel', wheel)]:
+        t = time.perf_counter()
+        for _ in range(events):
+            QApplication.sendEvent(target, event)
+        result[name] = (time.perf_counter() - t) / events * 1e6
+    assert views[-1].handled == events and sum([x.handled for x in views]) == events
+    for view in views:
+        view.release()
+        view.deleteLater()
+    return result
+
+
+if __name__ == '__main__':
+    events_ = 20000
+    for argv in sys.argv:
+        if '--events' in argv:
+            events_ = int(argv.split('=')[-1])
+    app = QApplication(sys.argv)
+    print(f'{"tabs":>5} {"mode":>10} {"move[us]":>10} {"wheel[us]":>10}')
+    for tabs_ in [1, 50, 200]:
+        for legacy_ in [True, False]:
+            res = run(tabs_, legacy_, events_)
+            mode = 'per-view' if legacy_ else 'dispatcher'
+            print(f'{tabs_:>5} {mode:>10} {res["move"]:>10.2f} {res["wheel"]:>10.2f}')
+    assert ViewEventDispatcher.instance().count() == 0
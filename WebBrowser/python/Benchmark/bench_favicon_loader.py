@@ -0,0 +1,130 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : bench_favicon_loader.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Favicon loader against a slow local server (in-flight cap, transfer timeout, toolbar build time)
+# -------------------------------------------------------------------------------------------------------------------- #
+# usage: python Benchmark/bench_favicon_loader.py [--icons=60] [--delay=0.3] [--timeout=500] [--pending=0,100,1000]
+#                                                 [--bookmarks=200]
+# cap: 'icons' favicons of distinct urls are requested at once from a server answering after 'delay' seconds. the
+# most requests the server answered at the same time must not exceed the cap of the loader (6), and the gui thread
+# must stay responsive (largest gap between timer ticks while loading).
+# timeout: an icon answered after 4 * 'timeout' ms is requested from a loader with a transfer timeout of 'timeout'
+# ms, the failure must be reported near the timeout.
+# toolbar: for each N of 'pending', N icons are requested from the server first (still pending), then a bookmark
+# toolbar of 'bookmarks' bookmarks with uncached icons is built (median of 5 builds). the build time must not depend
+# on N: the largest must stay within twice the time with no pending icon (+5 ms). exit code is 1 when a check fails
+import os
+import sys
+import time
+import shutil
+import tempfile
+from statistics import median
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PyQt5.QtCore import QTimer
+from PyQt5.QtWidgets import QApplication
+CURPATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(CURPATH), 'Include'))
+from FaviconLoader import FaviconLoader
+from FaviconCache import FaviconCache
+from BookMarkWidget import BookMarkManager, BookMarkToolBar
+from fixture_server import startServer
+from benchmark import processEvents, waitUntil
+
+
+def runCap(base_url: str, stats, count: int, cache_path: str) -> bool:
+    loader = FaviconLoader(FaviconCache(cache_path))
+    loaded = list()
+    loader.sig_icon_loaded.connect(lambda url, icon: loaded.append(not icon.isNull()))
+    ticks = list()
+    timer = QTimer()
+    timer.setInterval(10)
+    timer.timeout.connect(lambda: ticks.append(time.perf_counter()))
+    timer.start()
+    stats.reset()
+    start = time.perf_counter()
+    for i in range(count):
+        loader.request(f'{base_url}/icon/{i}.png')
+    queued_ms = (time.perf_counter() - start) * 1000
+    done = waitUntil(lambda: len(loaded) == count, 60000)
+    elapsed = time.perf_counter() - start
+    timer.stop()
+    gaps = [(b - a) * 1000 for a, b in zip(ticks, ticks[1:])]
+    max_in_flight = stats.snapshot()['max_in_flight']
+    print(f'cap: {count} icons in {elapsed:.2f} s ({sum(loaded)} decoded), requests queued in {queued_ms:.1f} ms, '
+          f'max in flight {max_in_flight} (cap {loader._max_concurrent}), '
+          f'largest gui gap {max(gaps) if gaps else 0:.0f} ms')
+    return done and sum(loaded) == count and 0 < max_in_flight <= loader._max_concurrent
+
+
+def runTimeout(base_url: str, timeout_ms: int, cache_path: str) -> bool:
+    loader = FaviconLoader(FaviconCache(cache_path), timeout_ms=timeout_ms)
+    loaded = list()
+    loader.sig_icon_loaded.connect(lambda url, icon: loaded.append((time.perf_counter(), icon.isNull())))
+    start = time.perf_counter()
+    loader.request(f'{base_url}/icon/slow.png?delay={timeout_ms * 4 / 1000}')
+    waitUntil(lambda: len(loaded) > 0, timeout_ms * 10)
+    if not loaded:
+        print('timeout: no answer')
+        return False
+    elapsed_ms = (loaded[0][0] - start) * 1000
+    print(f'timeout: failed after {elapsed_ms:.0f} ms (transfer timeout {timeout_ms} ms, server answers after '
+          f'{timeout_ms * 4} ms), empty icon: {loaded[0][1]}, pending {loader.pendingCount()}')
+    return loaded[0][1] and elapsed_ms < timeout_ms * 2 and loader.pendingCount() == 0
+
+
+def runToolbar(base_url: str, pending: list, bookmarks: int, cache_path: str) -> bool:
+    manager = BookMarkManager()
+    manager.beginUpdate()
+    for i in range(bookmarks):
+        manager.add(f'https://site{i}.example/', f'Site {i}', f'{base_url}/icon/bookmark{i}.png')
+    manager.endUpdate()
+    BookMarkToolBar(manager, deferred=True).deleteLater()  # warm up (style, fonts)
+    times = dict()
+    for count in pending:
+        builds = list()
+        for build in range(5):
+            loader = FaviconLoader(FaviconCache(os.path.join(cache_path, f'{count}_{build}')))
+            FaviconLoader._instance = loader  # used by the toolbar
+            for i in range(count):
+                loader.request(f'{base_url}/icon/pending{i}.png')
+            start = time.perf_counter()
+            toolbar = BookMarkToolBar(manager, deferred=True)
+            toolbar.resize(1200, 32)
+            toolbar.drawItems()
+            builds.append((time.perf_counter() - start) * 1000)
+            buttons, requested = len(toolbar._buttons), loader.pendingCount() - count
+            toolbar.deleteLater()
+            loader.deleteLater()  # aborts the transfers
+            processEvents()
+        times[count] = median(builds)
+        print(f'toolbar: {count:>5} icons pending, built in {times[count]:6.2f} ms (median of {len(builds)}), '
+              f'{buttons} buttons, {requested} icons requested')
+    FaviconLoader._instance = None
+    return max(times.values()) <= times[pending[0]] * 2 + 5
+
+
+if __name__ == '__main__':
+    icons_, delay_, timeout_, pending_, bookmarks_ = 60, 0.3, 500, [0, 100, 1000], 200
+    for argv in sys.argv:
+        if '--icons' in argv:
+            icons_ = int(argv.split('=')[-1])
+        if '--delay' in argv:
+            delay_ = float(argv.split('=')[-1])
+        if '--timeout' in argv:
+            timeout_ = int(argv.split('=')[-1])
+        if '--pending' in argv:
+            pending_ = [int(x) for x in argv.split('=')[-1].split(',') if x]
+        if '--bookmarks' in argv:
+            bookmarks_ = int(argv.split('=')[-1])
+    app_ = QApplication(sys.argv)
+    server_, stats_, base_url_ = startServer(delay_sec=delay_)
+    tempdir_ = tempfile.mkdtemp()
+    ok_ = runCap(base_url_, stats_, icons_, os.path.join(tempdir_, 'cap'))
+    ok_ = runTimeout(base_url_, timeout_, os.path.join(tempdir_, 'timeout')) and ok_
+    ok_ = runToolbar(base_url_, pending_, bookmarks_, os.path.join(tempdir_, 'toolbar')) and ok_
+    processEvents(100)
+    server_.shutdown()
+    shutil.rmtree(tempdir_)
+    print('ok' if ok_ else 'FAILED')
+    sys.exit(0 if ok_ else 1)
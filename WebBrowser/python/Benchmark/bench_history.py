@@ -0,0 +1,97 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : bench_history.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Search latency of the global browsing history (sqlite fts) with a million visits
+# -------------------------------------------------------------------------------------------------------------------- #
+# usage: QT_QPA_PLATFORM=offscreen python Benchmark/bench_history.py [--visits=1000000] [--urls=150000] [--db=path]
+# the database is filled through HistoryStore.commit (same path as navigations), then searches are timed for the
+# first page and for a deep page (keyset paging), and the cost of a navigation on the GUI thread is measured
+import os
+import sys
+import time
+import random
+import tempfile
+from PyQt5.QtWidgets import QApplication
+CURPATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(CURPATH), 'Include'))
+from BrowsingHistory import HistoryStore
+from LoadTiming import percentile
+
+WORDS = ['dashboard', 'report', 'sales', 'monitor', 'wiki', 'jira', 'build', 'deploy', 'metrics', 'grafana',
+         'kibana', 'team', 'project', 'release', 'incident', 'status', 'search', 'user', 'admin', 'settings',
+         'api', 'docs', 'review', 'pipeline', 'cluster', 'node', 'storage', 'network', 'alert', 'billing']
+HOSTS = ['intranet', 'portal', 'ci', 'ops', 'docs', 'git', 'hr', 'finance', 'mon', 'data']
+QUERIES = ['', 'grafana', 'gra', 'ci12', 'deploy pipeline', 'incident 4711', 'zzqx', 'com', 'status report']
+
+
+def fill(store: HistoryStore, visits: int, urls: int, now: float):
+    pages = list()
+    for i in range(urls):
+        host = f'{random.choice(HOSTS)}{random.randint(1, 30)}.corp.example.com'
+        pages.append((f'https://{host}/{"/".join(random.sample(WORDS, random.randint(1, 3)))}/{i}',
+                      ' '.join(random.sample(WORDS, 3)).title() + f' {i}'))
+    # skewed popularity, visits spread over the retention period (in order, as they are recorded)
+    batch = 50000
+    span = (store.retention_days - 1) * 86400
+    for start in range(0, visits, batch):
+        for i in range(start, min(start + batch, visits)):
+            url, title = pages[min(int(random.paretovariate(1.2)) - 1, urls - 1) if random.random() < 0.5
+                               else random.randrange(urls)]
+            store.addVisit(url, title, now - span + span * i / visits)
+        store.commit()
+        print(f'\r{start + batch} visits', end='', flush=True)
+    print()
+
+
+def timeit(func, repeat: int) -> list:
+    values = list()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        values.append((time.perf_counter() - start) * 1000)
+    return values
+
+
+if __name__ == '__main__':
+    visits_, urls_, db_ = 1000000, 150000, ''
+    for argv in sys.argv:
+        if '--visits' in argv:
+            visits_ = int(argv.split('=')[-1])
+        if '--urls' in argv:
+            urls_ = int(argv.split('=')[-1])
+        if '--db' in argv:
+            db_ = argv.split('=')[-1]  # reused when it exists
+    app_ = QApplication(sys.argv)
+    random.seed(0)
+    tempdir_ = tempfile.TemporaryDirectory()
+    path_ = db_ or os.path.join(tempdir_.name, 'history.db')
+    exists_ = os.path.isfile(path_)
+    store_ = HistoryStore(path_)
+    store_.flush(wait=True)
+    if not exists_:
+        t_ = time.perf_counter()
+        fill(store_, visits_, urls_, time.time())
+        print(f'fill: {time.perf_counter() - t_:.1f} s')
+    print(f'{store_.visitCount()} visits, fts5: {store_.fts}')
+
+    for text_ in QUERIES:
+        rows_ = store_.search(text_)
+        first_ = timeit(lambda: store_.search(text_), 20)
+        # 20th page
+        after_ = None
+        for _ in range(20):
+            page_ = store_.search(text_, after=after_)
+            if len(page_) < 200:
+                break
+            after_ = page_[-1][0]
+        deep_ = timeit(lambda: store_.search(text_, after=after_), 20)
+        print(f'{repr(text_):<18} first page p50 {percentile(first_, 50):6.1f} ms  max {max(first_):6.1f} ms  |  '
+              f'page 20 p50 {percentile(deep_, 50):6.1f} ms  ({len(rows_)} rows)')
+
+    # navigation: queued on the GUI thread, written by the worker
+    queue_ = timeit(lambda: store_.addVisit(f'https://new.corp.example.com/{random.random()}', 'New'), 1000)
+    commit_ = timeit(lambda: store_.flush(wait=True), 1)
+    print(f'addVisit p50 {percentile(queue_, 50) * 1000:.1f} us  max {max(queue_) * 1000:.1f} us, '
+          f'commit of 1000 visits {commit_[0]:.0f} ms (worker)')
+    store_.close()
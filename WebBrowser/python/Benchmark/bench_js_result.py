@@ -0,0 +1,71 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : bench_js_result.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : GUI stall of showing large javascript results in the developer widget
+# -------------------------------------------------------------------------------------------------------------------- #
+# usage: QT_QPA_PLATFORM=offscreen python Benchmark/bench_js_result.py [--mb=10]
+# results are python objects as converted by web engine (json of about 'mb' megabytes): an array of objects and a
+# string. 'old' is the previous single line edit (str() of the result), 'new' is the lazy tree (JsResultWidget)
+import os
+import sys
+import json
+import time
+from PyQt5.QtCore import QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication, QLineEdit
+CURPATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(CURPATH), 'Include'))
+from JsResultView import JsResultWidget
+
+
+def processEvents():
+    loop = QEventLoop()
+    QTimer.singleShot(0, loop.quit)
+    loop.exec_()
+
+
+def measure(show, value) -> float:
+    # time until the result is shown (call and the following paint)
+    t = time.perf_counter()
+    show(value)
+    processEvents()
+    return (time.perf_counter() - t) * 1000
+
+
+if __name__ == '__main__':
+    mb_ = 10
+    for argv in sys.argv:
+        if '--mb' in argv:
+            mb_ = float(argv.split('=')[-1])
+    app_ = QApplication(sys.argv)
+    item_ = {'id': 0, 'tag': 'div', 'class': 'item-class-name', 'text': 'x' * 120, 'attrs': {'a': 1, 'b': [1, 2, 3]}}
+    count_ = int(mb_ * 1024 * 1024 / len(json.dumps(item_)))
+    results_ = {
+        f'array of {count_} objects': [dict(item_, id=i) for i in range(count_)],
+        f'string of {mb_:g} MB': '<html>' + 'x' * int(mb_ * 1024 * 1024) + '</html>'
+    }
+
+    edit_ = QLineEdit()
+    edit_.setReadOnly(True)
+    edit_.resize(600, 30)
+    edit_.show()
+    widget_ = JsResultWidget()
+    widget_.resize(600, 600)
+    widget_.show()
+    processEvents()
+    for name_, value_ in results_.items():
+        old_ = measure(lambda x: edit_.setText(str(x)), value_)
+        new_ = measure(widget_.setResult, value_)
+        print(f'{name_:<28} old {old_:9.1f} ms   new {new_:7.1f} ms')
+    # paging: next part of the text and scrolling the tree to the end (rows are fetched in pages)
+    t_ = time.perf_counter()
+    widget_.loadMore()
+    processEvents()
+    print(f'load more                    {(time.perf_counter() - t_) * 1000:7.1f} ms')
+    widget_.setResult(results_[f'array of {count_} objects'])
+    t_ = time.perf_counter()
+    for _ in range(5):
+        widget_._tree.scrollToBottom()
+        processEvents()
+    print(f'scroll to bottom x5          {(time.perf_counter() - t_) * 1000:7.1f} ms '
+          f'({widget_._model.rowCount(widget_._model.index(0, 0))} rows fetched)')
@@ -0,0 +1,186 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : bench_network_log.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Request capture overhead of the network log on pages with many requests, panel refresh and export
+# -------------------------------------------------------------------------------------------------------------------- #
+# usage: python Benchmark/bench_network_log.py [--rounds=5] [--assets=1500] [--requests=100000]
+# page: a fixture page with 'assets' scripts (unique urls, never cached) is loaded 'rounds' times with the log off
+# and on. the time spent in the log is measured inside the profile and page request interceptors.
+# capture: 'requests' synthetic requests (request infos with the accessors the interceptors use) are passed to the
+# interceptor of the profile (and to the log as its page interceptor does) with and without the log, then the panel
+# model is filled and exported at capacity.
+# --rounds=0 runs the capture part only. the page part has not been run yet (written without QtWebEngine at hand),
+# only the capture part has been measured
+import os
+import sys
+import json
+import time
+import tempfile
+from typing import List
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PyQt5.QtCore import QUrl, QByteArray
+from PyQt5.QtWidgets import QApplication
+CURPATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(CURPATH))
+from Include import WebBrowserWindow, NetworkLog
+from WebPageWidget import WebPageWidget
+from ProfileManager import ProfileManager
+from NetworkLog import NetworkLogWidget, toHar
+from LoadTiming import percentile
+from fixture_server import startServer
+from benchmark import processEvents, waitUntil, isolateConfig, removeConfig
+
+
+class TimedObserver:
+    # wraps a request handler of the log (profile observer or page interceptor), time spent is accumulated
+    def __init__(self, observer):
+        self.observer = observer
+        self.elapsed = 0.
+        self.calls = 0
+
+    def __call__(self, *args):
+        start = time.perf_counter()
+        self.observer(*args)
+        self.elapsed += time.perf_counter() - start
+        self.calls += 1
+
+
+class SyntheticRequest:
+    # accessors of QWebEngineUrlRequestInfo used by the interceptor and its handlers
+    def __init__(self, url: str, first_party: QUrl, resource_type: int):
+        self._url = QUrl(url)
+        self._first_party = first_party
+        self._resource_type = resource_type
+
+    def requestUrl(self) -> QUrl:
+        return self._url
+
+    def firstPartyUrl(self) -> QUrl:
+        return self._first_party
+
+    def resourceType(self) -> int:
+        return self._resource_type
+
+    @staticmethod
+    def requestMethod() -> QByteArray:
+        return QByteArray(b'GET')
+
+    def block(self, shouldBlock: bool):
+        pass
+
+
+def runPages(window: WebBrowserWindow, base_url: str, rounds: int, assets: int, tag: str) -> dict:
+    widget: WebPageWidget = window.webPageWidgets()[0]
+    loads, logged = list(), list()
+    for i in range(rounds):
+        url = f'{base_url}/page?assets={assets}&size=1&{tag}={i}'
+        finished = list()
+        slot = lambda: finished.append(time.perf_counter())
+        widget.sig_load_finished.connect(slot)
+        t = time.perf_counter()
+        widget.load(url)
+        if not waitUntil(lambda: finished and widget.url().toString() == url, 60000):
+            print(f'timeout: {url}')
+        widget.sig_load_finished.disconnect(slot)
+        loads.append((finished[-1] - t) * 1000 if finished else 0.)
+        log = NetworkLog.instance().findPageLog(widget.view().page())
+        logged.append(0 if log is None else sum(1 for x in log.entries if x.navigation == log.navigation))
+    return {'loads': loads, 'logged': logged}
+
+
+def runCapture(count: int):
+    interceptor = ProfileManager.instance()._interceptor
+    first_party = QUrl('https://bench.example/page')
+    page = object()  # stands for the page the main frame navigation is told to the log
+    requests = [SyntheticRequest(f'https://cdn{i % 7}.example/asset/{i}.js?v={i % 13}', first_party, 3)
+                for i in range(count)]
+    observers = list(interceptor.observers)
+    network_log = NetworkLog.instance()
+    results = dict()
+    for name, enabled in [('log off', False), ('log on', True)]:
+        interceptor.observers = [network_log.onRequest] if enabled else []
+        by_page = enabled and NetworkLog.page_interceptors
+        network_log.navigate(page, first_party)
+        start = time.perf_counter()
+        for info in requests:
+            interceptor.interceptRequest(info)
+            if by_page:
+                network_log.onPageRequest(page, info)
+        results[name] = (time.perf_counter() - start) / count * 1e6
+    interceptor.observers = observers
+    print(f'capture: {results["log off"]:.2f} us per request without the log, {results["log on"]:.2f} us with it '
+          f'(+{results["log on"] - results["log off"]:.2f} us), {count} requests')
+
+    log = network_log.findPageLog(page)
+    panel = NetworkLogWidget()
+    start = time.perf_counter()
+    panel.setPage(page)
+    print(f'panel: first refresh {(time.perf_counter() - start) * 1000:.1f} ms, {panel._model.rowCount()} of '
+          f'{len(log.entries)} rows populated')
+    for info in requests[:500]:
+        if NetworkLog.page_interceptors:
+            network_log.onPageRequest(page, info)
+        else:
+            network_log.onRequest(info, 'script', False)
+    start = time.perf_counter()
+    panel.refresh()
+    print(f'panel: incremental refresh after 500 requests {(time.perf_counter() - start) * 1000:.1f} ms')
+    start = time.perf_counter()
+    har = toHar(panel._model.entries())
+    path = os.path.join(tempfile.mkdtemp(), 'network.har')
+    with open(path, 'w', encoding='utf-8') as fp:
+        json.dump(har, fp)
+    print(f'export: {len(har["log"]["entries"])} entries in {(time.perf_counter() - start) * 1000:.0f} ms, '
+          f'{os.path.getsize(path) / 1024:.0f} kB')
+    os.remove(path)
+    network_log.removePage(page)
+
+
+def report(name: str, result: dict):
+    values: List[float] = result['loads']
+    print(f'{name:<8} load p50 {percentile(values, 50):7.1f} ms  max {max(values):7.1f} ms  '
+          f'(requests logged per page: {min(result["logged"])} - {max(result["logged"])})')
+
+
+if __name__ == '__main__':
+    rounds_, assets_, requests_ = 5, 1500, 100000
+    for argv in sys.argv:
+        if '--rounds' in argv:
+            rounds_ = int(argv.split('=')[-1])
+        if '--assets' in argv:
+            assets_ = int(argv.split('=')[-1])
+        if '--requests' in argv:
+            requests_ = int(argv.split('=')[-1])
+    app_ = QApplication(sys.argv)
+    config_path_ = isolateConfig()
+    window_ = WebBrowserWindow(init_url='about:blank')
+    window_.resize(1024, 768)
+    window_.show()
+    processEvents(500)
+
+    if rounds_ > 0:
+        server_, stats_, base_url_ = startServer()
+        interceptor_ = ProfileManager.instance()._interceptor
+        observer_ = TimedObserver(NetworkLog.instance().onRequest)
+        page_observer_ = TimedObserver(NetworkLog.instance().onPageRequest)
+        interceptor_.observers = [observer_]
+        NetworkLog.instance().onPageRequest = page_observer_  # called by the page interceptors
+        NetworkLog.enabled = False
+        off_ = runPages(window_, base_url_, rounds_, assets_, 'off')
+        NetworkLog.enabled = True
+        observer_.elapsed, observer_.calls = 0., 0
+        page_observer_.elapsed = 0.
+        on_ = runPages(window_, base_url_, rounds_, assets_, 'on')
+        del NetworkLog.instance().onPageRequest
+        print(f'{rounds_} rounds, {assets_} scripts per page')
+        report('log off', off_)
+        report('log on', on_)
+        elapsed_ = observer_.elapsed + page_observer_.elapsed
+        print(f'log: {elapsed_ / max(observer_.calls, 1) * 1e6:.1f} us per request, '
+              f'{elapsed_ / rounds_ * 1000:.1f} ms per page')
+        server_.shutdown()
+
+    runCapture(requests_)
+    window_.close()
+    removeConfig(config_path_)
@@ -0,0 +1,91 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : bench_page_source.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Opening, scrolling and searching a large page source (SourceView vs QPlainTextEdit)
+# -------------------------------------------------------------------------------------------------------------------- #
+# usage: QT_QPA_PLATFORM=offscreen python Benchmark/bench_page_source.py [--mb=20] [--skip_text_edit]
+# source is a generated report page (table rows), 'interactive' is the time until the source is shown
+import os
+import sys
+import time
+import resource
+from PyQt5.QtCore import QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication, QPlainTextEdit
+CURPATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(CURPATH), 'Include'))
+from PageSourceView import PageSourceWidget
+
+
+def processEvents():
+    loop = QEventLoop()
+    QTimer.singleShot(0, loop.quit)
+    loop.exec_()
+
+
+def rssMb() -> float:
+    with open('/proc/self/statm', 'r') as fp:
+        return int(fp.read().split()[1]) * resource.getpagesize() / 1024 / 1024
+
+
+def generateReport(mb: float) -> str:
+    row = '<tr class="row"><td>{0}</td><td><a href="/item/{0}">Item {0}</a></td><td>&nbsp;{1}</td></tr>\n'
+    rows, size, i = list(), 0, 0
+    while size < mb * 1024 * 1024:
+        line = row.format(i, 'value-' * (i % 7 + 1))
+        rows.append(line)
+        size += len(line)
+        i += 1
+    return '<!DOCTYPE html>\n<html><body><table>\n' + ''.join(rows) + '</table></body></html>\n'
+
+
+if __name__ == '__main__':
+    mb_ = 20.
+    skip_text_edit_ = False
+    for argv in sys.argv:
+        if '--mb' in argv:
+            mb_ = float(argv.split('=')[-1])
+        if '--skip_text_edit' in argv:
+            skip_text_edit_ = True
+    app_ = QApplication(sys.argv)
+    html_ = generateReport(mb_)
+    print(f'source: {len(html_) / 1024 / 1024:.1f} MB, {html_.count(chr(10))} lines')
+
+    widget_ = PageSourceWidget()
+    widget_.resize(800, 600)
+    widget_.show()
+    processEvents()
+    rss_ = rssMb()
+    loop_ = QEventLoop()
+    widget_._worker.sig_indexed.connect(lambda _: QTimer.singleShot(0, loop_.quit))
+    t_ = time.perf_counter()
+    widget_.setSource(html_, 'http://127.0.0.1/report')
+    loop_.exec_()
+    processEvents()
+    print(f'SourceView      interactive {(time.perf_counter() - t_) * 1000:8.1f} ms  '
+          f'memory +{rssMb() - rss_:6.1f} MB')
+
+    view_ = widget_._view
+    t_ = time.perf_counter()
+    vbar_ = view_.verticalScrollBar()
+    for i_ in range(100):
+        vbar_.setValue(vbar_.maximum() * i_ // 100)
+        view_.viewport().repaint()
+    print(f'SourceView      100 scroll+paint {(time.perf_counter() - t_) * 1000:8.1f} ms')
+    loop_ = QEventLoop()
+    widget_._worker.sig_searched.connect(lambda *_: QTimer.singleShot(0, loop_.quit))
+    t_ = time.perf_counter()
+    widget_._editSearch.setText('Item 12345<')
+    loop_.exec_()
+    print(f'SourceView      search {(time.perf_counter() - t_) * 1000:8.1f} ms ({widget_._lblStatus.text()})')
+
+    if not skip_text_edit_:
+        rss_ = rssMb()
+        edit_ = QPlainTextEdit()
+        edit_.resize(800, 600)
+        edit_.show()
+        t_ = time.perf_counter()
+        edit_.setPlainText(html_)
+        processEvents()
+        print(f'QPlainTextEdit  interactive {(time.perf_counter() - t_) * 1000:8.1f} ms  '
+              f'memory +{rssMb() - rss_:6.1f} MB')
@@ -0,0 +1,63 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : bench_profile_cache.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Repeat-visit benchmark of web engine profile http cache types against a local server
+# -------------------------------------------------------------------------------------------------------------------- #
+# usage: python Benchmark/bench_profile_cache.py [--assets=20] [--size_kb=50] [--delay_ms=20]
+import os
+import sys
+import time
+import shutil
+import tempfile
+from PyQt5.QtCore import QUrl, QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtWebEngineWidgets import QWebEngineProfile, QWebEnginePage, QWebEngineView
+CURPATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(CURPATH), 'Include'))
+from ProfileManager import ProfileManager
+from fixture_server import startServer
+
+
+def loadAndWait(view: QWebEngineView, url: str, timeout_ms: int = 30000) -> float:
+    loop = QEventLoop()
+    view.loadFinished.connect(loop.quit)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    t = time.perf_counter()
+    view.load(QUrl(url))
+    loop.exec_()
+    view.loadFinished.disconnect(loop.quit)
+    return time.perf_counter() - t
+
+
+if __name__ == '__main__':
+    assets_, size_kb_, delay_ms_ = 20, 50, 20
+    for argv in sys.argv:
+        if '--assets' in argv:
+            assets_ = int(argv.split('=')[-1])
+        if '--size_kb' in argv:
+            size_kb_ = int(argv.split('=')[-1])
+        if '--delay_ms' in argv:
+            delay_ms_ = int(argv.split('=')[-1])
+    app_ = QApplication(sys.argv)
+    server_, stats_, base_url_ = startServer(delay_ms_ / 1000)
+    url_ = f'{base_url_}/page?assets={assets_}&size={size_kb_}'
+    temp_dir_ = tempfile.mkdtemp(prefix='bench_profile_')
+
+    print(f'{"cache":>7} {"visit":>6} {"time[ms]":>9} {"requests":>9} {"bytes":>10}')
+    for cache_type_ in ['none', 'memory', 'disk']:
+        profile_ = QWebEngineProfile(f'bench-{cache_type_}')
+        ProfileManager.applyOptions(profile_, {'cache_type': cache_type_, 'cache_size_mb': '64', 'cookies': 'none',
+                                               'storage_path': os.path.join(temp_dir_, cache_type_)})
+        profile_.clearHttpCache()
+        for visit_ in ['first', 'repeat']:
+            view_ = QWebEngineView()
+            view_.setPage(QWebEnginePage(profile_, view_))
+            stats_.reset()
+            elapsed_ = loadAndWait(view_, url_)
+            res_ = stats_.snapshot()
+            print(f'{cache_type_:>7} {visit_:>6} {elapsed_ * 1000:>9.1f} {res_["requests"]:>9} {res_["bytes"]:>10}')
+            view_.deleteLater()
+        app_.processEvents()
+    server_.shutdown()
+    shutil.rmtree(temp_dir_, ignore_errors=True)
@@ -0,0 +1,84 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : bench_resource_monitor.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : CPU cost of the per-tab resource monitor (performance panel) with many tabs
+# -------------------------------------------------------------------------------------------------------------------- #
+# usage: QT_QPA_PLATFORM=offscreen python Benchmark/bench_resource_monitor.py [--tabs=100] [--ticks=50]
+# tabs are stand-ins sharing a few real (sleeping) processes as renderers, javascript heap answers immediately
+import os
+import sys
+import time
+import subprocess
+from PyQt5.QtCore import QEventLoop, QTimer
+from PyQt5.QtWidgets import QApplication, QWidget
+from PyQt5.QtWebEngineWidgets import QWebEnginePage
+CURPATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(CURPATH), 'Include'))
+from ResourceMonitor import TabResourceMonitor, PerformanceWidget
+
+
+class FakePage:
+    def runJavaScript(self, _: str, callback):
+        callback(12 * 1024 * 1024)
+
+
+class FakeTab(QWidget):
+    def __init__(self, pid: int, index: int):
+        super().__init__()
+        self._pid = pid
+        self._title = f'Tab {index}'
+        self._page = FakePage()
+        self._activated = time.monotonic() - index
+
+    def renderProcessPid(self) -> int:
+        return self._pid
+
+    def lifecycleState(self):
+        return QWebEnginePage.Active
+
+    def view(self):
+        return self
+
+    def page(self):
+        return self._page
+
+    def title(self) -> str:
+        return self._title
+
+    def lastActivated(self) -> float:
+        return self._activated
+
+
+if __name__ == '__main__':
+    tabs_, ticks_, interval_ms_ = 100, 50, 2000
+    for argv in sys.argv:
+        if '--tabs' in argv:
+            tabs_ = int(argv.split('=')[-1])
+        if '--ticks' in argv:
+            ticks_ = int(argv.split('=')[-1])
+    app_ = QApplication(sys.argv)
+    procs_ = [subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(600)']) for _ in range(10)]
+    fake_tabs_ = [FakeTab(procs_[i % len(procs_)].pid, i) for i in range(tabs_)]
+    # ticks run back to back (interval 10 ms) to measure the cost of one tick
+    monitor_ = TabResourceMonitor(tabs=lambda: fake_tabs_, interval_ms=10)
+    widget_ = PerformanceWidget(monitor=monitor_)
+    widget_.resize(800, 600)
+    updates_ = []
+    monitor_.sig_updated.connect(lambda: updates_.append(1))
+
+    cpu_start_, wall_start_ = time.process_time(), time.perf_counter()
+    widget_.show()
+    loop_ = QEventLoop()
+    timer_ = QTimer()
+    timer_.timeout.connect(lambda: loop_.quit() if len(updates_) >= ticks_ else None)
+    timer_.start(5)
+    loop_.exec_()
+    widget_.hide()
+    cpu_ = time.process_time() - cpu_start_  # gui thread and sampler thread
+    per_tick_ms_ = cpu_ / len(updates_) * 1000
+    print(f'tabs {tabs_}, processes {len(procs_)}, ticks {len(updates_)}')
+    print(f'cpu per tick: {per_tick_ms_:.2f} ms -> {per_tick_ms_ / interval_ms_ * 100:.3f} % '
+          f'at {interval_ms_} ms interval')
+    for proc_ in procs_:
+        proc_.kill()
@@ -0,0 +1,131 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : bench_session_restore.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Restoring a session of many tabs from the session journal
+# -------------------------------------------------------------------------------------------------------------------- #
+# usage: python Benchmark/bench_session_restore.py [--tabs=200] [--windows=2] [--updates=20] [--bound=40]
+# a journal of 'tabs' tabs over 'windows' windows is written to a temporary directory, each tab with 'updates'
+# navigations (url, title and back/forward entries), the way a browsing session appends them. measured like main.py
+# restores a session: reading the journal, creating the windows with placeholder tabs, rewriting the journal (start)
+# and showing the current tab of the main window. the rewritten journal must restore the same tabs.
+# the same is measured for a journal of one tab (median of 5, after a warm-up restore). restoring 'tabs' tabs must
+# not take more than 'bound' times as long, otherwise the exit code is 1: tabs are placeholders until shown, a session
+# restoring every web view would take at least 'tabs' times as long. 200 tabs took 19-30x (stand-ins for the web
+# engine classes)
+# the session and the other stores of the browser (Config directory) are not touched
+import os
+import sys
+import time
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PyQt5.QtWidgets import QApplication
+CURPATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(CURPATH))
+from Include import WebBrowserWindow, SessionJournal
+from benchmark import processEvents, waitUntil, isolateConfig, removeConfig
+
+
+def writeJournal(path: str, tabs: int, windows: int, updates: int):
+    journal = SessionJournal(path)
+    journal.start()
+    for w in range(windows):
+        window = object()
+        journal.registerWindow(window)
+        widgets = list()
+        for t in range(w, tabs, windows):
+            widget = object()
+            widgets.append(widget)
+            journal.tabAdded(widget, 'about:blank', '')
+            history = list()
+            for u in range(updates):
+                url = f'https://site{t}.example/page/{u}?q=' + 'x' * 40
+                history.append([url, f'Page {u} of site {t}'])
+                journal.tabChanged(widget, url=url, history=history[-50:], history_index=len(history[-50:]) - 1)
+                journal.tabChanged(widget, title=f'Page {u} of site {t}')
+            journal.windowTabsChanged(window, widgets, widgets[0])
+    journal.close()
+
+
+def restoreSession(path: str, tabs: int, windows: int, updates: int) -> dict:
+    writeJournal(path, tabs, windows, updates)
+    size = os.path.getsize(path)
+    SessionJournal._instance = SessionJournal(path)
+    journal = SessionJournal.instance()
+
+    start = time.perf_counter()
+    session = journal.restore()
+    read_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    mainwnd = WebBrowserWindow(init_url=None)
+    mainwnd.restoreTabs(session[0]['tabs'], session[0]['current'])
+    mainwnd.resize(1024, 768)
+    mainwnd.show()
+    windows_list = [mainwnd]
+    for window in session[1:]:
+        subwnd = WebBrowserWindow(mainwnd, init_url=None)
+        subwnd.restoreTabs(window['tabs'], window['current'])
+        subwnd.resize(mainwnd.size())
+        subwnd.show()
+        windows_list.append(subwnd)
+    windows_ms = (time.perf_counter() - start) * 1000
+    journal_size_before_start = os.path.getsize(path)
+    start = time.perf_counter()
+    journal.start()
+    start_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    current = mainwnd._tabWidget.currentWidget()
+    waitUntil(lambda: current.isMaterialized(), 10000)
+    processEvents()
+    shown_ms = (time.perf_counter() - start) * 1000
+
+    rewritten = SessionJournal(path).restore()
+    result = {
+        'size': size,
+        'read_ms': read_ms,
+        'windows_ms': windows_ms,
+        'start_ms': start_ms,
+        'shown_ms': shown_ms,
+        'total_ms': read_ms + windows_ms + start_ms + shown_ms,
+        'rewritten_size': os.path.getsize(path),
+        'restored': sum(len(x.webPageWidgets()) for x in windows_list),
+        'materialized': sum(1 for x in windows_list for w in x.webPageWidgets() if w.isMaterialized()),
+        'untouched': journal_size_before_start == size,
+        'same': [[x['url'] for x in w['tabs']] for w in rewritten] == [[x['url'] for x in w['tabs']] for w in session]
+    }
+    journal.close()
+    for window in reversed(windows_list):
+        window.close()
+    processEvents(100)
+    return result
+
+
+if __name__ == '__main__':
+    tabs_, windows_, updates_, bound_ = 200, 2, 20, 40.
+    for argv in sys.argv:
+        if '--tabs' in argv:
+            tabs_ = int(argv.split('=')[-1])
+        if '--windows' in argv:
+            windows_ = int(argv.split('=')[-1])
+        if '--updates' in argv:
+            updates_ = int(argv.split('=')[-1])
+        if '--bound' in argv:
+            bound_ = float(argv.split('=')[-1])
+    app_ = QApplication(sys.argv)
+    config_path_ = isolateConfig()
+    restoreSession(os.path.join(config_path_, 'warmup.journal'), 1, 1, updates_)
+    ones_ = [restoreSession(os.path.join(config_path_, f'one{i}.journal'), 1, 1, updates_) for i in range(5)]
+    one_ = sorted(ones_, key=lambda x: x['total_ms'])[len(ones_) // 2]
+    many_ = restoreSession(os.path.join(config_path_, 'session.journal'), tabs_, windows_, updates_)
+    for name_, tabs_count_, windows_count_, result_ in [('one tab', 1, 1, one_), ('session', tabs_, windows_, many_)]:
+        print(f'{name_}: {tabs_count_} tabs in {windows_count_} windows, {updates_} navigations each, '
+              f'{result_["size"] / 1024:.0f} kB')
+        print(f'  read {result_["read_ms"]:.1f} ms, windows and tabs {result_["windows_ms"]:.1f} ms, journal rewrite '
+              f'(start) {result_["start_ms"]:.1f} ms ({result_["rewritten_size"] / 1024:.0f} kB), current tab shown '
+              f'{result_["shown_ms"]:.1f} ms, total {result_["total_ms"]:.1f} ms')
+        print(f'  {result_["restored"]} tabs restored, {result_["materialized"]} web views created, journal untouched '
+              f'before start: {result_["untouched"]}, rewritten journal restores the same tabs: {result_["same"]}')
+    ratio_ = many_['total_ms'] / max(one_['total_ms'], 1e-3)
+    ok_ = ratio_ <= bound_ and many_['same'] and many_['materialized'] == windows_
+    print(f'{tabs_} tabs take {ratio_:.2f}x the time of one tab (bound {bound_:.1f}x): {"ok" if ok_ else "FAIL"}')
+    removeConfig(config_path_)
+    sys.exit(0 if ok_ else 1)
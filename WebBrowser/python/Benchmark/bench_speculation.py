@@ -0,0 +1,96 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : bench_speculation.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Navigation latency with and without speculative preloading against a slow local server
+# -------------------------------------------------------------------------------------------------------------------- #
+# usage: python Benchmark/bench_speculation.py [--rounds=20] [--delay=0.4] [--think=0.8] [--miss=4]
+# every round types into the url bar (one suggestion, which is predicted), waits 'think' seconds and activates the
+# suggestion; every 'miss'-th round another url is activated (misprediction). the time from activation to the load
+# finished signal of the tab is measured with preloading off (cold) and on. the fixture server answers every
+# request after 'delay' seconds, pages are never cached (unique urls). written without QtWebEngine at hand: it has
+# not been run against a real web view yet, there are no reference numbers
+import os
+import sys
+import time
+from typing import List
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PyQt5.QtWidgets import QApplication
+CURPATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(CURPATH))
+from Include import WebBrowserWindow, SpeculationPool
+from WebPageWidget import WebPageWidget
+from LoadTiming import percentile
+from fixture_server import startServer
+from benchmark import processEvents, waitUntil, isolateConfig, removeConfig
+
+
+def runRounds(window: WebBrowserWindow, base_url: str, rounds: int, think_ms: int, miss: int, tag: str) -> dict:
+    widget: WebPageWidget = window.webPageWidgets()[0]
+    navbar = window._navBar
+    finished: List[float] = list()
+    latencies = list()
+    requests_at_commit = list()
+    for i in range(rounds):
+        url = f'{base_url}/page?assets=4&size=20&{tag}={i}'
+        navbar.setCompletionSource(lambda _, x=url: [(x, 'fixture')])
+        navbar.editUrl.setText(url[:-1])
+        navbar.onEditUrlTextEdited(url[:-1])
+        processEvents(think_ms)
+        target = f'{url}&miss=1' if miss > 0 and i % miss == miss - 1 else url
+        requests = stats_.snapshot()['requests']
+        # tab signals are reconnected when its view is swapped, the window slot is called in every case
+        slot = lambda: finished.append(time.perf_counter())
+        widget.sig_load_finished.connect(slot)
+        count = len(finished)
+        t = time.perf_counter()
+        navbar.onCompleterActivated(target)
+        if not waitUntil(lambda: len(finished) > count and widget.url().toString() == target, 30000):
+            print(f'timeout: {target}')
+        latencies.append((finished[-1] - t) * 1000)
+        processEvents(100)  # requests of the page still being answered
+        requests_at_commit.append(stats_.snapshot()['requests'] - requests)
+        widget.sig_load_finished.disconnect(slot)
+    return {'latencies': latencies, 'requests': requests_at_commit}
+
+
+def report(name: str, result: dict):
+    values = result['latencies']
+    print(f'{name:<10} commit -> loaded p50 {percentile(values, 50):7.1f} ms  p95 {percentile(values, 95):7.1f} ms  '
+          f'max {max(values):7.1f} ms  (server requests after commit: {sum(result["requests"])})')
+
+
+if __name__ == '__main__':
+    rounds_, delay_, think_, miss_ = 20, 0.4, 0.8, 4
+    for argv in sys.argv:
+        if '--rounds' in argv:
+            rounds_ = int(argv.split('=')[-1])
+        if '--delay' in argv:
+            delay_ = float(argv.split('=')[-1])
+        if '--think' in argv:
+            think_ = float(argv.split('=')[-1])
+        if '--miss' in argv:
+            miss_ = int(argv.split('=')[-1])
+    app_ = QApplication(sys.argv)
+    config_path_ = isolateConfig()
+    server_, stats_, base_url_ = startServer(delay_sec=delay_)
+    window_ = WebBrowserWindow(init_url='about:blank')
+    window_.resize(1024, 768)
+    window_.show()
+    processEvents(500)
+
+    SpeculationPool.enabled = False
+    cold_ = runRounds(window_, base_url_, rounds_, int(think_ * 1000), miss_, 'cold')
+    SpeculationPool.enabled = True
+    pool_ = SpeculationPool.instance()
+    warm_ = runRounds(window_, base_url_, rounds_, int(think_ * 1000), miss_, 'warm')
+    print(f'server delay {delay_ * 1000:.0f} ms, think time {think_ * 1000:.0f} ms, {rounds_} rounds')
+    report('cold', cold_)
+    report('preload', warm_)
+    stat_ = pool_.statistics()
+    print(f'hits {stat_["hits"]} / {stat_["commits"]} ({stat_["hit_rate"]:.0%}), saved p50 '
+          f'{stat_["saved_ms_p50"]:.0f} ms (total {stat_["saved_ms_total"] / 1000:.1f} s), '
+          f'cancelled {stat_["cancelled"]}, pool {stat_["pool"]}')
+    window_.close()
+    server_.shutdown()
+    removeConfig(config_path_)
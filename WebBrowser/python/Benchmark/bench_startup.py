@@ -0,0 +1,73 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : bench_startup.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Startup time of the browser (main.py --trace-startup=exit), checked against a time-to-window budget
+# -------------------------------------------------------------------------------------------------------------------- #
+# usage: python Benchmark/bench_startup.py [--runs=5] [--budget_ms=1000] [--drop_caches]
+# --drop_caches drops the page cache before every run (cold start, linux and root only).
+# exit code is 1 when the median time to the first frame exceeds the budget
+import os
+import re
+import sys
+import subprocess
+from statistics import median
+from typing import Dict, List
+CURPATH = os.path.dirname(os.path.abspath(__file__))
+MAIN_PATH = os.path.join(os.path.dirname(CURPATH), 'main.py')
+REPORT_PATTERN = re.compile(r'^\[startup\] ([+@]) (.+?)\s+([\d.]+) ms$')
+
+
+def dropCaches() -> bool:
+    try:
+        os.sync()
+        with open('/proc/sys/vm/drop_caches', 'w') as fp:
+            fp.write('3\n')
+        return True
+    except OSError:
+        return False
+
+
+def runOnce(timeout: float = 60.) -> Dict[str, float]:
+    args = [sys.executable, MAIN_PATH, '--trace-startup=exit', '--restore_session=0', '--start_page=about:blank']
+    proc = subprocess.run(args, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=timeout,
+                          universal_newlines=True)
+    result = dict()
+    for line in proc.stderr.splitlines():
+        match = REPORT_PATTERN.match(line.strip())
+        if match is not None:
+            result[match.group(2)] = float(match.group(3))
+    if 'first frame' not in result:
+        raise RuntimeError(f'no startup report (exit code {proc.returncode}):\n{proc.stderr}')
+    return result
+
+
+if __name__ == '__main__':
+    runs_ = 5
+    budget_ms_ = 1000.
+    drop_caches_ = False
+    for argv in sys.argv:
+        if '--runs' in argv:
+            runs_ = int(argv.split('=')[-1])
+        if '--budget_ms' in argv:
+            budget_ms_ = float(argv.split('=')[-1])
+        if '--drop_caches' in argv:
+            drop_caches_ = True
+
+    results_: List[Dict[str, float]] = list()
+    for _ in range(runs_):
+        if drop_caches_ and not dropCaches():
+            print('cannot drop page cache (root on linux required), running warm', file=sys.stderr)
+            drop_caches_ = False
+        results_.append(runOnce())
+
+    names_ = list()
+    for res_ in results_:
+        names_.extend([x for x in res_.keys() if x not in names_])
+    print(f'{"phase":<30} {"median[ms]":>10} {"max[ms]":>10}')
+    for name_ in names_:
+        values_ = [x[name_] for x in results_ if name_ in x]
+        print(f'{name_:<30} {median(values_):>10.1f} {max(values_):>10.1f}')
+    ttw_ = median([x['first frame'] for x in results_])
+    print(f'time to window: {ttw_:.1f} ms (budget {budget_ms_:.0f} ms, {"cold" if drop_caches_ else "warm"})')
+    sys.exit(0 if ttw_ <= budget_ms_ else 1)
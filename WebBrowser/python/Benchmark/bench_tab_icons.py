@@ -0,0 +1,72 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : bench_tab_icons.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Per-tab cost of icons (icon file per tab vs shared icon from compiled resources)
+# -------------------------------------------------------------------------------------------------------------------- #
+# usage: QT_QPA_PLATFORM=offscreen python Benchmark/bench_tab_icons.py [--tabs=200]
+# web engine is not required: tab pages are plain widgets, so only the tab chrome (close button etc.) is measured
+import os
+import sys
+import time
+from PyQt5.QtCore import QSize
+from PyQt5.QtGui import QIcon
+from PyQt5.QtWidgets import QApplication, QWidget, QPushButton, QTabBar
+CURPATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(CURPATH), 'Include'))
+from CustomTabWidget import CustomTabWidget
+from Resources import getIcon
+
+
+def legacyIcon(name: str) -> QIcon:
+    # former code: change directory to the package on every tab page, then load icon file from relative path
+    path_ = os.path.dirname(CURPATH)
+    if os.getcwd() != path_:
+        os.chdir(path_)
+    return QIcon('./Resource/' + name)
+
+
+def runIcon(tabs: int, icon_func) -> float:
+    # icon of a tab close button: created and rendered once per tab
+    t = time.perf_counter()
+    for _ in range(tabs):
+        icon_func('close.png').pixmap(QSize(14, 14))
+    return (time.perf_counter() - t) / tabs
+
+
+def run(tabs: int, icon_func) -> float:
+    app = QApplication.instance()
+    widget = CustomTabWidget()
+    widget.resize(1024, 600)
+    widget.show()
+    app.processEvents()
+    t = time.perf_counter()
+    for _ in range(tabs):
+        index = widget.count() - 1
+        page = QWidget()
+        widget.insertTab(index, page, 'Empty')
+        btn = QPushButton()
+        btn.setIcon(icon_func('close.png'))
+        btn.setFlat(True)
+        btn.setFixedSize(16, 16)
+        btn.setIconSize(QSize(14, 14))
+        widget.tabBar().setTabButton(index, QTabBar.RightSide, btn)
+        if index == 0:
+            page.setWindowIcon(icon_func('warning.png'))
+        widget.setCurrentIndex(index)
+        app.processEvents()  # paint: icons are decoded here
+    elapsed = (time.perf_counter() - t) / tabs
+    widget.close()
+    widget.deleteLater()
+    return elapsed
+
+
+if __name__ == '__main__':
+    tabs_ = 200
+    for argv in sys.argv:
+        if '--tabs' in argv:
+            tabs_ = int(argv.split('=')[-1])
+    app_ = QApplication(sys.argv)
+    print(f'{"mode":>10} {"icon[us]":>10} {"tab[ms]":>10}')
+    for name_, func_ in [('file', legacyIcon), ('resource', getIcon)]:
+        print(f'{name_:>10} {runIcon(tabs_, func_) * 1e6:>10.1f} {run(tabs_, func_) * 1000:>10.3f}')
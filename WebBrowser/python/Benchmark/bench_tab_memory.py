@@ -0,0 +1,126 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : bench_tab_memory.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Resident memory vs number of open tabs, with and without the tab lifecycle policy
+# -------------------------------------------------------------------------------------------------------------------- #
+# usage: python Benchmark/bench_tab_memory.py [--sizes=10,25,50] [--live=5] [--assets=10] [--asset_size=200]
+# for each size N, N tabs of fixture pages ('assets' scripts of 'asset_size' kB each, unique url per tab) are
+# opened in a window and loaded. rss of the browser process and of all its descendant processes (renderers, gpu,
+# zygote) is read from /proc after loading with the policy disabled, then after the policy is applied with every
+# background tab frozen and at most 'live' tabs alive. reactivating the least recently used (discarded) tab is timed
+# until its page finished loading. linux only (procfs)
+import os
+import sys
+import time
+from typing import Dict, List
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PyQt5.QtWebEngineWidgets import QWebEnginePage
+from PyQt5.QtWidgets import QApplication
+CURPATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(CURPATH))
+from Include import WebBrowserWindow
+from TabLifecycle import TabLifecycleManager
+from Common import readProcessRss
+from fixture_server import startServer
+from benchmark import processEvents, waitUntil, isolateConfig, removeConfig
+
+
+def descendantPids(pid: int) -> List[int]:
+    parents: Dict[int, int] = dict()
+    for name in os.listdir('/proc'):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f'/proc/{name}/stat', 'r') as fp:
+                # comm (2nd field) may contain spaces, ppid follows the closing parenthesis
+                parents[int(name)] = int(fp.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, ValueError, IndexError):
+            continue
+    result, stack = list(), [pid]
+    while stack:
+        parent = stack.pop()
+        children = [x for x, ppid in parents.items() if ppid == parent]
+        result.extend(children)
+        stack.extend(children)
+    return result
+
+
+def measureRss() -> tuple:
+    pid = os.getpid()
+    children = descendantPids(pid)
+    return readProcessRss(pid) / 1024 / 1024, sum(readProcessRss(x) for x in children) / 1024 / 1024, len(children)
+
+
+def countStates(window: WebBrowserWindow) -> str:
+    states = [x.lifecycleState() for x in window.webPageWidgets()]
+    return '/'.join(str(states.count(x)) for x in [QWebEnginePage.Active, QWebEnginePage.Frozen,
+                                                      QWebEnginePage.Discarded])
+
+
+def run(size: int, live: int, base_url: str, assets: int, asset_size: int) -> dict:
+    manager = TabLifecycleManager.instance()
+    manager.max_live_tabs, manager.freeze_after, manager.max_memory_mb = 0, 1e9, 0
+    window = WebBrowserWindow(init_url=None)
+    window.resize(1024, 768)
+    window.show()
+    processEvents(100)
+    loaded: List[object] = list()
+    for i in range(size):
+        window.addWebPageTab(f'{base_url}/page?assets={assets}&size={asset_size}&tab={i}&n={size}')
+        widget = window.webPageWidgets()[-1]
+        widget.sig_load_finished.connect(lambda w=widget: loaded.append(w))
+    if not waitUntil(lambda: len(set(loaded)) >= size, 120000):
+        print(f'[N={size}] timeout: {len(set(loaded))}/{size} pages loaded', file=sys.stderr)
+    processEvents(2000)
+    result = {'off': measureRss(), 'off_states': countStates(window)}
+
+    manager.max_live_tabs, manager.freeze_after = live, 0.
+    manager.applyPolicy()
+    processEvents(3000)
+    result['on'] = measureRss()
+    result['on_states'] = countStates(window)
+
+    widgets = window.webPageWidgets()
+    lru = next((x for x in widgets if x.lifecycleState() == QWebEnginePage.Discarded), None)
+    result['reactivate_ms'] = 0.
+    if lru is not None:
+        finished = list()
+        lru.sig_load_finished.connect(lambda: finished.append(time.perf_counter()))
+        start = time.perf_counter()
+        window._tabWidget.setCurrentWidget(lru)
+        waitUntil(lambda: len(finished) > 0, 60000)
+        result['reactivate_ms'] = ((finished[0] if finished else time.perf_counter()) - start) * 1000
+
+    window.closeWebPageAll()
+    window.close()
+    window.deleteLater()
+    processEvents(1000)
+    return result
+
+
+if __name__ == '__main__':
+    sizes_, live_, assets_, asset_size_ = [10, 25, 50], 5, 10, 200
+    for argv in sys.argv:
+        if '--sizes' in argv:
+            sizes_ = [int(x) for x in argv.split('=')[-1].split(',') if x]
+        if '--live' in argv:
+            live_ = int(argv.split('=')[-1])
+        if '--assets' in argv:
+            assets_ = int(argv.split('=')[-1])
+        if '--asset_size' in argv:
+            asset_size_ = int(argv.split('=')[-1])
+    app_ = QApplication(sys.argv)
+    config_path_ = isolateConfig()
+    server_, stats_, base_url_ = startServer()
+    print(f'{"tabs":>5} {"policy":>7} {"browser[MB]":>12} {"children[MB]":>13} {"procs":>6} '
+          f'{"active/frozen/discarded":>24} {"reactivate[ms]":>15}')
+    for tabs_ in sizes_:
+        res_ = run(tabs_, live_, base_url_, assets_, asset_size_)
+        for policy_ in ['off', 'on']:
+            browser_, children_, procs_ = res_[policy_]
+            reactivate_ = f'{res_["reactivate_ms"]:.0f}' if policy_ == 'on' else ''
+            print(f'{tabs_:>5} {policy_:>7} {browser_:>12.1f} {children_:>13.1f} {procs_:>6} '
+                  f'{res_[policy_ + "_states"]:>24} {reactivate_:>15}')
+    server_.shutdown()
+    removeConfig(config_path_)
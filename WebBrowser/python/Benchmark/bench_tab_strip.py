@@ -0,0 +1,78 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : bench_tab_strip.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Opening and closing many tabs in an offscreen tab widget (cached vs per-call tab size hints)
+# -------------------------------------------------------------------------------------------------------------------- #
+# usage: QT_QPA_PLATFORM=offscreen python Benchmark/bench_tab_strip.py [--tabs=500]
+import os
+import sys
+import time
+from PyQt5.QtCore import QSize
+from PyQt5.QtWidgets import QApplication, QTabBar, QWidget
+CURPATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(CURPATH), 'Include'))
+from CustomTabWidget import CustomTabBar, CustomTabWidget
+
+
+class LegacyTabBar(CustomTabBar):
+    # former implementation: width recomputed (and base hint measured) for every tab on every layout pass
+    def tabSizeHint(self, index: int) -> QSize:
+        size = QTabBar.tabSizeHint(self, index)
+        add_btn_width = 36
+        parent_width = self.parent().width()
+        if index == self.count() - 1:
+            width = add_btn_width + 14 if self.count() == 1 else add_btn_width
+        else:
+            width_max = 240
+            if (self.count() - 1) * width_max < parent_width:
+                width = width_max
+            else:
+                width = int((parent_width - add_btn_width) / (self.count() - 1))
+        return QSize(width, size.height())
+
+    def minimumTabSizeHint(self, index: int) -> QSize:
+        return QTabBar.minimumTabSizeHint(self, index)
+
+
+def run(tabs: int, legacy: bool) -> tuple:
+    widget = CustomTabWidget()
+    if legacy:
+        bar = LegacyTabBar(widget)
+        widget.setTabBar(bar)
+        widget.addTab(QWidget(), '')
+    bar = widget.tabBar()
+    widget.resize(1024, 600)
+    widget.show()
+    app = QApplication.instance()
+    app.processEvents()
+
+    t = time.perf_counter()
+    for i in range(tabs):
+        index = widget.count() - 1
+        widget.insertTab(index, QWidget(), f'Page Title Number {i}')
+        widget.setCurrentIndex(index)
+        app.processEvents()
+    t_open = time.perf_counter() - t
+    width = bar.tabRect(0).width()
+    pinned = widget.count() - 1 if legacy else bar.tabAt(bar.tabRect(widget.count() - 1).center())
+    t = time.perf_counter()
+    while widget.count() > 1:
+        widget.removeTab(0)
+        app.processEvents()
+    t_close = time.perf_counter() - t
+    widget.close()
+    widget.deleteLater()
+    return t_open, t_close, width, pinned == widget.count() - 1 or legacy
+
+
+if __name__ == '__main__':
+    tabs_ = 500
+    for argv in sys.argv:
+        if '--tabs' in argv:
+            tabs_ = int(argv.split('=')[-1])
+    app_ = QApplication(sys.argv)
+    print(f'{"mode":>8} {"tabs":>5} {"open[s]":>8} {"close[s]":>8} {"tab width":>9}')
+    for legacy_ in [True, False]:
+        t_open_, t_close_, width_, _ = run(tabs_, legacy_)
+        print(f'{"legacy" if legacy_ else "cached":>8} {tabs_:>5} {t_open_:>8.2f} {t_close_:>8.2f} {width_:>9}')
@@ -0,0 +1,142 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : bench_url_completer.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Keystroke latency of url autocomplete (frecency index) with many history entries
+# -------------------------------------------------------------------------------------------------------------------- #
+# usage: QT_QPA_PLATFORM=offscreen python Benchmark/bench_url_completer.py [--entries=200000] [--queries=300]
+#                                                                           [--bookmarks=100000]
+# entries are intranet style urls with titles and 1~50 visits in the last year. each query is typed character by
+# character: 'index' is UrlIndex.query (top 10), 'toolbar' also updates the suggestion popup of the url edit.
+# 'bookmarks' indexes the same history with that many bookmarks (half of them never visited): a bookmark toggle
+# (addBookmark/removeBookmark) and the keystrokes are timed, results are compared with a full scan
+import os
+import sys
+import time
+import random
+from heapq import nlargest
+from PyQt5.QtWidgets import QApplication
+CURPATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(CURPATH), 'Include'))
+from UrlCompleter import UrlIndex, visitRank, urlKey
+from NavigationWidget import NavigationToolBar
+from LoadTiming import percentile
+
+WORDS = ['dashboard', 'report', 'sales', 'monitor', 'wiki', 'jira', 'build', 'deploy', 'metrics', 'grafana',
+         'kibana', 'team', 'project', 'release', 'incident', 'status', 'search', 'user', 'admin', 'settings',
+         'api', 'docs', 'review', 'pipeline', 'cluster', 'node', 'storage', 'network', 'alert', 'billing']
+HOSTS = ['intranet', 'portal', 'ci', 'ops', 'docs', 'git', 'hr', 'finance', 'mon', 'data']
+
+
+def generate(count: int, now: float):
+    urls, titles, ranks = list(), list(), list()
+    for i in range(count):
+        host = f'{random.choice(HOSTS)}{random.randint(1, 30)}.corp.example.com'
+        path = '/'.join(random.sample(WORDS, random.randint(1, 3)))
+        urls.append(f'https://{host}/{path}/{i}')
+        titles.append(' '.join(random.sample(WORDS, 3)).title() + f' #{i}')
+        rank = -float('inf')
+        for _ in range(random.randint(1, 50) if random.random() < 0.2 else 1):
+            rank = visitRank(rank, now - random.random() * 365 * 86400)
+        ranks.append(rank)
+    return urls, titles, ranks
+
+
+def bruteForce(index: UrlIndex, text: str, k: int, now: float) -> list:
+    terms = [' ' + urlKey(x) for x in text.lower().split() if urlKey(x)]
+    found = [i for i in range(len(index.urls)) if all(x in index.haystacks[i] for x in terms)]
+    best = nlargest(k, found, key=lambda x: (index.score(x, now), -len(index.urls[x])))
+    return [(index.urls[x], index.titles[x]) for x in best]
+
+
+def runBookmarks(urls: list, titles: list, ranks: list, count: int, texts: list, now: float):
+    bookmarks = random.sample(urls, min(count // 2, len(urls)))
+    bookmarks += [f'https://{random.choice(HOSTS)}.bookmark.example.com/{random.choice(WORDS)}/{i}'
+                  for i in range(count - len(bookmarks))]
+    t = time.perf_counter()
+    index = UrlIndex(list(urls), list(titles), list(ranks), bookmarks)
+    print(f'build with {count} bookmarks: {(time.perf_counter() - t) * 1000:.0f} ms '
+          f'({len(index.bookmark_keys)} bookmark keys)')
+    toggles = list()
+    for i in range(1000):
+        url = bookmarks[random.randrange(count)] if i % 2 else f'https://toggle.example.com/{i}'
+        t = time.perf_counter()
+        index.removeBookmark(url)
+        index.addBookmark(url)
+        toggles.append((time.perf_counter() - t) * 1000)
+    report('toggle', toggles)
+    latencies = list()
+    for text in texts:
+        for n in range(1, len(text) + 1):
+            t = time.perf_counter()
+            index.query(text[:n], 10, now)
+            latencies.append((time.perf_counter() - t) * 1000)
+    report('bookmarks', latencies)
+    mismatch = sum(1 for text in texts[:40] if index.query(text, 10, now) != bruteForce(index, text, 10, now))
+    print(f'{"":<10} {mismatch} of {len(texts[:40])} queries differ from a full scan')
+
+
+def report(name: str, values: list):
+    print(f'{name:<10} p50 {percentile(values, 50):6.3f} ms  p95 {percentile(values, 95):6.3f} ms  '
+          f'p99 {percentile(values, 99):6.3f} ms  max {max(values):6.3f} ms  ({len(values)} keystrokes)')
+
+
+if __name__ == '__main__':
+    entries_, queries_, bookmarks_ = 200000, 300, 100000
+    for argv in sys.argv:
+        if '--entries' in argv:
+            entries_ = int(argv.split('=')[-1])
+        if '--queries' in argv:
+            queries_ = int(argv.split('=')[-1])
+        if '--bookmarks' in argv:
+            bookmarks_ = int(argv.split('=')[-1])
+    random.seed(0)
+    now_ = time.time()
+    urls_, titles_, ranks_ = generate(entries_, now_)
+    t_ = time.perf_counter()
+    index_ = UrlIndex(list(urls_), list(titles_), list(ranks_), bookmarks=random.sample(urls_, 500))
+    print(f'build {entries_} entries: {(time.perf_counter() - t_) * 1000:.0f} ms ({len(index_.keys)} keys)')
+
+    # typed text: host names, words of titles, url prefixes and misses
+    texts_ = list()
+    for i_ in range(queries_):
+        kind_ = i_ % 4
+        if kind_ == 0:
+            texts_.append(urls_[random.randrange(entries_)].split('/')[2][:random.randint(4, 20)])
+        elif kind_ == 1:
+            texts_.append(' '.join(random.sample(WORDS, 2)))
+        elif kind_ == 2:
+            texts_.append('https://' + urls_[random.randrange(entries_)][8:40])
+        else:
+            texts_.append('zzqx' + random.choice(WORDS))
+    # some visits while typing (incremental updates, not yet merged by a rebuild)
+    visit_times_ = list()
+    for i_ in range(1000):
+        t_ = time.perf_counter()
+        index_.visit(urls_[random.randrange(entries_)] if i_ % 2 else f'https://new.corp/{i_}', f'New page {i_}', now_)
+        visit_times_.append((time.perf_counter() - t_) * 1000)
+    report('visit', visit_times_)
+
+    latencies_ = list()
+    for text_ in texts_:
+        for n_ in range(1, len(text_) + 1):
+            t_ = time.perf_counter()
+            index_.query(text_[:n_], 10, now_)
+            latencies_.append((time.perf_counter() - t_) * 1000)
+    report('index', latencies_)
+    if bookmarks_ > 0:
+        runBookmarks(urls_, titles_, ranks_, bookmarks_, texts_, now_)
+
+    app_ = QApplication(sys.argv)
+    navbar_ = NavigationToolBar()
+    navbar_.setCompletionSource(lambda x: index_.query(x, 10, now_))
+    navbar_.show()
+    latencies_ = list()
+    for text_ in texts_[:100]:
+        for n_ in range(1, len(text_) + 1):
+            t_ = time.perf_counter()
+            navbar_.editUrl.setText(text_[:n_])
+            navbar_.onEditUrlTextEdited(text_[:n_])
+            app_.processEvents()
+            latencies_.append((time.perf_counter() - t_) * 1000)
+    report('toolbar', latencies_)
@@ -0,0 +1,126 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : bench_write_behind.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Write-behind persistence of bookmark toggles (number of writes, writing thread, gui thread cost)
+# -------------------------------------------------------------------------------------------------------------------- #
+# usage: python Benchmark/bench_write_behind.py [--toggles=1000] [--interval=6] [--backend=xml,sqlite]
+#                                               [--bookmarks=10000]
+# a configuration with 'bookmarks' bookmarks is created in a temporary directory, then a bookmark is added and
+# removed 'toggles' times (one change every 'interval' ms, driven by the event loop) and the configuration is
+# released like a closing window does. every write job (config.xml write or sqlite commit) is counted with the
+# thread it ran on. exit code is 1 when a write ran on the main thread, when the number of writes exceeds one per
+# 'max_delay_ms' of toggling (plus the final flush) or when the saved bookmarks differ
+import os
+import sys
+import time
+import shutil
+import tempfile
+import threading
+from PyQt5.QtCore import QCoreApplication, QTimer
+CURPATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(CURPATH), 'Include'))
+from BookMarkWidget import BookMarkManager
+from ConfigUtil import WebBrowserConfig
+from LoadTiming import percentile
+
+
+class BenchConfig(WebBrowserConfig):
+    # configuration files in 'path' instead of the Config directory of the browser, write jobs are counted
+    def __init__(self, bookmarkManager: BookMarkManager, backend: str, path: str):
+        self.bench_path = path
+        self.writes = list()  # (thread, time)
+        super().__init__(bookmarkManager, backend)
+
+    def load(self):
+        self.xml_path = os.path.join(self.bench_path, 'config.xml')
+        self.db_path = os.path.join(self.bench_path, 'config.db')
+        super().load()
+
+    def snapshot(self):
+        job = super().snapshot()
+        if job is None:
+            return None
+
+        def counted():
+            job()
+            self.writes.append((threading.current_thread(), time.perf_counter()))
+        return counted
+
+
+def run(app: QCoreApplication, backend: str, toggles: int, interval: int, bookmarks: int, tempdir: str) -> bool:
+    path = os.path.join(tempdir, backend)
+    os.makedirs(path)
+    manager = BookMarkManager()
+    config = BenchConfig(manager, backend, path)
+    manager.beginUpdate()
+    for i in range(bookmarks):
+        manager.add(f'https://site{i}.example/', f'Bookmark {i}', '')
+    manager.endUpdate()
+    config.save()
+    config.writes.clear()
+    config.retain(app)
+
+    costs = list()
+    state = {'count': 0}
+
+    def toggle():
+        start = time.perf_counter()
+        if manager.isExist('https://toggle.example/'):
+            manager.remove('https://toggle.example/')
+        else:
+            manager.add('https://toggle.example/', 'Toggle', '')
+        costs.append((time.perf_counter() - start) * 1000)
+        state['count'] += 1
+        if state['count'] == toggles:
+            timer.stop()
+            app.quit()
+
+    timer = QTimer()
+    timer.setInterval(interval)
+    timer.timeout.connect(toggle)
+    start = time.perf_counter()
+    timer.start()
+    app.exec_()
+    duration = time.perf_counter() - start
+    writes_during = len(config.writes)
+    release_start = time.perf_counter()
+    config.release(app)
+    release_ms = (time.perf_counter() - release_start) * 1000
+
+    max_delay = config._saver._max_delay_ms / 1000
+    bound = int(duration / max_delay) + 2
+    main_thread = threading.main_thread()
+    on_main = sum(1 for thread, _ in config.writes if thread is main_thread)
+    threads = sorted(set(thread.name for thread, _ in config.writes))
+    saved = BookMarkManager()
+    reader = BenchConfig(saved, backend, path)
+    reader.retain(app)
+    reader.release(app)
+    ok = len(config.writes) <= bound and on_main == 0 and saved.count() == manager.count()
+    print(f'{backend:<7} {toggles} toggles in {duration:.2f} s: {len(config.writes)} writes ({writes_during} while '
+          f'toggling, bound {bound}) on {threads}, {on_main} on the main thread')
+    print(f'{"":<7} gui cost per toggle p50 {percentile(costs, 50):.3f} ms  max {max(costs):.3f} ms, '
+          f'release {release_ms:.1f} ms, {saved.count()} of {manager.count()} bookmarks saved')
+    return ok
+
+
+if __name__ == '__main__':
+    toggles_, interval_, backends_, bookmarks_ = 1000, 6, ['xml', 'sqlite'], 10000
+    for argv in sys.argv:
+        if '--toggles' in argv:
+            toggles_ = int(argv.split('=')[-1])
+        if '--interval' in argv:
+            interval_ = int(argv.split('=')[-1])
+        if '--backend' in argv:
+            backends_ = argv.split('=')[-1].split(',')
+        if '--bookmarks' in argv:
+            bookmarks_ = int(argv.split('=')[-1])
+    app_ = QCoreApplication(sys.argv)
+    tempdir_ = tempfile.mkdtemp()
+    ok_ = True
+    for backend_ in backends_:
+        ok_ = run(app_, backend_, toggles_, interval_, bookmarks_, tempdir_) and ok_
+    shutil.rmtree(tempdir_)
+    print('ok' if ok_ else 'FAILED')
+    sys.exit(0 if ok_ else 1)
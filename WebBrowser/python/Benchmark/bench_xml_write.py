@@ -0,0 +1,143 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : bench_xml_write.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Writing large xml config trees, former recursive writer vs writeXmlFile
+# -------------------------------------------------------------------------------------------------------------------- #
+# usage: python Benchmark/bench_xml_write.py [--elements=120000] [--repeat=3] [--memory]
+# a config-like tree of 'elements' bookmark elements (attributes and text) is written to a temporary directory by
+# the former writer (recursive, re-parses the existing file to decide on the backup copy) and by writeXmlFile.
+# measured: first write, rewrite with one changed element, rewrite of an unchanged tree (wall time, fsync calls and,
+# with --memory, peak traced memory which slows down both writers). the outputs of both writers are compared byte by
+# byte
+import os
+import sys
+import time
+import shutil
+import tempfile
+import tracemalloc
+import xml.etree.ElementTree as ElementTree
+from xml.sax.saxutils import escape
+CURPATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(CURPATH), 'Include'))
+from Common import ensurePathExist, writeXmlFile
+
+
+def legacyWriteXmlFile(elem: ElementTree.Element, path: str = '', fp=None, level: int = 0, backup: bool = True):
+    # former implementation
+    if fp is None:
+        dir_name = os.path.dirname(os.path.abspath(path))
+        ensurePathExist(dir_name)
+        if backup and os.path.isfile(path):
+            try:
+                origin_data = ElementTree.parse(path)
+                origin_root = origin_data.getroot()
+                if ElementTree.tostring(origin_root) != ElementTree.tostring(elem):
+                    backup_path = os.path.join(dir_name, 'Backup')
+                    if not os.path.isdir(backup_path):
+                        os.mkdir(backup_path)
+                    origin_file_name = os.path.basename(path)
+                    origin_name, origin_ext = os.path.splitext(origin_file_name)
+                    backup_file_name = origin_name + '_backup' + origin_ext
+                    backup_file_path = os.path.join(backup_path, backup_file_name)
+                    shutil.copyfile(path, backup_file_path)
+            except Exception:
+                pass
+        _fp = open(path, 'w', encoding='utf-8')
+        _fp.write('<?xml version="1.0" encoding="UTF-8" standalone="no"?>' + '\n')
+    else:
+        _fp = fp
+    _fp.write('\t' * level)
+    _fp.write('<' + elem.tag)
+    for key in elem.keys():
+        _fp.write(' ' + key + '="' + escape(elem.attrib[key], {'"': '&quot;'}) + '"')
+    if len(list(elem)) > 0:
+        _fp.write('>\n')
+        for child in list(elem):
+            legacyWriteXmlFile(child, fp=_fp, level=level + 1)
+        _fp.write('\t' * level)
+        _fp.write('</' + elem.tag + '>\n')
+    else:
+        if elem.text is not None:
+            txt = elem.text
+            txt = txt.replace('\r', '')
+            txt = txt.replace('\n', '')
+            txt = txt.replace('\t', '')
+            if len(txt) > 0:
+                _fp.write('>' + txt + '</' + elem.tag + '>\n')
+            else:
+                _fp.write('/>\n')
+        else:
+            _fp.write('/>\n')
+    if level == 0:
+        _fp.close()
+
+
+class FsyncCounter:
+    def __init__(self):
+        self.calls = 0
+        self._fsync = os.fsync
+
+    def __call__(self, fd):
+        self.calls += 1
+        self._fsync(fd)
+
+
+def makeTree(elements: int) -> ElementTree.Element:
+    root = ElementTree.Element('WebBrowser')
+    node = ElementTree.SubElement(root, 'bookmarks')
+    for i in range(elements):
+        child = ElementTree.SubElement(node, 'item', {'title': f'Bookmark {i}', 'icon_url': ''})
+        child.text = f'https://site{i}.example/page?id={i}'
+    return root
+
+
+def measure(func, counter: FsyncCounter, memory: bool) -> tuple:
+    counter.calls = 0
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    peak = 0
+    if memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return elapsed, counter.calls, peak / 1024 / 1024
+
+
+if __name__ == '__main__':
+    elements_, repeat_, memory_ = 120000, 3, False
+    for argv in sys.argv:
+        if '--elements' in argv:
+            elements_ = int(argv.split('=')[-1])
+        if '--repeat' in argv:
+            repeat_ = int(argv.split('=')[-1])
+        if '--memory' in argv:
+            memory_ = True
+    tree_ = makeTree(elements_)
+    tempdir_ = tempfile.mkdtemp()
+    counter_ = FsyncCounter()
+    os.fsync = counter_
+    paths_ = dict()
+    print(f'{elements_} elements, best of {repeat_}')
+    print(f'{"writer":<10} {"step":<10} {"time[s]":>8} {"fsync":>6} {"peak[MB]":>9}')
+    for name_, writer_ in [('former', legacyWriteXmlFile), ('current', writeXmlFile)]:
+        path_ = os.path.join(tempdir_, name_, 'config.xml')
+        paths_[name_] = path_
+        results_ = {'write': list(), 'changed': list(), 'unchanged': list()}
+        for i_ in range(repeat_):
+            shutil.rmtree(os.path.dirname(path_), ignore_errors=True)
+            results_['write'].append(measure(lambda: writer_(tree_, path_), counter_, memory_))
+            tree_[0][0].text = f'https://changed.example/{i_}'
+            results_['changed'].append(measure(lambda: writer_(tree_, path_), counter_, memory_))
+            results_['unchanged'].append(measure(lambda: writer_(tree_, path_), counter_, memory_))
+        for step_, values_ in results_.items():
+            elapsed_, fsync_, peak_ = min(values_)
+            print(f'{name_:<10} {step_:<10} {elapsed_:>8.2f} {fsync_:>6} {peak_:>9.1f}')
+    with open(paths_['former'], 'rb') as fp_:
+        former_ = fp_.read()
+    with open(paths_['current'], 'rb') as fp_:
+        current_ = fp_.read()
+    print(f'identical output: {former_ == current_}, file mode {oct(os.stat(paths_["current"]).st_mode & 0o777)}')
+    shutil.rmtree(tempdir_)
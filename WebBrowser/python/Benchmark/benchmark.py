@@ -0,0 +1,228 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : benchmark.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Headless tab lifecycle benchmark of WebBrowserWindow against the local fixture server
+# -------------------------------------------------------------------------------------------------------------------- #
+# usage: python Benchmark/benchmark.py [--sizes=1,10,100] [--output=result.json]
+#                                      [--compare=baseline.json] [--threshold=0.2]
+# each size N: open N tabs (addWebPageTab, until every page is loaded), select every tab, move up to 10 tabs to new
+# windows (onTabNewWindow), close everything (closeWebPageAll). wall time of each step, peak rss of the browser and
+# renderer processes, and qt objects left after closing are written as json.
+# with --compare, results are checked against a stored result: exit code is 1 when a metric regressed
+import os
+import gc
+import sys
+import json
+import time
+import platform
+import shutil
+import resource
+import tempfile
+from typing import Dict, List
+from collections import Counter
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+from PyQt5.QtCore import QEventLoop, QTimer, QObject, QT_VERSION_STR, PYQT_VERSION_STR
+from PyQt5.QtWidgets import QApplication
+CURPATH = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.dirname(CURPATH))
+from Include import WebBrowserWindow, SessionJournal
+from TabLifecycle import TabLifecycleManager
+from ConfigUtil import WebBrowserConfig
+from ProfileManager import ProfileManager
+from BrowsingHistory import HistoryStore
+from UrlCompleter import UrlHistoryIndex
+from FaviconLoader import FaviconLoader, FaviconCache
+from ContentBlocker import ContentBlocker
+from fixture_server import startServer
+
+MOVE_MAX = 10
+# metric: (lower is better) relative threshold is applied to times and memory, leftovers must not grow
+TIME_METRICS = ['open_ms', 'switch_ms', 'move_ms', 'close_ms']
+MEMORY_METRICS = ['peak_rss_mb', 'peak_renderer_rss_mb']
+COUNT_METRICS = ['leftover_widgets', 'leftover_qobjects']
+ABSOLUTE_SLACK = {'open_ms': 20., 'switch_ms': 5., 'move_ms': 5., 'close_ms': 5., 'peak_rss_mb': 5.,
+                  'peak_renderer_rss_mb': 10.}
+
+
+def processEvents(milliseconds: int = 0):
+    loop = QEventLoop()
+    QTimer.singleShot(milliseconds, loop.quit)
+    loop.exec_()
+
+
+def waitUntil(condition, timeout_ms: int = 60000) -> bool:
+    start = time.perf_counter()
+    while not condition():
+        if (time.perf_counter() - start) * 1000 > timeout_ms:
+            return False
+        processEvents(5)
+    return True
+
+
+def isolateConfig() -> str:
+    # every store of the browser (configuration, session, history, url history, favicons, content filters and the
+    # web engine profile storage) in a temporary directory instead of Config: a run leaves the user's data untouched.
+    # call before the first window is created, removeConfig() when the run ends
+    path = tempfile.mkdtemp()
+    WebBrowserConfig.config_path = path
+    ProfileManager.storage_root = os.path.join(path, 'Profiles')
+    SessionJournal._instance = SessionJournal(os.path.join(path, 'session.journal'))
+    HistoryStore._instance = HistoryStore(os.path.join(path, 'history.db'))
+    UrlHistoryIndex._instance = UrlHistoryIndex(os.path.join(path, 'url_history.jsonl'))
+    UrlHistoryIndex._instance.load()
+    FaviconLoader._instance = FaviconLoader(FaviconCache(os.path.join(path, 'Favicon')))
+    ContentBlocker._instance = ContentBlocker(path)
+    return path
+
+
+def removeConfig(path: str):
+    SessionJournal.instance().close()
+    HistoryStore.instance().close()
+    UrlHistoryIndex.instance().close()
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def peakRssMb() -> float:
+    # ru_maxrss is kB on linux, bytes on macos
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 1024 / 1024
+
+
+def countQObjects() -> Counter:
+    # python wrappers of QObject by class name (a wrapper kept alive by a reference outlives its widget)
+    gc.collect()
+    return Counter([type(x).__name__ for x in gc.get_objects() if isinstance(x, QObject)])
+
+
+def runScenario(size: int, base_url: str) -> dict:
+    app = QApplication.instance()
+    processEvents()
+    widgets_before = len(app.allWidgets())
+    qobjects_before = countQObjects()
+    result = dict()
+
+    window = WebBrowserWindow(init_url=None)
+    window.resize(1024, 768)
+    window.show()
+    processEvents(50)
+
+    loaded: List[object] = list()
+    t = time.perf_counter()
+    for i in range(size):
+        window.addWebPageTab(f'{base_url}/page?assets=5&size=10&tab={i}')
+        widget = window.webPageWidgets()[-1]
+        widget.sig_load_finished.connect(lambda w=widget: loaded.append(w))
+    if not waitUntil(lambda: len(set(loaded)) >= size):
+        print(f'[N={size}] timeout: {len(set(loaded))}/{size} pages loaded', file=sys.stderr)
+    result['open_ms'] = (time.perf_counter() - t) * 1000
+    result['peak_renderer_rss_mb'] = TabLifecycleManager.instance().residentMemory() / 1024 / 1024
+
+    t = time.perf_counter()
+    tab_widget = window._tabWidget
+    for i in range(size):
+        tab_widget.setCurrentIndex(i)
+        processEvents()
+    result['switch_ms'] = (time.perf_counter() - t) * 1000
+
+    t = time.perf_counter()
+    moved = min(MOVE_MAX, size - 1) if size > 1 else 0
+    for _ in range(moved):
+        window.onTabNewWindow(0)
+        processEvents()
+    result['move_ms'] = (time.perf_counter() - t) * 1000
+    result['moved'] = moved
+
+    t = time.perf_counter()
+    children = [x for x in window.findChildren(WebBrowserWindow)]
+    for child in children:
+        child.closeWebPageAll()
+        child.close()
+        child.deleteLater()
+    window.closeWebPageAll()
+    window.close()
+    window.deleteLater()
+    processEvents()
+    result['close_ms'] = (time.perf_counter() - t) * 1000
+
+    # deferred deletes and renderer shutdown
+    processEvents(500)
+    del window, children, loaded
+    result['peak_rss_mb'] = peakRssMb()
+    result['leftover_widgets'] = len(app.allWidgets()) - widgets_before
+    leftover = countQObjects() - qobjects_before
+    result['leftover_qobjects'] = sum(leftover.values())
+    result['leftover_types'] = dict(leftover)
+    return result
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> List[str]:
+    regressions = list()
+    for key, values in current['results'].items():
+        base = baseline.get('results', dict()).get(key)
+        if base is None:
+            continue
+        for metric in TIME_METRICS + MEMORY_METRICS:
+            if metric in base and metric in values:
+                limit = base[metric] * (1 + threshold) + ABSOLUTE_SLACK.get(metric, 0.)
+                if values[metric] > limit:
+                    regressions.append(f'{key} {metric}: {values[metric]:.1f} > {limit:.1f} (baseline {base[metric]:.1f})')
+        for metric in COUNT_METRICS:
+            if metric in base and metric in values and values[metric] > base[metric]:
+                regressions.append(f'{key} {metric}: {values[metric]} > baseline {base[metric]}')
+    return regressions
+
+
+if __name__ == '__main__':
+    sizes_ = [1, 10, 100]
+    output_ = ''
+    compare_ = ''
+    threshold_ = 0.2
+    for argv in sys.argv:
+        if '--sizes' in argv:
+            sizes_ = [int(x) for x in argv.split('=')[-1].split(',') if x]
+        if '--output' in argv:
+            output_ = argv.split('=')[-1]
+        if '--compare' in argv:
+            compare_ = argv.split('=')[-1]
+        if '--threshold' in argv:
+            threshold_ = float(argv.split('=')[-1])
+
+    app_ = QApplication(sys.argv)
+    config_path_ = isolateConfig()
+    server_, stats_, base_url_ = startServer()
+    runScenario(1, base_url_)  # warm up: singletons and caches created on first use are not leftovers
+    results_: Dict[str, dict] = dict()
+    for size_ in sizes_:
+        results_[f'N={size_}'] = runScenario(size_, base_url_)
+        res_ = results_[f'N={size_}']
+        print(f'N={size_:<4} open {res_["open_ms"]:9.1f} ms  switch {res_["switch_ms"]:8.1f} ms  '
+              f'move {res_["move_ms"]:8.1f} ms  close {res_["close_ms"]:8.1f} ms  '
+              f'rss {res_["peak_rss_mb"]:7.1f} MB  renderer {res_["peak_renderer_rss_mb"]:7.1f} MB  '
+              f'leftover widgets {res_["leftover_widgets"]} qobjects {res_["leftover_qobjects"]}')
+    server_.shutdown()
+    removeConfig(config_path_)
+
+    document_ = {
+        'meta': {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'qt': QT_VERSION_STR,
+            'pyqt': PYQT_VERSION_STR,
+            'platform': platform.platform()
+        },
+        'results': results_
+    }
+    if output_:
+        with open(output_, 'w', encoding='utf-8') as fp_:
+            json.dump(document_, fp_, indent=2)
+
+    if compare_:
+        with open(compare_, 'r', encoding='utf-8') as fp_:
+            baseline_ = json.load(fp_)
+        regressions_ = compare(document_, baseline_, threshold_)
+        for line_ in regressions_:
+            print(f'REGRESSION {line_}')
+        if not regressions_:
+            print(f'no regression against {compare_} (threshold {threshold_ * 100:.0f} %)')
+        sys.exit(1 if regressions_ else 0)
@@ -0,0 +1,118 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : fixture_server.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Local HTTP server with generated pages and cacheable assets for benchmarks
+# -------------------------------------------------------------------------------------------------------------------- #
+# /page?assets=<n>&size=<kB>: html page referencing <n> scripts of <kB> each (cacheable for an hour)
+# /asset/<i>.js?size=<kB>: script asset, answers 304 to a matching If-None-Match
+# /icon/<i>.png: 1x1 png (favicon)
+# every request takes 'delay_sec' (or ?delay=<sec>) before it is answered
+import base64
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+from typing import Tuple
+
+ICON_PNG = base64.b64decode('iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAAC0lEQVR4nGNgAAIAAAUAAXpeqz8AAAAASUVORK5CY'
+                            'II=')
+
+
+class FixtureStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.bytes_sent = 0
+        self.not_modified = 0
+        self.in_flight = 0
+        self.max_in_flight = 0  # requests being answered at the same time (delay included)
+
+    def enter(self):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def leave(self):
+        with self._lock:
+            self.in_flight -= 1
+
+    def add(self, size: int, not_modified: bool = False):
+        with self._lock:
+            self.requests += 1
+            self.bytes_sent += size
+            self.not_modified += int(not_modified)
+
+    def reset(self):
+        with self._lock:
+            self.requests = self.bytes_sent = self.not_modified = 0
+            self.max_in_flight = self.in_flight
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {'requests': self.requests, 'bytes': self.bytes_sent, 'not_modified': self.not_modified,
+                    'max_in_flight': self.max_in_flight}
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    stats: FixtureStats = None
+    delay_sec: float = 0.
+
+    def log_message(self, *args):
+        pass
+
+    def send(self, body: bytes, content_type: str, headers: dict = None):
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or dict()).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+        self.stats.add(len(body))
+
+    def do_GET(self):
+        self.stats.enter()
+        try:
+            self.answer()
+        except ConnectionError:
+            pass  # client aborted the transfer (e.g. a timeout of the browser)
+        finally:
+            self.stats.leave()
+
+    def answer(self):
+        parts = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        delay_sec = float(query.get('delay', self.delay_sec))
+        if delay_sec > 0:
+            threading.Event().wait(delay_sec)
+        if parts.path == '/page':
+            count, size = int(query.get('assets', 20)), int(query.get('size', 50))
+            scripts = ''.join([f'<script src="/asset/{i}.js?size={size}"></script>' for i in range(count)])
+            body = f'<html><head><title>fixture</title>{scripts}</head><body>fixture page</body></html>'
+            self.send(body.encode(), 'text/html', {'Cache-Control': 'no-cache'})
+        elif parts.path.startswith('/asset/'):
+            size = int(query.get('size', 50))
+            etag = f'"{parts.path}-{size}"'
+            if self.headers.get('If-None-Match') == etag:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.end_headers()
+                self.stats.add(0, True)
+                return
+            name = parts.path.rsplit('/', 1)[-1]
+            body = (f'/* {name} */' + ' ' * 1024 * size + '\n').encode()
+            self.send(body, 'application/javascript', {'Cache-Control': 'max-age=3600', 'ETag': etag})
+        elif parts.path.startswith('/icon/'):
+            self.send(ICON_PNG, 'image/png', {'Cache-Control': 'max-age=3600'})
+        else:
+            self.send_error(404)
+            self.stats.add(0)
+
+
+def startServer(delay_sec: float = 0.) -> Tuple[ThreadingHTTPServer, FixtureStats, str]:
+    stats = FixtureStats()
+    handler = type('Handler', (FixtureHandler, ), {'stats': stats, 'delay_sec': delay_sec})
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    thread = threading.Thread(target=server.serve_forever, name='FixtureServer', daemon=True)
+    thread.start()
+    return server, stats, f'http://127.0.0.1:{server.server_address[1]}'
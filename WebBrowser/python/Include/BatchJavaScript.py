@@ -0,0 +1,376 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : BatchJavaScript.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Run a javascript on many tabs at once and collect the results (developer widget batch mode)
+# -------------------------------------------------------------------------------------------------------------------- #
+import json
+import time
+import reprlib
+from functools import partial
+from typing import Callable, Dict, List, Set, Union
+from PyQt5.QtCore import Qt, QObject, QTimer, pyqtSignal, QAbstractTableModel, QModelIndex
+from PyQt5.QtWidgets import QWidget, QTableView, QPushButton, QLabel, QSpinBox, QHeaderView, QAbstractItemView
+from PyQt5.QtWidgets import QVBoxLayout, QHBoxLayout, QFileDialog
+from PyQt5.QtGui import QShowEvent
+from PyQt5.QtWebEngineWidgets import QWebEnginePage
+from WebPageWidget import WebPageWidget
+from TabLifecycle import TabLifecycleManager
+
+# script runs unchanged in the page (no eval: pages with a strict content security policy allow it), the result is
+# the completion value of the try statement. an exception is returned as an object keyed by BATCH_ERROR_KEY
+BATCH_ERROR_KEY = '__batch_script_error__'
+BATCH_SCRIPT = """try {
+%s
+} catch (e) {
+    ({""" + BATCH_ERROR_KEY + """: String(e)});
+}
+"""
+
+VALUE_REPR = reprlib.Repr()
+VALUE_REPR.maxstring = 200
+VALUE_REPR.maxother = 200
+
+
+class BatchScriptRunner(QObject):
+    # sends the script to all tabs without waiting, every answer is a result of its row.
+    # tabs not answered within 'timeout_ms' are marked as timeout (a late answer is ignored), discarded tabs are
+    # skipped (running a script would reload them) and frozen tabs are resumed until they answered or timed out.
+    # tabs closed while running are marked as closed (see onTabClosed)
+    sig_result = pyqtSignal(int)
+    sig_finished = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._run_id = 0
+        self._start = 0.
+        self._results: List[dict] = list()
+        self._resumed: Set[int] = set()  # rows of frozen tabs
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.onTimeout)
+
+    def isRunning(self) -> bool:
+        return self._timer.isActive()
+
+    def results(self) -> List[dict]:
+        return self._results
+
+    def run(self, script: str, tabs: List[WebPageWidget], timeout_ms: int = 5000):
+        self.cancel()
+        self._run_id += 1
+        self._start = time.perf_counter()
+        self._results = list()
+        self._resumed = set()
+        wrapped = BATCH_SCRIPT % script
+        windows: Dict[QWidget, int] = dict()
+        for row, widget in enumerate(tabs):
+            self._results.append({
+                'widget': widget,
+                'window': windows.setdefault(widget.window(), len(windows) + 1),
+                'title': widget.title(),
+                'url': widget.url().toString(),
+                'status': 'pending',
+                'value': None,
+                'latency_ms': None
+            })
+        for row, widget in enumerate(tabs):
+            state = widget.lifecycleState()
+            if state == QWebEnginePage.Discarded:
+                self.setResult(row, 'discarded', None)
+                continue
+            page = widget.view().page()
+            if state == QWebEnginePage.Frozen:
+                page.setLifecycleState(QWebEnginePage.Active)
+                self._resumed.add(row)
+            page.runJavaScript(wrapped, partial(self.onAnswer, self._run_id, row))
+        if self.pendingCount() > 0:
+            self._timer.start(timeout_ms)
+        else:
+            self.sig_finished.emit()
+
+    def cancel(self):
+        # pending tabs are marked as timeout
+        if self.isRunning():
+            self._timer.stop()
+            self.onTimeout()
+
+    def clear(self):
+        self.cancel()
+        self._run_id += 1
+        self._results = list()
+        self._resumed = set()
+
+    def pendingCount(self) -> int:
+        return len([x for x in self._results if x['status'] == 'pending'])
+
+    def setResult(self, row: int, status: str, value: object):
+        result = self._results[row]
+        result['status'] = status
+        result['value'] = value
+        result['latency_ms'] = (time.perf_counter() - self._start) * 1000
+        self.sig_result.emit(row)
+
+    def onAnswer(self, run_id: int, row: int, answer: object):
+        if run_id != self._run_id or self._results[row]['status'] != 'pending':
+            return
+        if isinstance(answer, dict) and BATCH_ERROR_KEY in answer:
+            self.setResult(row, 'error', answer[BATCH_ERROR_KEY])
+        elif answer is None and self.syntaxError(row):
+            self.setResult(row, 'error', self.syntaxError(row))
+        else:
+            self.setResult(row, 'ok', answer)
+        self.restoreState(row)
+        if self.pendingCount() == 0:
+            self._timer.stop()
+            self.sig_finished.emit()
+
+    def syntaxError(self, row: int) -> str:
+        # a script which does not compile is not run (null result), its error is on the console of the page
+        when, message = getattr(self._results[row]['widget'].view().page(), 'last_error', (0., ''))
+        return message if when >= self._start and 'SyntaxError' in message else ''
+
+    def onTimeout(self):
+        for row, result in enumerate(self._results):
+            if result['status'] == 'pending':
+                self.setResult(row, 'timeout', None)
+                self.restoreState(row)
+        self.sig_finished.emit()
+
+    def onTabClosed(self, widget: WebPageWidget):
+        for row, result in enumerate(self._results):
+            if result['widget'] is widget:
+                self._resumed.discard(row)
+                if result['status'] == 'pending':
+                    self.setResult(row, 'closed', None)
+        if self.isRunning() and self.pendingCount() == 0:
+            self._timer.stop()
+            self.sig_finished.emit()
+
+    def restoreState(self, row: int):
+        # frozen tab resumed for the script is frozen again, unless it has been shown meanwhile
+        if row not in self._resumed:
+            return
+        self._resumed.discard(row)
+        page = self._results[row]['widget'].view().page()
+        if page.lifecycleState() == QWebEnginePage.Active and not page.isVisible():
+            page.setLifecycleState(QWebEnginePage.Frozen)
+
+    def toJson(self, script: str = '') -> str:
+        document = {
+            'script': script,
+            'results': [{k: v for k, v in x.items() if k != 'widget'} for x in self._results]
+        }
+        return json.dumps(document, ensure_ascii=False, indent=2, default=str)
+
+
+class BatchResultModel(QAbstractTableModel):
+    # tabs of all windows with check state (targets) and the result of the last run
+    columns = [('Win', 'window'), ('Tab', 'title'), ('URL', 'url'), ('Status', 'status'), ('Value', 'value'),
+               ('Latency(ms)', 'latency_ms')]
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._rows: List[dict] = list()
+        self._checked: Dict[WebPageWidget, bool] = dict()
+
+    def setRows(self, rows: List[dict]):
+        self.beginResetModel()
+        self._rows = rows
+        self._checked = {x['widget']: self._checked.get(x['widget'], True) for x in rows}
+        self.endResetModel()
+
+    def updateRow(self, row: int):
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.columns) - 1))
+
+    def row(self, row: int) -> dict:
+        return self._rows[row]
+
+    def setClosed(self, widget: WebPageWidget):
+        # closed tab is never a target again, its row is kept (rows of a run are indexed by the runner)
+        self._checked.pop(widget, None)
+        for index, row in enumerate(self._rows):
+            if row['widget'] is widget:
+                if row['status'] is None:
+                    row['status'] = 'closed'
+                self.updateRow(index)
+
+    def checkedWidgets(self) -> List[WebPageWidget]:
+        return [x['widget'] for x in self._rows if self._checked.get(x['widget'])]
+
+    def setAllChecked(self, checked: bool):
+        self._checked = {k: checked for k in self._checked.keys()}
+        if self._rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._rows) - 1, 0))
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.columns)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        flags = super().flags(index)
+        if index.column() == 0:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        row = self._rows[index.row()]
+        key = self.columns[index.column()][1]
+        if role == Qt.DisplayRole:
+            value = row.get(key)
+            if key == 'latency_ms':
+                return '-' if value is None else f'{value:.1f}'
+            if key == 'value':
+                if row.get('status') in [None, 'pending', 'timeout', 'discarded', 'closed']:
+                    return ''
+                return VALUE_REPR.repr(value)
+            return '' if value is None else str(value)
+        elif role == Qt.CheckStateRole and index.column() == 0:
+            return Qt.Checked if self._checked.get(row['widget']) else Qt.Unchecked
+        elif role == Qt.ForegroundRole and key == 'status' and row.get('status') in ['error', 'timeout']:
+            return Qt.red
+        return None
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.EditRole) -> bool:
+        if role == Qt.CheckStateRole and index.column() == 0:
+            self._checked[self._rows[index.row()]['widget']] = value == Qt.Checked
+            self.dataChanged.emit(index, index)
+            return True
+        return False
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.columns[section][0]
+        return None
+
+
+class BatchScriptWidget(QWidget):
+    # double clicking a row shows the whole value (sig_show_value)
+    sig_show_value = pyqtSignal(object)
+
+    def __init__(self, parent=None, tabs: Union[Callable[[], List[WebPageWidget]], None] = None):
+        super().__init__(parent=parent)
+        self._tabs = tabs if tabs is not None else TabLifecycleManager.instance().tabs
+        self._script = ''
+        self._runner = BatchScriptRunner(self)
+        self._model = BatchResultModel(self)
+        self._table = QTableView()
+        self._spinTimeout = QSpinBox()
+        self._btnRefresh = QPushButton('Refresh Tabs')
+        self._btnCheckAll = QPushButton('Check All')
+        self._btnUncheckAll = QPushButton('Uncheck All')
+        self._btnExport = QPushButton('Export JSON')
+        self._lblSummary = QLabel()
+        self.initControl()
+        TabLifecycleManager.instance().sig_unregistered.connect(self.onTabClosed)
+        self.initLayout()
+
+    def initLayout(self):
+        vbox = QVBoxLayout(self)
+        vbox.setContentsMargins(0, 0, 0, 0)
+        vbox.setSpacing(4)
+        hbox = QHBoxLayout()
+        hbox.setContentsMargins(0, 0, 0, 0)
+        hbox.setSpacing(4)
+        hbox.addWidget(self._btnRefresh)
+        hbox.addWidget(self._btnCheckAll)
+        hbox.addWidget(self._btnUncheckAll)
+        hbox.addStretch()
+        hbox.addWidget(QLabel('Timeout'))
+        hbox.addWidget(self._spinTimeout)
+        vbox.addLayout(hbox)
+        vbox.addWidget(self._table)
+        hbox = QHBoxLayout()
+        hbox.setContentsMargins(0, 0, 0, 0)
+        hbox.setSpacing(4)
+        hbox.addWidget(self._lblSummary)
+        hbox.addStretch()
+        hbox.addWidget(self._btnExport)
+        vbox.addLayout(hbox)
+
+    def initControl(self):
+        self._table.setModel(self._model)
+        self._table.verticalHeader().hide()
+        self._table.verticalHeader().setDefaultSectionSize(self._table.fontMetrics().height() + 6)
+        self._table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self._table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self._table.horizontalHeader().setStretchLastSection(True)
+        self._table.doubleClicked.connect(self.onTableDoubleClicked)
+        self._spinTimeout.setRange(100, 600000)
+        self._spinTimeout.setSingleStep(1000)
+        self._spinTimeout.setValue(5000)
+        self._spinTimeout.setSuffix(' ms')
+        self._btnRefresh.clicked.connect(self.refreshTabs)
+        self._btnCheckAll.clicked.connect(lambda: self._model.setAllChecked(True))
+        self._btnUncheckAll.clicked.connect(lambda: self._model.setAllChecked(False))
+        self._btnExport.clicked.connect(self.onClickBtnExport)
+        self._btnExport.setEnabled(False)
+        self._runner.sig_result.connect(self.onRunnerResult)
+        self._runner.sig_finished.connect(self.updateSummary)
+
+    def showEvent(self, a0: QShowEvent) -> None:
+        super().showEvent(a0)
+        if not self._runner.isRunning() and not self._runner.results():
+            self.refreshTabs()
+
+    def refreshTabs(self):
+        self._runner.clear()
+        windows: Dict[QWidget, int] = dict()
+        self._model.setRows([{
+            'widget': x,
+            'window': windows.setdefault(x.window(), len(windows) + 1),
+            'title': x.title(),
+            'url': x.url().toString(),
+            'status': None,
+            'value': None,
+            'latency_ms': None
+        } for x in self._tabs()])
+        self.updateSummary()
+
+    def run(self, script: str):
+        if self._model.rowCount() == 0:
+            self.refreshTabs()
+        # rows may be older than the tabs: only checked tabs which are still open are targets
+        tabs = set(self._tabs())
+        targets = [x for x in self._model.checkedWidgets() if x in tabs]
+        self._script = script
+        self._runner.run(script, targets, self._spinTimeout.value())
+        # the table shows the targets of the run (results are rows of the runner)
+        self._model.setRows(self._runner.results())
+        self.updateSummary()
+
+    def onTabClosed(self, widget: WebPageWidget):
+        self._runner.onTabClosed(widget)
+        self._model.setClosed(widget)
+        self.updateSummary()
+
+    def onRunnerResult(self, row: int):
+        if row < self._model.rowCount():
+            self._model.updateRow(row)
+
+    def updateSummary(self):
+        results = self._runner.results()
+        running = self._runner.isRunning()
+        counts: Dict[str, int] = dict()
+        for result in results:
+            counts[result['status']] = counts.get(result['status'], 0) + 1
+        text = ', '.join([f'{v} {k}' for k, v in sorted(counts.items())])
+        if results:
+            self._lblSummary.setText(('running: ' if running else 'done: ') + text)
+        else:
+            self._lblSummary.setText(f'{len(self._model.checkedWidgets())} tabs checked')
+        self._btnExport.setEnabled(bool(results) and not running)
+
+    def onTableDoubleClicked(self, index: QModelIndex):
+        row = self._model.row(index.row())
+        if row.get('status') in ['ok', 'error']:
+            self.sig_show_value.emit(row['value'])
+
+    def onClickBtnExport(self):
+        path, _ = QFileDialog.getSaveFileName(self, 'Export JSON', 'batch_result.json', 'JSON (*.json)')
+        if path:
+            with open(path, 'w', encoding='utf-8') as fp:
+                fp.write(self._runner.toJson(self._script))
@@ -4,12 +4,31 @@
 # Author       : Yogyui
 # Description  : Browser Bookmark Widget
 # -------------------------------------------------------------------------------------------------------------------- #
-import urllib.request
-from typing import List
+from typing import List, Dict, Union
+from bisect import bisect_right
 from functools import partial
-from PyQt5.QtCore import Qt, pyqtSignal, QSize, QObject
-from PyQt5.QtGui import QIcon, QPixmap
-from PyQt5.QtWidgets import QToolBar, QToolButton
+from urllib.parse import urlsplit, urlunsplit
+from PyQt5.QtCore import Qt, pyqtSignal, QSize, QObject, QEvent
+from PyQt5.QtGui import QIcon, QResizeEvent
+from PyQt5.QtWidgets import QToolBar, QToolButton, QMenu, QAction, QStyle
+from FaviconLoader import FaviconLoader
+from Resources import getIcon
+
+
+def normalizeUrl(url: str) -> str:
+    # scheme and host are case-insensitive, default ports and fragments do not change the page
+    try:
+        parts = urlsplit(url.strip())
+        scheme = parts.scheme.lower()
+        netloc = parts.netloc.lower()
+        if (scheme == 'http' and netloc.endswith(':80')) or (scheme == 'https' and netloc.endswith(':443')):
+            netloc = netloc.rsplit(':', 1)[0]
+        path = parts.path
+        if not path and netloc:
+            path = '/'
+        return urlunsplit((scheme, netloc, path, parts.query, ''))
+    except ValueError:
+        return url.strip()
 
 
 class BookMarkItem:
@@ -17,61 +36,433 @@ class BookMarkItem:
         self.url = url
         self.title = title
         self.icon_url = icon_url
+        self.parent: Union['BookMarkFolder', None] = None
+
+
+class BookMarkBlock:
+    # consecutive run of children of a folder
+    __slots__ = ('nodes',)
+
+    def __init__(self, nodes: list = None):
+        self.nodes = list() if nodes is None else nodes
+
+
+class BookMarkFolder:
+    # besides the flat 'children' list, children are kept in blocks of up to 2 * BLOCK_SIZE nodes with the start index
+    # of each block, so indexOf scans one block (and the block list) instead of all children: O(sqrt(n)) lookups,
+    # inserting or removing shifts the start of the following blocks only. a block below BLOCK_SIZE / 2 nodes is
+    # merged with a neighbour, so the block list stays short after many removals
+    BLOCK_SIZE = 512
+
+    def __init__(self, title: str):
+        self.title = title
+        self.parent: Union['BookMarkFolder', None] = None
+        self.children: List[Union[BookMarkItem, 'BookMarkFolder']] = list()
+        self._blocks: List[BookMarkBlock] = list()
+        self._starts: List[int] = list()
+        self._block_of: Dict[Union[BookMarkItem, 'BookMarkFolder'], BookMarkBlock] = dict()
+
+    def indexOf(self, node: Union[BookMarkItem, 'BookMarkFolder']) -> int:
+        block = self._block_of.get(node)
+        if block is None:
+            return -1
+        return self._starts[self._blocks.index(block)] + block.nodes.index(node)
+
+    def insert(self, index: int, node: Union[BookMarkItem, 'BookMarkFolder']) -> int:
+        node.parent = self
+        if index < 0 or index >= len(self.children):
+            index = len(self.children)
+            self.children.append(node)
+        else:
+            self.children.insert(index, node)
+        if not self._blocks:
+            self._blocks.append(BookMarkBlock())
+            self._starts.append(0)
+        pos = bisect_right(self._starts, index) - 1
+        block = self._blocks[pos]
+        block.nodes.insert(index - self._starts[pos], node)
+        self._block_of[node] = block
+        self.shiftStarts(pos + 1, 1)
+        self.splitBlock(pos)
+        return index
+
+    def pop(self, index: int) -> Union[BookMarkItem, 'BookMarkFolder']:
+        if index < 0:
+            index += len(self.children)
+        node = self.children.pop(index)
+        node.parent = None
+        pos = bisect_right(self._starts, index) - 1
+        block = self._block_of.pop(node)
+        del block.nodes[index - self._starts[pos]]
+        self.shiftStarts(pos + 1, -1)
+        if not block.nodes:
+            del self._blocks[pos]
+            del self._starts[pos]
+        elif len(block.nodes) < self.BLOCK_SIZE // 2 and len(self._blocks) > 1:
+            self.mergeBlocks(pos if pos + 1 < len(self._blocks) else pos - 1)
+        return node
+
+    def splitBlock(self, pos: int):
+        block = self._blocks[pos]
+        if len(block.nodes) >= 2 * self.BLOCK_SIZE:
+            tail = BookMarkBlock(block.nodes[self.BLOCK_SIZE:])
+            del block.nodes[self.BLOCK_SIZE:]
+            for child in tail.nodes:
+                self._block_of[child] = tail
+            self._blocks.insert(pos + 1, tail)
+            self._starts.insert(pos + 1, self._starts[pos] + self.BLOCK_SIZE)
+
+    def mergeBlocks(self, pos: int):
+        # block 'pos' takes the nodes of the next block, split again when too large
+        block, tail = self._blocks[pos], self._blocks.pop(pos + 1)
+        del self._starts[pos + 1]
+        for child in tail.nodes:
+            self._block_of[child] = block
+        block.nodes.extend(tail.nodes)
+        self.splitBlock(pos)
+
+    def shiftStarts(self, pos: int, delta: int):
+        starts = self._starts
+        for i in range(pos, len(starts)):
+            starts[i] += delta
+
+    def clear(self):
+        for node in self.children:
+            node.parent = None
+        self.children.clear()
+        self._blocks.clear()
+        self._starts.clear()
+        self._block_of.clear()
 
 
 class BookMarkManager(QObject):
+    # bookmarks are indexed by normalized url, so membership test, lookup and removal do not scan the tree.
+    # 'bookmarks' is the (ordered) children list of the root folder shown in the bookmark toolbar
     sig_changed = pyqtSignal()
+    sig_inserted = pyqtSignal(object, int, object)  # folder, index, node
+    sig_removed = pyqtSignal(object, int, object)  # folder, index, node
+    sig_moved = pyqtSignal(object, int, object, int)  # folder from, index from, folder to, index to
+    sig_reset = pyqtSignal()
 
     def __init__(self):
         super().__init__()
-        self.bookmarks: List[BookMarkItem] = list()
+        self.root = BookMarkFolder('')
+        self.bookmarks: List[Union[BookMarkItem, BookMarkFolder]] = self.root.children
+        self._index: Dict[str, BookMarkItem] = dict()
+        self._updating = 0
+
+    def beginUpdate(self):
+        # suppress per-node notifications (bulk loading), a single reset is emitted by endUpdate
+        self._updating += 1
+
+    def endUpdate(self):
+        self._updating = max(0, self._updating - 1)
+        if self._updating == 0:
+            self.sig_reset.emit()
+            self.sig_changed.emit()
 
     def urlList(self) -> List[str]:
-        return [x.url for x in self.bookmarks]
+        return [x.url for x in self._index.values()]
+
+    @staticmethod
+    def nodeUrls(node: Union[BookMarkItem, BookMarkFolder]) -> List[str]:
+        # urls of a bookmark or of every bookmark in a folder (nested folders too)
+        urls, stack = list(), [node]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, BookMarkFolder):
+                stack.extend(node.children)
+            else:
+                urls.append(node.url)
+        return urls
+
+    def count(self) -> int:
+        return len(self._index)
+
+    def isExist(self, url: str) -> bool:
+        return normalizeUrl(url) in self._index
 
-    def isExist(self, url: str):
-        return url in self.urlList()
+    def find(self, url: str) -> Union[BookMarkItem, None]:
+        return self._index.get(normalizeUrl(url))
 
-    def add(self, url: str, title: str, icon_url: str):
-        self.bookmarks.append(BookMarkItem(url, title, icon_url))
-        self.sig_changed.emit()
+    def add(self, url: str, title: str, icon_url: str,
+            folder: Union[BookMarkFolder, None] = None, index: int = -1) -> BookMarkItem:
+        key = normalizeUrl(url)
+        item = self._index.get(key)
+        if item is not None:
+            return item
+        item = BookMarkItem(url, title, icon_url)
+        self._index[key] = item
+        self.insertNode(item, folder, index)
+        return item
+
+    def addFolder(self, title: str, folder: Union[BookMarkFolder, None] = None, index: int = -1) -> BookMarkFolder:
+        node = BookMarkFolder(title)
+        self.insertNode(node, folder, index)
+        return node
+
+    def insertNode(self, node: Union[BookMarkItem, BookMarkFolder], folder: Union[BookMarkFolder, None], index: int):
+        folder = self.root if folder is None else folder
+        index = folder.insert(index, node)
+        if self._updating == 0:
+            self.sig_inserted.emit(folder, index, node)
+            self.sig_changed.emit()
 
     def remove(self, url: str):
-        find = list(filter(lambda x: x.url == url, self.bookmarks))
-        if len(find) >= 1:
-            self.bookmarks.remove(find[0])
-        self.sig_changed.emit()
+        item = self._index.get(normalizeUrl(url))
+        if item is not None:
+            self.removeNode(item)
+
+    def removeNode(self, node: Union[BookMarkItem, BookMarkFolder]):
+        folder = node.parent
+        if folder is None:
+            return
+        index = folder.indexOf(node)
+        if index < 0:
+            return
+        folder.pop(index)
+        self.unindex(node)
+        if self._updating == 0:
+            self.sig_removed.emit(folder, index, node)
+            self.sig_changed.emit()
+
+    def move(self, node: Union[BookMarkItem, BookMarkFolder], folder: Union[BookMarkFolder, None] = None,
+             index: int = -1):
+        folder_from = node.parent
+        folder_to = self.root if folder is None else folder
+        if folder_from is None:
+            return
+        parent = folder_to
+        while parent is not None:
+            if parent is node:
+                return  # can not move a folder into itself
+            parent = parent.parent
+        index_from = folder_from.indexOf(node)
+        folder_from.pop(index_from)
+        index_to = folder_to.insert(index, node)
+        if self._updating == 0:
+            self.sig_moved.emit(folder_from, index_from, folder_to, index_to)
+            self.sig_changed.emit()
+
+    def clear(self):
+        self.root.clear()
+        self._index.clear()
+        if self._updating == 0:
+            self.sig_reset.emit()
+            self.sig_changed.emit()
+
+    def unindex(self, node: Union[BookMarkItem, BookMarkFolder]):
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, BookMarkFolder):
+                stack.extend(node.children)
+            else:
+                key = normalizeUrl(node.url)
+                if self._index.get(key) is node:
+                    del self._index[key]
 
 
 class BookMarkToolBar(QToolBar):
+    # only bookmarks fitting in the toolbar width are created as buttons,
+    # the others are listed in the overflow (chevron) menu which is filled when it is shown
     sig_navitage = pyqtSignal(str)
+    sig_hover = pyqtSignal(str)  # mouse entered a bookmark button or menu item
 
-    def __init__(self, manager: BookMarkManager, parent=None):
+    def __init__(self, manager: BookMarkManager, parent=None, deferred: bool = False):
+        # deferred toolbar stays empty (and requests no favicons) until drawItems() is called
         super().__init__('Bookmark', parent=parent)
         stylesheet = "QToolBar {border: 0px; spacing: 0px;}"
         self.setStyleSheet(stylesheet)
         self._manager = manager
-        self._manager.sig_changed.connect(self.drawItems)
+        self._manager.sig_inserted.connect(self.onItemInserted)
+        self._manager.sig_removed.connect(self.onItemRemoved)
+        self._manager.sig_moved.connect(self.onItemMoved)
+        self._manager.sig_reset.connect(self.drawItems)
+        self._iconPlaceholder = getIcon('processing.png')
+        self._iconButtons: Dict[str, List[QToolButton]] = dict()
+        self._buttons: List[QToolButton] = list()
+        self._actions: List[QAction] = list()
+        self._widths: List[int] = list()
+        self._spare: Union[tuple, None] = None  # (node, button) measured but not fitting
+        self._loader: Union[FaviconLoader, None] = None
+        self._ready = False
+
+        self._menuOverflow = QMenu(self)
+        self._menuOverflow.aboutToShow.connect(self.onMenuOverflowAboutToShow)
+        self._btnOverflow = QToolButton()
+        self._btnOverflow.setText('\u00bb')
+        self._btnOverflow.setToolTip('More Bookmarks')
+        self._btnOverflow.setPopupMode(QToolButton.InstantPopup)
+        self._btnOverflow.setMenu(self._menuOverflow)
+        self._btnOverflow.setStyleSheet("QToolButton::menu-indicator {image: none;}")
+        self._actOverflow = self.addWidget(self._btnOverflow)
+        self._actOverflow.setVisible(False)
 
         self.setIconSize(QSize(18, 18))
-        self.drawItems()
+        if not deferred:
+            self.drawItems()
 
     def drawItems(self):
-        self.clear()
-        for item in self._manager.bookmarks:
-            try:
-                data = urllib.request.urlopen(item.icon_url).read()
-                pixmap = QPixmap()
-                pixmap.loadFromData(data)
-                icon = QIcon(pixmap)
-
-                btn = QToolButton()
-                btn.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
+        if self._loader is None:
+            self._loader = FaviconLoader.instance()
+            self._loader.sig_icon_loaded.connect(self.onIconLoaded)
+        self._ready = True
+        self.clearSpare()
+        for index in range(len(self._buttons) - 1, -1, -1):
+            self.removeButton(index)
+        self.fitButtons()
+
+    def createButton(self, node: Union[BookMarkItem, BookMarkFolder]) -> QToolButton:
+        btn = QToolButton()
+        btn.setToolButtonStyle(Qt.ToolButtonTextBesideIcon)
+        btn.setText(node.title)
+        btn.setToolTip(node.title)
+        btn.setIcon(self.itemIcon(node))
+        if isinstance(node, BookMarkFolder):
+            menu = QMenu(btn)
+            menu.aboutToShow.connect(partial(self.populateMenu, menu, node.children))
+            btn.setMenu(menu)
+            btn.setPopupMode(QToolButton.InstantPopup)
+        else:
+            btn.setProperty('icon_url', node.icon_url)
+            btn.setProperty('url', node.url)
+            btn.clicked.connect(partial(self.sig_navitage.emit, node.url))
+            btn.installEventFilter(self)
+        return btn
+
+    def eventFilter(self, a0: QObject, a1: QEvent) -> bool:
+        if a1.type() == QEvent.Enter and isinstance(a0, QToolButton) and a0.property('url'):
+            self.sig_hover.emit(a0.property('url'))
+        return super().eventFilter(a0, a1)
+
+    def itemIcon(self, item: Union[BookMarkItem, BookMarkFolder], fetch: bool = True) -> QIcon:
+        # menu entries (fetch=False) use the cached icon only, favicons are downloaded for toolbar buttons
+        if isinstance(item, BookMarkFolder):
+            return self.style().standardIcon(QStyle.SP_DirIcon)
+        if not item.icon_url:
+            return QIcon()
+        icon = self._loader.icon(item.icon_url, revalidate=fetch)
+        if icon is None:
+            if fetch:
+                self._loader.request(item.icon_url)
+            return self._iconPlaceholder
+        return icon
+
+    def insertButton(self, index: int, btn: QToolButton):
+        if index < len(self._actions):
+            action = self.insertWidget(self._actions[index], btn)
+        else:
+            action = self.insertWidget(self._actOverflow, btn)
+        self._buttons.insert(index, btn)
+        self._actions.insert(index, action)
+        self._widths.insert(index, btn.sizeHint().width())
+        icon_url = btn.property('icon_url')
+        if icon_url:
+            # the icon may have been loaded since the button was created (spare button of fitButtons)
+            icon = self._loader.icon(icon_url, revalidate=False)
+            if icon is not None:
                 btn.setIcon(icon)
-                btn.setText(item.title)
-                btn.setToolTip(item.title)
-                btn.clicked.connect(partial(self.sig_navitage.emit, item.url))
+            if icon_url not in self._iconButtons:
+                self._iconButtons[icon_url] = list()
+            self._iconButtons[icon_url].append(btn)
+
+    def removeButton(self, index: int):
+        btn = self._buttons.pop(index)
+        action = self._actions.pop(index)
+        self._widths.pop(index)
+        self.removeAction(action)
+        action.deleteLater()
+        btn.deleteLater()
+        buttons = self._iconButtons.get(btn.property('icon_url'), [])
+        if btn in buttons:
+            buttons.remove(btn)
+
+    def availableWidth(self) -> int:
+        margins = self.layout().contentsMargins()
+        width = self.width() - margins.left() - margins.right()
+        if self.isMovable():
+            width -= self.style().pixelMetric(QStyle.PM_ToolBarHandleExtent, None, self)
+        return width
+
+    def fitButtons(self):
+        if not self._ready:
+            return
+        bookmarks = self._manager.bookmarks
+        available = self.availableWidth()
+        overflow_width = self._btnOverflow.sizeHint().width()
+        used = sum(self._widths)
+        while self._buttons:
+            limit = available if len(self._buttons) == len(bookmarks) else available - overflow_width
+            if used <= limit:
+                break
+            used -= self._widths[-1]
+            self.removeButton(len(self._buttons) - 1)
+        while len(self._buttons) < len(bookmarks):
+            index = len(self._buttons)
+            node = bookmarks[index]
+            if self._spare is not None and self._spare[0] is node:
+                btn = self._spare[1]
+            else:
+                self.clearSpare()
+                btn = self.createButton(node)
+            width = btn.sizeHint().width()
+            limit = available if index == len(bookmarks) - 1 else available - overflow_width
+            if used + width > limit:
+                self._spare = (node, btn)
+                break
+            self._spare = None
+            self.insertButton(index, btn)
+            used += width
+        self._actOverflow.setVisible(len(self._buttons) < len(bookmarks))
+
+    def clearSpare(self):
+        if self._spare is not None:
+            self._spare[1].deleteLater()
+            self._spare = None
+
+    def onItemInserted(self, folder: BookMarkFolder, index: int, node: Union[BookMarkItem, BookMarkFolder]):
+        if folder is not self._manager.root:
+            return  # nested nodes are shown in folder menus which are filled when shown
+        if index < len(self._buttons):
+            self.insertButton(index, self.createButton(node))
+        self.fitButtons()
+
+    def onItemRemoved(self, folder: BookMarkFolder, index: int, _: Union[BookMarkItem, BookMarkFolder]):
+        if folder is not self._manager.root:
+            return
+        if index < len(self._buttons):
+            self.removeButton(index)
+        self.fitButtons()
+
+    def onItemMoved(self, folder_from: BookMarkFolder, index_from: int, folder_to: BookMarkFolder, index_to: int):
+        root = self._manager.root
+        if folder_from is root and index_from < len(self._buttons):
+            self.removeButton(index_from)
+        if folder_to is root and index_to < len(self._buttons):
+            self.insertButton(index_to, self.createButton(root.children[index_to]))
+        self.fitButtons()
+
+    def onMenuOverflowAboutToShow(self):
+        self.populateMenu(self._menuOverflow, self._manager.bookmarks[len(self._buttons):])
+
+    def populateMenu(self, menu: QMenu, nodes: List[Union[BookMarkItem, BookMarkFolder]]):
+        menu.clear()
+        for submenu in menu.findChildren(QMenu, options=Qt.FindDirectChildrenOnly):
+            submenu.deleteLater()
+        for node in nodes:
+            if isinstance(node, BookMarkFolder):
+                submenu = menu.addMenu(self.itemIcon(node, fetch=False), node.title)
+                submenu.aboutToShow.connect(partial(self.populateMenu, submenu, node.children))
+            else:
+                action = menu.addAction(self.itemIcon(node, fetch=False), node.title)
+                action.triggered.connect(partial(self.sig_navitage.emit, node.url))
+                action.hovered.connect(partial(self.sig_hover.emit, node.url))
+
+    def onIconLoaded(self, icon_url: str, icon: QIcon):
+        for btn in self._iconButtons.pop(icon_url, []):
+            btn.setIcon(icon)
 
-                self.addWidget(btn)
-            except Exception:
-                pass
+    def resizeEvent(self, a0: QResizeEvent) -> None:
+        super().resizeEvent(a0)
+        self.fitButtons()
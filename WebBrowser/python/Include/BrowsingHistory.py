@@ -0,0 +1,357 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : BrowsingHistory.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Global browsing history (sqlite, full-text search over url and title) and history view
+# -------------------------------------------------------------------------------------------------------------------- #
+import os
+import re
+import time
+import sqlite3
+import threading
+from typing import List, Tuple, Union
+from PyQt5.QtCore import Qt, QTimer, QModelIndex, QAbstractTableModel, QDateTime, pyqtSignal
+from PyQt5.QtWidgets import QWidget, QLineEdit, QTableView, QPushButton, QLabel, QHeaderView, QAbstractItemView
+from PyQt5.QtWidgets import QVBoxLayout, QHBoxLayout, QMessageBox
+from Common import ensurePathExist
+from WriteBehind import WriteBehindSaver
+from UrlCompleter import RECORDED_SCHEMES
+
+TOKEN_SPLIT = re.compile(r'[\W_]+')
+
+
+class HistoryStore:
+    # one row per url (latest title, visit count, last visit) and one row per visit. 'seq' of a url is renewed on
+    # every visit and is the rowid of its fts5 entry (url and title, external content kept in sync by triggers),
+    # so matches come out of the full-text index latest first and a page stops after 'limit' rows, however common
+    # the words are. visits are queued on the GUI thread and inserted in a single transaction by commit() on the
+    # write-behind worker thread; visits older than 'retention_days' are expired there too (at start and every
+    # 'expire_interval' seconds). searches use a separate connection (WAL: readers are not blocked by the writer)
+    _instance: Union['HistoryStore', None] = None
+    retention_days: int = 90
+    expire_interval: int = 6 * 3600
+
+    def __init__(self, path: str):
+        self._path = path
+        ensurePathExist(os.path.dirname(path))
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        with self._conn:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS urls ('
+                'id INTEGER PRIMARY KEY, url TEXT NOT NULL UNIQUE, title TEXT NOT NULL DEFAULT \'\', '
+                'visit_count INTEGER NOT NULL DEFAULT 0, last_visit REAL NOT NULL DEFAULT 0, '
+                'seq INTEGER NOT NULL UNIQUE)')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS urls_last_visit ON urls (last_visit)')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS visits ('
+                'id INTEGER PRIMARY KEY, url_id INTEGER NOT NULL, time REAL NOT NULL)')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS visits_time ON visits (time)')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS visits_url ON visits (url_id)')
+        self.fts = self.createFtsIndex()
+        self._read_conn: Union[sqlite3.Connection, None] = None
+        self._lock = threading.Lock()
+        self._pending: List[tuple] = list()
+        self._last_expire = 0.
+        self._saver = WriteBehindSaver(self.snapshot)
+        self._saver.markDirty()  # expire at start
+
+    def createFtsIndex(self) -> bool:
+        # sqlite without fts5: searches fall back to LIKE
+        try:
+            with self._conn:
+                self._conn.execute(
+                    'CREATE VIRTUAL TABLE IF NOT EXISTS urls_fts USING fts5('
+                    'url, title, content=\'urls\', content_rowid=\'seq\', prefix=\'2 3\')')
+                self._conn.execute(
+                    'CREATE TRIGGER IF NOT EXISTS urls_ai AFTER INSERT ON urls BEGIN '
+                    'INSERT INTO urls_fts (rowid, url, title) VALUES (new.seq, new.url, new.title); END')
+                self._conn.execute(
+                    'CREATE TRIGGER IF NOT EXISTS urls_ad AFTER DELETE ON urls BEGIN '
+                    'INSERT INTO urls_fts (urls_fts, rowid, url, title) VALUES '
+                    '(\'delete\', old.seq, old.url, old.title); END')
+                self._conn.execute(
+                    'CREATE TRIGGER IF NOT EXISTS urls_au AFTER UPDATE OF title, seq ON urls BEGIN '
+                    'INSERT INTO urls_fts (urls_fts, rowid, url, title) VALUES '
+                    '(\'delete\', old.seq, old.url, old.title); '
+                    'INSERT INTO urls_fts (rowid, url, title) VALUES (new.seq, new.url, new.title); END')
+            return True
+        except sqlite3.OperationalError:
+            return False
+
+    @classmethod
+    def instance(cls) -> 'HistoryStore':
+        if cls._instance is None:
+            curpath = os.path.dirname(os.path.abspath(__file__))
+            cls._instance = HistoryStore(os.path.join(os.path.dirname(curpath), 'Config', 'history.db'))
+        return cls._instance
+
+    def addVisit(self, url: str, title: str = '', when: Union[float, None] = None):
+        if not url.startswith(RECORDED_SCHEMES):
+            return
+        self.queue(('visit', url, title, time.time() if when is None else when))
+
+    def setTitle(self, url: str, title: str):
+        if title and url.startswith(RECORDED_SCHEMES):
+            self.queue(('title', url, title))
+
+    def remove(self, urls: List[str]):
+        for url in urls:
+            self.queue(('remove', url))
+
+    def clear(self):
+        self.queue(('clear', ))
+
+    def queue(self, op: tuple):
+        with self._lock:
+            self._pending.append(op)
+        self._saver.markDirty()
+
+    def pendingCount(self) -> int:
+        return len(self._pending)
+
+    def snapshot(self):
+        return self.commit
+
+    def flush(self, wait: bool = False):
+        self._saver.flush(wait=wait)
+
+    def commit(self):
+        with self._lock:
+            pending, self._pending = self._pending, list()
+        expire = time.time() - self._last_expire > self.expire_interval
+        if not pending and not expire:
+            return
+        with self._conn:
+            for op in pending:
+                if op[0] == 'visit':
+                    _, url, title, when = op
+                    self._conn.execute(
+                        'INSERT INTO urls (url, title, visit_count, last_visit, seq) '
+                        'VALUES (?, ?, 1, ?, (SELECT IFNULL(MAX(seq), 0) + 1 FROM urls)) '
+                        'ON CONFLICT (url) DO UPDATE SET visit_count = visit_count + 1, '
+                        'last_visit = max(last_visit, excluded.last_visit), seq = excluded.seq, '
+                        'title = CASE WHEN excluded.title != \'\' THEN excluded.title ELSE title END',
+                        (url, title, when))
+                    self._conn.execute(
+                        'INSERT INTO visits (url_id, time) SELECT id, ? FROM urls WHERE url = ?', (when, url))
+                elif op[0] == 'title':
+                    self._conn.execute('UPDATE urls SET title = ? WHERE url = ? AND title != ?', (op[2], op[1], op[2]))
+                elif op[0] == 'remove':
+                    self._conn.execute(
+                        'DELETE FROM visits WHERE url_id = (SELECT id FROM urls WHERE url = ?)', (op[1], ))
+                    self._conn.execute('DELETE FROM urls WHERE url = ?', (op[1], ))
+                elif op[0] == 'clear':
+                    self._conn.execute('DELETE FROM visits')
+                    self._conn.execute('DELETE FROM urls')
+            if expire:
+                self._last_expire = time.time()
+                self.expire(self._last_expire - self.retention_days * 86400)
+
+    def expire(self, before: float):
+        # urls visited only before 'before' are removed, visit counts of the others are recounted
+        self._conn.execute(
+            'UPDATE urls SET visit_count = (SELECT COUNT(*) FROM visits WHERE url_id = urls.id AND time >= ?) '
+            'WHERE id IN (SELECT DISTINCT url_id FROM visits WHERE time < ?) AND last_visit >= ?',
+            (before, before, before))
+        self._conn.execute('DELETE FROM visits WHERE time < ?', (before, ))
+        self._conn.execute('DELETE FROM urls WHERE last_visit < ?', (before, ))
+
+    def close(self):
+        self._saver.stop()
+        self._conn.close()
+        if self._read_conn is not None:
+            self._read_conn.close()
+            self._read_conn = None
+
+    def readConnection(self) -> sqlite3.Connection:
+        # used by the GUI thread only
+        if self._read_conn is None:
+            self._read_conn = sqlite3.connect(self._path)
+        return self._read_conn
+
+    def matchExpression(self, text: str) -> str:
+        # every word as a prefix: 'git hub' -> '"git"* "hub"*'
+        tokens = [x for x in TOKEN_SPLIT.split(text) if x]
+        return ' '.join(f'"{x}"*' for x in tokens)
+
+    def search(self, text: str, limit: int = 200,
+               after: Union[int, None] = None) -> List[Tuple[int, str, str, float, int]]:
+        # rows (seq, url, title, last_visit, visit_count), latest first. 'after' is seq of the last row of the
+        # previous page (keyset paging: the cost of a page does not grow with its depth)
+        conn = self.readConnection()
+        expression = self.matchExpression(text) if self.fts else ''
+        if expression:
+            sql = 'SELECT u.seq, u.url, u.title, u.last_visit, u.visit_count FROM urls_fts ' \
+                  'JOIN urls u ON u.seq = urls_fts.rowid WHERE urls_fts MATCH ?'
+            params = [expression]
+            if after is not None:
+                sql += ' AND urls_fts.rowid < ?'
+                params.append(after)
+            sql += ' ORDER BY urls_fts.rowid DESC LIMIT ?'
+        else:
+            where, params = list(), list()
+            if after is not None:
+                where.append('seq < ?')
+                params.append(after)
+            if not self.fts:
+                for token in text.split():
+                    where.append('(url LIKE ? OR title LIKE ?)')
+                    params.extend([f'%{token}%'] * 2)
+            sql = 'SELECT seq, url, title, last_visit, visit_count FROM urls'
+            if where:
+                sql += ' WHERE ' + ' AND '.join(where)
+            sql += ' ORDER BY seq DESC LIMIT ?'
+        params.append(limit)
+        return conn.execute(sql, params).fetchall()
+
+    def visitCount(self) -> int:
+        return self.readConnection().execute('SELECT COUNT(*) FROM visits').fetchone()[0]
+
+
+class HistoryModel(QAbstractTableModel):
+    # rows of the current search, fetched 'page_size' at a time while scrolling (fetchMore)
+    columns = ['Title', 'URL', 'Last Visit', 'Visits']
+    page_size: int = 200
+
+    def __init__(self, store: HistoryStore, parent=None):
+        super().__init__(parent=parent)
+        self._store = store
+        self._text = ''
+        self._rows: List[Tuple[int, str, str, float, int]] = list()
+        self._done = True
+
+    def setSearchText(self, text: str):
+        self.beginResetModel()
+        self._text = text
+        self._rows = self._store.search(text, self.page_size)
+        self._done = len(self._rows) < self.page_size
+        self.endResetModel()
+
+    def refresh(self):
+        self.setSearchText(self._text)
+
+    def url(self, row: int) -> str:
+        return self._rows[row][1]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.columns)
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        return not parent.isValid() and not self._done
+
+    def fetchMore(self, parent: QModelIndex):
+        rows = self._store.search(self._text, self.page_size, after=self._rows[-1][0])
+        self._done = len(rows) < self.page_size
+        if rows:
+            self.beginInsertRows(QModelIndex(), len(self._rows), len(self._rows) + len(rows) - 1)
+            self._rows.extend(rows)
+            self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        _, url, title, last_visit, visit_count = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return title or url
+            elif column == 1:
+                return url
+            elif column == 2:
+                return QDateTime.fromMSecsSinceEpoch(int(last_visit * 1000)).toString('yyyy-MM-dd hh:mm:ss')
+            return str(visit_count)
+        elif role == Qt.ToolTipRole and column < 2:
+            return url if column == 1 else title
+        elif role == Qt.TextAlignmentRole and column == 3:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.columns[section]
+        return None
+
+
+class HistoryWidget(QWidget):
+    # search is run shortly after typing stops and does not wait for the writer: queued visits are written when the
+    # view is opened (reload). double click opens the url (sig_navigate)
+    sig_navigate = pyqtSignal(str)
+
+    def __init__(self, store: Union[HistoryStore, None] = None, parent=None):
+        super().__init__(parent=parent)
+        self._store = HistoryStore.instance() if store is None else store
+        self._model = HistoryModel(self._store, self)
+        self._editSearch = QLineEdit()
+        self._table = QTableView()
+        self._btnDelete = QPushButton('Delete')
+        self._btnClear = QPushButton('Clear All')
+        self._lblStatus = QLabel()
+        self._timer = QTimer(self)
+        self.initControl()
+        self.initLayout()
+        self.setWindowTitle('History')
+
+    def initLayout(self):
+        vbox = QVBoxLayout(self)
+        vbox.setContentsMargins(4, 4, 4, 4)
+        vbox.setSpacing(4)
+        vbox.addWidget(self._editSearch)
+        vbox.addWidget(self._table)
+        hbox = QHBoxLayout()
+        hbox.setContentsMargins(0, 0, 0, 0)
+        hbox.setSpacing(4)
+        hbox.addWidget(self._lblStatus)
+        hbox.addStretch()
+        hbox.addWidget(self._btnDelete)
+        hbox.addWidget(self._btnClear)
+        vbox.addLayout(hbox)
+
+    def initControl(self):
+        self._editSearch.setPlaceholderText('Search history')
+        self._editSearch.setClearButtonEnabled(True)
+        self._editSearch.textChanged.connect(lambda: self._timer.start())
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(150)
+        self._timer.timeout.connect(self.refresh)
+        self._table.setModel(self._model)
+        self._table.verticalHeader().hide()
+        self._table.verticalHeader().setDefaultSectionSize(self._table.fontMetrics().height() + 6)
+        self._table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self._table.setWordWrap(False)
+        header = self._table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setStretchLastSection(False)
+        header.resizeSection(0, 300)
+        header.resizeSection(1, 400)
+        self._table.doubleClicked.connect(lambda x: self.sig_navigate.emit(self._model.url(x.row())))
+        self._btnDelete.clicked.connect(self.deleteSelected)
+        self._btnClear.clicked.connect(self.clearAll)
+
+    def reload(self):
+        # queued visits (and removals) are written first, so the latest navigations are listed
+        self._store.flush(wait=True)
+        self.refresh()
+
+    def refresh(self):
+        self._timer.stop()
+        start = time.perf_counter()
+        self._model.setSearchText(self._editSearch.text())
+        elapsed = (time.perf_counter() - start) * 1000
+        self._lblStatus.setText(f'{self._model.rowCount()}{"+" if self._model.canFetchMore(QModelIndex()) else ""} '
+                                f'entries ({elapsed:.0f} ms)')
+
+    def deleteSelected(self):
+        rows = self._table.selectionModel().selectedRows()
+        self._store.remove([self._model.url(x.row()) for x in rows])
+        self.reload()
+
+    def clearAll(self):
+        if QMessageBox.question(self, 'History', 'Clear all browsing history?') == QMessageBox.Yes:
+            self._store.clear()
+            self.reload()
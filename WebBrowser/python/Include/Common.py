@@ -1,9 +1,16 @@
 import os
 import _io
 import shutil
+import hashlib
+import tempfile
+from typing import Union
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QAction
 import xml.etree.ElementTree as ElementTree
+from xml.sax.saxutils import escape
+
+UMASK = os.umask(0)
+os.umask(UMASK)
 
 
 def makeQAction(**kwargs):
@@ -42,6 +49,26 @@ def makeQAction(**kwargs):
     return action
 
 
+def readProcessRss(pid: int) -> int:
+    # resident set size (bytes) of process, 0 if not available (linux procfs only)
+    try:
+        with open('/proc/%d/statm' % pid, 'r') as fp:
+            return int(fp.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return 0
+
+
+def readProcessCpuTime(pid: int) -> float:
+    # user + system cpu time (seconds) of process, 0 if not available (linux procfs only)
+    try:
+        with open('/proc/%d/stat' % pid, 'r') as fp:
+            # command name (2nd field) may contain spaces, fields after it are fixed
+            fields = fp.read().rsplit(')', 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf('SC_CLK_TCK')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return 0.
+
+
 def ensurePathExist(path: str):
     targetpath = os.path.abspath(path)
     if not os.path.isdir(targetpath):
@@ -59,56 +86,134 @@ def ensurePathExist(path: str):
                 os.mkdir(ptemp)
 
 
+def escapeXmlText(text: str) -> str:
+    return escape(text)
+
+
+def escapeXmlAttribute(value: str) -> str:
+    return escape(value, {'"': '&quot;', '\n': '&#10;', '\r': '&#13;', '\t': '&#9;'})
+
+
+def iterXmlChunks(elem: ElementTree.Element, level: int = 0):
+    # depth-first walk with an explicit stack of child iterators (no recursion, memory grows with depth only)
+    stack = list()
+    node = elem
+    while True:
+        line = '\t' * (level + len(stack)) + '<' + node.tag
+        for key, value in node.items():
+            line += ' ' + key + '="' + escapeXmlAttribute(value) + '"'
+        if len(node) > 0:
+            yield line + '>\n'
+            stack.append((node, iter(node)))
+        else:
+            txt = node.text
+            if txt is not None:
+                txt = txt.replace('\r', '').replace('\n', '').replace('\t', '')
+            if txt:
+                yield line + '>' + escapeXmlText(txt) + '</' + node.tag + '>\n'
+            else:
+                yield line + '/>\n'
+        while stack:
+            parent, children = stack[-1]
+            node = next(children, None)
+            if node is not None:
+                break
+            stack.pop()
+            yield '\t' * (level + len(stack)) + '</' + parent.tag + '>\n'
+        else:
+            return
+
+
+def hashFile(path: str, chunk_size: int = 1 << 16) -> Union[bytes, None]:
+    try:
+        digest = hashlib.sha1()
+        with open(path, 'rb') as fp:
+            while True:
+                data = fp.read(chunk_size)
+                if not data:
+                    break
+                digest.update(data)
+        return digest.digest()
+    except OSError:
+        return None
+
+
 def writeXmlFile(
         elem: ElementTree.Element,
         path: str = '',
         fp: _io.TextIOWrapper = None,
         level: int = 0,
-        backup: bool = True
+        backup: bool = True,
+        buffer_size: int = 1 << 16
 ):
-    if fp is None:
-        dir_name = os.path.dirname(os.path.abspath(path))
-        ensurePathExist(dir_name)
-        if backup and os.path.isfile(path):
+    if fp is not None:
+        for chunk in iterXmlChunks(elem, level):
+            fp.write(chunk)
+        return
+
+    # serialize into a temporary file next to the target (hashing while writing), then replace the target atomically.
+    # the content hash is compared with the current file before anything is synced, so unchanged trees cost no fsync
+    path = os.path.abspath(path)
+    dir_name = os.path.dirname(path)
+    ensurePathExist(dir_name)
+    temp_fd, temp_path = tempfile.mkstemp(prefix='.' + os.path.basename(path) + '.', suffix='.tmp', dir=dir_name)
+    try:
+        digest = hashlib.sha1()
+        exists = os.path.isfile(path)
+        with os.fdopen(temp_fd, 'wb') as _fp:
+            pending = ['<?xml version="1.0" encoding="UTF-8" standalone="no"?>' + '\n']
+            pending_len = 0
+            for chunk in iterXmlChunks(elem):
+                pending.append(chunk)
+                pending_len += len(chunk)
+                if pending_len >= buffer_size:
+                    data = ''.join(pending).encode('utf-8')
+                    digest.update(data)
+                    _fp.write(data)
+                    pending.clear()
+                    pending_len = 0
+            data = ''.join(pending).encode('utf-8')
+            digest.update(data)
+            _fp.write(data)
+            _fp.flush()
+            unchanged = exists and hashFile(path) == digest.digest()
+            if not unchanged:
+                # mkstemp creates the file with mode 0600: keep the mode of the replaced file (default mode if new)
+                try:
+                    if exists:
+                        shutil.copymode(path, temp_path)
+                    else:
+                        os.chmod(temp_path, 0o666 & ~UMASK)
+                except OSError:
+                    pass
+                os.fsync(_fp.fileno())
+
+        if unchanged:
+            os.remove(temp_path)
+            return
+        if exists and backup:
             try:
-                origin_data = ElementTree.parse(path)
-                origin_root = origin_data.getroot()
-                if ElementTree.tostring(origin_root) != ElementTree.tostring(elem):
-                    backup_path = os.path.join(dir_name, 'Backup')
-                    if not os.path.isdir(backup_path):
-                        os.mkdir(backup_path)
-                    origin_file_name = os.path.basename(path)
-                    origin_name, origin_ext = os.path.splitext(origin_file_name)
-                    backup_file_name = origin_name + '_backup' + origin_ext
-                    backup_file_path = os.path.join(backup_path, backup_file_name)
-                    shutil.copyfile(path, backup_file_path)
+                backup_path = os.path.join(dir_name, 'Backup')
+                if not os.path.isdir(backup_path):
+                    os.mkdir(backup_path)
+                origin_name, origin_ext = os.path.splitext(os.path.basename(path))
+                backup_file_path = os.path.join(backup_path, origin_name + '_backup' + origin_ext)
+                shutil.copyfile(path, backup_file_path)
             except Exception:
                 pass
-        _fp = open(path, 'w', encoding='utf-8')
-        _fp.write('<?xml version="1.0" encoding="UTF-8" standalone="no"?>' + '\n')
-    else:
-        _fp = fp
-    _fp.write('\t' * level)
-    _fp.write('<' + elem.tag)
-    for key in elem.keys():
-        fp.write(' ' + key + '="' + elem.attrib[key] + '"')
-    if len(list(elem)) > 0:
-        _fp.write('>\n')
-        for child in list(elem):
-            writeXmlFile(child, fp=_fp, level=level+1)
-        _fp.write('\t' * level)
-        _fp.write('</' + elem.tag + '>\n')
-    else:
-        if elem.text is not None:
-            txt = elem.text
-            txt = txt.replace('\r', '')
-            txt = txt.replace('\n', '')
-            txt = txt.replace('\t', '')
-            if len(txt) > 0:
-                _fp.write('>' + txt + '</' + elem.tag + '>\n')
-            else:
-                _fp.write('/>\n')
-        else:
-            _fp.write('/>\n')
-    if level == 0:
-        _fp.close()
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    if os.name != 'nt':
+        try:
+            dir_fd = os.open(dir_name, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError:
+            pass
@@ -5,20 +5,255 @@
 # Description  : Configuration Web Browser
 # -------------------------------------------------------------------------------------------------------------------- #
 import os
+import sqlite3
+import threading
 import xml.etree.ElementTree as ET
-from BookMarkWidget import BookMarkManager
-from Common import writeXmlFile
+from functools import partial
+from typing import Union, Dict, List, Callable
+from BookMarkWidget import BookMarkManager, BookMarkFolder, BookMarkItem
+from Common import writeXmlFile, ensurePathExist
+from WriteBehind import WriteBehindSaver
+
+
+class SqliteConfigStore:
+    # settings are key-value rows, bookmarks are one row per node (parent 0 is the root folder).
+    # changes are queued as a few single-row statements (row ids are assigned here) and executed in a single
+    # transaction by commit(), which is called from the write-behind worker thread
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        with self._conn:
+            self._conn.execute('CREATE TABLE IF NOT EXISTS settings (key TEXT PRIMARY KEY, value TEXT)')
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS bookmarks ('
+                'id INTEGER PRIMARY KEY, parent INTEGER NOT NULL, position INTEGER NOT NULL, '
+                'is_folder INTEGER NOT NULL, title TEXT, url TEXT, icon_url TEXT)')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS bookmarks_parent ON bookmarks (parent, position)')
+        self._db_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending: List[tuple] = list()
+        self._ids: Dict[Union[BookMarkItem, BookMarkFolder], int] = dict()
+        row = self._conn.execute('SELECT MAX(id) FROM bookmarks').fetchone()
+        self._next_id = (row[0] or 0) + 1
+
+    def close(self):
+        with self._db_lock:
+            self._conn.close()
+
+    def execute(self, sql: str, params: tuple = ()):
+        with self._pending_lock:
+            self._pending.append((sql, params, False))
+
+    def executemany(self, sql: str, params: List[tuple]):
+        with self._pending_lock:
+            self._pending.append((sql, params, True))
+
+    def hasPending(self) -> bool:
+        return len(self._pending) > 0
+
+    def commit(self):
+        with self._pending_lock:
+            pending, self._pending = self._pending, list()
+        if not pending:
+            return
+        with self._db_lock, self._conn:
+            for sql, params, many in pending:
+                if many:
+                    self._conn.executemany(sql, params)
+                else:
+                    self._conn.execute(sql, params)
+
+    def value(self, key: str, default: Union[str, None] = None) -> Union[str, None]:
+        with self._db_lock:
+            row = self._conn.execute('SELECT value FROM settings WHERE key = ?', (key, )).fetchone()
+        return default if row is None else row[0]
+
+    def setValue(self, key: str, value: str):
+        self.execute('INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)', (key, value))
+
+    def values(self, prefix: str) -> Dict[str, str]:
+        with self._db_lock:
+            rows = self._conn.execute(
+                'SELECT key, value FROM settings WHERE substr(key, 1, ?) = ?', (len(prefix), prefix)).fetchall()
+        return {key[len(prefix):]: value for key, value in rows}
+
+    def loadBookmarks(self, manager: BookMarkManager):
+        with self._db_lock:
+            rows = self._conn.execute(
+                'SELECT id, parent, is_folder, title, url, icon_url FROM bookmarks ORDER BY parent, position'
+            ).fetchall()
+        children: Dict[int, List[tuple]] = dict()
+        for row in rows:
+            children.setdefault(row[1], list()).append(row)
+        self._ids.clear()
+        manager.beginUpdate()
+        try:
+            stack = [(0, None)]
+            while stack:
+                parent_id, folder = stack.pop()
+                for node_id, _, is_folder, title, url, icon_url in children.get(parent_id, []):
+                    if is_folder:
+                        node = manager.addFolder(title or '', folder)
+                        stack.append((node_id, node))
+                    else:
+                        node = manager.add(url or '', title or '', icon_url or '', folder)
+                    self._ids[node] = node_id
+        finally:
+            manager.endUpdate()
+
+    def saveBookmarks(self, root: BookMarkFolder):
+        self._ids.clear()
+        self.execute('DELETE FROM bookmarks')
+        for index, node in enumerate(root.children):
+            self.writeNode(0, index, node)
+
+    def writeNode(self, parent_id: int, position: int, node: Union[BookMarkItem, BookMarkFolder]):
+        rows = list()
+        stack = [(parent_id, position, node)]
+        while stack:
+            parent_id, position, node = stack.pop()
+            node_id = self._next_id
+            self._next_id += 1
+            self._ids[node] = node_id
+            if isinstance(node, BookMarkFolder):
+                rows.append((node_id, parent_id, position, 1, node.title, None, None))
+                stack.extend([(node_id, i, x) for i, x in enumerate(node.children)])
+            else:
+                rows.append((node_id, parent_id, position, 0, node.title, node.url, node.icon_url))
+        self.executemany(
+            'INSERT INTO bookmarks (id, parent, position, is_folder, title, url, icon_url) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+
+    def folderId(self, folder: BookMarkFolder) -> int:
+        return self._ids.get(folder, 0)
+
+    def onNodeInserted(self, folder: BookMarkFolder, index: int, node: Union[BookMarkItem, BookMarkFolder]):
+        parent_id = self.folderId(folder)
+        if index < len(folder.children) - 1:
+            self.execute(
+                'UPDATE bookmarks SET position = position + 1 WHERE parent = ? AND position >= ?', (parent_id, index))
+        self.writeNode(parent_id, index, node)
+
+    def onNodeRemoved(self, folder: BookMarkFolder, index: int, node: Union[BookMarkItem, BookMarkFolder]):
+        parent_id = self.folderId(folder)
+        ids = list()
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            node_id = self._ids.pop(node, None)
+            if node_id is not None:
+                ids.append((node_id, ))
+            if isinstance(node, BookMarkFolder):
+                stack.extend(node.children)
+        self.executemany('DELETE FROM bookmarks WHERE id = ?', ids)
+        if index < len(folder.children):
+            self.execute(
+                'UPDATE bookmarks SET position = position - 1 WHERE parent = ? AND position > ?', (parent_id, index))
+
+    def onNodeMoved(self, folder_from: BookMarkFolder, index_from: int, folder_to: BookMarkFolder, index_to: int):
+        node = folder_to.children[index_to]
+        node_id = self._ids.get(node)
+        if node_id is None:
+            return
+        parent_from, parent_to = self.folderId(folder_from), self.folderId(folder_to)
+        self.execute(
+            'UPDATE bookmarks SET position = position - 1 WHERE parent = ? AND position > ?', (parent_from, index_from))
+        self.execute(
+            'UPDATE bookmarks SET position = position + 1 WHERE parent = ? AND position >= ?', (parent_to, index_to))
+        self.execute('UPDATE bookmarks SET parent = ?, position = ? WHERE id = ?', (parent_to, index_to, node_id))
 
 
 class WebBrowserConfig:
-    def __init__(self, bookmarkManager: BookMarkManager):
+    backend_default: str = 'xml'  # 'xml' or 'sqlite'
+    config_path: str = ''  # empty: Config directory of the browser
+
+    def __init__(self, bookmarkManager: BookMarkManager, backend: Union[str, None] = None):
         curpath = os.path.dirname(os.path.abspath(__file__))
-        configpath = os.path.join(os.path.dirname(curpath), 'Config')
+        configpath = self.config_path or os.path.join(os.path.dirname(curpath), 'Config')
         self.xml_path = os.path.join(configpath, 'config.xml')
+        self.db_path = os.path.join(configpath, 'config.db')
+        self.backend = self.backend_default if backend is None else backend
+        self._store: Union[SqliteConfigStore, None] = None
 
         self.url_home = 'about:blank'
+        # web engine profiles: {name: {option: value}}, see ProfileManager.PROFILE_DEFAULTS for options
+        self.profiles: Dict[str, Dict[str, str]] = {'default': dict()}
         self.bookmarkManager = bookmarkManager
-        self.load_from_xml()
+        self.load()
+        # changes are written by a worker thread, shortly after the last change (see WriteBehindSaver)
+        self._saver = WriteBehindSaver(self.snapshot)
+        self.bookmarkManager.sig_changed.connect(self._saver.markDirty)
+        self._users = set()  # windows sharing this configuration
+
+    def load(self):
+        if self.backend == 'sqlite':
+            self.load_from_db()
+        else:
+            self.load_from_xml()
+
+    def save(self):
+        # flush pending changes and wait until they are written (clean shutdown)
+        self.save_to_db()
+        self._saver.flush(wait=True)
+
+    def retain(self, user: object):
+        self._users.add(user)
+
+    def release(self, user: object):
+        # the last window releasing the configuration writes pending changes and stops the writer thread
+        if user not in self._users:
+            return
+        self._users.discard(user)
+        if self._users:
+            self.save()
+            return
+        self.save_to_db()
+        self._saver.stop()
+        if self._store is not None:
+            self._store.close()
+
+    def snapshot(self) -> Union[Callable[[], None], None]:
+        if self._store is not None:
+            return self._store.commit
+        tree = self.bookmark_tree(self.bookmarkManager.root)
+        return partial(self.write_xml, self.xml_path, self.url_home, tree, self.profiles_copy())
+
+    def profiles_copy(self) -> Dict[str, Dict[str, str]]:
+        return {name: dict(options) for name, options in self.profiles.items()}
+
+    def setHomeUrl(self, url: str):
+        self.url_home = url
+        if self._store is not None:
+            self._store.setValue('home', url)
+        self._saver.markDirty()
+
+    def load_from_db(self):
+        ensurePathExist(os.path.dirname(self.db_path))
+        migrate = not os.path.isfile(self.db_path) and os.path.isfile(self.xml_path)
+        self._store = SqliteConfigStore(self.db_path)
+        if migrate:
+            self.load_from_xml()
+            self._store.setValue('home', self.url_home)
+            for name, options in self.profiles.items():
+                for key, value in options.items():
+                    self._store.setValue(f'profile/{name}/{key}', value)
+            self._store.saveBookmarks(self.bookmarkManager.root)
+            self._store.commit()
+        else:
+            self.url_home = self._store.value('home', self.url_home)
+            for key, value in self._store.values('profile/').items():
+                name, _, option = key.partition('/')
+                self.profiles.setdefault(name, dict())[option] = value
+            self._store.loadBookmarks(self.bookmarkManager)
+        self.bookmarkManager.sig_inserted.connect(self._store.onNodeInserted)
+        self.bookmarkManager.sig_removed.connect(self._store.onNodeRemoved)
+        self.bookmarkManager.sig_moved.connect(self._store.onNodeMoved)
+        self.bookmarkManager.sig_reset.connect(lambda: self._store.saveBookmarks(self.bookmarkManager.root))
+
+    def save_to_db(self):
+        if self._store is not None:
+            self._store.setValue('home', self.url_home)
 
     def load_from_xml(self):
         if not os.path.isfile(self.xml_path):
@@ -30,17 +265,57 @@ class WebBrowserConfig:
         if node is not None:
             self.url_home = node.text
 
+        node = root.find('profiles')
+        if node is not None:
+            for child in node.findall('profile'):
+                options = dict(child.attrib)
+                name = options.pop('name', 'default')
+                self.profiles[name] = options
+
         node = root.find('bookmarks')
         if node is not None:
-            for child in list(node):
-                title = child.tag
-                url = child.attrib.get('url')
-                icon_url = child.attrib.get('icon_url')
-                self.bookmarkManager.add(url, title, icon_url)
+            self.bookmarkManager.beginUpdate()
+            try:
+                self.load_bookmarks(node, None)
+            finally:
+                self.bookmarkManager.endUpdate()
+
+    def load_bookmarks(self, node: ET.Element, folder: Union[BookMarkFolder, None]):
+        for child in list(node):
+            url = child.attrib.get('url')
+            if child.tag == 'folder' and url is None:
+                subfolder = self.bookmarkManager.addFolder(child.attrib.get('title', ''), folder)
+                self.load_bookmarks(child, subfolder)
+            elif url is not None:
+                # title was stored as tag name in old config files
+                title = child.attrib.get('title', child.tag) if child.tag == 'item' else child.tag
+                icon_url = child.attrib.get('icon_url', '')
+                self.bookmarkManager.add(url, title, icon_url, folder)
 
     def save_to_xml(self):
-        if os.path.isfile(self.xml_path):
-            xmldata = ET.parse(self.xml_path)
+        tree = self.bookmark_tree(self.bookmarkManager.root)
+        self.write_xml(self.xml_path, self.url_home, tree, self.profiles_copy())
+
+    @staticmethod
+    def bookmark_tree(folder: BookMarkFolder) -> list:
+        # plain (thread-safe) copy of bookmarks: ('folder', title, children) or ('item', title, url, icon_url)
+        tree = list()
+        stack = [(folder, tree)]
+        while stack:
+            folder, nodes = stack.pop()
+            for item in folder.children:
+                if isinstance(item, BookMarkFolder):
+                    children = list()
+                    nodes.append(('folder', item.title, children))
+                    stack.append((item, children))
+                else:
+                    nodes.append(('item', item.title, item.url, item.icon_url))
+        return tree
+
+    @staticmethod
+    def write_xml(xml_path: str, url_home: str, tree: list, profiles: Dict[str, Dict[str, str]]):
+        if os.path.isfile(xml_path):
+            xmldata = ET.parse(xml_path)
         else:
             xmldata = ET.ElementTree(ET.Element('BrowserConfig'))
         root = xmldata.getroot()
@@ -49,19 +324,37 @@ class WebBrowserConfig:
         if node is None:
             node = ET.Element('home')
             root.append(node)
-        node.text = self.url_home
+        node.text = url_home
 
-        node = root.find('bookmarks')
-        if node is None:
-            node = ET.Element('bookmarks')
-            root.append(node)
+        node = root.find('profiles')
+        if node is not None:
+            root.remove(node)
+        node = ET.Element('profiles')
+        root.append(node)
+        for name, options in profiles.items():
+            child = ET.Element('profile')
+            child.attrib['name'] = name
+            child.attrib.update(options)
+            node.append(child)
 
-            for item in self.bookmarkManager.bookmarks:
-                child = node.find(item.title)
-                if child is None:
-                    child = ET.Element(item.title)
-                    node.append(child)
-                child.attrib['url'] = item.url
-                child.attrib['icon_url'] = item.icon_url
+        node = root.find('bookmarks')
+        if node is not None:
+            root.remove(node)
+        node = ET.Element('bookmarks')
+        root.append(node)
+        stack = [(node, tree)]
+        while stack:
+            node, nodes = stack.pop()
+            for item in nodes:
+                if item[0] == 'folder':
+                    child = ET.Element('folder')
+                    child.attrib['title'] = item[1]
+                    stack.append((child, item[2]))
+                else:
+                    child = ET.Element('item')
+                    child.attrib['title'] = item[1]
+                    child.attrib['url'] = item[2]
+                    child.attrib['icon_url'] = item[3]
+                node.append(child)
 
-        writeXmlFile(root, self.xml_path, backup=False)
+        writeXmlFile(root, xml_path, backup=False)
@@ -0,0 +1,458 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : ContentBlocker.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Request blocking by EasyList style filter lists (compiled token index, cached on disk)
+# -------------------------------------------------------------------------------------------------------------------- #
+import os
+import re
+import glob
+import pickle
+import threading
+import traceback
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple, Union
+from PyQt5.QtCore import QObject, pyqtSignal
+from Common import ensurePathExist
+
+FORMAT_VERSION = 2  # of the compiled cache
+TOKEN = re.compile(r'[a-z0-9%]+')
+HOST = re.compile(r'://(?:[^/?#@]*@)?([^/?#:]*)')
+GRAM = 4  # length of the substrings indexing rules without a whole token
+OPTIONS = re.compile(r'^~?[\w-]+(?:=[^,]*)?(?:,~?[\w-]+(?:=[^,]*)?)*$')
+TYPES = ['script', 'image', 'stylesheet', 'object', 'xmlhttprequest', 'subdocument', 'ping', 'media', 'font',
+         'websocket', 'other']
+TYPE_BITS = {name: 1 << i for i, name in enumerate(TYPES)}
+TYPE_ALIASES = {'xhr': 'xmlhttprequest', 'frame': 'subdocument', 'css': 'stylesheet', 'object-subrequest': 'object'}
+ALL_TYPES = (1 << len(TYPES)) - 1
+THIRD_PARTY, FIRST_PARTY, MATCH_CASE = 1, 2, 4
+IGNORED_OPTIONS = {'important', 'all'}  # matched like plain blocking rules
+HOST_RULE = re.compile(r'^\|\|([a-z0-9.-]+)\^$')  # '||host^': matched with the host of the url, no regex
+
+
+def siteOf(host: str) -> str:
+    # registrable domain without a public suffix list: last two labels, three for 'co.uk' style suffixes
+    labels = host.lower().rstrip('.').split('.')
+    if len(labels) > 2 and len(labels[-1]) <= 2 and len(labels[-2]) <= 3:
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
+
+
+def hostMatches(host: str, domains: Iterable[str]) -> bool:
+    return any(host == x or host.endswith('.' + x) for x in domains)
+
+
+def hostOf(url: str) -> str:
+    match = HOST.search(url)
+    return match.group(1).lower() if match is not None else ''
+
+
+def patternRegex(pattern: str) -> str:
+    # '||' host anchor, '|' start/end anchor, '*' wildcard, '^' separator (anything but a letter, digit, _-.% or end)
+    if len(pattern) > 1 and pattern[0] == '/' and pattern[-1] == '/':
+        return pattern[1:-1]
+    prefix, suffix = '', ''
+    if pattern.startswith('||'):
+        prefix = r'^[^:/?#]+:/+(?:[^/?#]*\.)?'  # any scheme (urls are valid), cheaper to compile
+        pattern = pattern[2:]
+    elif pattern.startswith('|'):
+        prefix = '^'
+        pattern = pattern[1:]
+    if pattern.endswith('|'):
+        suffix = '$'
+        pattern = pattern[:-1]
+    parts = list()
+    for char in pattern:
+        if char == '*':
+            parts.append('.*')
+        elif char == '^':
+            parts.append(r'(?:[^\w.%-]|$)')
+        else:
+            parts.append(re.escape(char))
+    return prefix + ''.join(parts) + suffix
+
+
+def patternTokens(pattern: str) -> List[str]:
+    # tokens which any matching url must contain as a whole token (bounded by non-token characters or anchors)
+    if len(pattern) > 1 and pattern[0] == '/' and pattern[-1] == '/':
+        return []
+    anchored_start = pattern.startswith('|')
+    body = pattern.lstrip('|')
+    anchored_end = body.endswith('|')
+    body = body.rstrip('|').lower()
+    tokens = list()
+    for match in TOKEN.finditer(body):
+        start, end = match.span()
+        before = body[start - 1] if start > 0 else ('|' if anchored_start else '*')
+        after = body[end] if end < len(body) else ('|' if anchored_end else '*')
+        if before != '*' and after != '*':
+            tokens.append(match.group())
+    return tokens
+
+
+def regexLiterals(source: str) -> List[str]:
+    # literal runs which every match of a regular expression contains (nothing inside groups or alternations)
+    if '|' in source:
+        return []
+    items, depth, i = list(), 0, 0
+    while i < len(source):
+        char = source[i]
+        i += 1
+        if char == '\\' and i < len(source):
+            char = source[i]
+            i += 1
+            items.append(None if char.isalnum() or depth else char)  # class, anchor or backreference
+        elif char == '[':
+            i += 1 if source[i:i + 1] == '^' else 0
+            i += 1 if source[i:i + 1] == ']' else 0
+            while i < len(source) and source[i] != ']':
+                i += 2 if source[i] == '\\' else 1
+            i += 1
+            items.append(None)
+        elif char in '*?{':
+            if char == '{':
+                i = source.find('}', i) + 1 or len(source)
+            if items:
+                items[-1] = None  # optional
+            items.append(None)
+        elif char in '()':
+            depth += 1 if char == '(' else -1
+            items.append(None)
+        elif char in '.^$+':
+            items.append(None)
+        else:
+            items.append(None if depth else char)
+    runs = ''.join(x if x is not None else '\n' for x in items).split('\n')
+    return [x for x in runs if x]
+
+
+def patternLiterals(pattern: str) -> List[str]:
+    if len(pattern) > 1 and pattern[0] == '/' and pattern[-1] == '/':
+        return regexLiterals(pattern[1:-1])
+    return [x for x in re.split(r'[*^|]', pattern) if x]
+
+
+def patternPlain(pattern: str, match_case: bool) -> Union[tuple, None]:
+    # (is host, text) of a pattern checked without a regular expression: '||host^' by the host of the url, a
+    # pattern without anchors, separators and inner wildcards as a substring. None for the others
+    if len(pattern) > 1 and pattern[0] == '/' and pattern[-1] == '/':
+        return None
+    match = HOST_RULE.match(pattern.lower())
+    if match is not None:
+        return True, match.group(1)
+    literal = pattern.strip('*')
+    if not literal or any(x in literal for x in '|^*'):
+        return None
+    return False, literal if match_case else literal.lower()
+
+
+def parseFilter(line: str) -> Union[tuple, None]:
+    # (exception, pattern, flags, type mask, include domains, exclude domains) of a network rule, None for
+    # comments, element hiding and rules with options which are not supported
+    line = line.strip()
+    if not line or line[0] in '![' or '#' in line and re.search(r'#[@?$]?#', line):
+        return None
+    exception = line.startswith('@@')
+    if exception:
+        line = line[2:]
+    pattern, options = line, ''
+    index = line.rfind('$')
+    if index >= 0 and OPTIONS.match(line[index + 1:]) and not (line.startswith('/') and line.endswith('/')):
+        pattern, options = line[:index], line[index + 1:]
+    flags, include, exclude = 0, 0, 0
+    domains, not_domains = list(), list()
+    for option in options.split(',') if options else []:
+        negated = option.startswith('~')
+        name, _, value = option.lstrip('~').partition('=')
+        name = TYPE_ALIASES.get(name, name)
+        if name in TYPE_BITS:
+            if negated:
+                exclude |= TYPE_BITS[name]
+            else:
+                include |= TYPE_BITS[name]
+        elif name in ('third-party', '3p'):
+            flags |= FIRST_PARTY if negated else THIRD_PARTY
+        elif name in ('first-party', '1p'):
+            flags |= THIRD_PARTY if negated else FIRST_PARTY
+        elif name == 'domain' and not negated:
+            for domain in value.lower().split('|'):
+                if domain.startswith('~'):
+                    not_domains.append(domain[1:])
+                elif domain:
+                    domains.append(domain)
+        elif name == 'match-case':
+            flags |= MATCH_CASE
+        elif name not in IGNORED_OPTIONS:
+            return None  # e.g. popup, csp, redirect, document: not a plain request block
+    if not pattern or pattern in ('*', '|', '||'):
+        if not domains:
+            return None  # would match every request
+        pattern = '*'
+    types = (include or ALL_TYPES) & ~exclude
+    return exception, pattern, flags, types, tuple(domains), tuple(not_domains)
+
+
+class FilterMatcher:
+    # rules are indexed by their rarest token: a url is checked only against the rules of its own tokens. rules
+    # without a whole token (regular expressions, wildcards around every word) are indexed by the rarest GRAM long
+    # substring of a literal they require, the rest is checked for every url. host and substring patterns are
+    # checked without a regular expression (patternPlain), the others are compiled by compileRegexes on the worker
+    # thread, or when they are first checked
+    def __init__(self):
+        self.texts: List[str] = list()
+        self.patterns: List[str] = list()
+        self.plain: List[Union[tuple, None]] = list()
+        self.options: List[Tuple[int, int, tuple, tuple]] = list()
+        self.index: Dict[str, List[int]] = dict()
+        self.grams: Dict[str, List[int]] = dict()
+        self.untokenized: List[int] = list()
+        self._regex: Dict[int, re.Pattern] = dict()
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['_regex'] = dict()
+        return state
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def build(self, rules: List[Tuple[str, tuple]]):
+        # rules: (text, parsed rule without the exception flag)
+        candidates = [patternTokens(x[1][0]) for x in rules]
+        grams = [[] if tokens else [y[i:i + GRAM] for y in patternLiterals(x[1][0].lower())
+                                    for i in range(len(y) - GRAM + 1)] for x, tokens in zip(rules, candidates)]
+        frequency = Counter()
+        for tokens, substrings in zip(candidates, grams):
+            frequency.update(set(tokens))
+            frequency.update(set(substrings))
+        for (text, (pattern, flags, types, domains, not_domains)), tokens, substrings in zip(rules, candidates, grams):
+            rule_id = len(self.patterns)
+            self.texts.append(text)
+            self.patterns.append(pattern)
+            self.plain.append(patternPlain(pattern, bool(flags & MATCH_CASE)))
+            self.options.append((flags, types, domains, not_domains))
+            if tokens:
+                self.index.setdefault(min(tokens, key=lambda x: (frequency[x], -len(x))), list()).append(rule_id)
+            elif substrings:
+                self.grams.setdefault(min(substrings, key=lambda x: frequency[x]), list()).append(rule_id)
+            else:
+                self.untokenized.append(rule_id)
+
+    def regex(self, rule_id: int) -> re.Pattern:
+        regex = self._regex.get(rule_id)
+        if regex is None:
+            case = 0 if self.options[rule_id][0] & MATCH_CASE else re.IGNORECASE
+            try:
+                regex = re.compile(patternRegex(self.patterns[rule_id]), case)
+            except re.error:
+                regex = re.compile(r'(?!)')
+            self._regex[rule_id] = regex
+        return regex
+
+    def compileRegexes(self):
+        for rule_id, plain in enumerate(self.plain):
+            if plain is None:
+                self.regex(rule_id)
+
+    def match(self, url: str, tokens: Iterable[str], type_bit: int, third_party: bool, site_host: str) -> int:
+        # id of the first matching rule, -1 for none. 'tokens' are the tokens of the lower case url
+        index = self.index
+        for token in tokens:
+            rule_ids = index.get(token)
+            if rule_ids is not None:
+                for rule_id in rule_ids:
+                    if self.check(rule_id, url, type_bit, third_party, site_host):
+                        return rule_id
+        if self.grams:
+            grams = self.grams
+            lower = url.lower()
+            for gram in filter(grams.__contains__, set([lower[i:i + GRAM] for i in range(len(lower) - GRAM + 1)])):
+                for rule_id in grams[gram]:
+                    if self.check(rule_id, url, type_bit, third_party, site_host):
+                        return rule_id
+        for rule_id in self.untokenized:
+            if self.check(rule_id, url, type_bit, third_party, site_host):
+                return rule_id
+        return -1
+
+    def check(self, rule_id: int, url: str, type_bit: int, third_party: bool, site_host: str) -> bool:
+        flags, types, domains, not_domains = self.options[rule_id]
+        if not types & type_bit:
+            return False
+        if flags & THIRD_PARTY and not third_party or flags & FIRST_PARTY and third_party:
+            return False
+        if domains and not hostMatches(site_host, domains):
+            return False
+        if not_domains and hostMatches(site_host, not_domains):
+            return False
+        plain = self.plain[rule_id]
+        if plain is None:
+            return self.regex(rule_id).search(url) is not None
+        is_host, text = plain
+        if is_host:
+            return hostMatches(hostOf(url), (text, ))
+        return text in (url if flags & MATCH_CASE else url.lower())
+
+
+class CompiledFilters:
+    def __init__(self, blocking: FilterMatcher, exceptions: FilterMatcher, key: tuple):
+        self.blocking = blocking
+        self.exceptions = exceptions
+        self.key = key  # source lists (name, size, mtime) and format version
+
+
+def compileLists(paths: List[str], key: tuple) -> CompiledFilters:
+    blocking, exceptions = list(), list()
+    for path in paths:
+        with open(path, 'r', encoding='utf-8', errors='replace') as fp:
+            for line in fp:
+                rule = parseFilter(line)
+                if rule is not None:
+                    (exceptions if rule[0] else blocking).append((line.strip(), rule[1:]))
+    compiled = CompiledFilters(FilterMatcher(), FilterMatcher(), key)
+    compiled.blocking.build(blocking)
+    compiled.exceptions.build(exceptions)
+    return compiled
+
+
+class ContentBlocker(QObject):
+    # filter lists are the *.txt files of 'Config/filters'. they are compiled on a worker thread and the result is
+    # pickled to 'Config/content_filters.cache', which is loaded instead while the lists are unchanged. requests
+    # pass unchecked until the filters are ready. sites (first party hosts) of the allowlist are not filtered
+    _instance: Union['ContentBlocker', None] = None
+    enabled: bool = True  # --content_blocker
+
+    sig_compiled = pyqtSignal(object)
+
+    def __init__(self, path: str, parent=None):
+        super().__init__(parent=parent)
+        self._path = path
+        self._filters: Union[CompiledFilters, None] = None
+        self._allowlist: set = set()
+        self._started = False
+        self.blocked_total = 0
+        self.checked_total = 0
+        self.site_hits = Counter()  # site host: blocked requests
+        self.rule_hits = Counter()  # rule text: blocked requests
+        self.sig_compiled.connect(self.onCompiled)
+        self.loadAllowlist()
+
+    @classmethod
+    def instance(cls) -> 'ContentBlocker':
+        if cls._instance is None:
+            curpath = os.path.dirname(os.path.abspath(__file__))
+            cls._instance = ContentBlocker(os.path.join(os.path.dirname(curpath), 'Config'))
+        return cls._instance
+
+    def listPaths(self) -> List[str]:
+        return sorted(glob.glob(os.path.join(self._path, 'filters', '*.txt')))
+
+    def cachePath(self) -> str:
+        return os.path.join(self._path, 'content_filters.cache')
+
+    def allowlistPath(self) -> str:
+        return os.path.join(self._path, 'content_allowlist.txt')
+
+    def hasLists(self) -> bool:
+        return len(self.listPaths()) > 0
+
+    def start(self) -> bool:
+        # loads the filters once, True when the blocker is in use (enabled and there are lists)
+        if not self._started and self.enabled and self.hasLists():
+            self._started = True
+            self.load()
+        return self._started
+
+    def load(self):
+        paths = self.listPaths()
+        thread = threading.Thread(target=self.loadJob, args=(paths, ), name='ContentBlocker', daemon=True)
+        thread.start()
+
+    def loadJob(self, paths: List[str]):
+        try:
+            key = (FORMAT_VERSION, ) + tuple(
+                (os.path.basename(x), os.path.getsize(x), os.stat(x).st_mtime_ns) for x in paths)
+            compiled = None
+            try:
+                with open(self.cachePath(), 'rb') as fp:
+                    compiled = pickle.load(fp)
+                if not isinstance(compiled, CompiledFilters) or compiled.key != key:
+                    compiled = None
+            except Exception:
+                compiled = None  # missing, old or broken cache
+            if compiled is None:
+                compiled = compileLists(paths, key)
+                ensurePathExist(self._path)
+                temp_path = self.cachePath() + '.tmp'
+                with open(temp_path, 'wb') as fp:
+                    pickle.dump(compiled, fp, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, self.cachePath())
+            self.sig_compiled.emit(compiled)
+            # requests are checked meanwhile, a pattern not compiled yet is compiled when it is first checked
+            compiled.blocking.compileRegexes()
+            compiled.exceptions.compileRegexes()
+        except Exception:
+            traceback.print_exc()
+
+    def onCompiled(self, compiled: CompiledFilters):
+        self._filters = compiled
+
+    def isReady(self) -> bool:
+        return self._filters is not None
+
+    def ruleCount(self) -> int:
+        filters = self._filters
+        return 0 if filters is None else len(filters.blocking) + len(filters.exceptions)
+
+    def check(self, url: str, site_host: str, type_name: str = 'other') -> bool:
+        # True: block. 'site_host' is the host of the first party (page) url
+        filters = self._filters
+        if filters is None or not self.enabled:
+            return False
+        self.checked_total += 1
+        if site_host and self.isAllowed(site_host):
+            return False
+        tokens = set(TOKEN.findall(url.lower()))
+        host = hostOf(url)
+        third_party = bool(site_host) and siteOf(host) != siteOf(site_host)
+        type_bit = TYPE_BITS.get(type_name, TYPE_BITS['other'])
+        rule_id = filters.blocking.match(url, tokens, type_bit, third_party, site_host)
+        if rule_id < 0:
+            return False
+        if len(filters.exceptions) and filters.exceptions.match(url, tokens, type_bit, third_party, site_host) >= 0:
+            return False
+        self.blocked_total += 1
+        self.site_hits[site_host] += 1
+        self.rule_hits[filters.blocking.texts[rule_id]] += 1
+        return True
+
+    def interceptRequest(self, info, type_name: str) -> bool:
+        # request handler of ProfileManager (main frame navigations are never blocked)
+        if type_name == 'document':
+            return False
+        if self.check(info.requestUrl().toString(), info.firstPartyUrl().host().lower(), type_name):
+            info.block(True)
+            return True
+        return False
+
+    def isAllowed(self, host: str) -> bool:
+        labels = host.split('.')
+        return any('.'.join(labels[i:]) in self._allowlist for i in range(len(labels)))
+
+    def setAllowed(self, host: str, allowed: bool):
+        host = host.lower()
+        if allowed:
+            self._allowlist.add(host)
+        else:
+            self._allowlist.discard(host)
+        self.saveAllowlist()
+
+    def loadAllowlist(self):
+        if os.path.isfile(self.allowlistPath()):
+            with open(self.allowlistPath(), 'r', encoding='utf-8') as fp:
+                self._allowlist = set([x.strip().lower() for x in fp if x.strip() and not x.startswith('!')])
+
+    def saveAllowlist(self):
+        ensurePathExist(self._path)
+        with open(self.allowlistPath(), 'w', encoding='utf-8') as fp:
+            fp.writelines([x + '\n' for x in sorted(self._allowlist)])
@@ -4,16 +4,34 @@
 # Author       : Yogyui
 # Description  : Customize tab widget and tab bar
 # -------------------------------------------------------------------------------------------------------------------- #
+from typing import Union
 from PyQt5.QtCore import Qt, pyqtSignal, QSize, QPoint, QRect
-from PyQt5.QtGui import QIcon, QPaintEvent
+from PyQt5.QtGui import QIcon, QPaintEvent, QMouseEvent, QResizeEvent
 from PyQt5.QtWidgets import QTabBar, QTabWidget, QPushButton, QWidget, QStylePainter, QStyleOptionTab, QStyle
-from PyQt5.QtWidgets import QMenu
+from PyQt5.QtWidgets import QMenu, QToolButton
 from Common import makeQAction
+from Resources import getIcon
 
 
 class CustomTabBar(QTabBar):
+    # the last tab is the 'add tab' pseudo-tab, it is pinned to the right side while dragging.
+    # tab width is computed once after a resize or tab count change, and does not go below 'tab_width_min'
+    # (tab bar scrolls instead)
+    add_btn_width: int = 36
+    tab_width_max: int = 240
+    tab_width_min: int = 100
+
+    sig_overflow_changed = pyqtSignal(bool)
+
     def __init__(self, parent=None):
         super().__init__(parent=parent)
+        self.setUsesScrollButtons(True)
+        self.setElideMode(Qt.ElideRight)
+        self._size_valid = False
+        self._tab_width = self.tab_width_max
+        self._tab_height = 0
+        self._overflow = False
+        self._drag_grab: Union[int, None] = None  # offset of cursor from the left edge of dragged tab
     """
     def paintEvent(self, a0: QPaintEvent) -> None:
         # https://stackoverflow.com/questions/3607709/how-to-change-text-alignment-in-qtabwidget
@@ -36,22 +54,76 @@ class CustomTabBar(QTabBar):
             painter.drawControl(QStyle.CE_TabBarTabShape, option)
             painter.drawText(tabRect, Qt.AlignVCenter | Qt.TextDontClip, self.tabText(index))
     """
+    def availableWidth(self) -> int:
+        return self.parent().width()
+
+    def invalidateSizeCache(self):
+        self._size_valid = False
+
+    def updateSizeCache(self):
+        self._size_valid = True
+        self._tab_height = super().tabSizeHint(0).height() if self.count() > 0 else 0
+        parent_width, count = self.availableWidth(), self.count()
+        if (count - 1) * self.tab_width_max < parent_width:
+            self._tab_width = self.tab_width_max
+        else:
+            self._tab_width = max(self.tab_width_min, int((parent_width - self.add_btn_width) / max(1, count - 1)))
+        overflow = (count - 1) * self._tab_width + self.add_btn_width > parent_width
+        if overflow != self._overflow:
+            self._overflow = overflow
+            self.sig_overflow_changed.emit(overflow)
+
+    def isOverflow(self) -> bool:
+        return self._overflow
+
+    def tabInserted(self, index: int) -> None:
+        self._size_valid = False
+        super().tabInserted(index)
+
+    def tabRemoved(self, index: int) -> None:
+        self._size_valid = False
+        super().tabRemoved(index)
+
+    def resizeEvent(self, a0: QResizeEvent) -> None:
+        # tab bar is resized along with the tab widget
+        self._size_valid = False
+        super().resizeEvent(a0)
+
     def tabSizeHint(self, index: int) -> QSize:
-        size = super().tabSizeHint(index)
-        add_btn_width = 36
-        parent_width = self.parent().width()
+        if not self._size_valid:
+            self.updateSizeCache()
         if index == self.count() - 1:
             if self.count() == 1:
-                width = add_btn_width + 14
+                width = self.add_btn_width + 14
             else:
-                width = add_btn_width
+                width = self.add_btn_width
         else:
-            width_max = 240
-            if (self.count() - 1) * width_max < parent_width:
-                width = width_max
-            else:
-                width = int((parent_width - add_btn_width) / (self.count() - 1))
-        return QSize(width, size.height())
+            width = self._tab_width
+        return QSize(width, self._tab_height)
+
+    def minimumTabSizeHint(self, index: int) -> QSize:
+        # default implementation computes elided text and calls tabSizeHint again
+        return self.tabSizeHint(index)
+
+    def mousePressEvent(self, a0: QMouseEvent) -> None:
+        self._drag_grab = None
+        index = self.tabAt(a0.pos())
+        if a0.button() == Qt.LeftButton and 0 <= index < self.count() - 1:
+            self._drag_grab = a0.pos().x() - self.tabRect(index).left()
+        super().mousePressEvent(a0)
+
+    def mouseMoveEvent(self, a0: QMouseEvent) -> None:
+        if self._drag_grab is not None and a0.buttons() & Qt.LeftButton and self.count() > 1:
+            # dragged tab must not pass the center of the pseudo-tab, otherwise they are swapped
+            pinned = self.tabRect(self.count() - 1)
+            limit = pinned.center().x() - 1 - self._tab_width + self._drag_grab
+            if a0.pos().x() > limit:
+                a0 = QMouseEvent(a0.type(), QPoint(limit, a0.pos().y()), a0.button(), a0.buttons(), a0.modifiers())
+        super().mouseMoveEvent(a0)
+
+    def mouseReleaseEvent(self, a0: QMouseEvent) -> None:
+        self._drag_grab = None
+        super().mouseReleaseEvent(a0)
 
 
 class CustomTabWidget(QTabWidget):
@@ -68,7 +140,7 @@ class CustomTabWidget(QTabWidget):
         self.setMovable(True)
 
         btn = QPushButton()
-        btn.setIcon(QIcon('./Resource/add.png'))
+        btn.setIcon(getIcon('add.png'))
         btn.setFlat(True)
         btn.setIconSize(QSize(18, 16))
         btn.setToolTip('Add New Tab')
@@ -78,7 +150,19 @@ class CustomTabWidget(QTabWidget):
         self.addTab(self._defaultWidget, '')
         self.tabBar().setTabButton(0, QTabBar.LeftSide, btn)
         self.setTabEnabled(0, False)
-        self.tabBar().tabMoved.connect(self.onTabMoved)
+
+        # list of all tabs, shown when tabs do not fit
+        self._btnOverflow = QToolButton(self)
+        self._btnOverflow.setArrowType(Qt.DownArrow)
+        self._btnOverflow.setAutoRaise(True)
+        self._btnOverflow.setToolTip('List All Tabs')
+        self._btnOverflow.setPopupMode(QToolButton.InstantPopup)
+        self._menuOverflow = QMenu(self._btnOverflow)
+        self._menuOverflow.aboutToShow.connect(self.populateOverflowMenu)
+        self._btnOverflow.setMenu(self._menuOverflow)
+        self.setCornerWidget(self._btnOverflow, Qt.TopRightCorner)
+        self._btnOverflow.hide()
+        self._tabbar.sig_overflow_changed.connect(self._btnOverflow.setVisible)
 
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.showContextMenu)
@@ -87,10 +171,23 @@ class CustomTabWidget(QTabWidget):
         stylesheet += "QTabBar::tab:!selected {border: 0px; margin-left: 8px;}\n"
         self.setStyleSheet(stylesheet)
 
-    def onTabMoved(self):
-        # add tab should be always on right side
-        index = self.indexOf(self._defaultWidget)
-        self.tabBar().moveTab(index, self.count() - 1)
+    def resizeEvent(self, a0: QResizeEvent) -> None:
+        self._tabbar.invalidateSizeCache()
+        super().resizeEvent(a0)
+
+    def populateOverflowMenu(self):
+        # built when shown: hundreds of actions are not kept up to date with every tab change
+        self._menuOverflow.clear()
+        current = self.currentIndex()
+        for index in range(self.count() - 1):
+            action = makeQAction(parent=self._menuOverflow, text=self.tabText(index).replace('&', '&&'),
+                                 checkable=True, checked=index == current,
+                                 triggered=lambda _=False, i=index: self.setCurrentIndex(i))
+            action.setIcon(self.tabIcon(index))
+            self._menuOverflow.addAction(action)
+        self._menuOverflow.addSeparator()
+        self._menuOverflow.addAction(makeQAction(parent=self._menuOverflow, text='Add New Tab',
+                                                 triggered=self.sig_add_tab.emit))
 
     def showContextMenu(self, point: QPoint):
         if point.isNull():
@@ -2,21 +2,35 @@
 # File Name    : DeveloperWidget.py
 # Project Name : WebBrowser
 # Author       : Yogyui
-# Description  : Widget for Developer (Javascript, Page Source)
+# Description  : Widget for Developer (Javascript, Network, Page Source)
 # -------------------------------------------------------------------------------------------------------------------- #
-from PyQt5.QtCore import pyqtSignal
-from PyQt5.QtWidgets import QWidget, QTextEdit, QPushButton, QLineEdit
-from PyQt5.QtWidgets import QVBoxLayout, QGroupBox, QSizePolicy
+from typing import Union
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtWebEngineWidgets import QWebEnginePage
+from PyQt5.QtWidgets import QWidget, QTextEdit, QPushButton, QTabWidget, QSplitter
+from PyQt5.QtWidgets import QVBoxLayout, QHBoxLayout, QGroupBox
+from ResourceMonitor import PerformanceWidget
+from JsResultView import JsResultWidget
+from BatchJavaScript import BatchScriptWidget
+from PageSourceView import PageSourceWidget
+from NetworkLog import NetworkLogWidget
 
 
 class DeveloperWidget(QWidget):
     sig_run_js = pyqtSignal(str)
+    sig_load_source = pyqtSignal()
 
     def __init__(self, parent=None):
         super().__init__(parent=parent)
         self._editJavaScript = QTextEdit()
         self._btnRunJavaScript = QPushButton('RUN')
-        self._editJsResult = QLineEdit()
+        self._btnRunBatch = QPushButton('RUN ON CHECKED TABS')
+        self._tabResult = QTabWidget()
+        self._jsResult = JsResultWidget()
+        self._batch = BatchScriptWidget()
+        self._performance = PerformanceWidget()
+        self._pageSource = PageSourceWidget()
+        self._network = NetworkLogWidget()
         self.initControl()
         self.initLayout()
 
@@ -24,31 +38,74 @@ class DeveloperWidget(QWidget):
         vbox = QVBoxLayout(self)
         vbox.setContentsMargins(4, 4, 4, 4)
         vbox.setSpacing(4)
+        splitter = QSplitter(Qt.Vertical)
+        vbox.addWidget(splitter)
 
         grbox = QGroupBox('JavaScript')
-        grbox.setSizePolicy(QSizePolicy.MinimumExpanding, QSizePolicy.Fixed)
         vbox_gr = QVBoxLayout(grbox)
         vbox_gr.setContentsMargins(4, 4, 4, 4)
         vbox_gr.setSpacing(4)
         vbox_gr.addWidget(self._editJavaScript)
-        vbox_gr.addWidget(self._btnRunJavaScript)
-        vbox_gr.addWidget(self._editJsResult)
-        vbox.addWidget(grbox)
+        hbox = QHBoxLayout()
+        hbox.setContentsMargins(0, 0, 0, 0)
+        hbox.setSpacing(4)
+        hbox.addWidget(self._btnRunJavaScript)
+        hbox.addWidget(self._btnRunBatch)
+        vbox_gr.addLayout(hbox)
+        vbox_gr.addWidget(self._tabResult, 1)
+        splitter.addWidget(grbox)
 
-        vbox.addWidget(QWidget())
+        grbox = QGroupBox('Performance')
+        vbox_gr = QVBoxLayout(grbox)
+        vbox_gr.setContentsMargins(4, 4, 4, 4)
+        vbox_gr.setSpacing(4)
+        vbox_gr.addWidget(self._performance)
+        splitter.addWidget(grbox)
+
+        grbox = QGroupBox('Network')
+        vbox_gr = QVBoxLayout(grbox)
+        vbox_gr.setContentsMargins(4, 4, 4, 4)
+        vbox_gr.setSpacing(4)
+        vbox_gr.addWidget(self._network)
+        splitter.addWidget(grbox)
+
+        grbox = QGroupBox('Page Source')
+        vbox_gr = QVBoxLayout(grbox)
+        vbox_gr.setContentsMargins(4, 4, 4, 4)
+        vbox_gr.setSpacing(4)
+        vbox_gr.addWidget(self._pageSource)
+        splitter.addWidget(grbox)
 
     def initControl(self):
         self._editJavaScript.setLineWrapColumnOrWidth(-1)
         self._editJavaScript.setLineWrapMode(QTextEdit.FixedPixelWidth)
+        self._editJavaScript.setMaximumHeight(120)
         self._btnRunJavaScript.clicked.connect(self.onClickBtnRunJavaScript)
-        self._editJsResult.setReadOnly(True)
+        self._btnRunBatch.clicked.connect(self.onClickBtnRunBatch)
+        self._tabResult.addTab(self._jsResult, 'Result')
+        self._tabResult.addTab(self._batch, 'Batch')
+        self._batch.sig_show_value.connect(self.setJsResult)
+        self._pageSource.sig_load_source.connect(self.sig_load_source.emit)
 
     def onClickBtnRunJavaScript(self):
         script = self._editJavaScript.toPlainText()
         self.sig_run_js.emit(script)
 
+    def onClickBtnRunBatch(self):
+        # runs on the tabs checked in 'Batch' page (tabs of all windows)
+        self._tabResult.setCurrentWidget(self._batch)
+        self._batch.run(self._editJavaScript.toPlainText())
+
+    def setPageSource(self, html: str, url: str = ''):
+        self._pageSource.setSource(html, url)
+
+    def setNetworkPage(self, page: Union[QWebEnginePage, None]):
+        # requests of the current tab
+        self._network.setPage(page)
+
     def setJsResult(self, obj: object):
-        self._editJsResult.setText(str(obj))
+        self._tabResult.setCurrentWidget(self._jsResult)
+        self._jsResult.setResult(obj)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,199 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : FaviconCache.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Persistent (content-addressed) favicon cache with LRU eviction
+# -------------------------------------------------------------------------------------------------------------------- #
+import os
+import time
+import hashlib
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from typing import Dict, Union
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice, QSize
+from PyQt5.QtGui import QIcon, QPixmap
+from Common import writeXmlFile
+
+
+class FaviconCacheEntry:
+    def __init__(self, url: str, digest: str, size: int, etag: str = '', last_modified: str = '',
+                 checked: float = 0., accessed: float = 0.):
+        self.url = url
+        self.digest = digest
+        self.size = size
+        self.etag = etag
+        self.last_modified = last_modified
+        self.checked = checked
+        self.accessed = accessed
+
+
+class FaviconCache:
+    # icon files are named by sha1 digest of their content (identical icons are stored once),
+    # entries are kept in LRU order and evicted when the total size of files exceeds 'max_bytes'
+    def __init__(self, path: str, max_bytes: int = 4 * 1024 * 1024, revalidate_interval: int = 24 * 3600):
+        self._path = path
+        self._index_path = os.path.join(path, 'index.xml')
+        self._max_bytes = max_bytes
+        self._revalidate_interval = revalidate_interval
+        self._entries: OrderedDict[str, FaviconCacheEntry] = OrderedDict()
+        self._refcount: Dict[str, int] = dict()
+        self._filesize: Dict[str, int] = dict()
+        self._total_bytes = 0
+        self._icons: Dict[str, QIcon] = dict()
+        self._dirty = False
+        self.load()
+
+    def load(self):
+        if not os.path.isfile(self._index_path):
+            return
+        try:
+            root = ET.parse(self._index_path).getroot()
+        except Exception:
+            return
+        entries = list()
+        for node in root.findall('entry'):
+            try:
+                entries.append(FaviconCacheEntry(
+                    url=node.attrib['url'],
+                    digest=node.attrib['digest'],
+                    size=int(node.attrib.get('size', '0')),
+                    etag=node.attrib.get('etag', ''),
+                    last_modified=node.attrib.get('last_modified', ''),
+                    checked=float(node.attrib.get('checked', '0')),
+                    accessed=float(node.attrib.get('accessed', '0'))
+                ))
+            except (KeyError, ValueError):
+                continue
+        entries.sort(key=lambda x: x.accessed)
+        for entry in entries:
+            if os.path.isfile(self.filePath(entry.digest)):
+                self.insertEntry(entry)
+        self._dirty = False
+
+    def save(self):
+        if not self._dirty:
+            return
+        root = ET.Element('FaviconCache')
+        for entry in self._entries.values():
+            node = ET.Element('entry')
+            node.attrib['url'] = entry.url
+            node.attrib['digest'] = entry.digest
+            node.attrib['size'] = str(entry.size)
+            node.attrib['etag'] = entry.etag
+            node.attrib['last_modified'] = entry.last_modified
+            node.attrib['checked'] = '%.0f' % entry.checked
+            node.attrib['accessed'] = '%.0f' % entry.accessed
+            root.append(node)
+        writeXmlFile(root, self._index_path, backup=False)
+        self._dirty = False
+
+    def isDirty(self) -> bool:
+        return self._dirty
+
+    def filePath(self, digest: str) -> str:
+        return os.path.join(self._path, digest)
+
+    def entry(self, url: str) -> Union[FaviconCacheEntry, None]:
+        return self._entries.get(url)
+
+    def isFresh(self, url: str) -> bool:
+        entry = self._entries.get(url)
+        if entry is None:
+            return False
+        return time.time() - entry.checked < self._revalidate_interval
+
+    def icon(self, url: str) -> Union[QIcon, None]:
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        self.touch(entry)
+        icon = self._icons.get(url)
+        if icon is None:
+            pixmap = QPixmap()
+            if not pixmap.load(self.filePath(entry.digest)):
+                self.removeEntry(entry)
+                return None
+            icon = QIcon(pixmap)
+            self._icons[url] = icon
+        return icon
+
+    def store(self, url: str, data: bytes, etag: str = '', last_modified: str = '') -> Union[QIcon, None]:
+        pixmap = QPixmap()
+        if not pixmap.loadFromData(data):
+            return None
+        digest = hashlib.sha1(data).hexdigest()
+        now = time.time()
+        entry = self._entries.get(url)
+        if entry is not None and entry.digest != digest:
+            self.removeEntry(entry)
+            entry = None
+        if entry is None:
+            path = self.filePath(digest)
+            if digest not in self._refcount and not os.path.isfile(path):
+                if not os.path.isdir(self._path):
+                    os.makedirs(self._path)
+                with open(path, 'wb') as fp:
+                    fp.write(data)
+            self.insertEntry(FaviconCacheEntry(url, digest, len(data), etag, last_modified, now, now))
+        else:
+            entry.etag = etag
+            entry.last_modified = last_modified
+            entry.checked = now
+            self.touch(entry)
+            self._dirty = True
+        icon = QIcon(pixmap)
+        self._icons[url] = icon
+        self.evict()
+        return icon
+
+    def storeIcon(self, url: str, icon: QIcon):
+        if not url or icon.isNull() or self.isFresh(url):
+            return
+        sizes = icon.availableSizes()
+        pixmap = icon.pixmap(sizes[-1] if sizes else QSize(32, 32))
+        array = QByteArray()
+        buffer = QBuffer(array)
+        buffer.open(QIODevice.WriteOnly)
+        pixmap.save(buffer, 'PNG')
+        buffer.close()
+        self.store(url, bytes(array))
+
+    def revalidated(self, url: str):
+        entry = self._entries.get(url)
+        if entry is not None:
+            entry.checked = time.time()
+            self._dirty = True
+
+    def touch(self, entry: FaviconCacheEntry):
+        # lookups only reorder in memory, access times are written with the next store/evict
+        entry.accessed = time.time()
+        self._entries.move_to_end(entry.url)
+
+    def insertEntry(self, entry: FaviconCacheEntry):
+        self._entries[entry.url] = entry
+        count = self._refcount.get(entry.digest, 0)
+        if count == 0:
+            self._filesize[entry.digest] = entry.size
+            self._total_bytes += entry.size
+        self._refcount[entry.digest] = count + 1
+        self._dirty = True
+
+    def removeEntry(self, entry: FaviconCacheEntry):
+        self._entries.pop(entry.url, None)
+        self._icons.pop(entry.url, None)
+        count = self._refcount.get(entry.digest, 0) - 1
+        if count <= 0:
+            self._refcount.pop(entry.digest, None)
+            self._total_bytes -= self._filesize.pop(entry.digest, 0)
+            try:
+                os.remove(self.filePath(entry.digest))
+            except OSError:
+                pass
+        else:
+            self._refcount[entry.digest] = count
+        self._dirty = True
+
+    def evict(self):
+        while self._total_bytes > self._max_bytes and len(self._entries) > 1:
+            oldest = next(iter(self._entries.values()))
+            self.removeEntry(oldest)
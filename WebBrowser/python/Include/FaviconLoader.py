@@ -0,0 +1,111 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : FaviconLoader.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Asynchronous favicon downloader (bounded, non-blocking)
+# -------------------------------------------------------------------------------------------------------------------- #
+import os
+from collections import deque
+from functools import partial
+from typing import Deque, Dict, Set, Union
+from PyQt5.QtCore import QObject, QUrl, QTimer, pyqtSignal
+from PyQt5.QtGui import QIcon
+from PyQt5.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+from FaviconCache import FaviconCache
+
+
+class FaviconLoader(QObject):
+    # network access manager keeps connections alive per host,
+    # at most 'max_concurrent' requests are in flight and each one is aborted after 'timeout_ms'.
+    # downloaded icons are kept in the favicon cache, stale entries are revalidated with conditional requests
+    _instance: Union['FaviconLoader', None] = None
+
+    sig_icon_loaded = pyqtSignal(str, QIcon)
+
+    def __init__(self, cache: FaviconCache, max_concurrent: int = 6, timeout_ms: int = 5000, parent=None):
+        super().__init__(parent=parent)
+        self._cache = cache
+        self._timerSave = QTimer(self)
+        self._timerSave.setSingleShot(True)
+        self._timerSave.setInterval(2000)
+        self._timerSave.timeout.connect(self.saveCache)
+        self._network = QNetworkAccessManager(self)
+        self._max_concurrent = max(1, max_concurrent)
+        self._timeout_ms = timeout_ms
+        self._queue: Deque[str] = deque()
+        self._pending: Set[str] = set()
+        self._replies: Dict[QNetworkReply, str] = dict()
+
+    @classmethod
+    def instance(cls) -> 'FaviconLoader':
+        if cls._instance is None:
+            curpath = os.path.dirname(os.path.abspath(__file__))
+            cachepath = os.path.join(os.path.dirname(curpath), 'Config', 'Favicon')
+            cls._instance = FaviconLoader(FaviconCache(cachepath))
+        return cls._instance
+
+    def icon(self, url: str, revalidate: bool = True) -> Union[QIcon, None]:
+        icon = self._cache.icon(url)
+        if icon is not None:
+            if revalidate and not self._cache.isFresh(url):
+                self.request(url)
+        if self._cache.isDirty():
+            self._timerSave.start()
+        return icon
+
+    def storeIcon(self, url: str, icon: QIcon):
+        self._cache.storeIcon(url, icon)
+        if self._cache.isDirty():
+            self._timerSave.start()
+
+    def saveCache(self):
+        self._timerSave.stop()
+        try:
+            self._cache.save()
+        except Exception:
+            pass
+
+    def request(self, url: str):
+        if not url or url in self._pending:
+            return
+        self._pending.add(url)
+        self._queue.append(url)
+        self.dispatch()
+
+    def pendingCount(self) -> int:
+        return len(self._pending)
+
+    def dispatch(self):
+        while self._queue and len(self._replies) < self._max_concurrent:
+            url = self._queue.popleft()
+            request = QNetworkRequest(QUrl(url))
+            request.setAttribute(QNetworkRequest.RedirectPolicyAttribute, QNetworkRequest.NoLessSafeRedirectPolicy)
+            request.setTransferTimeout(self._timeout_ms)
+            entry = self._cache.entry(url)
+            if entry is not None:
+                if entry.etag:
+                    request.setRawHeader(b'If-None-Match', entry.etag.encode())
+                if entry.last_modified:
+                    request.setRawHeader(b'If-Modified-Since', entry.last_modified.encode())
+            reply = self._network.get(request)
+            self._replies[reply] = url
+            reply.finished.connect(partial(self.onReplyFinished, reply))
+
+    def onReplyFinished(self, reply: QNetworkReply):
+        url = self._replies.pop(reply, None)
+        if url is not None:
+            icon = None
+            status = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+            if status == 304:
+                self._cache.revalidated(url)
+            elif reply.error() == QNetworkReply.NoError:
+                etag = bytes(reply.rawHeader(b'ETag')).decode(errors='ignore')
+                last_modified = bytes(reply.rawHeader(b'Last-Modified')).decode(errors='ignore')
+                icon = self._cache.store(url, bytes(reply.readAll()), etag, last_modified)
+            if icon is None:
+                icon = self._cache.icon(url)
+            self._pending.discard(url)
+            self._timerSave.start()
+            self.sig_icon_loaded.emit(url, icon if icon is not None else QIcon())
+        reply.deleteLater()
+        self.dispatch()
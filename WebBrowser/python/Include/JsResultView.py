@@ -0,0 +1,257 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : JsResultView.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Lazy tree view of javascript results (nested objects, arrays and long strings are paged)
+# -------------------------------------------------------------------------------------------------------------------- #
+import json
+from typing import Iterator, List, Union
+from PyQt5.QtCore import Qt, QModelIndex, QAbstractItemModel
+from PyQt5.QtGui import QTextOption
+from PyQt5.QtWidgets import QWidget, QTreeView, QPlainTextEdit, QPushButton, QLabel, QSplitter, QHeaderView
+from PyQt5.QtWidgets import QVBoxLayout, QHBoxLayout, QAbstractItemView
+
+
+class JsResultNode:
+    # children are created on demand (fetchMore), a long string is split into pages of 'string_page' characters
+    __slots__ = ('key', 'value', 'parent', 'row', 'children', 'page', '_keys')
+
+    def __init__(self, key: str, value: object, parent: Union['JsResultNode', None], row: int, page: bool = False):
+        self.key = key
+        self.value = value
+        self.parent = parent
+        self.row = row
+        self.children: List['JsResultNode'] = list()
+        self.page = page  # a page of the parent string
+        self._keys: Union[list, None] = None
+
+    def childCount(self, string_page: int) -> int:
+        if isinstance(self.value, (dict, list, tuple)):
+            return len(self.value)
+        if isinstance(self.value, str) and not self.page and len(self.value) > string_page:
+            return (len(self.value) + string_page - 1) // string_page
+        return 0
+
+    def createChild(self, row: int, string_page: int) -> 'JsResultNode':
+        if isinstance(self.value, dict):
+            if self._keys is None:
+                self._keys = list(self.value.keys())
+            key = self._keys[row]
+            return JsResultNode(str(key), self.value[key], self, row)
+        if isinstance(self.value, (list, tuple)):
+            return JsResultNode(f'[{row}]', self.value[row], self, row)
+        start = row * string_page
+        end = min(len(self.value), start + string_page)
+        return JsResultNode(f'[{start}:{end}]', self.value[start:end], self, row, page=True)
+
+
+def typeName(value: object) -> str:
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, (int, float)):
+        return 'number'
+    if isinstance(value, str):
+        return 'string'
+    if isinstance(value, dict):
+        return 'object'
+    if isinstance(value, (list, tuple)):
+        return 'array'
+    return type(value).__name__
+
+
+def textChunks(value: object) -> Iterator[str]:
+    # text of a value, produced piece by piece (containers are encoded as json only as far as they are read)
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, (dict, list, tuple)):
+        yield from json.JSONEncoder(ensure_ascii=False, indent=2, default=str).iterencode(value)
+    else:
+        yield json.dumps(value, ensure_ascii=False, default=str)
+
+
+class JsResultModel(QAbstractItemModel):
+    # the result is the only top level row. rows are fetched 'fetch_size' at a time, so opening an array of
+    # 50k elements creates only the rows which are scrolled into view
+    columns = ['Key', 'Type', 'Value']
+    fetch_size: int = 500
+    string_page: int = 10000  # characters of a string page
+    preview_chars: int = 200
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._root = JsResultNode('', None, None, 0)
+
+    def setResult(self, value: object):
+        self.beginResetModel()
+        self._root = JsResultNode('', None, None, 0)
+        self._root.children.append(JsResultNode('result', value, self._root, 0))
+        self.endResetModel()
+
+    def node(self, index: QModelIndex) -> JsResultNode:
+        return index.internalPointer() if index.isValid() else self._root
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        node = self.node(parent)
+        if 0 <= row < len(node.children) and 0 <= column < len(self.columns):
+            return self.createIndex(row, column, node.children[row])
+        return QModelIndex()
+
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self._root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
+        return len(self.node(parent).children)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return len(self.columns)
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if parent.column() > 0:
+            return False
+        node = self.node(parent)
+        return len(node.children) > 0 or node.childCount(self.string_page) > 0
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        node = self.node(parent)
+        return len(node.children) < node.childCount(self.string_page)
+
+    def fetchMore(self, parent: QModelIndex):
+        node = self.node(parent)
+        start = len(node.children)
+        end = min(node.childCount(self.string_page), start + self.fetch_size)
+        if end <= start:
+            return
+        self.beginInsertRows(parent, start, end - 1)
+        node.children.extend([node.createChild(row, self.string_page) for row in range(start, end)])
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        node = index.internalPointer()
+        if role == Qt.DisplayRole:
+            if index.column() == 0:
+                return node.key
+            elif index.column() == 1:
+                return typeName(node.value)
+            return self.preview(node)
+        elif role == Qt.ToolTipRole and index.column() == 2 and isinstance(node.value, str):
+            return f'{len(node.value)} characters'
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.columns[section]
+        return None
+
+    def preview(self, node: JsResultNode) -> str:
+        value = node.value
+        if isinstance(value, dict):
+            return f'Object({len(value)})'
+        if isinstance(value, (list, tuple)):
+            return f'Array({len(value)})'
+        if isinstance(value, str):
+            text = value[:self.preview_chars].replace('\r', '\\r').replace('\n', '\\n')
+            if len(value) > self.preview_chars:
+                return f'"{text}..." ({len(value)} characters)'
+            return f'"{text}"'
+        return next(textChunks(value))
+
+
+class JsResultWidget(QWidget):
+    # tree of the result and text of the selected node. the text is shown 'byte_cap' (utf-8) bytes at a time,
+    # 'Load More' appends the next part
+    byte_cap: int = 64 * 1024
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._model = JsResultModel(self)
+        self._tree = QTreeView()
+        self._editText = QPlainTextEdit()
+        self._btnLoadMore = QPushButton('Load More')
+        self._lblStatus = QLabel()
+        self._chunks: Union[Iterator[str], None] = None
+        self._pending = ''
+        self._shown_bytes = 0
+        self.initControl()
+        self.initLayout()
+
+    def initLayout(self):
+        vbox = QVBoxLayout(self)
+        vbox.setContentsMargins(0, 0, 0, 0)
+        vbox.setSpacing(4)
+        splitter = QSplitter(Qt.Vertical)
+        splitter.addWidget(self._tree)
+        splitter.addWidget(self._editText)
+        vbox.addWidget(splitter)
+        hbox = QHBoxLayout()
+        hbox.setContentsMargins(0, 0, 0, 0)
+        hbox.setSpacing(4)
+        hbox.addWidget(self._lblStatus)
+        hbox.addStretch()
+        hbox.addWidget(self._btnLoadMore)
+        vbox.addLayout(hbox)
+
+    def initControl(self):
+        self._tree.setModel(self._model)
+        self._tree.setUniformRowHeights(True)
+        self._tree.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._tree.header().setStretchLastSection(True)
+        self._tree.header().setSectionResizeMode(QHeaderView.Interactive)
+        self._tree.selectionModel().currentChanged.connect(self.onTreeCurrentChanged)
+        self._editText.setReadOnly(True)
+        # word wrapping of a long line without spaces (minified json, dom dump) takes seconds
+        self._editText.setWordWrapMode(QTextOption.WrapAnywhere)
+        self._btnLoadMore.clicked.connect(self.loadMore)
+        self._btnLoadMore.setEnabled(False)
+
+    def setResult(self, value: object):
+        self._model.setResult(value)
+        index = self._model.index(0, 0)
+        self._tree.expand(index)
+        self._tree.setCurrentIndex(index)
+
+    def onTreeCurrentChanged(self, current: QModelIndex, _: QModelIndex):
+        self._editText.clear()
+        self._chunks = textChunks(self._model.node(current).value) if current.isValid() else None
+        self._pending = ''
+        self._shown_bytes = 0
+        self.loadMore()
+
+    def loadMore(self):
+        budget = self.byte_cap
+        parts = list()
+        while budget > 0 and self._chunks is not None:
+            if not self._pending:
+                self._pending = next(self._chunks, '')
+                if not self._pending:
+                    self._chunks = None
+                    break
+            # characters fitting in the budget (a multibyte character is not split)
+            piece = self._pending[:budget].encode('utf-8', 'replace')[:budget].decode('utf-8', 'ignore')
+            if not piece:
+                break
+            self._pending = self._pending[len(piece):]
+            parts.append(piece)
+            budget -= len(piece.encode('utf-8', 'replace'))
+        if parts:
+            self._editText.moveCursor(self._editText.textCursor().End)
+            self._editText.insertPlainText(''.join(parts))
+            self._shown_bytes += self.byte_cap - budget
+        if self._chunks is not None and not self._pending:
+            self._pending = next(self._chunks, '')
+            if not self._pending:
+                self._chunks = None
+        more = self._chunks is not None
+        self._btnLoadMore.setEnabled(more)
+        size = f'{self._shown_bytes} bytes' if self._shown_bytes < 1024 else f'{self._shown_bytes / 1024:.1f} KB'
+        self._lblStatus.setText(f'{size} shown' + (' (truncated)' if more else ''))
@@ -0,0 +1,117 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : LoadTiming.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Page load timing records (ring buffer, optional jsonl stream) and per-host summary
+# -------------------------------------------------------------------------------------------------------------------- #
+import os
+import json
+import math
+from collections import deque
+from typing import Dict, List, Union
+from urllib.parse import urlsplit
+from Common import ensurePathExist
+
+# navigation entry and the slowest resource entries of the page (times in ms since navigation start)
+TIMING_SCRIPT = """
+(function(max_resources) {
+    var nav = performance.getEntriesByType('navigation');
+    var res = performance.getEntriesByType('resource');
+    var size = 0;
+    for (var i = 0; i < res.length; i++) size += res[i].transferSize || 0;
+    var slowest = res.slice().sort(function(a, b) { return b.duration - a.duration; }).slice(0, max_resources);
+    return JSON.stringify({
+        navigation: nav.length ? nav[0].toJSON() : null,
+        resource_count: res.length,
+        resource_transfer_size: size,
+        resources: slowest.map(function(e) {
+            return {name: e.name, type: e.initiatorType, start: e.startTime, duration: e.duration,
+                    size: e.transferSize};
+        })
+    });
+})(%d)
+"""
+
+
+def percentile(values: List[float], p: float) -> float:
+    # nearest-rank percentile
+    if not values:
+        return 0.
+    ordered = sorted(values)
+    return ordered[max(0, min(len(ordered) - 1, int(math.ceil(p / 100. * len(ordered))) - 1))]
+
+
+class LoadTimingRecorder:
+    # keeps the latest 'capacity' navigation records in memory, each record is also appended to the jsonl file
+    # (one json object per line) when an output path is set
+    _instance: Union['LoadTimingRecorder', None] = None
+    max_resources: int = 20
+
+    def __init__(self, capacity: int = 1000):
+        self._records = deque(maxlen=capacity)
+        self._path = ''
+        self._fp = None
+
+    @classmethod
+    def instance(cls) -> 'LoadTimingRecorder':
+        if cls._instance is None:
+            cls._instance = LoadTimingRecorder()
+        return cls._instance
+
+    def script(self) -> str:
+        return TIMING_SCRIPT % self.max_resources
+
+    def setOutputPath(self, path: str):
+        self.close()
+        self._path = path
+        if path:
+            ensurePathExist(os.path.dirname(os.path.abspath(path)))
+            self._fp = open(path, 'a', encoding='utf-8')
+
+    def close(self):
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+
+    def record(self, record: dict):
+        self._records.append(record)
+        if self._fp is not None:
+            try:
+                self._fp.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+                self._fp.flush()
+            except OSError:
+                pass
+
+    def records(self, host: Union[str, None] = None) -> List[dict]:
+        if host is None:
+            return list(self._records)
+        return [x for x in self._records if x.get('host') == host]
+
+    def summary(self) -> Dict[str, dict]:
+        # {host: {'count', 'load_p50', 'load_p95', 'dcl_p50', 'dcl_p95'}} of successful loads (ms)
+        loads: Dict[str, List[float]] = dict()
+        dcls: Dict[str, List[float]] = dict()
+        for record in self._records:
+            if not record.get('ok'):
+                continue
+            host = record.get('host', '')
+            loads.setdefault(host, list()).append(record['load_ms'])
+            if record.get('dom_content_loaded_ms') is not None:
+                dcls.setdefault(host, list()).append(record['dom_content_loaded_ms'])
+        result = dict()
+        for host, values in loads.items():
+            result[host] = {
+                'count': len(values),
+                'load_p50': percentile(values, 50),
+                'load_p95': percentile(values, 95),
+                'dcl_p50': percentile(dcls.get(host, []), 50),
+                'dcl_p95': percentile(dcls.get(host, []), 95)
+            }
+        return result
+
+    @staticmethod
+    def hostOf(url: str) -> str:
+        try:
+            return urlsplit(url).hostname or ''
+        except ValueError:
+            return ''
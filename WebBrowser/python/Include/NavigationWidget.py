@@ -4,9 +4,11 @@
 # Author       : Yogyui
 # Description  : Implementation of Navigation Toolbar
 # -------------------------------------------------------------------------------------------------------------------- #
+from typing import Callable, List, Tuple, Union
 from PyQt5.QtCore import pyqtSignal, QSize
-from PyQt5.QtGui import QIcon
-from PyQt5.QtWidgets import QToolBar, QToolButton, QLineEdit
+from PyQt5.QtWidgets import QToolBar, QToolButton, QLineEdit, QCompleter
+from Resources import getIcon
+from UrlCompleter import UrlCompletionModel
 
 
 class NavigationToolBar(QToolBar):
@@ -19,6 +21,7 @@ class NavigationToolBar(QToolBar):
     sig_stop = pyqtSignal()
     sig_go_home = pyqtSignal()
     sig_toggle_bookmark = pyqtSignal()
+    sig_predict_url = pyqtSignal(str)  # likely next navigation (top or highlighted suggestion), '' for none
 
     def __init__(self, parent=None):
         super().__init__('Navigation', parent=parent)
@@ -27,11 +30,14 @@ class NavigationToolBar(QToolBar):
         self.btnForward = QToolButton()
         self.btnReload = QToolButton()
         self.btnHome = QToolButton()
-        self._iconRefresh = QIcon('./Resource/reload.png')
-        self._iconStop = QIcon('./Resource/cancel.png')
+        self._iconRefresh = getIcon('reload.png')
+        self._iconStop = getIcon('cancel.png')
         self.btnBookmark = QToolButton()
-        self._iconBookmarkOff = QIcon('./Resource/bookmark_off.png')
-        self._iconBookmarkOn = QIcon('./Resource/bookmark_on.png')
+        self._iconBookmarkOff = getIcon('bookmark_off.png')
+        self._iconBookmarkOn = getIcon('bookmark_on.png')
+        self._completer = QCompleter(self)
+        self._completionModel = UrlCompletionModel(self)
+        self._completionSource: Union[Callable[[str], List[Tuple[str, str]]], None] = None
         self.initControl()
         self.initLayout()
         stylesheet = "QToolBar {border: 0px;}"
@@ -52,25 +58,54 @@ class NavigationToolBar(QToolBar):
 
     def initControl(self):
         self.editUrl.returnPressed.connect(self.onEditUrlReturnPressed)
+        self.editUrl.textEdited.connect(self.onEditUrlTextEdited)
+        # suggestions are queried on every keystroke and shown as they are (not filtered by the completer)
+        self._completer.setModel(self._completionModel)
+        self._completer.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self._completer.setMaxVisibleItems(10)
+        self._completer.setWidget(self.editUrl)
+        self._completer.activated[str].connect(self.onCompleterActivated)
+        self._completer.highlighted[str].connect(self.sig_predict_url.emit)
         self.btnBackward.setEnabled(False)
         self.btnBackward.clicked.connect(self.sig_go_backward.emit)
-        self.btnBackward.setIcon(QIcon('./Resource/previous.png'))
+        self.btnBackward.setIcon(getIcon('previous.png'))
         self.btnBackward.setToolTip('Previous')
         self.btnForward.setEnabled(False)
         self.btnForward.clicked.connect(self.sig_go_forward.emit)
-        self.btnForward.setIcon(QIcon('./Resource/forward.png'))
+        self.btnForward.setIcon(getIcon('forward.png'))
         self.btnForward.setToolTip('Forward')
         self.btnReload.clicked.connect(self.onClickBtnStopRefresh)
         self.btnReload.setIcon(self._iconRefresh)
         self.btnReload.setToolTip('Reload')
         self.btnHome.clicked.connect(self.sig_go_home.emit)
-        self.btnHome.setIcon(QIcon('./Resource/home.png'))
+        self.btnHome.setIcon(getIcon('home.png'))
         self.btnHome.setToolTip('Home')
         self.btnBookmark.clicked.connect(self.sig_toggle_bookmark.emit)
         self.btnBookmark.setIcon(self._iconBookmarkOff)
         self.btnBookmark.setToolTip('BookMark')
 
+    def setCompletionSource(self, source: Union[Callable[[str], List[Tuple[str, str]]], None]):
+        # source(text) returns suggestions [(url, title), ...]
+        self._completionSource = source
+
+    def onEditUrlTextEdited(self, text: str):
+        rows = self._completionSource(text) if self._completionSource is not None and text.strip() else []
+        self._completionModel.setRows(rows)
+        self.sig_predict_url.emit(rows[0][0] if rows else '')
+        if rows:
+            self._completer.complete()
+        else:
+            self._completer.popup().hide()
+
+    def onCompleterActivated(self, url: str):
+        self.editUrl.setText(url)
+        self.sig_navigate_url.emit(url)
+
     def onEditUrlReturnPressed(self):
+        popup = self._completer.popup()
+        if popup.isVisible() and popup.currentIndex().isValid():
+            return  # the highlighted suggestion is activated by the completer
+        popup.hide()
         self.sig_navigate_url.emit(self.editUrl.text())
 
     def onClickBtnStopRefresh(self):
@@ -0,0 +1,545 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : NetworkLog.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Per-tab network request log (profile request interceptor), waterfall panel and HAR export
+# -------------------------------------------------------------------------------------------------------------------- #
+import json
+import time
+from collections import deque
+from typing import Dict, List, Set, Union
+from PyQt5.QtCore import Qt, QUrl, QTimer, QRect, QDateTime, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QColor, QPainter, QShowEvent, QHideEvent
+from PyQt5.QtWidgets import QWidget, QTableView, QPushButton, QHeaderView, QAbstractItemView, QLineEdit, QLabel
+from PyQt5.QtWidgets import QComboBox, QCheckBox, QStyledItemDelegate, QStyleOptionViewItem, QFileDialog
+from PyQt5.QtWidgets import QVBoxLayout, QHBoxLayout
+from PyQt5.QtWebEngineWidgets import QWebEnginePage, QWebEngineScript
+from PyQt5.QtWebEngineCore import QWebEngineUrlRequestInterceptor, QWebEngineUrlRequestInfo
+from ProfileManager import RESOURCE_TYPES
+
+# page key of a first party url (flags are combined once, not per request)
+PAGE_KEY_FORMAT = QUrl.RemoveFragment | QUrl.FullyEncoded
+# resource timing entries of the document from index 'start' on (the page buffer keeps 250 entries, an observer
+# installed by the first call keeps the later ones). 'origin' tells documents apart
+NETWORK_TIMING_SCRIPT = """
+(function(start) {
+    if (!window.__networkTimings) {
+        var timings = window.__networkTimings = performance.getEntriesByType('resource').slice();
+        try {
+            new PerformanceObserver(function(list) {
+                Array.prototype.push.apply(timings, list.getEntries());
+            }).observe({entryTypes: ['resource']});
+        } catch (e) {}
+    }
+    var entries = window.__networkTimings.slice(start);
+    return JSON.stringify({
+        origin: performance.timeOrigin,
+        count: window.__networkTimings.length,
+        entries: entries.map(function(e) { return [e.name, e.startTime, e.duration, e.transferSize || 0]; })
+    });
+})(%d)
+"""
+
+
+class NetworkRequest:
+    __slots__ = ['seq', 'time', 'start_ms', 'method', 'url', 'type_name', 'blocked', 'duration_ms', 'size',
+                 'navigation']
+
+    def __init__(self, seq: int, time_: float, start_ms: float, method: str, url: str, type_name: str,
+                 blocked: bool, navigation: int):
+        self.seq = seq
+        self.time = time_  # epoch seconds
+        self.start_ms = start_ms  # since the navigation started
+        self.method = method
+        self.url = url
+        self.type_name = type_name
+        self.blocked = blocked
+        self.duration_ms: Union[float, None] = None  # from resource timing, when the page reported it
+        self.size = 0  # transfer size (0: cached or not reported)
+        self.navigation = navigation
+
+
+class PageNetworkLog:
+    # ring buffer of the requests of one page (tab). a navigation is the main frame request and what follows it
+    def __init__(self, capacity: int):
+        self.entries: deque = deque(maxlen=capacity)
+        self.seq = 0  # requests logged so far, including the ones dropped from the buffer
+        self.blocked = 0
+        self.navigation = 0
+        self.navigation_t0 = time.monotonic()
+        self.timing_origin = 0.
+        self.timing_count = 0  # resource timing entries received of the current document
+
+    def startNavigation(self):
+        self.navigation += 1
+        self.navigation_t0 = time.monotonic()
+
+    def applyTimings(self, result: dict):
+        # durations (and transfer sizes) of the current navigation, matched by url in request order
+        if result.get('origin') != self.timing_origin:
+            self.timing_origin = result.get('origin')
+            self.timing_count = 0
+            if result.get('count', 0) != len(result.get('entries', [])):
+                return  # entries of the previous document were asked, next call starts from 0
+        pending: Dict[str, deque] = dict()
+        for entry in self.entries:
+            if entry.navigation == self.navigation and entry.duration_ms is None:
+                pending.setdefault(entry.url, deque()).append(entry)
+        for url, _, duration, size in result.get('entries', []):
+            candidates = pending.get(url)
+            if candidates:
+                entry = candidates.popleft()
+                entry.duration_ms = duration
+                entry.size = size
+        self.timing_count = result.get('count', self.timing_count)
+
+
+class NetworkLog:
+    # requests of every profile are passed by the request interceptor (ProfileManager.addRequestObserver) on the
+    # gui thread, which counts them and logs the blocked ones. allowed requests are logged by the interceptor of
+    # their page (PageRequestInterceptor, Qt >= 5.13). the profile request info has no page, so a request logged by
+    # the profile belongs to the page whose main frame navigation (WebPage.acceptNavigationRequest) is its first
+    # party url: tabs showing the same url share the latest one (sharingPages). pages not shown in a tab
+    # (detachPage: speculative preloads, replaced views) only take a url nobody owns
+    _instance: Union['NetworkLog', None] = None
+    enabled: bool = True  # --network_log
+    capacity: int = 2000  # per tab
+    page_interceptors: bool = hasattr(QWebEnginePage, 'setUrlRequestInterceptor')
+
+    def __init__(self):
+        self._pages: Dict[QWebEnginePage, PageNetworkLog] = dict()
+        self._first_party: Dict[str, QWebEnginePage] = dict()
+        self._page_keys: Dict[QWebEnginePage, str] = dict()
+        self._detached: Set[QWebEnginePage] = set()
+        self.unattributed = 0  # requests without a known page (service workers, closed tabs)
+
+    @classmethod
+    def instance(cls) -> 'NetworkLog':
+        if cls._instance is None:
+            cls._instance = NetworkLog()
+        return cls._instance
+
+    def navigate(self, page: QWebEnginePage, url: QUrl, reload: bool = False):
+        # main frame navigation of 'page' (before its request is made)
+        if not self.enabled:
+            return
+        key = url.toString(PAGE_KEY_FORMAT)
+        previous = self._page_keys.get(page)
+        if previous == key and url.hasFragment() and not reload:
+            return  # same document
+        if previous is not None and self._first_party.get(previous) is page:
+            del self._first_party[previous]
+        if page in self._detached:
+            self._first_party.setdefault(key, page)
+        else:
+            self._first_party[key] = page
+        self._page_keys[page] = key
+        self.pageLog(page).startNavigation()
+
+    def attachPage(self, page: QWebEnginePage):
+        # page is shown in a tab (WebPageWidget.attachView): it owns its url again
+        self._detached.discard(page)
+        key = self._page_keys.get(page)
+        if key is not None:
+            self._first_party[key] = page
+
+    def detachPage(self, page: QWebEnginePage):
+        self._detached.add(page)
+
+    def removePage(self, page: QWebEnginePage):
+        self._pages.pop(page, None)
+        self._detached.discard(page)
+        key = self._page_keys.pop(page, None)
+        if key is not None and self._first_party.get(key) is page:
+            del self._first_party[key]
+
+    def pageLog(self, page: QWebEnginePage) -> PageNetworkLog:
+        log = self._pages.get(page)
+        if log is None:
+            log = self._pages[page] = PageNetworkLog(self.capacity)
+        return log
+
+    def findPageLog(self, page: Union[QWebEnginePage, None]) -> Union[PageNetworkLog, None]:
+        return self._pages.get(page)
+
+    def sharingPages(self, page: Union[QWebEnginePage, None]) -> int:
+        # other pages showing the url of 'page' (requests attributed by url go to the latest of them)
+        key = self._page_keys.get(page)
+        return 0 if key is None else sum(1 for x in self._page_keys.values() if x == key) - 1
+
+    def installInterceptor(self, page: QWebEnginePage) -> Union['PageRequestInterceptor', None]:
+        # called by WebPage on creation, the page keeps the returned interceptor
+        if not self.enabled or not self.page_interceptors:
+            return None
+        interceptor = PageRequestInterceptor(page)
+        page.setUrlRequestInterceptor(interceptor)
+        return interceptor
+
+    def onRequest(self, info, type_name: str, blocked: bool):
+        # request observer of ProfileManager
+        if not self.enabled:
+            return
+        log = self._pages.get(self._first_party.get(info.firstPartyUrl().toString(PAGE_KEY_FORMAT)))
+        if log is None:
+            self.unattributed += 1
+        elif blocked or not self.page_interceptors:
+            self.logRequest(log, info, type_name, blocked)
+
+    def onPageRequest(self, page: QWebEnginePage, info):
+        # request of 'page' passed by its interceptor (not blocked by the profile interceptor)
+        if not self.enabled:
+            return
+        log = self._pages.get(page)
+        if log is not None:
+            self.logRequest(log, info, RESOURCE_TYPES.get(info.resourceType(), 'other'), False)
+
+    @staticmethod
+    def logRequest(log: PageNetworkLog, info, type_name: str, blocked: bool):
+        log.seq += 1
+        log.blocked += blocked
+        log.entries.append(NetworkRequest(
+            log.seq, time.time(), (time.monotonic() - log.navigation_t0) * 1000,
+            info.requestMethod().data().decode('ascii', 'replace'), info.requestUrl().toString(QUrl.FullyEncoded),
+            type_name, blocked, log.navigation))
+
+
+class PageRequestInterceptor(QWebEngineUrlRequestInterceptor):
+    # interceptor of one page (QWebEnginePage.setUrlRequestInterceptor): it is called after the profile
+    # interceptor, only for the requests the profile interceptor did not block. the page keeps a reference
+    def __init__(self, page: QWebEnginePage):
+        super().__init__()
+        self._page = page
+
+    def interceptRequest(self, info: QWebEngineUrlRequestInfo):
+        NetworkLog.instance().onPageRequest(self._page, info)
+
+
+def isoTime(epoch: float) -> str:
+    return QDateTime.fromMSecsSinceEpoch(int(epoch * 1000)).toOffsetFromUtc(0).toString(Qt.ISODateWithMs)
+
+
+def toHar(entries: List[NetworkRequest]) -> dict:
+    # HAR 1.2 layout with what the interceptor and resource timing know: no headers, status or content.
+    # unknown sizes and durations are -1, '_blocked' and '_resourceType' are custom fields
+    pages, har_entries = dict(), list()
+    for entry in entries:
+        pageref = f'page_{entry.navigation}'
+        if pageref not in pages:
+            pages[pageref] = {
+                'startedDateTime': isoTime(entry.time - entry.start_ms / 1000),
+                'id': pageref,
+                'title': '',
+                'pageTimings': {}
+            }
+        if entry.type_name == 'document' and not pages[pageref]['title']:
+            pages[pageref]['title'] = entry.url
+        duration = entry.duration_ms if entry.duration_ms is not None else -1
+        har_entries.append({
+            'pageref': pageref,
+            'startedDateTime': isoTime(entry.time),
+            'time': max(duration, 0),
+            'request': {
+                'method': entry.method, 'url': entry.url, 'httpVersion': '', 'cookies': [], 'headers': [],
+                'queryString': [], 'headersSize': -1, 'bodySize': -1
+            },
+            'response': {
+                'status': 0, 'statusText': 'blocked' if entry.blocked else '', 'httpVersion': '', 'cookies': [],
+                'headers': [], 'content': {'size': -1, 'mimeType': ''}, 'redirectURL': '', 'headersSize': -1,
+                'bodySize': entry.size if entry.duration_ms is not None else -1
+            },
+            'cache': {},
+            'timings': {'send': 0, 'wait': max(duration, 0), 'receive': 0},
+            '_blocked': entry.blocked,
+            '_resourceType': entry.type_name,
+            '_startMs': round(entry.start_ms, 3),
+            '_durationMs': duration
+        })
+    return {'log': {
+        'version': '1.2',
+        'creator': {'name': 'YOGYUI Browser', 'version': ''},
+        'pages': list(pages.values()),
+        'entries': har_entries
+    }}
+
+
+class NetworkLogModel(QAbstractTableModel):
+    # filtered requests of one page, exposed 'page_size' rows at a time while scrolling (fetchMore). the last
+    # column is drawn as a waterfall bar (WaterfallDelegate)
+    columns = ['URL', 'Type', 'Method', 'Start', 'Duration', 'Status', 'Waterfall']
+    page_size: int = 200
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._rows: List[NetworkRequest] = list()
+        self._count = 0
+        self._text = ''
+        self._type_name = ''
+        self._blocked_only = False
+        self._last_seq = 0
+        self.span_ms = 1.  # end of the latest request, scale of the waterfall
+
+    def setFilter(self, text: str, type_name: str, blocked_only: bool):
+        self._text = text.lower()
+        self._type_name = type_name
+        self._blocked_only = blocked_only
+
+    def accepts(self, entry: NetworkRequest) -> bool:
+        if self._type_name and entry.type_name != self._type_name:
+            return False
+        if self._blocked_only and not entry.blocked:
+            return False
+        return not self._text or self._text in entry.url.lower()
+
+    def setEntries(self, entries: deque, navigation: int, reset: bool = False):
+        # requests of the current navigation. unless reset, rows logged since the last call are appended
+        if reset or not entries or entries[-1].seq < self._last_seq:
+            self.beginResetModel()
+            self._rows = [x for x in entries if x.navigation == navigation and self.accepts(x)]
+            self._count = min(len(self._rows), self.page_size)
+            self.endResetModel()
+        else:
+            # rows dropped from the ring buffer are removed from the top
+            evicted = 0
+            while evicted < len(self._rows) and self._rows[evicted].seq < entries[0].seq:
+                evicted += 1
+            shown = min(evicted, self._count)
+            if shown:
+                self.beginRemoveRows(QModelIndex(), 0, shown - 1)
+            del self._rows[:evicted]
+            self._count -= shown
+            if shown:
+                self.endRemoveRows()
+            count = min(entries[-1].seq - self._last_seq, len(entries))
+            if count > 0:
+                rows = [x for x in list(entries)[-count:] if x.navigation == navigation and self.accepts(x)]
+                shown_all = self._count == len(self._rows)
+                self._rows.extend(rows)
+                if shown_all and rows:
+                    # the tail is followed while every row is shown
+                    self.fetchMore(QModelIndex())
+        self._last_seq = entries[-1].seq if entries else 0
+        self.updateSpan()
+
+    def updateSpan(self):
+        self.span_ms = max([1.] + [x.start_ms + (x.duration_ms or 0) for x in self._rows])
+        if self._count:
+            self.dataChanged.emit(self.index(0, 3), self.index(self._count - 1, len(self.columns) - 1))
+
+    def entries(self) -> List[NetworkRequest]:
+        return list(self._rows)
+
+    def entry(self, row: int) -> NetworkRequest:
+        return self._rows[row]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._count
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.columns)
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        return not parent.isValid() and self._count < len(self._rows)
+
+    def fetchMore(self, parent: QModelIndex):
+        count = min(len(self._rows) - self._count, self.page_size)
+        if count > 0:
+            self.beginInsertRows(QModelIndex(), self._count, self._count + count - 1)
+            self._count += count
+            self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._rows[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return entry.url
+            elif column == 1:
+                return entry.type_name
+            elif column == 2:
+                return entry.method
+            elif column == 3:
+                return f'{entry.start_ms:.0f} ms'
+            elif column == 4:
+                return f'{entry.duration_ms:.0f} ms' if entry.duration_ms is not None else ''
+            elif column == 5:
+                return 'blocked' if entry.blocked else 'allowed'
+            return None
+        elif role == Qt.UserRole:
+            return entry
+        elif role == Qt.ToolTipRole and column == 0:
+            return entry.url
+        elif role == Qt.ForegroundRole and entry.blocked:
+            return QColor(200, 0, 0)
+        elif role == Qt.TextAlignmentRole and column in (3, 4):
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.columns[section]
+        return None
+
+
+class WaterfallDelegate(QStyledItemDelegate):
+    # bar from the start of the request to its end (a tick when the duration is not known)
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+        super().paint(painter, option, index)  # background and selection
+        entry: NetworkRequest = index.data(Qt.UserRole)
+        model: NetworkLogModel = index.model()
+        if entry is None:
+            return
+        rect: QRect = option.rect.adjusted(2, 3, -2, -3)
+        scale = rect.width() / max(model.span_ms, 1.)
+        x = rect.left() + int(entry.start_ms * scale)
+        width = max(2, int((entry.duration_ms or 0) * scale))
+        if entry.blocked:
+            color = QColor(200, 0, 0)
+        elif entry.duration_ms is None:
+            color = QColor(160, 160, 160)
+        else:
+            color = QColor(60, 120, 220)
+        painter.fillRect(QRect(x, rect.top(), min(width, rect.right() - x + 1), rect.height()), color)
+
+
+class NetworkLogWidget(QWidget):
+    # requests of the page set by setPage(), refreshed every 'interval_ms' while shown. durations come from the
+    # resource timing of the page (asked on refresh), blocked requests have none
+    interval_ms: int = 1000
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._page: Union[QWebEnginePage, None] = None
+        self._navigation = 0
+        self._model = NetworkLogModel(self)
+        self._editFilter = QLineEdit()
+        self._cmbType = QComboBox()
+        self._chkBlocked = QCheckBox('Blocked')
+        self._table = QTableView()
+        self._lblStatus = QLabel()
+        self._btnClear = QPushButton('Clear')
+        self._btnExport = QPushButton('Export HAR')
+        self._timer = QTimer(self)
+        self._timerFilter = QTimer(self)
+        self.initControl()
+        self.initLayout()
+
+    def initLayout(self):
+        vbox = QVBoxLayout(self)
+        vbox.setContentsMargins(0, 0, 0, 0)
+        vbox.setSpacing(4)
+        hbox = QHBoxLayout()
+        hbox.setContentsMargins(0, 0, 0, 0)
+        hbox.setSpacing(4)
+        hbox.addWidget(self._editFilter, 1)
+        hbox.addWidget(self._cmbType)
+        hbox.addWidget(self._chkBlocked)
+        vbox.addLayout(hbox)
+        vbox.addWidget(self._table)
+        hbox = QHBoxLayout()
+        hbox.setContentsMargins(0, 0, 0, 0)
+        hbox.setSpacing(4)
+        hbox.addWidget(self._lblStatus)
+        hbox.addStretch()
+        hbox.addWidget(self._btnClear)
+        hbox.addWidget(self._btnExport)
+        vbox.addLayout(hbox)
+
+    def initControl(self):
+        self._editFilter.setPlaceholderText('Filter URL')
+        self._editFilter.setClearButtonEnabled(True)
+        self._editFilter.textChanged.connect(lambda: self._timerFilter.start())
+        self._cmbType.addItems(['All', 'document', 'subdocument', 'script', 'stylesheet', 'image', 'font',
+                                'xmlhttprequest', 'media', 'object', 'ping', 'other'])
+        self._cmbType.currentIndexChanged.connect(self.applyFilter)
+        self._chkBlocked.toggled.connect(self.applyFilter)
+        self._timerFilter.setSingleShot(True)
+        self._timerFilter.setInterval(150)
+        self._timerFilter.timeout.connect(self.applyFilter)
+        self._timer.setInterval(self.interval_ms)
+        self._timer.timeout.connect(self.refresh)
+        self._table.setModel(self._model)
+        self._table.setItemDelegateForColumn(len(NetworkLogModel.columns) - 1, WaterfallDelegate(self._table))
+        self._table.verticalHeader().hide()
+        self._table.verticalHeader().setDefaultSectionSize(self._table.fontMetrics().height() + 6)
+        self._table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self._table.setWordWrap(False)
+        header = self._table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setStretchLastSection(True)
+        for column, width in enumerate([320, 90, 70, 80, 80, 80]):
+            header.resizeSection(column, width)
+        self._btnClear.clicked.connect(self.clear)
+        self._btnExport.clicked.connect(self.exportHar)
+
+    def showEvent(self, a0: QShowEvent) -> None:
+        super().showEvent(a0)
+        self._timer.start()
+        self.refresh()
+
+    def hideEvent(self, a0: QHideEvent) -> None:
+        super().hideEvent(a0)
+        self._timer.stop()
+
+    def setPage(self, page: Union[QWebEnginePage, None]):
+        if page is not self._page:
+            self._page = page
+            self.refresh(reset=True)
+
+    def pageLog(self) -> Union[PageNetworkLog, None]:
+        return NetworkLog.instance().findPageLog(self._page)
+
+    def applyFilter(self):
+        self._timerFilter.stop()
+        type_name = self._cmbType.currentText() if self._cmbType.currentIndex() > 0 else ''
+        self._model.setFilter(self._editFilter.text(), type_name, self._chkBlocked.isChecked())
+        self.refresh(reset=True)
+
+    def refresh(self, reset: bool = False):
+        log = self.pageLog()
+        if log is None:
+            self._model.setEntries(deque(), 0, reset=True)
+            self._lblStatus.setText('No requests' if NetworkLog.enabled else 'Network log is disabled')
+            return
+        reset = reset or log.navigation != self._navigation
+        self._navigation = log.navigation
+        self._model.setEntries(log.entries, log.navigation, reset=reset)
+        count = sum(1 for x in log.entries if x.navigation == log.navigation)
+        status = f'{self._model.rowCount()} / {count} requests ({log.blocked} blocked, {log.seq} logged)'
+        sharing = NetworkLog.instance().sharingPages(self._page)
+        if sharing:
+            # requests are told apart by the url of the tab, see NetworkLog
+            which = 'blocked requests' if NetworkLog.page_interceptors else 'requests'
+            status += f' - {sharing} other tab(s) show this url, {which} may be listed in the wrong tab'
+        self._lblStatus.setText(status)
+        if self.isVisible() and self._page is not None and self._page.lifecycleState() == QWebEnginePage.Active:
+            page, start = self._page, log.timing_count
+            self._page.runJavaScript(NETWORK_TIMING_SCRIPT % start, QWebEngineScript.ApplicationWorld,
+                                     lambda x: self.onTimings(page, x))
+
+    def onTimings(self, page: QWebEnginePage, value: object):
+        log = NetworkLog.instance().findPageLog(page)
+        if log is None or not isinstance(value, str):
+            return
+        try:
+            log.applyTimings(json.loads(value))
+        except ValueError:
+            return
+        if page is self._page:
+            self._model.updateSpan()
+
+    def clear(self):
+        log = self.pageLog()
+        if log is not None:
+            log.entries.clear()
+        self.refresh(reset=True)
+
+    def exportHar(self):
+        if self.pageLog() is None:
+            return
+        path, _ = QFileDialog.getSaveFileName(self, 'Export HAR', 'network.har', 'HAR (*.har *.json)')
+        if path:
+            with open(path, 'w', encoding='utf-8') as fp:
+                json.dump(toHar(self._model.entries()), fp, ensure_ascii=False, indent=1)
@@ -0,0 +1,383 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : PageSourceView.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Page source viewer (only visible lines are laid out and highlighted, indexed search)
+# -------------------------------------------------------------------------------------------------------------------- #
+import re
+import threading
+import traceback
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import Callable, List, Tuple, Union
+from PyQt5.QtCore import Qt, QObject, QRect, pyqtSignal
+from PyQt5.QtGui import QColor, QFont, QFontDatabase, QFontInfo, QPainter, QPaintEvent, QResizeEvent, QKeyEvent
+from PyQt5.QtWidgets import QWidget, QAbstractScrollArea, QLineEdit, QPushButton, QLabel, QCheckBox
+from PyQt5.QtWidgets import QVBoxLayout, QHBoxLayout
+
+# html tokens, a line is highlighted without the state of previous lines (a comment or a string spanning
+# several lines is highlighted only on its first and last line)
+HTML_TOKEN = re.compile(
+    r'(?P<comment><!--.*?(?:-->|$))'
+    r'|(?P<tag></?[A-Za-z!?][\w:.-]*|/?>)'
+    r'|(?P<attr>[\w:.-]+(?=\s*=))'
+    r'|(?P<string>"[^"]*"?|\'[^\']*\'?)'
+    r'|(?P<entity>&#?\w+;)'
+)
+TOKEN_COLORS = {
+    'comment': QColor(0, 128, 0),
+    'tag': QColor(128, 0, 128),
+    'attr': QColor(200, 80, 0),
+    'string': QColor(0, 0, 200),
+    'entity': QColor(150, 100, 0)
+}
+
+
+class SourceDocument:
+    # text and start offsets of its display lines. a line longer than 'max_line' characters (minified pages) is
+    # shown as several display lines, so memory is the text plus 8 bytes per line
+    max_line: int = 4096
+
+    def __init__(self, text: str, url: str = ''):
+        self.text = text
+        self.url = url
+        self.offsets = array('q')
+        self.max_columns = 0
+        self.buildIndex()
+
+    def buildIndex(self):
+        offsets, max_line = self.offsets, self.max_line
+        pos, longest = 0, 0
+        for line in self.text.split('\n'):
+            length = len(line)
+            if length > max_line:
+                offsets.extend(range(pos, pos + length, max_line))
+                longest = max_line
+            else:
+                offsets.append(pos)
+                longest = length if length > longest else longest
+            pos += length + 1
+        self.max_columns = longest
+
+    def lineCount(self) -> int:
+        return len(self.offsets)
+
+    def lineRange(self, line: int) -> Tuple[int, int]:
+        # [start, end) of the display line without line break
+        start = self.offsets[line]
+        end = self.offsets[line + 1] if line + 1 < len(self.offsets) else len(self.text)
+        if end > start and self.text[end - 1] == '\n':
+            end -= 1
+        return start, end
+
+    def line(self, line: int) -> str:
+        start, end = self.lineRange(line)
+        return self.text[start:end]
+
+    def lineOf(self, position: int) -> int:
+        return max(0, bisect_right(self.offsets, position) - 1)
+
+    def search(self, query: str, case_sensitive: bool = False) -> array:
+        # start offsets of all matches
+        if case_sensitive or query.lower() == query.upper():
+            result, find = array('q'), self.text.find
+            pos = find(query)
+            while pos >= 0:
+                result.append(pos)
+                pos = find(query, pos + 1)
+            return result
+        pattern = re.compile(re.escape(query), re.IGNORECASE)
+        return array('q', [m.start() for m in pattern.finditer(self.text)])
+
+
+class SourceWorker(QObject):
+    # builds documents and search indexes on a worker thread, only the latest request is run
+    sig_indexed = pyqtSignal(object)
+    sig_searched = pyqtSignal(str, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._cond = threading.Condition()
+        self._job: Union[Callable[[], None], None] = None
+        self._thread = threading.Thread(target=self.run, name='SourceWorker', daemon=True)
+        self._thread.start()
+
+    def request(self, job: Callable[[], None]):
+        with self._cond:
+            self._job = job
+            self._cond.notify_all()
+
+    def index(self, text: str, url: str):
+        self.request(lambda: self.sig_indexed.emit(SourceDocument(text, url)))
+
+    def search(self, document: SourceDocument, query: str, case_sensitive: bool):
+        self.request(lambda: self.sig_searched.emit(query, document.search(query, case_sensitive)))
+
+    def run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._job is not None)
+                job, self._job = self._job, None
+            try:
+                job()
+            except Exception:
+                traceback.print_exc()
+
+
+class SourceView(QAbstractScrollArea):
+    # paints the visible lines of the document only. highlight spans of painted lines are cached (LRU).
+    # tab characters are drawn as a single space so that a column is a character
+    cache_lines: int = 2000
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._document: Union[SourceDocument, None] = None
+        self._matches = array('q')
+        self._match_length = 0
+        self._current_match = -1
+        self._highlight_cache: OrderedDict = OrderedDict()
+        font = QFontDatabase.systemFont(QFontDatabase.FixedFont)
+        if not QFontInfo(font).fixedPitch():
+            # columns are computed from a character width
+            font = QFont('monospace')
+            font.setStyleHint(QFont.TypeWriter)
+        self.setFont(font)
+        self.viewport().setFont(font)
+        self._char_width = max(1, self.fontMetrics().horizontalAdvance('0'))
+        self._line_height = self.fontMetrics().height()
+        self._gutter_width = 0
+
+    def setDocument(self, document: Union[SourceDocument, None]):
+        self._document = document
+        self._matches = array('q')
+        self._current_match = -1
+        self._highlight_cache.clear()
+        digits = len(str(document.lineCount())) if document is not None else 1
+        self._gutter_width = (digits + 2) * self._char_width
+        self.updateScrollBars()
+        self.verticalScrollBar().setValue(0)
+        self.horizontalScrollBar().setValue(0)
+        self.viewport().update()
+
+    def document(self) -> Union[SourceDocument, None]:
+        return self._document
+
+    def setMatches(self, matches: array, length: int):
+        self._matches = matches
+        self._match_length = length
+        self._current_match = -1
+        self.viewport().update()
+
+    def matchCount(self) -> int:
+        return len(self._matches)
+
+    def currentMatch(self) -> int:
+        return self._current_match
+
+    def setCurrentMatch(self, index: int):
+        self._current_match = index
+        if self._document is not None and 0 <= index < len(self._matches):
+            position = self._matches[index]
+            line = self._document.lineOf(position)
+            self.scrollToLine(line)
+            column = position - self._document.offsets[line]
+            hbar = self.horizontalScrollBar()
+            x = column * self._char_width
+            text_width = self.viewport().width() - self._gutter_width
+            if not hbar.value() <= x < hbar.value() + text_width - self._char_width * self._match_length:
+                hbar.setValue(max(0, x - text_width // 2))
+        self.viewport().update()
+
+    def scrollToLine(self, line: int):
+        vbar = self.verticalScrollBar()
+        visible = self.visibleLineCount()
+        if not vbar.value() <= line < vbar.value() + visible:
+            vbar.setValue(max(0, line - visible // 2))
+
+    def visibleLineCount(self) -> int:
+        return max(1, self.viewport().height() // self._line_height)
+
+    def updateScrollBars(self):
+        lines = self._document.lineCount() if self._document is not None else 0
+        columns = self._document.max_columns if self._document is not None else 0
+        visible = self.visibleLineCount()
+        self.verticalScrollBar().setRange(0, max(0, lines - visible + 1))
+        self.verticalScrollBar().setPageStep(visible)
+        text_width = self.viewport().width() - self._gutter_width
+        self.horizontalScrollBar().setRange(0, max(0, (columns + 1) * self._char_width - text_width))
+        self.horizontalScrollBar().setPageStep(max(1, text_width))
+        self.horizontalScrollBar().setSingleStep(self._char_width * 4)
+
+    def resizeEvent(self, a0: QResizeEvent) -> None:
+        super().resizeEvent(a0)
+        self.updateScrollBars()
+
+    def keyPressEvent(self, a0: QKeyEvent) -> None:
+        if a0.key() == Qt.Key_Home and a0.modifiers() & Qt.ControlModifier:
+            self.verticalScrollBar().setValue(0)
+        elif a0.key() == Qt.Key_End and a0.modifiers() & Qt.ControlModifier:
+            self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+        else:
+            super().keyPressEvent(a0)
+
+    def highlight(self, line: int, text: str) -> List[Tuple[int, int, QColor]]:
+        spans = self._highlight_cache.get(line)
+        if spans is None:
+            spans = [(m.start(), m.end(), TOKEN_COLORS[m.lastgroup]) for m in HTML_TOKEN.finditer(text)]
+            self._highlight_cache[line] = spans
+            if len(self._highlight_cache) > self.cache_lines:
+                self._highlight_cache.popitem(last=False)
+        else:
+            self._highlight_cache.move_to_end(line)
+        return spans
+
+    def paintEvent(self, a0: QPaintEvent) -> None:
+        painter = QPainter(self.viewport())
+        rect = self.viewport().rect()
+        painter.fillRect(rect, Qt.white)
+        painter.fillRect(QRect(0, 0, self._gutter_width, rect.height()), QColor(240, 240, 240))
+        if self._document is None:
+            return
+        document = self._document
+        cw, lh, ascent = self._char_width, self._line_height, self.fontMetrics().ascent()
+        first = self.verticalScrollBar().value()
+        last = min(document.lineCount(), first + self.visibleLineCount() + 1)
+        hscroll = self.horizontalScrollBar().value()
+        col_first = hscroll // cw
+        col_last = col_first + (rect.width() - self._gutter_width) // cw + 2
+        x0 = self._gutter_width - hscroll + col_first * cw
+        for row, line in enumerate(range(first, last)):
+            y = row * lh
+            start, end = document.lineRange(line)
+            text = document.text[start:end].replace('\t', ' ')
+            painter.setClipRect(QRect(self._gutter_width, y, rect.width() - self._gutter_width, lh))
+            # search matches of the line
+            lo = bisect_left(self._matches, start - self._match_length + 1)
+            hi = bisect_left(self._matches, end)
+            for index in range(lo, hi):
+                column = self._matches[index] - start
+                color = QColor(255, 150, 50) if index == self._current_match else QColor(255, 240, 120)
+                painter.fillRect(QRect(x0 + (column - col_first) * cw, y, self._match_length * cw, lh), color)
+            # text runs between tokens are black
+            column = col_first
+            for s, e, color in self.highlight(line, text) + [(col_last, col_last, None)]:
+                if color is not None and (e <= col_first or s >= col_last):
+                    continue
+                s, e = max(s, col_first), min(e, col_last)
+                if s > column:
+                    painter.setPen(Qt.black)
+                    painter.drawText(x0 + (column - col_first) * cw, y + ascent, text[column:s])
+                if color is not None and e > s:
+                    painter.setPen(color)
+                    painter.drawText(x0 + (s - col_first) * cw, y + ascent, text[s:e])
+                column = max(column, e)
+            painter.setClipping(False)
+            painter.setPen(Qt.gray)
+            painter.drawText(QRect(0, y, self._gutter_width - cw, lh), Qt.AlignRight | Qt.AlignVCenter, str(line + 1))
+
+
+class PageSourceWidget(QWidget):
+    # 'Load' requests the html of the current tab (sig_load_source), setSource shows the answer
+    sig_load_source = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._worker = SourceWorker(self)
+        self._view = SourceView()
+        self._btnLoad = QPushButton('Load')
+        self._editSearch = QLineEdit()
+        self._chkCase = QCheckBox('Aa')
+        self._btnPrev = QPushButton('<')
+        self._btnNext = QPushButton('>')
+        self._lblStatus = QLabel()
+        self._searched = ''
+        self.initControl()
+        self.initLayout()
+
+    def initLayout(self):
+        vbox = QVBoxLayout(self)
+        vbox.setContentsMargins(0, 0, 0, 0)
+        vbox.setSpacing(4)
+        hbox = QHBoxLayout()
+        hbox.setContentsMargins(0, 0, 0, 0)
+        hbox.setSpacing(4)
+        hbox.addWidget(self._btnLoad)
+        hbox.addWidget(self._editSearch, 1)
+        hbox.addWidget(self._chkCase)
+        hbox.addWidget(self._btnPrev)
+        hbox.addWidget(self._btnNext)
+        vbox.addLayout(hbox)
+        vbox.addWidget(self._view, 1)
+        vbox.addWidget(self._lblStatus)
+
+    def initControl(self):
+        self._btnLoad.clicked.connect(self.onClickBtnLoad)
+        self._editSearch.setPlaceholderText('Search')
+        self._editSearch.returnPressed.connect(lambda: self.moveMatch(1))
+        self._editSearch.textChanged.connect(self.search)
+        self._chkCase.setToolTip('Case sensitive')
+        self._chkCase.toggled.connect(self.search)
+        self._btnPrev.setFixedWidth(28)
+        self._btnNext.setFixedWidth(28)
+        self._btnPrev.clicked.connect(lambda: self.moveMatch(-1))
+        self._btnNext.clicked.connect(lambda: self.moveMatch(1))
+        self._worker.sig_indexed.connect(self.onIndexed)
+        self._worker.sig_searched.connect(self.onSearched)
+
+    def onClickBtnLoad(self):
+        self._lblStatus.setText('Loading...')
+        self.sig_load_source.emit()
+
+    def setSource(self, html: str, url: str = ''):
+        # lines are indexed on the worker thread, the view is updated when the index is ready
+        self._lblStatus.setText(f'Indexing {len(html) / 1024 / 1024:.1f} MB...')
+        self._worker.index(html, url)
+
+    def onIndexed(self, document: SourceDocument):
+        self._view.setDocument(document)
+        self._searched = ''
+        self.updateStatus()
+        self.search()
+
+    def search(self):
+        document = self._view.document()
+        query = self._editSearch.text()
+        if document is None:
+            return
+        if not query:
+            self._searched = ''
+            self._view.setMatches(array('q'), 0)
+            self.updateStatus()
+            return
+        self._worker.search(document, query, self._chkCase.isChecked())
+
+    def onSearched(self, query: str, matches: array):
+        if query != self._editSearch.text():
+            return  # answer of an old query
+        self._searched = query
+        self._view.setMatches(matches, len(query))
+        if matches:
+            # first match at or after the top line
+            document = self._view.document()
+            top = document.offsets[min(self._view.verticalScrollBar().value(), document.lineCount() - 1)]
+            self._view.setCurrentMatch(bisect_left(matches, top) % len(matches))
+        self.updateStatus()
+
+    def moveMatch(self, step: int):
+        count = self._view.matchCount()
+        if count > 0:
+            self._view.setCurrentMatch((self._view.currentMatch() + step) % count)
+            self.updateStatus()
+
+    def updateStatus(self):
+        document = self._view.document()
+        if document is None:
+            self._lblStatus.clear()
+            return
+        text = f'{document.lineCount()} lines, {len(document.text) / 1024:.1f} KB'
+        if self._searched:
+            count = self._view.matchCount()
+            text += f'  |  {self._view.currentMatch() + 1 if count else 0}/{count} matches'
+        self._lblStatus.setText(text)
+        self._lblStatus.setToolTip(document.url)
@@ -0,0 +1,174 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : ProfileManager.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Shared web engine profiles (HTTP cache, storage path, cookie policy) configured from config
+# -------------------------------------------------------------------------------------------------------------------- #
+import os
+import traceback
+from typing import Callable, Dict, List, Union
+from PyQt5.QtCore import QObject
+from PyQt5.QtWebEngineWidgets import QWebEngineProfile
+from PyQt5.QtWebEngineCore import QWebEngineUrlRequestInterceptor, QWebEngineUrlRequestInfo
+
+CACHE_TYPES = {
+    'disk': QWebEngineProfile.DiskHttpCache,
+    'memory': QWebEngineProfile.MemoryHttpCache,
+    'none': QWebEngineProfile.NoCache
+}
+COOKIE_POLICIES = {
+    'none': QWebEngineProfile.NoPersistentCookies,
+    'allow': QWebEngineProfile.AllowPersistentCookies,
+    'force': QWebEngineProfile.ForcePersistentCookies
+}
+# request resource types by filter list type names
+RESOURCE_TYPES = {
+    QWebEngineUrlRequestInfo.ResourceTypeMainFrame: 'document',
+    QWebEngineUrlRequestInfo.ResourceTypeSubFrame: 'subdocument',
+    QWebEngineUrlRequestInfo.ResourceTypeStylesheet: 'stylesheet',
+    QWebEngineUrlRequestInfo.ResourceTypeScript: 'script',
+    QWebEngineUrlRequestInfo.ResourceTypeImage: 'image',
+    QWebEngineUrlRequestInfo.ResourceTypeFavicon: 'image',
+    QWebEngineUrlRequestInfo.ResourceTypeFontResource: 'font',
+    QWebEngineUrlRequestInfo.ResourceTypeObject: 'object',
+    QWebEngineUrlRequestInfo.ResourceTypePluginResource: 'object',
+    QWebEngineUrlRequestInfo.ResourceTypeMedia: 'media',
+    QWebEngineUrlRequestInfo.ResourceTypeXhr: 'xmlhttprequest',
+    QWebEngineUrlRequestInfo.ResourceTypePing: 'ping',
+    QWebEngineUrlRequestInfo.ResourceTypeCspReport: 'ping'
+}
+PROFILE_DEFAULTS = {
+    'cache_type': 'disk',
+    'cache_size_mb': '0',  # 0: size is managed by web engine
+    'storage_path': '',  # empty: web engine default location of the profile
+    'cookies': 'allow'
+}
+
+
+class RequestInterceptor(QWebEngineUrlRequestInterceptor):
+    # a profile has one interceptor: every request is passed to the handlers in order, handler(info, type_name)
+    # returns True when it blocked the request. observers see the outcome, observer(info, type_name, blocked)
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self.handlers: List[Callable[[QWebEngineUrlRequestInfo, str], bool]] = list()
+        self.observers: List[Callable[[QWebEngineUrlRequestInfo, str, bool], None]] = list()
+
+    def interceptRequest(self, info: QWebEngineUrlRequestInfo):
+        type_name = RESOURCE_TYPES.get(info.resourceType(), 'other')
+        blocked = False
+        for handler in self.handlers:
+            try:
+                blocked = bool(handler(info, type_name)) or blocked
+            except Exception:
+                traceback.print_exc()
+        for observer in self.observers:
+            try:
+                observer(info, type_name, blocked)
+            except Exception:
+                traceback.print_exc()
+
+
+class ProfileManager(QObject):
+    # one QWebEngineProfile per configured profile name, created on first use and shared by all windows.
+    # 'default' is the web engine default profile (keeps existing cache and cookies), others are named
+    # persistent profiles. options of a profile are strings (see PROFILE_DEFAULTS)
+    _instance: Union['ProfileManager', None] = None
+    default_name: str = 'default'
+    storage_root: str = ''  # profiles without 'storage_path' are stored in 'storage_root/name' (empty: web engine)
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._options: Dict[str, Dict[str, str]] = dict()
+        self._profiles: Dict[str, QWebEngineProfile] = dict()
+        self._interceptor = RequestInterceptor(self)
+
+    @classmethod
+    def instance(cls) -> 'ProfileManager':
+        if cls._instance is None:
+            cls._instance = ProfileManager()
+        return cls._instance
+
+    def setOptions(self, profiles: Dict[str, Dict[str, str]]):
+        for name, options in profiles.items():
+            self._options[name] = dict(options)
+            if name in self._profiles:
+                self.applyOptions(self._profiles[name], self.options(name))
+
+    def options(self, name: str) -> Dict[str, str]:
+        options = dict(PROFILE_DEFAULTS)
+        options.update(self._options.get(name, dict()))
+        if not options['storage_path'] and self.storage_root:
+            options['storage_path'] = os.path.join(self.storage_root, name)
+        return options
+
+    def names(self) -> list:
+        return sorted(set([self.default_name] + list(self._options.keys()) + list(self._profiles.keys())))
+
+    def profile(self, name: str = '') -> QWebEngineProfile:
+        name = name or self.default_name
+        profile = self._profiles.get(name)
+        if profile is None:
+            if name == self.default_name:
+                profile = QWebEngineProfile.defaultProfile()
+            else:
+                profile = QWebEngineProfile(name, self)
+            self.applyOptions(profile, self.options(name))
+            if self._interceptor.handlers or self._interceptor.observers:
+                profile.setUrlRequestInterceptor(self._interceptor)
+            self._profiles[name] = profile
+        return profile
+
+    def addRequestHandler(self, handler: Callable[[QWebEngineUrlRequestInfo, str], bool]):
+        # the interceptor is installed on profiles only when there is a handler or an observer
+        if handler not in self._interceptor.handlers:
+            self._interceptor.handlers.append(handler)
+            self.installInterceptor()
+
+    def addRequestObserver(self, observer: Callable[[QWebEngineUrlRequestInfo, str, bool], None]):
+        if observer not in self._interceptor.observers:
+            self._interceptor.observers.append(observer)
+            self.installInterceptor()
+
+    def installInterceptor(self):
+        for profile in self._profiles.values():
+            profile.setUrlRequestInterceptor(self._interceptor)
+
+    @staticmethod
+    def applyOptions(profile: QWebEngineProfile, options: Dict[str, str]):
+        storage_path = options.get('storage_path', '')
+        if storage_path:
+            profile.setPersistentStoragePath(os.path.join(storage_path, 'storage'))
+            profile.setCachePath(os.path.join(storage_path, 'cache'))
+        profile.setHttpCacheType(CACHE_TYPES.get(options.get('cache_type'), QWebEngineProfile.DiskHttpCache))
+        try:
+            profile.setHttpCacheMaximumSize(max(0, int(float(options.get('cache_size_mb', 0)) * 1024 * 1024)))
+        except ValueError:
+            pass
+        profile.setPersistentCookiesPolicy(
+            COOKIE_POLICIES.get(options.get('cookies'), QWebEngineProfile.AllowPersistentCookies))
+
+    def cacheStatistics(self, name: str = '') -> dict:
+        # size of http cache on disk (memory cache is not visible from here)
+        profile = self.profile(name)
+        path = profile.cachePath()
+        files, size = 0, 0
+        for dirpath, _, filenames in os.walk(path):
+            for filename in filenames:
+                try:
+                    size += os.path.getsize(os.path.join(dirpath, filename))
+                    files += 1
+                except OSError:
+                    pass
+        cache_type = [k for k, v in CACHE_TYPES.items() if v == profile.httpCacheType()]
+        return {
+            'name': name or self.default_name,
+            'cache_type': cache_type[0] if cache_type else '',
+            'path': path,
+            'max_bytes': profile.httpCacheMaximumSize(),
+            'files': files,
+            'bytes': size
+        }
+
+    def clearCache(self, name: str = ''):
+        # web engine removes cache entries asynchronously
+        self.profile(name).clearHttpCache()
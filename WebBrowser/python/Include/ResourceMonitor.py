@@ -0,0 +1,281 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : ResourceMonitor.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Per-tab resource usage (renderer process, javascript heap) and performance panel
+# -------------------------------------------------------------------------------------------------------------------- #
+import time
+import threading
+import traceback
+from typing import Callable, Dict, List, Union
+from PyQt5.QtCore import Qt, QObject, QTimer, pyqtSignal, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from PyQt5.QtCore import QItemSelectionModel
+from PyQt5.QtWidgets import QWidget, QTableView, QPushButton, QHeaderView, QAbstractItemView
+from PyQt5.QtWidgets import QVBoxLayout, QHBoxLayout, QLabel
+from PyQt5.QtGui import QShowEvent, QHideEvent
+from PyQt5.QtWebEngineWidgets import QWebEnginePage
+from WebPageWidget import WebPageWidget
+from TabLifecycle import TabLifecycleManager
+from Common import readProcessRss, readProcessCpuTime
+
+JS_HEAP_SCRIPT = 'performance.memory ? performance.memory.usedJSHeapSize : -1'
+
+
+class ProcessSampler(QObject):
+    # reads procfs for the requested pids on a worker thread, result is emitted as {pid: (rss_bytes, cpu_percent)}.
+    # cpu usage is the cpu time used since the previous sample of the same pid
+    sig_sampled = pyqtSignal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._cond = threading.Condition()
+        self._pids: Union[List[int], None] = None
+        self._stopped = False
+        self._last: Dict[int, tuple] = dict()  # pid: (cpu time, wall time)
+        self._thread = threading.Thread(target=self.run, name='ProcessSampler', daemon=True)
+        self._thread.start()
+
+    def request(self, pids: List[int]):
+        with self._cond:
+            self._pids = list(pids)
+            self._cond.notify_all()
+
+    def stop(self):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def sample(self, pids: List[int]) -> Dict[int, tuple]:
+        result, last = dict(), dict()
+        for pid in pids:
+            now, cpu_time = time.monotonic(), readProcessCpuTime(pid)
+            prev = self._last.get(pid)
+            cpu = 0.
+            if prev is not None and now > prev[1]:
+                cpu = max(0., (cpu_time - prev[0]) / (now - prev[1]) * 100)
+            last[pid] = (cpu_time, now)
+            result[pid] = (readProcessRss(pid), cpu)
+        self._last = last  # pids which are gone are forgotten
+        return result
+
+    def run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pids is not None or self._stopped)
+                if self._stopped:
+                    return
+                pids, self._pids = self._pids, None
+            try:
+                self.sig_sampled.emit(self.sample(pids))
+            except Exception:
+                traceback.print_exc()
+
+
+class TabResourceMonitor(QObject):
+    # samples renderer processes of all tabs every 'interval_ms' (while started) and javascript heap of active
+    # tabs every 'js_every' samples. frozen/discarded tabs are not touched
+    sig_updated = pyqtSignal()
+
+    def __init__(self, tabs: Union[Callable[[], List[WebPageWidget]], None] = None,
+                 interval_ms: int = 2000, js_every: int = 3, parent=None):
+        super().__init__(parent=parent)
+        self._tabs = tabs if tabs is not None else TabLifecycleManager.instance().tabs
+        self._js_every = js_every
+        self._ticks = 0
+        self._processes: Dict[int, tuple] = dict()
+        self._js_heap: Dict[WebPageWidget, int] = dict()
+        self._sampler = ProcessSampler(self)
+        self._sampler.sig_sampled.connect(self.onSampled)
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.sample)
+
+    def start(self):
+        if not self._timer.isActive():
+            self._timer.start()
+            self.sample()
+
+    def stop(self):
+        self._timer.stop()
+
+    def isActive(self) -> bool:
+        return self._timer.isActive()
+
+    def sample(self):
+        tabs = self._tabs()
+        self._sampler.request(sorted(set([x.renderProcessPid() for x in tabs]) - {0}))
+        if self._ticks % self._js_every == 0:
+            for widget in tabs:
+                if widget.lifecycleState() == QWebEnginePage.Active:
+                    widget.view().page().runJavaScript(JS_HEAP_SCRIPT, self.makeJsHeapCallback(widget))
+        self._ticks += 1
+        alive = set(tabs)
+        self._js_heap = {k: v for k, v in self._js_heap.items() if k in alive}
+
+    def makeJsHeapCallback(self, widget: WebPageWidget) -> Callable[[object], None]:
+        def callback(value: object):
+            if isinstance(value, (int, float)) and value >= 0:
+                self._js_heap[widget] = int(value)
+        return callback
+
+    def onSampled(self, result: dict):
+        self._processes = result
+        self.sig_updated.emit()
+
+    def rows(self) -> List[dict]:
+        now = time.monotonic()
+        windows: Dict[QWidget, int] = dict()
+        rows = list()
+        for widget in self._tabs():
+            window = windows.setdefault(widget.window(), len(windows) + 1)
+            pid = widget.renderProcessPid()
+            rss, cpu = self._processes.get(pid, (0, 0.))
+            rows.append({
+                'widget': widget,
+                'window': window,
+                'title': widget.title() or widget.url().toString(),
+                'pid': pid,
+                'rss_mb': rss / 1024 / 1024,
+                'cpu': cpu,
+                'js_heap_mb': self._js_heap[widget] / 1024 / 1024 if widget in self._js_heap else -1.,
+                'idle_sec': now - widget.lastActivated(),
+                'state': ['Active', 'Frozen', 'Discarded'][int(widget.lifecycleState())]
+            })
+        return rows
+
+
+class TabResourceModel(QAbstractTableModel):
+    # rows are replaced on every sample: values only (dataChanged) while the set of tabs is unchanged
+    columns = [('Win', 'window'), ('Title', 'title'), ('PID', 'pid'), ('RSS(MB)', 'rss_mb'), ('CPU(%)', 'cpu'),
+               ('JS Heap(MB)', 'js_heap_mb'), ('Idle(s)', 'idle_sec'), ('State', 'state')]
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._rows: List[dict] = list()
+
+    def setRows(self, rows: List[dict]):
+        if [x['widget'] for x in rows] == [x['widget'] for x in self._rows]:
+            self._rows = rows
+            if rows:
+                self.dataChanged.emit(self.index(0, 0), self.index(len(rows) - 1, len(self.columns) - 1))
+        else:
+            self.beginResetModel()
+            self._rows = rows
+            self.endResetModel()
+
+    def widget(self, row: int) -> WebPageWidget:
+        return self._rows[row]['widget']
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        value = self._rows[index.row()][self.columns[index.column()][1]]
+        if role == Qt.DisplayRole:
+            if isinstance(value, float):
+                return '-' if value < 0 else f'{value:.1f}'
+            return str(value)
+        elif role == Qt.UserRole:
+            return value  # sort key
+        elif role == Qt.TextAlignmentRole and index.column() != 1:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.columns[section][0]
+        return None
+
+
+class PerformanceWidget(QWidget):
+    # table of all tabs, sampled only while the widget is shown.
+    # buttons act on the selected rows, or on the first row (worst one of the sorted column) without selection
+    def __init__(self, parent=None, monitor: Union[TabResourceMonitor, None] = None):
+        super().__init__(parent=parent)
+        self._monitor = TabResourceMonitor(parent=self) if monitor is None else monitor
+        self._monitor.sig_updated.connect(self.refresh)
+        self._model = TabResourceModel(self)
+        self._proxy = QSortFilterProxyModel(self)
+        self._table = QTableView()
+        self._btnClose = QPushButton('Close')
+        self._btnFreeze = QPushButton('Freeze')
+        self._btnReload = QPushButton('Reload')
+        self._lblSummary = QLabel()
+        self._columns_fitted = False
+        self.initControl()
+        self.initLayout()
+
+    def initLayout(self):
+        vbox = QVBoxLayout(self)
+        vbox.setContentsMargins(0, 0, 0, 0)
+        vbox.setSpacing(4)
+        vbox.addWidget(self._table)
+        hbox = QHBoxLayout()
+        hbox.setContentsMargins(0, 0, 0, 0)
+        hbox.setSpacing(4)
+        hbox.addWidget(self._lblSummary)
+        hbox.addStretch()
+        hbox.addWidget(self._btnClose)
+        hbox.addWidget(self._btnFreeze)
+        hbox.addWidget(self._btnReload)
+        vbox.addLayout(hbox)
+
+    def initControl(self):
+        self._proxy.setSourceModel(self._model)
+        self._proxy.setSortRole(Qt.UserRole)
+        self._proxy.setDynamicSortFilter(True)
+        self._table.setModel(self._proxy)
+        self._table.horizontalHeader().setStretchLastSection(False)
+        self._table.verticalHeader().hide()
+        self._table.verticalHeader().setDefaultSectionSize(self._table.fontMetrics().height() + 6)
+        self._table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self._table.setSortingEnabled(True)
+        self._table.sortByColumn(4, Qt.DescendingOrder)  # cpu
+        self._btnClose.clicked.connect(lambda: self.applyToTargets(lambda x: x.sig_close.emit(x)))
+        self._btnFreeze.clicked.connect(lambda: self.applyToTargets(lambda x: x.freeze()))
+        self._btnReload.clicked.connect(lambda: self.applyToTargets(lambda x: x.view().reload()))
+
+    def showEvent(self, a0: QShowEvent) -> None:
+        super().showEvent(a0)
+        self._monitor.start()
+
+    def hideEvent(self, a0: QHideEvent) -> None:
+        super().hideEvent(a0)
+        self._monitor.stop()
+
+    def refresh(self):
+        rows = self._monitor.rows()
+        selected = self.selectedWidgets()
+        reset = [x['widget'] for x in rows] != [self._model.widget(i) for i in range(self._model.rowCount())]
+        self._model.setRows(rows)
+        if reset and selected:
+            selection = self._table.selectionModel()
+            for row, data in enumerate(rows):
+                if data['widget'] in selected:
+                    index = self._proxy.mapFromSource(self._model.index(row, 0))
+                    selection.select(index, QItemSelectionModel.Select | QItemSelectionModel.Rows)
+        if not self._columns_fitted and rows:
+            # fitting columns measures every cell, so it is done once
+            self._columns_fitted = True
+            self._table.resizeColumnsToContents()
+            self._table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        # a renderer process may host several tabs
+        processes = {x['pid']: x['rss_mb'] for x in rows if x['pid'] > 0}
+        self._lblSummary.setText(f'{len(rows)} tabs, {len(processes)} processes, {sum(processes.values()):.0f} MB')
+
+    def selectedWidgets(self) -> List[WebPageWidget]:
+        rows = self._table.selectionModel().selectedRows()
+        return [self._model.widget(self._proxy.mapToSource(x).row()) for x in rows]
+
+    def applyToTargets(self, func: Callable[[WebPageWidget], object]):
+        targets = self.selectedWidgets()
+        if not targets and self._proxy.rowCount() > 0:
+            targets = [self._model.widget(self._proxy.mapToSource(self._proxy.index(0, 0)).row())]
+        for widget in targets:
+            func(widget)
+        self._monitor.sample()
@@ -0,0 +1,2949 @@
+# -*- coding: utf-8 -*-
+
+# Resource object code
+#
+# Created by: The Resource Compiler for PyQt5 (Qt v5.15.14)
+#
+# WARNING! All changes made in this file will be lost!
+
+from PyQt5 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x04\xf6\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x04\xa8\x49\x44\x41\x54\x58\x85\xed\
+\x96\x69\x4c\xdb\x75\x18\xc7\x1f\x8e\x72\x6c\x60\xa9\xdc\x47\x5c\
+\x81\x71\x94\x8e\x8d\xb1\x8d\xc0\xd8\xc1\x02\xcb\x06\x4b\xb6\xc8\
+\x70\x51\xe2\x8b\x91\xf0\x4a\x13\xf6\xca\x57\x4b\x74\xbe\x5b\x7c\
+\xb3\x18\x45\xc7\xd4\x88\x1c\x95\xb0\xb1\x29\x3a\xe3\x32\x17\x34\
+\xc8\xc0\xa4\x85\x9e\xf4\x58\x29\x94\xfb\x28\xa0\x71\x09\x09\x5b\
+\x78\x7c\x9e\x5f\x0b\x49\xa1\x1a\xb6\x15\xa2\x89\xbf\xe4\x9b\x36\
+\x3d\xfe\x9f\xe7\xf8\x3d\x07\xc0\xff\xe7\xbf\x7a\xbe\x00\x88\x6d\
+\x05\xb8\x41\x6a\x6a\x04\x48\xde\x56\xf8\x7b\x00\xc1\xed\x91\x91\
+\x06\xf3\x85\x0b\x68\x25\xdd\x94\x4a\xad\x5f\x02\x84\x6d\x9b\x01\
+\x2d\x00\x75\x03\x67\xcf\x2e\x69\xa3\xa3\x71\x40\x2a\x45\x5d\x45\
+\xc5\x93\x26\x80\xf7\xb7\x05\xce\x9e\xde\x4e\x48\x70\x5a\x4b\x4b\
+\x51\x0d\x20\x64\x39\x76\x0c\xbf\x4d\x49\x19\x6b\x06\x78\x69\xcb\
+\x0d\xa0\x9c\x5f\x31\x54\x56\x2e\xf7\xef\xdc\x89\x9a\xf8\x78\xec\
+\x4f\x4e\xc6\xfe\xb0\x30\xd4\x9f\x39\xb3\x42\x91\xf9\x64\x4b\xe1\
+\x1f\x03\x44\x74\xca\xe5\xe3\x96\x23\x47\x84\xe7\x83\xd7\xae\xa1\
+\xf9\xfa\x75\xf7\xfb\x03\x07\xf0\x7b\xb9\x7c\x92\x22\x94\xb0\x65\
+\x06\x90\x87\x1f\x99\xce\x9f\x7f\xaa\x09\x0d\xc5\x81\xcc\x4c\xb4\
+\xdb\x6c\x38\x34\x34\x84\xda\xfc\x7c\xd4\x04\x07\xa3\xb1\xbc\x7c\
+\x45\x15\x10\xd0\xb6\x25\xf0\x06\x80\x98\x1f\x14\x8a\x49\xf3\xa1\
+\x43\xc2\x63\x73\x43\x83\x80\x3b\x1c\x0e\xb4\xb5\xb5\x89\xcf\x8c\
+\x39\x39\x78\x2f\x23\x63\xb6\x11\x20\xdd\xef\x06\x90\x67\x4d\xa6\
+\xaa\xaa\x15\x8d\x44\x82\xda\xbd\x7b\x71\xc8\x6e\x17\x70\xd6\xf0\
+\xf0\x30\xea\x8a\x8b\x51\x1d\x18\x88\xa6\x93\x27\x51\x15\x18\xf8\
+\xa3\x5f\xe1\x5f\x01\xbc\x72\x7f\xdf\xbe\x19\x13\x81\xd9\x53\x6b\
+\x4b\x8b\x17\x9c\x65\xef\xec\x44\x75\x40\x00\xea\xe5\x72\xfc\x49\
+\xa1\x70\x51\x45\xe4\xfb\xcd\x00\x55\x70\xf0\x77\x96\xaa\x2a\xe1\
+\x21\x7b\xca\x60\x83\xc1\x80\xf5\xf5\xf5\x42\x26\x93\x09\x9d\x4e\
+\x27\xea\x4f\x9d\x12\x46\x0c\x96\x94\xa0\x4a\x22\xe9\xf1\x0b\xfc\
+\x73\x80\xac\xae\x83\x07\x5d\xc6\xac\x2c\xe1\xbd\xad\xa3\x43\x18\
+\xd0\xd3\xd3\x83\xf4\xb5\x50\x6f\x6f\xaf\x30\xc0\xd1\xd5\x25\x2e\
+\xa3\x2e\x31\x11\x7f\x56\x2a\x7f\xa7\xc8\x95\xbd\xb0\x01\x5f\x4b\
+\x24\xbf\x58\x2b\x2b\xdd\xe1\xa5\xfc\xae\xe5\x5c\xa7\x5b\x33\x80\
+\xa3\x31\x3a\x3a\x8a\x63\x63\x63\x68\xe2\x48\x71\x59\x16\x15\x61\
+\x5b\x68\xa8\x9e\x7e\x10\xf0\xdc\xf0\x46\x80\x82\xee\xc3\x87\x17\
+\x38\xaf\x1c\xfe\x47\x77\xef\x0a\xf8\xc8\xc8\x08\xda\xe9\x12\xae\
+\x1a\xc0\x46\x31\x7c\x7c\x7c\x1c\x9d\x7d\x7d\xa8\x0e\x09\xc1\x01\
+\x99\x0c\xbb\x73\x73\xff\xa4\xc6\xf5\xda\x73\x1b\xd0\x16\x1e\xde\
+\x6f\x3d\x77\x4e\x78\xa4\xa7\xd7\x55\x38\x8b\x43\x1e\x46\x1d\x30\
+\x3c\x3c\x7c\x0d\xce\x9a\x98\x98\x40\x73\x4d\x8d\xf8\x8f\x89\xfa\
+\x43\xfb\x8e\x1d\x96\x76\x80\xa0\x67\x86\x53\x47\x2b\x7d\x58\x52\
+\xf2\x87\x2e\x29\x09\xd5\x41\x41\x68\x7f\xf0\xc0\x0b\xce\x8a\xa6\
+\x61\x14\x13\x13\xe3\x05\x9f\x9c\x9c\xc4\x09\x4a\x89\x86\x5a\x75\
+\x7f\x44\x04\xf6\xe4\xe6\x2e\x51\x45\xbc\xf5\xcc\x06\xb4\x47\x44\
+\x18\xad\xe5\xe5\xee\x06\x53\x5d\xbd\x01\xce\x39\x97\x53\x6a\x52\
+\x53\x53\xbd\xe0\x53\x53\x53\x38\x3d\x3d\x8d\xb6\xba\x3a\x77\x14\
+\x94\x4a\xbc\x19\x19\xe9\xf8\x10\x20\x74\xd3\x70\x1a\xad\xaf\xff\
+\x56\x56\xf6\x58\x1b\x1b\x8b\xdc\x76\x1d\x74\xcb\xd7\xc3\x39\xec\
+\x0d\xd4\x0d\x59\xeb\xe1\x33\x33\x33\x38\x45\x6d\x9a\xef\x01\xff\
+\xbf\x4f\xa9\x5c\xa6\x28\x5c\xd9\x9c\xe7\x94\xaf\x5b\x32\xd9\x23\
+\x0b\xdd\x78\xe1\x41\x6d\xad\x4f\xb8\xd1\x68\xc4\x22\xba\xe9\xc5\
+\xd4\x17\x2c\x16\x8b\x17\x9c\x35\x3b\x3b\x8b\x43\x97\x2f\x8b\x67\
+\x18\xd2\xd3\xb1\x43\x2a\x75\x6e\x6a\x5c\x93\xf7\x6f\x6b\x4e\x9f\
+\x5e\xe2\x45\x83\xf3\x38\xac\xd1\x6c\x80\x73\xc8\x9b\x9b\x9b\xd7\
+\xaa\x40\xa5\x52\x6d\x80\xcf\xcd\xcd\xe1\x1c\xfd\x7e\x20\x2e\x4e\
+\xf4\x06\x75\x4e\xce\xd3\x56\x31\x50\xff\xd9\xfb\x90\xdb\x71\x71\
+\x23\x96\xe3\xc7\xdd\xb5\x7c\xe9\x92\x4f\x38\x87\x9c\x07\x51\x15\
+\xd5\x7c\x25\xf5\x08\xae\x8e\xf5\x70\x97\xcb\x85\xf3\xf3\xf3\x38\
+\x7c\xf5\xaa\xbb\x8a\x52\x52\xf0\x1b\x99\x6c\xfc\x33\x80\xf8\xbf\
+\x35\x80\x3a\xd7\xbb\xb4\x5e\x2d\xf3\xed\xd5\x50\x04\x46\xf4\x7a\
+\x9f\x70\x5f\x39\x67\xf0\x7a\xf8\xc2\xc2\x02\xce\xd3\xf7\x3a\x4f\
+\x1f\x51\x67\x65\xf1\xb8\x6e\xf5\xc5\x0e\xcc\x06\x48\xec\x48\x48\
+\x98\xb0\xf0\x54\xe3\xdc\x5f\xbc\x28\xc0\x2f\x02\x67\x2d\x2e\x2e\
+\xa2\xc3\x73\x17\xb4\x94\x8e\x3b\x32\xd9\xf4\xa7\x3e\xb6\xe8\x97\
+\x6b\x01\x5e\xa5\xba\x7f\xcc\xb9\x5f\xdd\xf5\xfc\x2e\x8a\x42\xb7\
+\x5c\xfe\xe4\x03\x80\x6a\x2f\xef\x49\xf1\x14\x81\xc2\x3b\xbb\x76\
+\xb9\xac\x15\x15\x68\xa3\x0a\xe0\xa5\xd3\x7a\xe2\x04\x5a\x69\xb2\
+\xf1\xd2\x69\x39\x7a\x14\x39\x3a\x66\xba\xf9\xe6\xc2\x42\x34\x17\
+\x14\x20\x2f\x27\xbc\x8a\x0d\xee\xdf\x8f\x83\x79\x79\xc8\xe3\xda\
+\xb4\x67\x8f\xa8\x7d\xa3\x42\x81\xc6\xec\x6c\x34\xd2\xe6\x64\xd8\
+\xbd\x5b\x54\x82\x36\x2d\x0d\x6f\x45\x45\xcd\x50\x6f\xce\xf3\x70\
+\xd7\x4e\x14\x29\xfd\x4d\x80\x1a\xda\x2a\x1f\xde\x00\x30\xd1\x06\
+\x34\xe8\x2f\xf1\xf3\x3c\xcf\xfc\xf5\x1d\x80\x37\x3c\xbc\x0d\x87\
+\x6b\x34\x89\x94\x46\xca\x24\x65\xfb\x51\x19\x9e\xe7\x26\xc1\x26\
+\x7a\x01\x87\x46\x02\xee\xd6\xe9\x2f\x49\xd6\x87\xfc\x5f\x73\xfe\
+\x02\x48\x47\x39\x18\x36\xa8\xbb\x1c\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x02\x44\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x01\xf6\x49\x44\x41\x54\x58\x85\xed\
+\x96\xbd\x4b\xc3\x60\x10\xc6\x4f\x11\x41\x10\xa4\x7e\xd4\x49\x44\
+\x87\x0e\x22\xa8\xd5\xc1\x45\xfc\x00\x07\xbb\x08\x82\x1f\x20\xa8\
+\xa3\x20\x8a\x82\x55\xa8\x6e\x5a\x28\x75\xd2\xc9\xc1\x62\x75\x10\
+\x9c\x84\x22\x38\x75\x56\x41\xff\x04\x1d\x74\x2a\xea\x50\xed\xe0\
+\x57\xab\xcf\x99\x0b\x29\x25\xd5\x34\x69\x33\x48\x0f\x7e\x90\xbe\
+\xb9\xe7\xee\xf2\xf6\xcd\x5d\x88\x8a\x56\x34\xf3\x56\x0f\xbc\x60\
+\x19\x38\xed\x4e\x5e\x0b\xee\xc1\x97\x70\x07\x6a\xec\x2c\x60\x4b\
+\x12\x5f\x0a\x7c\x1d\xb4\x2b\x39\x3f\xe9\x0b\x48\x81\x4e\xd0\x21\
+\xd7\x09\x50\x67\x47\x01\x01\x52\x9e\xf8\x24\x6d\x2d\x22\x6b\x9b\
+\x85\x4e\xce\x4f\xff\x2c\xc9\xba\xd2\xd6\xdd\xa4\xec\x42\x1c\x38\
+\x0a\x95\xb8\x1b\x1c\x49\xf2\x88\x8e\xcf\xa9\xdc\x3b\x14\xdf\x6a\
+\xb3\xc9\x4a\xc1\x14\x38\x00\x17\xe0\x89\xb4\xd3\xce\xf0\x0e\xb4\
+\xe8\xe8\x5a\x49\x39\x1b\xe9\xbe\x8f\xe0\x1c\x84\xc1\xa4\xc4\xfe\
+\xd3\x82\x19\x41\x18\xde\xda\x2b\xb0\x07\xda\x7f\xd1\xb6\x81\xdd\
+\x2c\x85\x33\x1b\x46\x0a\x88\x8b\xf3\x3c\xe8\x21\xa5\xe1\x98\x35\
+\xf5\xaf\x9b\x93\x98\x0f\x46\x44\x6a\x83\xf1\x5a\x48\x9c\x69\x2b\
+\x12\xf3\xc6\x88\xf3\x38\x48\x8a\xc0\x97\x87\xe4\x3e\x89\xc5\x31\
+\x47\x8d\x8a\x26\xc0\x87\x08\x03\x16\x92\xaf\x4a\x8c\x4f\x30\x9d\
+\xab\x38\xbd\x08\xbf\x89\xe4\x7e\xd1\xbe\x83\x31\x13\xfa\x1f\x1b\
+\x01\x6f\xa4\x34\x99\xbe\x1c\x74\xbd\xa2\x79\x05\xc3\x66\x93\xab\
+\xa6\x0e\x9e\xf5\x1c\x34\x6b\x94\xc7\x01\x15\x22\xed\xb5\x34\x6a\
+\x0b\xa2\x09\xe5\xa3\x00\x75\xdc\xf6\xe7\xa0\x19\x20\x6d\x5c\x5b\
+\xb2\x12\xd2\xda\xab\xde\x57\x8f\x83\xf4\x87\x8f\x53\x34\xac\x35\
+\xd4\x7e\xb3\x59\x93\x04\x8a\x65\xac\xf3\xf4\x3b\x23\xe5\xdd\x4e\
+\xca\xb5\x3b\xc3\x27\x26\xda\x66\x2b\x05\x78\x24\x48\x54\x7e\xbb\
+\xc0\x31\x29\x27\x5c\x1d\x4c\xea\x78\x4e\xc9\x3d\x97\xf8\x46\x65\
+\xdd\x63\xa5\x80\x21\xd2\x5a\xe8\x3e\x69\x7d\x81\xb7\x96\x07\x4b\
+\x95\xc0\x1f\x22\x09\xb9\xc7\x3e\x61\x70\x2b\xbf\x07\xad\x14\x50\
+\x0e\xae\x49\x9b\x66\xfc\x5e\x6f\x93\xfe\x79\xe0\xa1\xb5\x43\x4a\
+\xdf\x50\xfd\xf9\x10\x96\x59\x29\x80\xad\x12\xcc\x82\x25\xd0\x60\
+\xc0\xbf\x11\x2c\x82\x19\x50\x61\x35\x79\xd1\xfe\xbf\x7d\x03\x53\
+\x36\x92\xee\x3a\x88\xcf\x83\x00\x00\x00\x00\x49\x45\x4e\x44\xae\
+\x42\x60\x82\
+\x00\x00\x63\xb0\
+\x00\
+\x01\xbc\xb3\x78\x9c\xd4\x7b\x05\x58\x94\x4d\xd7\xff\xbd\x4b\x77\
+\x29\xdd\xad\xb4\xa4\x84\x80\x20\x82\x60\x10\x0a\x48\x0b\x02\x4a\
+\x2b\x48\xc3\xd2\x0a\x48\xa7\x28\x20\x21\x22\xdd\x28\xdd\x2d\xdd\
+\xb5\x48\x97\x80\x74\xee\x7f\x17\x1f\x7d\xc0\x47\x9f\x78\xbf\xf7\
+\x7b\xbf\xf7\x3f\xd7\x75\xae\x7b\x77\xef\x99\x73\x7e\x33\x73\xe6\
+\xcc\x39\x67\x66\x01\x00\x04\xa0\x02\x88\x02\x02\x68\x81\x2b\x82\
+\x00\x60\x08\xff\x8c\x8f\xff\xf5\xbb\x31\x32\x00\xa4\xc1\x7f\xe3\
+\xe6\xfe\xfa\xfd\x2d\x13\x00\x10\x89\x02\x00\x2d\xed\x6f\xdf\xe1\
+\xf5\x4a\xf4\x00\x00\x02\xf9\xfa\x9d\x15\x1d\x04\xe8\x3f\x02\x00\
+\x09\x89\xdf\xbe\x5f\x06\x00\x3f\x07\x10\xf0\xec\xd6\x8d\xab\x38\
+\x98\xe4\x98\x70\xd6\x38\x72\xb2\xd2\x4a\x88\xb7\x08\x42\x47\x88\
+\xd6\x7c\xf4\x16\x2e\x53\x10\x5b\x4e\x5a\x52\xc5\x6e\x68\xf9\x95\
+\x7d\x98\xd6\xed\x70\x58\xc5\xfe\xc8\xc4\xf5\xcd\x87\x0e\xb7\xe5\
+\x98\x0c\x68\xf5\x02\x14\x30\x15\x41\x28\xaf\xdd\x68\x7c\x89\x04\
+\x7c\xcd\xba\x33\x04\xe8\x73\x5f\xde\xdd\x49\x85\x30\x86\xc5\xeb\
+\x9a\x78\x88\xfb\x98\x4b\x7a\x43\xa0\xd2\x25\xe8\xee\x0c\x03\xb4\
+\xb4\xf4\x52\x41\xf8\xde\x9e\x0a\x06\xf1\xef\x42\x5e\x2c\xf6\xa6\
+\x39\xd4\x94\x19\xc1\x8e\xec\x52\xfd\xc3\x9b\xd3\x1c\x66\x47\x1c\
+\xc7\x33\xf6\xd5\xfd\xae\x84\x38\xd8\x78\xef\x7f\x1c\xb4\x8d\x2b\
+\xdb\x1e\x8c\xc1\x57\x1c\x1e\x29\x4c\xbe\x68\xf8\x82\xe5\x3d\xfb\
+\x4d\xc6\x04\x2f\xd3\x5b\x6c\x51\xbc\xdc\x9d\xac\xcf\x16\x25\x65\
+\xab\x83\x30\xd0\x2f\x44\x49\xd0\x32\xe3\xbb\x55\x41\x58\x05\x25\
+\x99\xdc\x83\x59\x48\xd5\x43\xea\x81\x69\x39\xa5\x00\x46\x9c\xea\
+\xb3\x5a\xb4\x1b\x17\xde\x92\xb4\x96\x5d\x0e\x83\xad\x10\xda\xa2\
+\x3f\x7d\x5e\x93\xda\xd9\x6f\x35\x38\xa2\x58\x41\x23\x59\xdb\x43\
+\x57\x81\x86\xaf\x08\x6a\x11\xa2\x7e\xfc\xe1\x63\x10\x6a\x5c\x13\
+\xf3\x0d\x03\xa2\xc7\x83\x53\xd8\x14\x2f\xef\xf9\x79\x35\x67\x36\
+\x32\x0d\xbc\x62\x4e\xa7\x4e\xec\xd2\x99\x07\xdb\x31\x48\x50\x54\
+\xa9\xe1\xad\x9e\xbf\x97\x73\xbe\x84\x35\x8f\x98\x86\xae\x7f\xe5\
+\x2a\x09\x0f\x4f\x30\x80\x4e\xbe\x9d\x9e\x51\xf4\x25\xd5\xf5\x1e\
+\xd6\x8a\xa1\xc7\x78\xad\x80\xa1\xbc\x06\xf3\x6b\xeb\x18\x1a\xd2\
+\xc7\x1d\x12\x4e\xa1\x28\x8d\xe7\x04\x83\x59\xa0\xf7\xe5\x36\xe8\
+\xa3\x74\xce\x5c\xbe\x14\x9a\x41\x73\xd7\x8d\x8b\xf2\xce\xea\x13\
+\x66\x02\x22\x02\x0c\x20\x2e\x27\xd2\x86\x12\x23\x02\x76\x9e\xc3\
+\xca\x3b\x7f\x97\x95\x2c\x74\x53\xdb\x62\xeb\x50\xcf\x00\x87\xb1\
+\x2f\xe6\x56\xb1\x02\x26\x10\xab\x0f\x95\x93\xb4\x0b\xc1\x99\x4d\
+\x9d\x48\x33\xb4\xd9\x17\x6b\x9f\x57\x60\x04\x4a\x67\x22\x02\x92\
+\xee\x7f\xb9\x62\x3a\xa9\x7f\xa1\xbe\xa1\x45\xa8\xe1\x90\xba\x4b\
+\x7a\x60\x18\x7b\xe0\x55\x44\x39\x2e\x3a\xd7\x85\xf5\x15\x59\xe8\
+\x76\x4d\x46\xc6\xcd\x09\xc2\xf3\xbb\x62\xb3\xf3\xd2\x8c\x80\x68\
+\x65\xf9\xfb\xc7\x04\x0d\x3b\x6c\x17\x3e\x1a\x35\x23\xb7\x1b\x56\
+\x15\xac\x8f\x90\xc9\x66\x06\x48\x9e\x11\x25\xfb\x82\x2f\x81\x47\
+\xd4\x32\xce\xdb\x82\xe6\x33\x3c\x5c\xb8\x2f\x76\x98\xad\x2c\x82\
+\x95\x53\xff\x74\xb4\xf4\x90\x3b\xda\x32\xa2\x98\xc7\x3e\x53\xe1\
+\x51\xde\xf8\x64\x2a\x6a\x5a\x83\x84\x69\x9a\x0c\x87\xae\x13\x23\
+\xe4\xea\xb3\x35\x79\xb5\x9c\xfd\x5c\xd5\xde\xed\xbd\x43\xca\x6a\
+\x59\x46\xe0\x4c\x48\xb1\x49\x8b\x24\xae\x5f\x56\x0b\xe9\x25\x28\
+\xf3\x7d\x79\xb5\x58\xce\xf7\x9e\x3d\xef\xa2\xe2\xa4\x2c\xd1\x77\
+\x88\x2a\x2b\xf2\x93\xac\x74\x74\x1c\x0d\x1b\x57\x8c\x08\x89\x2f\
+\xe7\x4a\x3b\x7b\xaa\xab\x15\x59\xec\x23\xb3\x4c\xab\xbe\xf2\x74\
+\x14\x3a\xbf\x15\xdb\x4b\xdc\xd4\x2b\x20\x3d\xe6\xba\xc8\x88\x74\
+\x11\xdf\x45\x8f\x7b\x54\x38\x9f\x71\x1d\xfb\xe9\xc0\x0a\x4f\xef\
+\x85\x60\x20\x8a\x7e\x4d\xa3\x84\x58\xa8\xf0\xa0\x50\xa1\x79\xbb\
+\x59\x2d\x1b\xc7\xfe\xbc\xac\x69\xb6\x1e\xf6\x2e\x17\xb0\xe5\x79\
+\xc7\x6d\x2a\xc3\xfb\xc1\x38\xaf\xdd\x7d\xfd\x8a\xf1\xc4\xd4\x2b\
+\xf4\x20\x6e\xb9\x7b\x45\x36\x2f\x27\xeb\xad\x12\x95\x67\x39\x31\
+\x7d\x4b\x3e\x62\x7d\xa2\xe0\x88\xf2\x70\xbb\x6d\xf1\x45\x77\xe4\
+\x8a\x7f\x4c\xee\x72\x46\xd6\xae\x58\xd4\x5d\x7a\x42\x20\xbc\x92\
+\x3d\xbd\xe4\x03\xa7\xcd\xa4\x53\x81\xc2\x07\x33\x17\xbc\x06\x3c\
+\xc2\x45\x53\xd2\x1a\xb7\x48\x3b\x6c\x28\x08\x3c\x1e\xa5\xd5\xb5\
+\x17\x39\x67\x67\xa9\x0b\x67\x4a\xb0\x6c\x3a\xb4\x2e\x6c\x6e\xa9\
+\xe4\x94\xaa\x60\xd9\xbc\x32\xb1\x23\xb7\x30\x4d\xfa\x56\x45\xa4\
+\xc5\x8b\xac\x1d\x7f\xaa\xc8\xc7\xbe\xfe\x51\x7e\x77\xcf\x24\x99\
+\xd4\x8d\x65\xa7\x44\xed\x6a\xf6\xa5\xfb\xaf\xfa\x85\x1f\xd8\x47\
+\xfb\x5b\x55\xc3\x2b\x3f\x6f\x24\x0a\x49\x73\xde\x04\xab\xd4\x5c\
+\xa3\x67\x6f\xd3\x1e\xfd\xa2\x9b\x44\xb0\x24\xcf\x08\x3c\xf1\x51\
+\x8f\x6a\x19\x2b\xbe\xf6\x66\x0e\x33\x3a\xa8\x7b\xef\x79\x85\x48\
+\x8e\x20\xbb\xda\xa8\x9b\x18\x4c\x15\x19\xd4\x7e\x2d\x42\xfe\x91\
+\xbc\x91\xe8\x19\x0c\x77\x2d\x69\xb0\x2e\x5a\x5f\x6e\xa6\xdf\x68\
+\xd2\x7e\xdc\x05\xba\xc5\x43\x6a\xf9\xa0\x78\x7a\xba\x02\xe1\x3b\
+\x6d\xc9\xf1\xf1\x6b\x8c\x92\x4e\x17\x4b\xf8\xd6\xc3\xc6\x91\x30\
+\xc0\xdd\xda\x80\x9a\xf8\x67\x4d\x76\xe5\x2f\xda\x82\x1c\x78\x5b\
+\x8e\xec\x92\x8c\x39\x63\xee\xc1\x19\xcb\x45\xb0\x62\x7c\x97\x85\
+\x0f\x9f\x7c\x3b\xb7\x5a\xef\x54\xf8\x7c\x5a\xd1\x8f\xca\x84\xaf\
+\xb0\xc1\xfc\x3a\x98\xd0\xe6\x17\xff\xf9\xa9\x8f\x31\xd8\x39\x19\
+\x70\xc5\xef\x5e\xd1\x9b\x33\x40\x86\x52\x78\x2f\x62\x0a\xde\xe8\
+\xaf\x65\xee\x56\x02\x06\x5a\x84\x2b\x6e\xbf\xb3\xe5\x32\xf2\x93\
+\x2a\xfb\x90\x82\x29\x47\x5b\x38\xe8\x7d\x91\x5b\x8c\x91\x01\x14\
+\x53\xb9\x91\xbc\xc4\xcf\xd1\x72\x48\xed\x87\xf7\x38\xee\x92\x9a\
+\xed\x93\x97\xb4\x66\xa2\x73\x7d\xef\xf3\x0e\xa8\xe5\x69\xf5\x2a\
+\x17\x04\x75\x6d\xa3\xe3\x3f\xe5\xdf\x25\xd7\xc7\xd3\x7d\x1f\xb6\
+\xf1\x3e\x78\xab\x0f\xb7\xe2\xea\xa7\xb3\xdd\x93\x1a\xe6\x46\xdd\
+\x77\x8b\x97\x6f\xa4\x8c\xed\xaa\x5d\xd7\xaa\xbb\x0d\xbc\x47\x0e\
+\xc1\xbe\x17\x6f\xba\xcf\x49\x51\xf9\x0c\x24\x09\x44\x81\x22\xdd\
+\xc0\x52\xfe\xc5\x10\x06\x89\x10\xa0\x01\xf9\xec\xf5\x20\xde\xe5\
+\xb0\x24\x3a\x70\xf9\xcb\x70\x8e\xa2\xeb\x3e\x3b\x6e\x1d\x16\xde\
+\x03\x66\x54\xb3\x61\x5d\x3b\x5e\x0a\xc5\x38\x2e\x81\x57\xf8\xa7\
+\xc0\xd5\x20\x6c\x6e\x4f\x4b\xdd\xbb\xb8\xfe\x76\x18\x86\xa5\xc8\
+\x0c\xda\x9e\x04\x8f\x81\x9c\x96\xc9\x3a\x5d\x3e\x79\x24\x1a\xdf\
+\xb6\x7a\xd3\x1c\x23\xbb\x9a\x78\xf6\x4f\xaf\x35\x59\x62\x49\x47\
+\x71\x8d\x6c\x43\xc5\x89\xde\x1a\xb8\x5f\x23\x7e\xab\x2b\x35\x65\
+\xd6\x61\x8c\x4d\x4f\xc3\x05\x73\xe5\xc3\x3d\xef\xa5\x24\x2b\x2a\
+\xe9\xe9\x97\x27\x7f\xb7\x7f\x47\x0c\xff\x95\xa7\x2a\xc0\x8d\xb5\
+\xc8\x42\x25\xce\xc6\xdf\x88\x55\xad\x3b\xc5\xeb\x0b\xa9\xe2\x54\
+\x68\x71\x0b\x67\xa7\xbd\x23\x0e\x66\xb8\x9d\xbe\xb3\x4d\x14\xb2\
+\xaa\xe7\x48\x3c\x43\x41\xe4\x23\xb8\xf1\x1e\x85\xbd\xdd\xac\xca\
+\xd7\x69\xba\x7f\x25\xd5\x58\xd2\x20\x14\xff\xfd\x19\xff\x09\xe4\
+\x5a\x4b\x4c\xfa\x48\xe0\xa1\xce\x60\xb3\xc7\x5c\xee\x44\x1a\xaf\
+\xa0\x0f\xff\x93\xf8\x99\x8a\xd7\x6b\xd9\x70\x6b\x30\x5f\xbb\xd3\
+\x9e\x7b\xe3\xe3\x86\x23\xbb\xb2\x1b\xa3\x6e\x18\x69\xa1\xba\x7b\
+\x78\x33\x43\x30\x19\xea\xe0\xc7\xb0\xe1\x98\x76\x01\x4e\xff\xf6\
+\x2c\x35\xdc\x0b\x10\x9f\xc7\xaf\x76\x6c\xcc\x79\xdf\x7c\x58\x68\
+\xe2\xa7\xf5\x5e\xd0\xc5\x4e\xd2\xc3\x4e\xa2\xf3\x5e\x90\x30\x6f\
+\xfb\x40\x44\x03\x99\x77\x3a\xef\xbf\x8b\x25\xc5\x02\xb4\x8a\x08\
+\x67\x5a\x53\x4c\x09\xaa\xa4\xb4\xf4\x3d\x57\x44\x36\x9d\xa0\x1d\
+\xe3\xf6\xb7\x5b\xb4\x54\xc7\x54\xc1\xe0\x9d\x5c\xee\x81\xe4\xe9\
+\x2b\x87\x7a\x70\x11\xef\x59\x35\x74\x08\x9f\x51\xaf\x52\x8c\xc2\
+\xa8\xbf\x45\xe5\x3f\x26\x13\x55\xf6\x1c\x7f\xf0\x05\x56\xfe\xd2\
+\x3d\x42\x9a\x76\x8e\x26\xd1\xa9\x6d\x09\x15\x42\x6a\x90\xa5\xfc\
+\xd5\x2e\x85\x4f\x3c\x29\x55\x62\x9d\x2b\xaf\x55\x90\x89\xd2\x13\
+\xa4\x45\x79\x7c\xa5\x17\x69\xfd\x93\xf6\x34\xa3\x56\x2e\x13\x8d\
+\x91\x99\xa4\xbe\x7b\xce\x5f\x47\x77\xa0\xab\xcb\x3f\x15\x66\xe3\
+\xb6\xf6\x3a\x01\x25\xaf\x88\x40\xc6\x96\x37\xbd\x1c\x35\x3b\x1d\
+\xc7\xfe\xba\x3f\x45\x9e\x19\x87\xaa\x37\x93\xfd\x03\x56\x64\x88\
+\xf3\x62\x84\xfe\x2b\x07\x07\x4d\x66\x21\xa8\xf7\xa5\xcb\x52\xc1\
+\x1d\x84\x5c\xf4\x82\x26\x14\x8d\x7d\xaa\x82\x93\xc6\x37\x26\x4a\
+\x77\x4c\x99\xcc\xc4\x5e\xad\x54\x69\x49\x2d\x6e\x8a\x9d\x6d\xa8\
+\x55\x7f\x9f\xd8\x31\x1e\x5c\xfd\x82\x53\x02\xf5\x30\xbf\xcd\xee\
+\xe5\xf5\xdd\xe0\x91\x7e\x43\xf3\x75\x47\xd6\x5e\xa5\x75\x70\xe5\
+\xdd\x3e\x9b\x9c\x6e\xe8\xd1\xd3\xeb\x64\x03\x48\x86\xe9\xb2\x42\
+\x02\x7a\x50\xe7\xc7\x28\xe4\x66\xf5\x38\x5e\x36\x22\x4e\x96\x0e\
+\x51\x0c\x1c\x4e\x17\xac\xb2\xbb\x04\x60\xdc\x5f\x50\xa9\x49\xfb\
+\x48\xf8\x45\x86\x15\xa0\xef\xde\xe8\x07\x71\x11\x68\x0f\x28\xd8\
+\x19\x52\x75\xf0\xc4\x67\x88\x9c\xb5\xc6\xaf\xdd\x2d\x70\x49\x89\
+\x7f\x82\x52\x19\x15\x5e\x11\xcc\x25\x01\xe0\xe4\x33\xba\xa9\x07\
+\xb8\xe5\x19\x61\xbe\x14\x52\x5e\xe2\xab\xe4\x68\xb7\x85\x32\x35\
+\x3f\x58\x14\xa4\xc3\x88\x64\xc2\xbd\xfd\x79\x47\x17\xb0\xc5\xce\
+\x88\x09\xb3\xd5\xcd\x75\x4a\x38\xba\x55\xca\x1f\x3b\x38\x38\xde\
+\x77\x09\x3a\xbf\xe9\x49\x22\x00\xaa\x4b\x1d\x96\xb0\x51\x02\x77\
+\x92\x98\x0c\xca\xdf\x8a\x01\x43\xe1\x26\x5c\xbd\xc1\xd5\xb6\xeb\
+\x8b\x65\x85\x4f\xae\xe0\x1b\x29\xa1\x8f\x17\x56\x27\x50\x50\x17\
+\x96\xc5\x5c\xef\x78\xd6\x16\x7d\x31\x91\x4c\x9a\x2d\x6d\x09\x59\
+\x1b\xdc\xa9\x6a\x0c\xd2\x72\xd6\x9f\x0c\xd2\x47\x1b\x9f\x73\x26\
+\xf0\x50\x6a\x5f\x13\xd4\xaf\xb5\xbc\x3e\xa3\x16\xe5\xf8\x2c\xcb\
+\x1d\x49\xb4\x04\x64\x77\x0f\xa7\x23\x0e\x6b\x2c\xe4\x7e\xf5\xf2\
+\x7b\x32\x8e\xc8\xbe\x04\x2d\x5a\xbb\x9b\xeb\x00\xe3\x67\x3b\x7d\
+\x73\xba\x26\x2e\x64\x8e\x7e\x97\x04\x56\xcb\x6b\x43\x95\xfb\x78\
+\xc4\xdc\xdb\xeb\x2a\xae\x97\x3e\xa0\x2c\x4a\x6b\x0f\x93\x8e\x49\
+\x3e\x17\x1a\x35\xef\x15\x6e\x57\xc5\xf4\xd8\x99\x80\x3e\x34\x5b\
+\xd6\x09\xba\x44\x9a\xc2\x54\xbf\x7d\x57\x16\xf5\x8e\x19\x88\xda\
+\x35\x3c\x9b\xc9\xee\x9c\x04\xcc\x60\xb0\x7e\xf7\x50\x95\x0f\x6f\
+\x4f\x2c\xa8\xe9\x96\x32\xb8\xb2\x54\x7f\xb8\xe9\x82\x96\x83\x74\
+\xbd\x10\xf7\xfc\x03\x25\x14\xb7\xc7\x1a\x38\x2f\x85\x35\x14\xde\
+\x3e\x31\x7a\xef\xb9\x42\x2c\xe0\x2e\xdb\xce\x60\x11\x06\x8e\xbb\
+\x49\xf9\xa9\xe9\xa5\x6b\xf0\xe8\xd3\x86\xab\x9b\x67\x96\x53\x49\
+\x88\x33\xdb\x28\xf1\x1c\xc1\x1c\xcf\x40\xa6\x03\xb8\xa2\xf9\xbe\
+\xd9\x3c\xb2\xb1\xf6\x9f\x22\x35\xfb\x45\x6d\xf3\xcb\xec\xf3\xc6\
+\xa5\x52\xed\x1a\x5d\xf0\xe2\x95\x96\x44\x84\x39\xd9\xf9\x1b\x4b\
+\xdc\x3f\x8d\xdf\x3c\x83\xb1\x62\x2e\x60\x55\x4f\xa9\xd8\x69\xbf\
+\x9f\x19\x7c\x7d\xc0\x54\x85\xfa\xbd\x20\x99\xda\x05\xce\x40\x2e\
+\x69\xdf\x52\x8c\x26\x8e\xdc\xda\xfe\x7d\x6d\xe9\x8a\xb4\x94\x8e\
+\x15\x34\xe5\x75\xcb\x27\x0b\x95\xdb\x05\xa4\x95\x43\x9c\xd5\x34\
+\xaa\x3c\x85\x1b\xa8\x86\xe7\x6c\xe5\xa0\x65\x0c\xf2\x1a\xaa\x3b\
+\x62\x41\xd7\xd0\x6b\x0d\x85\xf1\x67\xa8\xa8\x54\x89\x63\x46\x4b\
+\x3c\xb2\x77\x97\xe9\x27\x0e\xe5\xb0\xc6\x2f\xf6\xd5\x47\x9f\x35\
+\x3f\xa2\x67\x14\xc0\x70\xbe\x9d\x33\xce\xbe\x20\x3a\x7c\x00\xe8\
+\x86\x56\xa2\x29\x3f\xce\x2f\x80\xcd\x76\x72\x16\x9f\xad\xa5\xc2\
+\x87\xd4\x0c\x93\xc6\x89\x60\xed\x4c\xa5\xfa\x47\xe3\xb8\x65\xd7\
+\x14\x60\x40\xd7\x7a\x6c\xca\x8c\xf6\xe1\x8c\x57\x9d\xa5\xa8\xd0\
+\x1d\xd5\x1b\x70\x6e\xd4\x97\x8d\xad\x04\x87\x20\x07\xf8\xb8\x59\
+\xd0\x98\x4d\xbc\xb4\x0f\x37\x3b\xe0\xa1\x6e\xb6\x7d\xa0\x7c\xe8\
+\x65\xf0\x92\x42\x79\x72\x25\x0e\x9b\xa5\x5e\xc3\x32\x3b\x99\xe5\
+\x85\x85\x04\x71\xce\x05\x9d\x5d\xba\x38\x80\x92\x9f\x62\x67\xfb\
+\x31\xe4\x71\x20\x1a\x3b\x8c\xaa\x5a\xee\xde\xae\xee\xde\x87\x58\
+\xc4\x70\x23\x11\x18\x83\x74\x47\x07\xd7\xc6\xeb\xfc\x1d\xbd\xc6\
+\xd1\xc2\x15\x14\xa1\x69\x8f\xcd\x9c\xf6\x64\x89\xb6\xce\x1c\x6c\
+\xb3\x5d\x4c\x33\x33\x35\x22\xe3\x28\x77\x7a\x86\x0c\x3d\xf8\xe0\
+\x51\x50\x00\x9b\x33\xee\x4f\x72\x6d\xa0\x85\xe6\x33\x90\xe9\x5c\
+\x8c\xb4\x6a\xd5\xa4\xa1\x6e\x8e\x1d\x68\x3d\x48\xeb\x29\x18\xa5\
+\x59\x77\xa4\x25\x22\x50\x43\x30\xb4\xb2\x4d\x1d\x2c\xeb\x69\xe7\
+\x89\x62\xaa\xb6\xb7\x21\xce\x14\xe9\xab\x2e\xdd\xe8\x49\xea\xc0\
+\xaa\x03\xc9\xbe\x9e\xe5\x61\xd1\x84\x66\x14\xba\x7e\x0c\xf2\xba\
+\x43\x75\xe3\xe9\xfd\xfc\xfc\xb2\xf2\xb0\x3a\x62\xa3\x87\x6b\x84\
+\x38\x72\x50\x9d\x1b\x7a\x9a\xd6\xe4\x0c\xa1\x5b\xcb\x6b\xc0\xfd\
+\x68\xeb\x9b\x7b\x8b\xa3\x24\xfb\xc2\xbe\xcf\x50\xe7\xb6\x81\xfa\
+\x9a\xd2\xbc\xc9\x4b\x29\x83\x65\x95\x59\x47\x72\x60\xbf\x81\xca\
+\xc8\xc0\x7c\x4b\x03\x7d\x9b\x85\x86\x76\x3f\x8d\xd7\x6c\xef\x3f\
+\x5e\xcd\x18\x34\x26\x74\x70\x3a\x0a\xbf\xd0\x7e\x6d\x22\xe7\x40\
+\xa0\x4e\x10\xa5\xb9\xb8\x55\x88\xb3\x8f\x6f\x7a\xdc\x42\x0e\xc9\
+\x42\x04\x99\x1b\x25\x3b\xd5\xe7\x00\x93\x87\x19\x7f\xcc\x28\xee\
+\x68\xfa\xe8\x53\xe2\xb8\xfd\x50\x24\x81\x82\x04\x94\x0f\x58\xfc\
+\x18\x50\xf2\xca\x70\x5b\xb4\x62\xcf\x82\x15\xdd\x69\x9e\x96\x22\
+\x4e\xc3\x80\x5e\x3d\x59\xcb\x2c\x26\xe6\xea\x9d\x39\xb9\xf3\xa1\
+\x61\x95\xe0\x6e\x18\x85\x0d\x87\x0c\x36\xcb\xc3\x2e\x70\x2c\xc7\
+\x86\xae\xda\x1d\x12\xb0\x31\x59\x65\xf4\x55\xa4\xc8\x0a\x1f\xab\
+\xb0\xac\x67\xd0\x39\x47\xc9\x1e\x64\x30\x13\x90\x2e\x22\x72\x54\
+\xd2\xb3\xa4\x3d\x77\x75\x9c\xd1\xcd\x96\x94\xb9\xdc\xfe\xa5\x97\
+\x14\x45\x4f\x69\xae\xab\xc6\x02\xf8\xc1\x05\xdd\x97\xfa\xa8\x2c\
+\xbd\x55\x83\xe7\xc4\x64\x64\x7d\xc8\x5c\x9b\xd2\x9e\x09\x36\xf6\
+\x80\xe2\x84\x9e\xaf\x4d\xd4\x2d\xc5\x04\x07\x61\x14\x21\xb7\x31\
+\xe3\x93\x82\x74\xb9\x16\x8b\xab\xb2\x78\x2b\x6e\xd3\x6b\x5e\xa8\
+\xa9\x6f\xc0\xe5\x0d\x13\x0b\xa2\x67\x2c\xcc\xa5\xae\xa8\x58\x06\
+\x5b\xe4\xba\x2b\x57\x18\x14\x06\x57\xf2\xdc\x7e\xbb\x40\xb4\xb6\
+\xd3\x58\xe8\xab\xe9\x1e\x2e\x01\x10\xd3\x80\x9d\x8e\x4c\xeb\xb1\
+\x5d\xa9\x69\x08\x56\x43\x37\xfa\x1d\x2f\x41\xe5\x57\x26\xf1\xd1\
+\x41\xd9\x35\xed\xae\x5e\x34\xce\xed\xec\x98\x4e\x93\xe8\x14\x0d\
+\x85\x6f\x9d\x95\xc5\xef\x0c\xe0\x76\x59\x4f\xae\x58\x2b\x07\x36\
+\x6b\xe1\xc0\x58\x52\xaf\x62\x91\x06\x5d\x29\x55\x22\xbd\x35\x64\
+\xa8\x81\xb4\xea\x95\x47\x66\x71\x71\x80\x24\x11\x52\x55\xbb\x8d\
+\xca\x74\xa3\xd2\x16\xa4\x3b\xde\x69\xf5\xba\x7b\x49\x7b\xa5\x20\
+\x2d\x90\xd4\x2e\xe5\xc1\xbd\xa6\x1c\xe2\x2e\xf2\x25\x63\x36\x2d\
+\xb1\x4c\x71\xa9\xdc\xac\x08\xd8\x61\x4e\xc7\xbb\x9a\xd7\x11\xd4\
+\xa1\xfb\x79\x5e\x97\xa6\xcd\x86\x98\x2d\xab\x86\xdd\xf0\x2a\x7a\
+\x23\x19\xdc\xae\xb3\x47\xb2\x64\x2d\x5f\xaa\x5a\x8f\xdd\xae\x56\
+\x05\xe9\x8e\xe5\x2c\x4f\x29\x79\x94\xb6\x2c\x2a\xaa\x5d\xa9\x4e\
+\xe6\x35\x3d\xe8\x7e\xbd\xa0\x72\x34\xda\x94\xe3\x41\x20\xd5\x3e\
+\x3c\x8d\x4c\x30\xf2\x92\xc5\x88\x71\x53\x6d\x50\x9b\x7d\x23\x55\
+\x4e\xbe\x90\x04\x59\x77\xed\x32\x74\xdd\xa8\x2a\x90\x41\x52\x09\
+\xa8\x90\xcb\xdf\x6e\x5b\x2f\x9d\x1d\x5d\xbd\x7e\x6c\x8d\x32\x15\
+\x22\xa9\xd7\x84\x4b\x8b\x32\x18\x2d\x0f\xe9\x29\xae\x1a\x6d\xa4\
+\x52\x06\x9e\x29\x32\xe1\x39\xe2\x91\x7f\x49\xdd\xed\x38\x9c\x45\
+\x1e\xf0\x8c\x3f\x41\x5b\xad\x79\x18\xbe\xaa\xfd\xae\x38\xf7\xc3\
+\x86\xc8\xc9\x74\x84\x62\xac\xdc\xb7\xaf\xba\x0b\xd4\x58\xba\x0c\
+\x6f\x64\x5c\x1a\x4f\xfa\x20\x0e\x86\x56\x14\xf6\x9f\x0d\x39\x70\
+\xef\x2f\xda\xbb\xc1\x48\x24\x1f\x98\x13\xd4\x45\x29\x00\xf3\xa5\
+\xec\xeb\xfa\xac\x50\xa8\xb7\xef\xfa\x70\x98\x0b\x15\x9d\x85\x69\
+\x03\xfd\xad\x11\x3f\x33\x3d\xe8\x09\x15\xc6\x25\x4b\xf7\x06\xc1\
+\xa9\xa8\x00\xce\xb3\xa3\x3a\x13\xc4\x77\xb8\x2e\xb2\x55\xee\xf7\
+\xd6\xb2\xb7\xd6\x77\x61\x5a\xac\xac\x13\x7d\xf4\x57\xdf\x29\x62\
+\xd8\xa0\xd9\x72\x78\xff\x34\x81\x79\x72\x5c\xbd\x0f\x7b\x79\x32\
+\x2b\x22\x74\xd2\xa1\x7e\xe7\x9a\x1e\x70\xb1\x2f\x8e\x78\x2e\xac\
+\x86\x94\x46\x24\x5a\xcf\xce\x24\x54\x98\xb7\xa0\x6c\xf6\xaa\xee\
+\x0a\xd6\x39\x3b\x4e\x20\x3d\xce\xfa\xa0\xb5\x45\xe1\x12\xa3\xdb\
+\x7a\x37\xf1\xa5\xfc\xca\x98\xd4\xa3\x2c\xfa\x8a\xcd\xb1\x28\xa5\
+\x7b\x7a\x00\xd8\x15\x57\x3a\x8d\xa0\x86\x80\x5c\x33\x8c\x93\x94\
+\xcb\x98\x1b\x35\xa0\xc1\x6a\x1d\xe2\xea\xa8\xaa\xce\xb6\x8a\x79\
+\x4f\x53\x65\xfb\xf9\x58\xbb\x5d\xbf\x3e\xd9\x4d\x14\x48\x41\xfa\
+\xe2\x27\x25\x06\x47\xe2\x4f\x6c\x94\xd0\x50\x0e\xe2\x8f\x42\x8d\
+\x22\x55\x1f\xa8\x19\xee\x0e\x89\x79\x1f\xe0\x3c\x8c\xc3\x5e\x91\
+\x5d\xe8\x04\x5b\xd3\x20\x3d\x99\xcd\x8e\xf6\x6f\x7f\x59\x25\x6b\
+\x6f\x2f\x7b\xff\x48\x7b\x6f\x68\x2c\x54\x74\xa9\x53\x04\x3e\xef\
+\x1f\xa6\xd5\x52\xaa\x0e\x83\x55\x31\x44\xdb\x08\x27\xd6\xd1\x06\
+\x85\xac\xbc\x6d\x2f\x7c\xc6\xb1\x3d\x13\x80\xba\x19\x17\x6d\x75\
+\x27\xbd\x2d\xcf\x5e\xa5\xc5\xea\x49\x5e\xc4\x01\xb2\x89\x9f\x14\
+\x69\x98\x83\x7b\x5a\xbd\xfe\x0d\xde\xd5\x41\x5e\xb2\xeb\x63\xe7\
+\xb4\x89\xa5\x8e\xce\x6f\xb6\x99\xc5\x7a\xd9\x3b\xe4\x89\x98\xcf\
+\xcb\x0a\x6f\xd6\x4f\x6a\x27\x7f\x0e\x38\x8b\xa1\xa3\xa5\x3b\xf1\
+\x94\xd9\x22\x50\x25\x30\xc2\x21\x3f\x7f\xb8\x11\xf5\xde\x0b\xc2\
+\x67\x0b\x95\x8c\xd5\x31\x93\x0b\xd7\x45\xb1\x75\xaf\x8c\xc5\xe8\
+\x57\x92\x72\x3c\x80\xe6\x19\xf1\x18\xf2\x3b\xf4\x4d\x9b\x3e\xaa\
+\x2d\xd3\x26\x43\x11\x53\xbf\x6d\x48\x18\x68\x7f\xfb\x95\xe0\xed\
+\x33\xc5\x33\x96\x58\x68\xbd\xf6\x71\xd2\xba\x58\x8b\x8a\xb0\x71\
+\x4a\xdd\x71\x78\xf4\xe7\xf7\x06\xeb\x32\x17\x09\x9a\x68\x9c\xbc\
+\x33\x65\xf1\x06\x76\x3d\x38\x4b\x34\xdb\x53\xb9\x5b\x4b\x4c\xd0\
+\xae\x33\xfc\x09\x48\x97\x73\xb1\xb8\x39\xed\x91\x56\x6a\x42\x65\
+\x7f\x60\x6e\x07\xe9\xb6\xcb\xfa\x6c\x92\x5f\x88\x77\x11\x1f\xef\
+\x64\x92\xda\x2a\x3d\x0c\xb7\x76\xe2\x09\xb9\xcd\xe5\x1a\x9e\x78\
+\xbe\x24\x26\xd6\x39\x89\x5a\x33\xa8\xf2\xca\x97\x1b\xe8\xdc\x13\
+\x8f\xb8\xaa\xbd\x0a\x30\x01\xb8\x4d\x0e\x36\x2f\x2b\xbd\xb1\xcd\
+\x08\xc9\x1d\x72\xed\x9d\x60\x0e\x29\xb7\x53\x76\xab\x08\x77\x78\
+\xcd\xb0\xa8\x8a\xe4\xe7\xfc\x65\xaa\x1f\x0c\xf6\x9c\xe4\xf3\x64\
+\x17\x69\x55\x53\xed\x89\xd4\x7b\x40\xcf\x8e\xb4\x33\x25\x52\x26\
+\x82\x8b\xdf\x52\xb2\x90\xb9\xd2\x73\xfe\xd1\x46\x06\xbb\xe1\x04\
+\xdc\x31\xd3\x96\xde\x8b\x66\xaa\x86\x69\x19\xbf\x6e\xf2\x11\x84\
+\x91\x66\x5d\x13\xf3\xfb\xc2\x91\xd0\x59\x74\xf1\x76\x0b\x86\x95\
+\x58\x03\x44\xf5\x1a\x52\x79\xdb\x39\x73\x24\x92\xb2\x16\xde\x1a\
+\x5d\x0a\xca\x75\x81\x57\x6b\xa0\x21\x81\x14\x1b\xd5\x86\x9b\xf7\
+\x5f\xf5\x98\xb7\x9d\xc1\x5d\x1d\xbc\x78\xf4\x72\xd7\x36\x85\x66\
+\x01\xcb\xb9\xef\xdd\x9e\xb8\x77\xa6\x7e\x25\x1b\x8a\xab\x89\x45\
+\x4f\x83\x9b\xdf\xf8\x74\xb4\xdf\xea\xa1\x4d\xff\xa6\x66\x42\x9a\
+\x15\x07\x98\xf6\x89\x46\xc3\xc5\x64\x99\x5d\x45\xe7\xf6\x24\x6c\
+\x39\x28\x11\x6f\x69\xd1\xd6\x4a\x1b\xb3\xad\xb4\x7c\x4e\xfb\xdd\
+\xdb\xb0\x86\x0e\x1b\xec\xb9\x47\x57\x3b\x53\x52\x99\x25\x93\xf3\
+\x93\xdc\xfc\x6e\xe8\x67\xb9\x7b\x99\x5f\xd3\xe9\x77\xf6\x0c\xf0\
+\xee\xcd\xca\x7c\x22\x20\xff\xe0\xe0\xf2\xfe\x87\xfb\xd5\xe2\x02\
+\x76\x8b\xb3\xe3\x34\x37\x49\x36\x8b\xdf\x8c\x31\xba\x87\x6e\xe8\
+\xbf\xa3\x24\xe9\x0f\x65\x9d\xea\x0d\x81\x9d\x2d\x9e\xe1\x43\xa2\
+\x71\x65\x29\x45\xa7\xb8\x91\x5d\x1b\xd8\x99\x79\x24\x94\x51\x2a\
+\x69\x32\x51\x28\x52\x66\xb9\xfb\xea\x2c\xaf\xd8\xf3\xd5\x98\xa7\
+\xfd\xf6\x2a\xf6\x31\xd8\xf5\x72\xa0\xd2\x6d\x71\x75\xdc\xa2\x85\
+\x02\x63\x1e\x17\x1a\xa4\x7a\x21\x53\xe6\xc9\x44\x96\x9c\x23\x2c\
+\x69\xf8\x9c\x25\xcc\x2a\xbf\x8b\xb9\xbd\xd7\xa6\x56\x64\xe6\x9a\
+\xa7\xbc\x62\xdc\x6e\xff\x84\x3e\x5a\xc8\xe2\x35\xcc\xc2\x25\xfe\
+\xe5\x1e\x1b\x57\xcf\x55\xc1\x17\x84\xb1\x77\xf6\x3b\xbd\xae\x83\
+\x7d\x8c\x65\xcf\xe4\x7e\x10\x42\x4f\x65\x22\x59\x9b\xba\x68\x4e\
+\xbd\xea\x82\xa7\xe4\xc8\xbd\xba\x6c\xe0\x58\xd4\xd5\x23\x7f\xcd\
+\x36\x58\x21\xc2\xa5\xe6\xf2\xca\xf3\x37\x85\x21\xab\x53\x77\x74\
+\x92\x45\x75\x16\xfa\x95\x36\x8d\x70\x51\xde\x1c\x3d\xe8\xa5\xbc\
+\x9f\xa6\x8a\x7e\x75\xb0\xae\x3e\x24\xd6\xa4\x5f\x79\x62\xaa\x46\
+\xb4\x89\xa5\x83\x16\x19\x26\x71\xdf\xa3\x19\x19\x52\x96\xbe\xae\
+\x61\xfe\xaa\xe7\x6e\x62\xf3\x79\x42\x4e\xf1\x66\x96\xab\x30\x17\
+\xbb\xba\xce\xc9\x23\xc7\xbc\xc1\xb9\xed\x9e\xb0\x1c\xd6\x37\xb3\
+\xd2\x3b\x77\xad\x1a\x57\x52\x97\x3d\x01\x27\xe3\x1c\x92\x68\xaf\
+\x39\xa9\xf9\xac\x6d\x56\xf9\x98\x2c\x19\x00\x1e\x0c\xbd\xef\x81\
+\x6a\x67\xda\x0c\x61\x6b\x3a\x05\x1d\x19\x50\x87\x26\x6b\x48\xcd\
+\xe8\x18\xd6\xc7\xb4\x0e\x09\x02\x01\x56\x41\xd1\x12\x77\xa5\xde\
+\xc4\xf7\xa7\xa8\x5d\x94\x25\x89\x00\x69\xda\xe5\xa2\x15\x60\x3c\
+\xab\xf0\x8b\x29\x64\x54\xe1\x4b\x96\x06\xa2\x22\x8a\x23\xaf\xf7\
+\x7d\xe0\x1f\xd7\x8b\xbe\xdb\x6d\x77\x1d\x05\x23\x3e\xbe\xea\x8c\
+\x62\x03\xb8\x7a\xc5\xfd\x29\x26\x1d\x7e\x40\x6e\x2f\x56\xfe\xf3\
+\x64\x53\x89\x74\xa0\xc4\xd8\xc4\xc0\x69\x15\xb9\x2c\xf1\x9e\xae\
+\x8b\x16\xe7\x93\x68\xdf\xc2\x77\xda\xe5\x7d\x81\x22\x24\x22\x38\
+\x5f\x68\xac\x6f\xd8\x19\x2a\x42\xdd\xa5\x3c\x1e\x7f\xa6\xd1\xf7\
+\x08\xed\x7e\x74\xa4\x23\x2b\x57\x91\xf2\xe6\x65\x62\xba\xcc\xb4\
+\x19\xae\x3c\x5a\xd9\xa5\x06\x24\xff\x86\x67\x58\x6e\x44\xc4\xc6\
+\xc4\xd7\x15\x54\x99\xca\x3b\x1f\xdf\x2a\x68\x53\xe1\x00\x0c\xae\
+\x8d\xa5\x75\xcf\x5a\x84\xa3\x47\x52\x3d\x40\xb9\x40\x39\x73\xf6\
+\x6a\x20\xdb\xf9\xa7\x0f\x2a\xd2\xa6\x1b\xa3\x62\x19\xda\x16\x99\
+\x5c\x3f\xa3\x28\x20\x83\x84\x56\x90\x97\xb7\x20\x49\xe7\x76\x35\
+\x7a\x05\x94\x7a\xcb\x73\xcd\x17\x8b\x6b\xaf\xb7\x78\xd8\xb4\x05\
+\x91\x16\x1b\x47\xc4\x96\x1e\x9e\x1f\x60\x5f\x6f\x1e\x36\x30\x6c\
+\x25\xb6\x42\x08\x46\xd5\x63\x60\xe8\x71\x14\x10\x40\x6d\xc5\xe5\
+\xf6\x36\x03\x93\xc4\x26\x14\xcd\x00\x48\x24\x77\x62\x24\x8d\x17\
+\xc0\x10\xf5\xe2\x07\x47\x85\xe5\xf3\xa0\x94\xa8\x37\x5f\x7c\xc5\
+\xce\x93\x49\xcb\xd9\xc7\x9c\x5b\x59\xbf\xec\x50\x4f\x57\xb8\x67\
+\x07\x79\x0e\xea\x01\xea\x8d\x4d\x80\x4b\x3b\xc4\xa3\x5b\xc0\xee\
+\xab\x87\x9c\x58\xd7\xd5\x81\xe3\xa8\x97\x39\x49\x80\x29\xe5\x35\
+\xed\x6a\x67\x8d\xbb\xed\x67\x9a\xc4\x4a\xc2\x4c\x6f\xd2\x0e\x0f\
+\xd9\x67\x56\x82\x41\xec\x7c\x8b\x61\x45\xef\x0b\xf8\x30\x7d\x3c\
+\x0c\x31\x47\xea\x9e\xf9\x48\xd8\xde\xfe\xa4\xac\xd4\x6f\x1e\xf7\
+\x68\x0c\x92\x8a\x01\x18\xd2\x2d\xca\x6a\x70\x88\x87\x54\x5e\x41\
+\x43\xdb\x27\x6f\x6d\xee\x82\x44\x7c\xa2\xb9\x4a\x31\x61\x05\x5b\
+\x6e\xbb\x8c\x43\x0e\x41\x7a\x96\x11\x10\xab\xa0\x70\x9e\x16\x58\
+\x11\x77\xd3\x7b\xa8\xd9\xea\x5e\x6b\xa3\xdc\x0b\x7e\xc3\xc7\xee\
+\xa8\x3e\x5b\x70\x81\xb3\x60\xf4\xe9\x25\x4c\xef\x5c\xc2\xd1\x0f\
+\x6a\x8b\xef\xc4\x1d\x2f\xf0\x06\xf0\xf5\x54\x30\x79\x54\x9b\x32\
+\xb8\x91\xa6\xf6\x2f\x08\x3c\xc4\xac\x57\xba\xf2\x06\x57\x48\x3f\
+\xf8\x12\x87\x97\x5b\xdd\xbc\x89\xe3\x98\x48\xf8\xf8\xab\x52\xc0\
+\xd8\xa8\x5b\x4e\x9e\xe9\x52\xe3\x1a\xb7\xbc\xa7\xab\x88\xa8\x6e\
+\xe7\xa5\xc9\x8e\xa6\x05\x1c\x08\x31\xd2\x1b\xf4\xdc\x31\x65\x2a\
+\x77\x74\x2c\xf6\xcd\x95\xe7\xcf\x93\x75\xc9\xc1\xb6\xb3\xf9\x89\
+\xcd\xee\x12\x24\xec\x96\xcb\x2a\xe6\x58\x37\xf6\x48\x96\xec\xa9\
+\x04\x1b\x49\x4d\x44\xde\x96\x67\x35\x49\x5f\xd8\xd9\xa7\x49\x24\
+\xe7\x04\x0a\xe8\xd5\xf4\x3e\x0a\x0b\x49\x4b\x75\x06\x5d\x07\x09\
+\x20\x07\xe8\x91\x75\x50\xd0\xd6\x0a\x95\x07\x14\xde\x14\x96\xb6\
+\x7b\x04\x1f\x60\xa1\x73\x9a\xef\x4c\x70\xa3\x13\x2a\xd5\x1f\xbb\
+\xc3\x50\x5b\xe5\x48\x84\x09\x01\x6a\xe2\x7b\x9b\xae\xfe\x5e\x11\
+\x7b\x17\xb7\x8a\x51\xc2\x9c\x64\xcf\x08\xab\x07\x44\xa1\x50\xf2\
+\xaa\xea\xec\x63\xaf\x85\x37\x0d\x81\x99\x0b\x86\x11\xb9\x8d\x70\
+\x0c\x31\x23\xd7\x90\xca\x3a\xac\x87\xd0\x5e\x3c\xdd\x57\x6f\x0e\
+\x5c\x1b\x5e\x14\x44\x1e\x39\xe6\xb6\xf6\xdf\x1a\xf3\x07\x99\x3e\
+\xee\xa5\x69\xb2\x5e\x3d\x12\x5c\xf4\xc3\xa1\xad\xd6\xe8\x1e\x5f\
+\xba\x74\xff\x42\x05\xef\x39\x10\xb4\x7e\xaa\xf7\x03\x75\xab\x55\
+\x75\x65\xa9\x75\x36\x8e\xab\xbe\x69\x97\xae\x8d\x61\x93\x31\x21\
+\xe8\xb9\x9d\x92\xac\x52\x94\xf1\x85\x1e\x34\x64\x1b\x94\x01\xa2\
+\x6c\x11\xb8\x5f\xb8\xa4\xbf\x51\xd0\x1e\xc2\x6c\x73\x2e\xeb\x93\
+\xaa\xf9\x52\x61\xc0\x63\xcc\x73\xaa\xf2\xce\xe7\xd3\x64\x85\x8e\
+\x9e\x52\xc6\x72\xa1\xf4\xc7\x95\x88\x2c\x4e\xa3\xc7\xab\xf9\x6a\
+\x60\x9b\x62\x1a\xab\xc4\x3c\x7c\xe1\xf5\xdc\xa5\x8e\xe7\x20\x4d\
+\x5e\x3d\xff\x45\x01\x81\x14\xcf\x0a\xfe\xe5\x75\x6f\xe4\x3d\xef\
+\x7c\x4a\x5b\xf1\x20\xf3\x95\x4b\xa2\xc3\x63\x7b\x77\x99\x68\x32\
+\x77\xc2\x4d\xc6\xba\xd7\x72\x95\x57\x38\xbb\x78\x3e\xa1\x8a\xf8\
+\x4d\x49\x1e\x0a\xbf\xc8\x24\xf3\xc6\xb2\x37\x58\x2f\x58\x23\xf6\
+\x7b\x4b\x9d\x97\x82\xb1\x46\x52\x30\xb5\x8b\x0c\x89\xf1\x89\x2c\
+\xbc\x63\x90\x96\x26\x8b\x5c\x67\xb1\x7c\x17\xda\x33\x3f\x78\x20\
+\x43\xd0\xed\xb2\x8e\x24\xd1\x64\x73\x40\x7d\xd9\xd3\x47\x88\xe3\
+\xd0\x72\xb1\xe0\x3e\xdf\x9e\x74\x0d\x0e\xd2\xd9\xfb\xfa\x19\xb2\
+\x00\x22\xab\x94\x99\x5d\xfa\x61\x0f\x6a\x60\xb3\x46\xd4\x70\x5b\
+\x47\x95\x96\x7e\xe0\x0c\x89\x79\x6f\xaf\xf5\x08\xc7\x45\x98\x66\
+\x13\x1a\x5e\x69\x46\xb4\x97\x42\x13\xde\x02\x69\xb2\x3a\x10\x92\
+\x87\x6a\x2d\xe6\xf9\xc2\x8d\xcc\xd2\x80\x11\x78\x43\x61\xbe\x0e\
+\x8c\xc8\x88\x51\x33\x09\xbc\x6a\x39\x6f\x85\x41\x7d\x0b\xa8\x75\
+\x3d\xda\xeb\xed\xea\x0b\x5d\x4e\xc9\x3c\x47\x9a\xfa\xea\x90\x79\
+\xe8\xa0\x3b\xf2\x93\x3b\xc7\xdd\x21\xa6\x06\xb5\xa0\x83\x89\xbd\
+\xc7\xb8\x1b\xef\x91\x30\x81\xfe\xa4\xac\x79\xd2\x78\x45\x64\x42\
+\x5e\x06\x10\x20\x3d\x0b\x9b\xf7\x1f\xe6\x43\x8e\xee\x9b\x3c\x0c\
+\xae\x15\xa4\x9a\xe3\x25\xc2\x84\x6c\x78\xb4\xc7\x4d\x0d\x78\x13\
+\xcf\x5a\x9f\xbf\x28\xa6\xa9\x1d\x8e\xff\x00\xe8\x8e\xf9\x54\x8a\
+\xcb\xb1\x4c\x8e\xb4\x79\x95\xd9\xe5\xa8\xd5\x33\xc7\x07\x5e\x4f\
+\xe9\xf5\x67\x01\xaa\x02\x67\x2f\x29\xd9\xb6\x67\xec\x30\x7d\x69\
+\xd4\xca\xf9\xe7\xbc\x89\x78\x94\xaa\x71\xc3\x41\x49\x90\xd6\x3e\
+\x2d\xfe\x4e\x23\xe6\x91\x31\x5c\x16\xdc\x7e\x9e\x09\x4f\x9e\xbb\
+\x01\x87\xcf\x01\xa0\xf8\x82\x03\x71\x37\xf9\xbd\x33\xb3\x36\x0f\
+\x1f\x0c\x35\x26\x33\xe7\x23\x2d\xa9\x02\xb5\xe6\x63\x2e\x51\xfa\
+\xaa\xd4\xe7\xd4\xd6\x34\x99\x82\x62\x13\x53\xa2\x0c\xcd\xaa\x2d\
+\x2f\x76\x01\x6f\x44\x3e\xa6\x9b\x67\xbf\x76\xa1\x7a\x3a\x51\x7b\
+\xb0\xb1\x29\x15\x7d\x78\xe4\xe4\x2a\x1e\x84\x61\xf4\x2c\xa0\x67\
+\xa3\x70\xd2\x7d\xa9\x71\x8e\xdf\x9b\x8d\x0c\xf4\xd1\xf8\xec\x04\
+\x81\x69\xb1\xa5\xe1\xd6\x43\xe3\x28\xf4\x1b\x7a\x15\xfd\x9e\xdb\
+\x6c\xc0\x48\x94\xa8\x6a\x83\x74\x68\x74\xe3\x97\x0a\x91\x60\x10\
+\xf7\x3d\x6c\xa3\xad\x27\x1c\xcb\x17\x2c\xab\x8e\x5c\x04\x32\x81\
+\x6c\x8b\xcf\x9a\x8c\xa1\xe9\xa2\x17\xcb\x14\x91\x3f\x71\x54\x9d\
+\x9b\x23\x45\x1e\x91\x05\xa4\x97\x2a\x33\x68\xbc\xd3\xbb\x1f\xd1\
+\x4c\xf9\x7f\xd8\xca\x24\x9b\x3c\xd4\xd5\x04\x55\xf2\x1c\xf9\x06\
+\x28\x32\x2e\x0d\x15\xe7\x2d\x33\x05\xf8\x6f\xc0\x9e\x6a\x85\x6d\
+\x18\x83\xdc\x3d\x49\x05\x8d\xa0\xc5\x60\x89\xfa\x5d\x85\x69\x29\
+\x5d\xda\x8b\x22\x8f\x0e\x97\xaf\x27\x81\xa4\x97\x02\x78\xf3\x52\
+\x34\x09\xae\xf2\x60\xaf\x7d\x5e\x3b\x72\xd6\x41\xe4\x2f\x94\x98\
+\xd5\xec\xa3\x2d\xd2\x2a\xb9\xef\x2d\x60\x3d\xe8\x11\x56\xc4\x96\
+\xa8\xfd\x9c\x3d\x5d\x69\xd6\xa7\xc7\x32\x99\xd7\x51\x6e\x21\x0b\
+\xbb\x04\xae\xbc\xb0\x4b\x4f\xbc\xd0\xd2\x5d\x1b\x9a\x48\xce\x7c\
+\x7b\x5f\x9a\xb3\xf2\x69\xd9\xb9\xb6\x0e\x28\x0e\x40\xde\x95\xe0\
+\x18\x77\xe1\xde\x3e\x3a\x50\xb8\xc6\x33\xad\xc5\x4b\xc7\xcf\xa6\
+\x04\xdb\x96\x79\x34\x05\xf6\x1f\x20\x29\x2a\xa0\xc1\x5f\xf0\xa8\
+\x61\x5c\x8d\x2d\x83\x99\xd1\x80\x68\xf5\x9d\x4a\x17\x02\x32\x12\
+\x90\x07\x3b\x63\xcc\x2d\x0c\xce\x80\x48\x79\x70\x4d\x85\x2d\xf9\
+\x28\x91\xd0\xf3\x03\xa9\x74\xf1\x10\xc1\x83\x90\x52\xbd\xba\xfd\
+\x83\x21\x3b\x7a\x25\x58\x43\x4d\x86\x9b\x4a\x1f\xc1\x11\xb4\xf0\
+\xe1\xb3\x08\x31\xce\xd1\xb1\xce\xdc\x7d\xf1\xa5\x07\x67\x74\x35\
+\xdf\x26\xf6\x4b\x69\xac\xcb\xbe\x8d\x64\x8b\xed\x6a\x67\xc2\x46\
+\x2f\xb8\xab\x00\x46\xfd\x98\x15\xb3\xb2\xdd\xe3\x34\x1d\xed\xc4\
+\x25\x20\xf2\x50\x5f\xea\xc6\xf5\xd6\x5a\xec\xc4\xc2\x7e\x0d\xbd\
+\xcc\xca\xc4\x2c\xf8\xf0\xa7\x87\x02\xa2\x42\x5b\xfd\x62\xc8\x90\
+\xfc\xf8\x91\x43\x12\x2e\x42\x4e\xf3\x2e\x0d\xea\x5e\xac\x08\x12\
+\x61\x6e\xa0\x40\x35\x2a\xc6\xcb\x8b\x97\xf0\x2e\x21\x47\x3f\x36\
+\x52\xee\x5b\x4d\x80\x3d\x7b\x61\xb5\xd0\x4e\x7e\x13\x67\x57\x8e\
+\xd0\x2e\x03\xc3\x4e\x2a\x67\x5e\xc1\xfd\x66\x95\x39\x58\x37\x90\
+\x01\x92\xbf\xcb\xda\xbb\x1e\x65\x84\x5c\x54\xbb\x6d\x40\xda\x09\
+\xcd\xca\x4a\x1c\x62\xf5\x4c\x08\x75\x78\x5d\x4e\x39\x84\xee\x33\
+\x99\xd9\x44\x40\x3e\x16\x83\x3c\x94\x68\xd9\xc8\x09\xb2\x6c\x1f\
+\x72\x20\x0b\x6d\xc6\x2a\xe2\x30\xc7\x75\x49\xcd\xba\x46\xea\xb5\
+\x77\xa5\x97\x14\x03\xe0\x33\xc6\x07\x12\x2f\x50\x82\xa1\x8d\x83\
+\xe4\x9a\xd2\x9e\x75\x3b\x47\x43\xaf\xc2\xd5\x9f\x7c\xbe\xc1\x16\
+\xb7\xc7\xd2\x1b\xed\x2a\x07\xb6\x30\x49\x7b\xfe\x50\x1c\x2d\x21\
+\xbe\x4a\xb7\x5f\x7a\x22\x0b\xd9\x9a\x96\x9c\x4f\x45\x8a\x1c\xe3\
+\x99\x95\x8d\x36\xaa\x70\xf3\xd3\xba\x2e\xa4\x36\x0b\xb2\xfd\x96\
+\x8f\x1c\xed\xc4\x63\x62\x05\x5b\x5b\x37\x5f\x49\x71\xd7\xe4\xc0\
+\x14\x7b\xf0\x63\x2f\x4a\xbd\xe5\x0a\xbe\x6d\xd2\x43\x11\x8c\x9a\
+\x2d\x8e\x0c\x5a\xd7\xe8\xc9\x12\xc1\xd8\x2d\x7c\xe5\xec\x7f\xe8\
+\x86\xe3\x12\xba\x10\x30\x13\x35\x71\x0b\x06\x8a\x47\xde\xb4\x08\
+\x27\x4b\x28\xe4\xe8\x3d\x6f\x4c\x8b\x03\xa6\x65\x14\x00\x00\xb5\
+\x8e\x77\x13\x38\xd7\xac\x97\x06\x68\x6c\x31\x00\x8a\xe6\x49\x18\
+\x49\xaf\x4f\x0d\x80\x2e\xf1\x1e\x05\xa2\x1e\x08\x4a\xef\x7b\x8a\
+\x45\x14\xf1\x49\x69\x91\x81\x0e\x33\x2b\x36\xab\x2a\x9a\x8e\x71\
+\x85\xfd\xe6\x5d\x62\xa0\x45\x88\xd3\x2c\x5a\x65\xb4\xf3\x13\x19\
+\x5d\x27\x0c\xc4\xaa\xa3\xd4\xfa\xc1\x97\xa3\xf7\x0c\x32\x2d\x5d\
+\x0f\xb9\xd4\xd5\xcb\x8f\x90\x81\xe6\xab\x40\xdd\x17\x02\x05\x21\
+\xf2\xed\x5c\xd0\x12\x3e\xc0\x93\xb2\x88\xdd\x9b\xc6\x73\x87\xb1\
+\xc7\xa7\xb1\xbe\xee\x96\x23\x31\x43\xdd\x72\xef\x05\x8c\xba\x54\
+\x96\xab\x52\xd6\x75\xc2\x86\x60\x33\x9c\xe6\x98\xe7\x29\xfd\x1b\
+\x94\x98\xf0\xda\x5d\xb7\x5c\x61\x15\x8a\x57\x2f\x4b\xd2\xd0\xbd\
+\x7e\x72\x89\x9c\x53\xb3\x8f\x1d\x43\xc9\x51\x85\x52\x31\x2b\x6b\
+\xb7\x79\x89\x99\x6a\x17\xd4\xdc\x00\x80\x00\xd3\x4f\xd2\xbd\x54\
+\xf9\x83\x13\x8a\x96\x4c\xa4\xa1\x6f\x93\xb4\x09\x26\xec\x85\x7b\
+\x43\xf1\x1f\xa2\x48\x68\x0b\x37\xf3\x0b\x88\x3f\x30\xe9\x58\xcd\
+\xd5\x1d\x92\x02\x5a\x33\x32\x0b\x9c\xd5\xd5\x48\x62\x05\x47\xe2\
+\x55\xe2\x1a\xa5\x0b\x26\xd2\x22\x9e\xb1\xf5\x01\xa4\x12\x97\xa4\
+\x1b\x20\x85\xa8\x1c\x20\x49\x1f\x40\x04\x05\x30\x7a\x67\x62\xa6\
+\x43\xcc\xef\x6d\xe4\x86\x07\x9f\xb0\x37\x01\x21\xf2\xfc\xbe\x0f\
+\x19\x68\xf1\xe1\x9e\x6a\xba\x0c\xce\xf3\x6b\x77\x01\x7f\x0c\xc0\
+\x43\xf9\xfc\x30\x31\xa7\xde\x9d\xa7\x7c\x10\xba\xb7\x24\x40\x8e\
+\x2c\xd2\x80\x1c\x78\x61\xb4\x4e\xef\x02\xf2\x1b\x22\x09\xa5\x02\
+\xc9\x57\x76\x3e\x40\xb1\x99\x3c\xaf\xc6\x43\x9d\xab\x3c\x3e\x97\
+\x6d\xea\xa9\xba\xa0\x77\x72\xf9\xd9\xe1\x16\x9d\xae\x27\x2b\x82\
+\xfb\x3d\x18\x43\xe2\xcd\x0d\xfb\xbc\x3c\xcb\xee\x08\xcf\xa7\xd1\
+\x33\x72\xbd\x45\x05\x2c\xa9\x41\x65\xa3\xbe\xe4\xf7\x5a\x26\xe9\
+\x1c\x65\x7a\x83\x3a\x2c\xcf\x35\x63\xa8\x67\x16\x18\x6e\x82\x81\
+\xf9\xd7\xb5\x4e\x13\xb9\x2a\x9f\x41\xc6\xd8\x83\x2d\x6d\xbd\xba\
+\x8a\x77\x96\xf7\xde\xdd\x57\x71\x04\x01\x95\xbd\xf8\x1f\x96\x59\
+\xae\x9f\xdb\x34\xe9\xe0\x9f\xba\x2c\x29\x8d\x75\x5b\x70\xe4\xa1\
+\xcf\xe2\xf2\x0c\x1c\xfc\xb9\x4d\x1b\x55\x13\x62\x2a\x72\x09\x3b\
+\x76\xe0\xbe\xb5\x31\xe0\x5d\xcb\x5e\x85\x5a\xf0\xce\xdc\xee\x0e\
+\xbd\x26\x58\xa2\x61\x98\x51\x46\x2f\x37\x44\xc5\x27\x63\x42\x5d\
+\x88\xae\x1b\x78\xa1\x2c\xcc\x89\xf2\xcc\x1f\x48\xb3\x05\x15\x7a\
+\x29\x00\x73\xdc\x2c\x64\x74\x7e\x61\xe9\xa8\x75\x92\x11\x40\xf3\
+\xed\xc8\x1a\x69\xa9\xcb\xce\x31\x84\x2f\x09\xb8\x3b\xdf\x7e\x98\
+\x50\x68\x34\x7f\xbf\xd0\x38\x46\x81\x02\x5e\xae\xee\x80\xf2\x76\
+\xe9\x15\xad\x85\x26\x65\x30\x91\xb2\x32\x30\xe6\x7c\xe1\xd3\x25\
+\xc3\xe9\x6a\xbe\x69\xfd\x92\x25\xb1\x04\x28\xe9\x78\x8d\xe3\xd5\
+\x86\x1e\xd5\xb3\xaa\xc4\x24\x23\x03\x89\xdf\x20\xe7\x96\x73\xcf\
+\x90\x4a\x59\x27\xa0\x9a\x95\x63\x13\x06\x2f\x49\x1b\x77\x78\x57\
+\x1b\x22\xf3\xa1\x3f\x4d\xbb\x49\x13\x4c\xc0\xad\xf6\x40\xfb\x3c\
+\x83\xe9\x4d\x6a\x48\x9a\xe4\x7e\x2e\xbd\x20\xf4\x06\x3d\x4e\xfc\
+\x05\xa5\x77\xbc\x8d\x04\x82\x18\x77\x28\xf3\x8d\xbc\x6e\x15\x84\
+\x93\x7f\x0c\xbd\x2c\x15\x50\x75\xf7\x8a\x0f\xab\x75\x4d\x11\xac\
+\xd7\x07\x89\xb7\x0e\xe5\x0c\x16\x84\x5b\xb8\xc8\x9a\x95\xff\xce\
+\x19\xcc\x52\x22\x29\x0f\x0a\x6e\x7f\x72\x48\x2a\x9d\x54\x36\x90\
+\xda\x5b\x21\xdd\x98\x9e\x05\x89\xad\x33\xb8\x62\x05\x88\x74\x3e\
+\x46\x46\x1f\x17\xe6\xf3\xfc\x72\x71\x10\x7c\xb9\x00\x40\x9f\x20\
+\x90\xf0\xf8\x60\xee\xbd\x7a\xf1\xfa\x59\x29\x3f\x02\x6e\x27\x70\
+\xa5\x92\x85\x66\x20\x86\xf7\x90\x54\x09\x41\xf9\x2c\x2e\x15\x0f\
+\x93\xe1\x19\xb4\x6c\x22\x2a\x4e\x45\x41\x83\x48\x37\x40\xe2\x6d\
+\x3f\x70\xef\xf2\xe6\x6b\x2d\x1f\xbe\x6d\x0a\x2a\x8b\xd0\x39\xf4\
+\x6c\x2c\x29\x8f\x61\x21\x7f\x70\x25\x1f\x9f\x31\xf0\x4e\xc3\xdf\
+\x7f\x98\x80\xa0\xc0\x23\x3e\x64\x88\xc3\xc4\xbb\x7d\xe7\x5d\x9d\
+\xec\x6d\x4c\xb9\x43\xe1\xb3\x73\x4f\x87\xf1\x12\x99\x17\xde\xe2\
+\xc9\x9e\x43\xe7\x79\xc8\x5a\xb6\x18\xc2\xea\xdd\x5e\x96\xcc\x90\
+\xcd\x63\x8a\xc1\xf6\x4e\xd2\x27\x98\xdf\x1f\x2c\x71\x6d\xfa\xf1\
+\x79\xf4\xc7\x4f\xbf\x34\xbf\xd0\xa7\x4d\xce\x2c\xa8\x8c\xaf\x91\
+\x4d\x66\x68\x90\xc8\x48\x98\x2c\xa5\xae\x1f\x8e\x60\xda\x7c\xa1\
+\x24\x19\x75\x58\x8f\xff\xfe\x21\x75\x44\xaf\x05\xe4\xd5\x2a\x59\
+\x91\xf5\xc8\x1d\xbf\x00\xf8\x40\xeb\x19\xe0\x24\x02\x96\xbd\x26\
+\xc0\x15\x49\xce\x2f\x4f\x8c\x36\xc9\xd4\x65\xc1\x4f\x22\x31\x58\
+\x3c\x6d\x41\xd6\x94\x0f\xaf\xbd\x2e\xc9\xbc\x60\x63\xad\x59\xd4\
+\x47\x97\x7f\x28\x53\x33\x76\x1e\x1d\xb0\x4f\x6b\x80\x5c\x54\x1b\
+\xbd\x10\x68\x56\x28\x79\xa5\xfa\xe9\x1e\xf6\x50\x79\x22\x43\xb1\
+\x9c\xf7\xea\xc7\x5a\x95\x4e\x3a\xcc\xe7\xab\xcb\xae\xfe\x67\xce\
+\x0a\xca\xbe\x24\xd1\xdd\x40\x42\x9c\xe8\x31\x88\xf0\xd3\xe1\x0f\
+\x3f\xac\xa6\x64\x15\x5f\xd3\xac\xea\x37\x4a\x42\xd9\xfc\xac\x1a\
+\x7f\x26\x81\xb0\xaf\x37\x61\x16\x1d\xff\x12\x46\xbc\x93\x05\xcf\
+\x26\x16\xbe\x03\x08\x20\x94\x4d\x17\xd4\xb3\xe0\xbd\x35\xbf\x2d\
+\x79\xe5\xf2\xbd\x32\x94\x34\xa3\x7e\x02\x7a\x9d\x9e\xc7\xce\x7d\
+\x37\x15\xa8\x04\x20\x8d\xe8\xc5\x44\xa9\x75\xe8\xa4\x9c\x9a\xa8\
+\x5f\x16\x0a\x16\xb5\x43\x25\xcb\x4a\xae\xdd\x26\x5a\xba\x81\x65\
+\x18\xf7\x4c\x29\x0d\x29\x45\xce\xbd\xe1\xd9\xf2\x59\x7b\xf7\x5e\
+\x93\xea\x05\x7e\xee\x31\xb1\xe8\x60\x70\x10\xae\xe2\x5d\x6e\x2a\
+\x3f\x39\x9f\xc5\xb4\x3b\xcf\xf8\x20\x48\xbc\x09\x55\x25\xf5\x9e\
+\xda\x44\xad\x65\x8e\x34\x56\x57\xdc\xe0\xc0\xe8\x0a\xcf\x06\x59\
+\x61\x14\x82\x98\x51\xdf\x23\x2b\xd2\xde\x7a\x70\xef\x95\x5d\x92\
+\x84\x6c\x43\x4d\x5e\xa5\x8d\xa6\x2a\xc7\xf1\xdc\x5b\x0d\x5f\x30\
+\xd5\x86\x04\x27\x04\x60\x56\xcd\xf1\x7b\xc5\x6b\xc7\xea\xf2\xf8\
+\x96\x02\xcc\xe7\x9c\x51\xaf\xba\x45\xe3\x50\x8b\xd3\x3d\x9f\x6b\
+\x84\xd2\xd4\x0f\x3f\x54\xbe\xd2\x70\x9f\x8d\x6a\x1b\xeb\xc0\xc0\
+\x52\xc5\x39\x06\xdc\xc3\x56\x39\x92\xf6\x61\xe2\x48\xb3\x98\xb8\
+\x08\xd7\x26\x17\xbf\x0e\xb4\x24\x7d\x75\x9e\x9f\xea\x09\x85\xf8\
+\x7c\x77\x4e\x8a\xda\x16\x66\x64\xb1\xd4\xa1\x6e\x99\x1d\xe3\xd8\
+\xeb\xc9\xcf\x2e\x37\xe4\x0b\xdc\x86\x0c\xc2\x7a\xc5\xfd\xb2\xc9\
+\x40\xfb\xde\xbd\x45\xf3\x98\xd6\x98\xa0\x1c\xc5\x43\xdd\x9a\x64\
+\x97\x79\xa1\x9b\x01\x32\xe6\x95\xaf\xe6\x58\xa7\xa9\x04\x18\x74\
+\x5d\x6f\x1c\x92\xf3\x69\xe6\x48\x62\xa7\xc8\xe8\xa8\x8e\x66\xe3\
+\x3e\x98\x66\x11\xbe\xa6\x3a\xcd\xc0\x00\xbd\x01\x5f\xb5\x7a\xf2\
+\xc5\x09\xfa\x37\xef\x07\x3b\x6b\x41\x73\xdf\x27\x02\x1f\x54\x04\
+\x46\x44\x34\xad\x58\x25\xaf\xdf\xe2\xea\x89\x01\xf9\x29\xb2\xae\
+\xde\x90\x49\x76\xa0\x90\x50\xaa\xb1\x9d\x21\xf1\xff\x12\xab\xa4\
+\xc0\x32\x44\x32\x65\x5b\x3a\xa4\x36\xcf\xa3\x9b\x84\x6e\x20\x65\
+\xcd\x96\x4d\xbd\xc0\x76\xe1\x0c\x3d\x8e\x2e\x4b\x22\xb9\xe7\xeb\
+\x80\x90\x49\x97\x60\xaa\x5e\x7c\xd4\xd6\x7c\x82\x81\xe8\xba\x98\
+\xb0\x61\xd0\x07\xd4\xea\x44\x77\x7e\xcc\x4d\x70\xe5\xeb\x46\x2c\
+\xee\xfa\xb7\x2a\xae\xc8\xb2\xde\x8d\xd8\x03\x17\xe3\x5f\x2b\x56\
+\x95\x60\x00\xf5\x7b\x2f\x48\xf3\x6f\x22\x76\x30\x45\xda\x0e\xce\
+\x2f\xbe\x38\x09\xc8\xb4\xd4\xf0\x75\x69\x72\x4b\x1e\xbf\xc3\x41\
+\x37\x05\xb5\x32\x2d\x0c\xcf\x81\x56\x14\xab\xd4\x89\xe2\xd6\xb2\
+\x53\xc2\x36\x8c\x13\x6e\x9c\x3e\x55\xab\x68\x7d\xae\x56\xfd\x80\
+\x6a\xa3\x82\xca\xb9\x62\xaf\x78\x94\x77\x8b\x13\x10\x96\xb2\x46\
+\x06\x80\x3b\x94\x99\xc4\xa3\x28\x03\x5e\x0f\x23\x8d\xa3\x7a\x5c\
+\x81\xb9\x39\xd5\x8a\x48\xf4\x7c\x79\xc0\x20\x58\xdd\x47\x0e\xed\
+\xe0\x86\xc2\x2c\xed\x2d\x74\xc5\x74\xbf\x05\x41\x4c\x9f\x39\x9c\
+\xdb\x1c\x89\xbe\x1e\x09\xd5\x06\x00\xbb\x90\x44\x7f\xfc\x17\xc3\
+\xf5\x41\x86\xbb\x7d\x20\xfd\xab\x90\x27\x8f\xd0\xed\xd4\xef\xe3\
+\xb5\x56\xce\x8c\xad\xb2\x3f\x9a\x96\xf7\x65\x15\x46\x8d\x77\xca\
+\x56\x32\x43\xc6\x0e\xc5\xb2\x54\xc6\x93\x2c\x78\xff\x94\x94\x6b\
+\x82\x61\x0a\x5c\xd2\xfb\x25\x4c\x44\x05\x1c\x5e\x3a\x46\x45\xcd\
+\xaf\xba\x19\x42\x0f\xf6\x36\x40\xef\x66\xb9\x1e\x52\x6a\x1d\x46\
+\x21\x1d\x4a\x77\xbe\xac\x3c\xf5\xaa\x73\x8c\xd2\xd2\xd0\x62\xc9\
+\xe5\x91\xa7\x3a\xf0\x8d\x6d\x71\xf4\x45\xac\x2f\x9e\x1a\xf9\x65\
+\xf9\xa2\x16\x7c\x14\x79\x85\x60\xc9\x3b\x5c\xc8\x44\x67\xa8\x71\
+\x74\x13\x03\x22\x59\x57\x86\x16\x45\x54\x0b\x68\x77\xf3\x17\x5c\
+\x04\x36\x43\x22\xd2\x62\x5d\x74\x4d\x1a\x27\x8a\xb4\xbc\xb9\x5d\
+\x87\x18\xc9\x1e\xf1\xa3\x43\x82\x28\x41\x8c\x91\x81\xc0\x3b\x02\
+\xfc\x9b\x2b\x7b\xeb\xb8\xb9\x9b\x52\x6c\x00\xab\x56\xf0\x15\xb4\
+\x81\xf4\x83\xdc\x1c\xf1\x5a\xbe\x11\xb4\x39\xa3\xde\x09\xad\x82\
+\x86\x78\x15\x18\x76\x08\x5d\x6a\x49\xf1\x7b\x12\xd6\x07\x8d\xc8\
+\x2f\xcd\x96\x1c\x5d\x96\xb8\x4a\x62\x7b\x48\x70\xd9\x00\xbb\x1b\
+\x36\x16\x69\x22\xd5\x7a\xe8\x0a\xc6\xb2\x58\x17\xe2\x27\x08\x15\
+\x32\x78\xde\x56\xe1\x12\x12\xe3\x48\xb4\x8c\xe9\x89\x96\xe8\x67\
+\x21\x55\xc6\xa2\x69\xa0\xc6\xaa\x8c\x8e\x93\x27\xf7\xfb\x1f\x30\
+\xa4\x56\x15\xf0\x51\x62\x00\x1c\xde\x1d\x06\xb2\xa6\x80\x89\x70\
+\x6f\x51\x13\x54\x6c\x6b\x87\x1a\x2c\x11\xe4\x00\x5a\x95\xd1\xd9\
+\xbd\x20\x95\x11\xea\x96\x51\xda\x16\x3c\x27\x13\x4f\x0c\xea\x60\
+\xed\x71\x55\xd5\x0e\xa5\x42\x19\x9b\x53\x1d\xcf\x04\x96\x73\x1a\
+\xb6\xf1\xc3\x4d\x85\x6e\x56\x29\x72\x89\xb9\x66\xdb\x53\x10\x3e\
+\xce\x5b\x30\x9a\xa4\xc3\x55\xb3\xe7\x96\x88\xa0\x3a\x30\x90\xdd\
+\xe5\xf7\x7f\x71\xef\xba\xa2\x73\x58\x8b\x7e\xa2\x96\x9d\xb0\xce\
+\x30\xe7\x5b\xb7\x8c\x07\x00\x6f\xaf\x60\x6b\x72\xca\x13\xd8\xe2\
+\x25\x1f\xff\x0f\x8b\x1f\x54\xdd\xad\xd2\x9b\x2f\xb5\xa9\xd7\xc8\
+\x96\x6a\xd9\xcf\xe4\xbc\x68\xb0\xd2\xb2\xc6\x4b\x1b\x07\x08\x0a\
+\x6e\x1e\xd4\x31\xe8\x6e\xf1\xa5\x9a\x3f\x99\x5e\xed\xea\x9b\xb4\
+\x85\xf9\x38\xb7\x26\xb3\xef\x6e\xbf\x73\xb4\x29\x4a\x86\xe0\x13\
+\xe3\x64\x10\xd3\x25\x18\x11\xe6\x70\x4d\x45\x71\xef\xf7\xa4\xf4\
+\x1a\x2e\x95\x14\x6d\xab\xbb\x19\x40\x6d\x9b\x45\x22\x3c\x95\xae\
+\xbe\xfa\x82\xd1\x2b\xec\x8e\x4e\xd7\xa2\x79\xf6\x35\x90\x58\x82\
+\x11\xb4\xa0\x83\x0b\xde\xff\xbc\xec\xec\x40\x66\x6e\xe6\x8c\x59\
+\x19\xb4\xf0\xf1\x55\xc6\x83\x69\x22\x4c\x24\x99\xa7\xd5\x77\x18\
+\x7a\x74\xcd\xda\xe7\x8c\x9f\x70\xb3\x69\xc4\x0d\xed\xd3\x6c\x9f\
+\xe5\x8d\xbc\x85\x11\xef\x73\x7b\xfb\xb3\xe9\x4d\x77\xbf\xce\x7b\
+\xe3\x14\xdd\x4f\x63\xe5\x6a\x39\xdf\x1a\x54\x77\xc4\x1f\x21\x6d\
+\x70\x0f\x3d\xa0\xa9\x58\x2f\x76\x40\xcd\x51\x31\x47\x03\x94\x93\
+\x50\xfc\x3d\x08\x12\xd2\xd2\x08\x7a\xf5\xcd\x4d\x40\x7c\x9e\xaf\
+\x88\xea\xc7\xbb\x27\x31\x01\xc3\x5d\x5a\x3e\xc6\x8c\x73\x65\xd4\
+\x09\x0e\x7a\xbe\xdc\x52\x77\xaa\xcf\x27\x08\xa7\x07\x90\x09\xbf\
+\x08\x67\x9f\xb6\xa8\xdf\xaf\x2a\x06\xeb\x16\x97\x99\x89\x40\xae\
+\xde\x0e\xac\xa6\xf2\xaf\x5a\xc6\x53\x1c\xd4\x45\x91\x26\x97\xa8\
+\x25\xad\xbf\x45\x55\x6b\xa9\x74\xb5\x3b\x70\x69\xa0\x7b\x3f\x5b\
+\x47\x99\x81\xc7\x25\x55\x9f\x31\xf9\x7a\x30\x71\xb6\x88\x21\x23\
+\x40\xff\x44\x77\xc1\x7e\xdf\x23\x1b\x56\x56\xea\xaa\xe3\x71\xb6\
+\x04\x8f\xfc\x4b\x5f\x78\x61\x52\x62\x14\x64\x94\x5b\x7a\x0a\xd3\
+\x1f\x68\xe4\xd7\x7d\x52\x60\x6c\x1c\x15\x9d\xe4\x3c\x7e\xe4\x52\
+\x3a\xfe\x2a\xaa\xec\x5d\xb9\xaa\x81\x4c\x8f\x51\xba\x25\xb2\x6f\
+\xcc\x42\xef\xcd\x7c\xc3\xd7\x8d\x67\x49\x41\x79\x79\x67\x93\xaa\
+\xb6\xb9\xba\x19\xb4\xa4\x96\x71\x9c\xf7\xf7\x77\x3d\xc5\x94\x86\
+\x3b\x28\x84\x99\x35\x34\xfb\xd3\xeb\xba\xd4\xd3\x48\x15\xa5\xa1\
+\x1b\xde\x18\x5b\x33\xea\x77\x5f\x3c\x79\xe1\x13\x1b\x37\x37\x4b\
+\x94\x29\xda\x29\x90\xfd\x12\x7b\xb3\x01\xa0\xe6\x99\x90\x0e\x76\
+\x13\x79\x76\x0f\xf4\x46\x70\x66\xcb\xf0\xd6\xa5\x37\xa5\x5a\xc4\
+\x84\x9f\x97\x96\x6d\x6f\x6e\x44\x63\xa0\x40\xfc\x82\x29\xfc\x2f\
+\x36\x7b\x80\x41\x40\x5d\x41\x33\x97\x70\x0f\x7b\x30\x9d\xa5\x83\
+\xbe\x45\x6c\x46\xb2\x96\x91\xa1\x45\xd5\xf5\x2d\x31\x6e\x78\xe0\
+\x75\x06\x90\x62\x89\xeb\xf6\x51\x3f\xe4\x9a\x23\x7d\x39\x4c\xe3\
+\x33\x9c\x58\x37\xad\xf8\x58\x4d\x46\x88\x50\x4d\x5a\x81\x3a\xb1\
+\x82\x9a\x3e\xa6\xab\xab\xd0\x94\xac\x14\x8d\xc5\xd5\xa0\xda\x94\
+\x12\x4d\xd4\x29\x62\x01\xad\x9d\x60\xf3\x0a\x47\xaa\x18\x56\x96\
+\xf1\x33\xfb\xcc\x8b\x70\xcb\xb5\x77\xcf\xe2\x65\x5a\xb2\x56\x34\
+\x39\x47\x04\xf9\x3a\xcc\x25\xbe\x9d\xea\x16\x30\x35\xe6\x32\x23\
+\x70\xc3\x7f\x24\x55\x3f\xc8\xdc\x02\xfc\xf1\x89\x58\x57\x56\x04\
+\xad\xaf\x67\xa5\x75\xed\x9c\x89\x27\x4f\x3c\x8b\x68\x2c\x4e\x39\
+\x46\x4a\xdc\x25\xa7\xf8\xf6\xdb\x06\x2e\xc4\xce\x19\x91\x1e\xf1\
+\xc9\xbe\x57\x26\x7a\x0d\x39\xf0\xe2\xfb\x9e\x62\xbb\x75\xe3\x39\
+\xd6\x50\x6a\x5d\x27\x59\xee\xf4\xb6\x50\xfd\x52\xe5\x8b\x5c\x09\
+\x0d\x7f\x7e\x18\x54\x2c\xd5\x20\x7b\x5f\x07\x6c\xae\x9a\x84\x22\
+\xfd\x04\x32\xef\x35\xd8\x8d\xac\x2f\x1b\xc3\xb2\x14\x50\xc5\x46\
+\xc1\xd6\xcc\xaa\x96\x83\xf4\x02\xb9\x1c\xab\x97\x3f\xd7\x36\xc8\
+\x55\xbd\x1d\xe7\xed\xdd\x6a\x5f\xf8\x18\xe1\x29\x64\xf7\x2f\x5e\
+\xdc\x47\xd2\x0d\xd9\x31\x4f\xa6\x89\xed\xc9\x4c\x2b\x29\xdc\x77\
+\x01\x68\x3a\x78\x16\xf2\x02\x23\x85\xa6\x9f\x0e\xb1\x32\x6c\xf8\
+\x38\xb1\x68\x13\x32\x5c\x1b\x36\x68\x2a\xbe\xe0\x12\x35\xae\xbc\
+\xee\x69\xb2\x77\xe7\x5e\xe5\x6d\x8d\xb3\xf3\x93\xf3\x5e\x76\xf2\
+\x9a\x52\xac\x19\xa8\xb1\x6a\xd7\x77\x6a\xae\x99\x71\x95\xee\xc3\
+\xc3\xf9\x58\xd5\x79\x1f\x96\x64\x5b\xc2\x1d\x19\xd4\x07\x04\x40\
+\x60\x26\xa1\x9a\x68\x60\xe7\x2d\xa4\xd8\x2a\xaf\x3b\x98\x5c\xef\
+\x1f\xa2\x00\x18\xd5\xdc\x91\x1d\x67\xdc\xc3\xfa\x88\x78\xe8\xa9\
+\xa6\x63\x68\x00\xdc\x5c\xa5\xec\x87\x50\xa5\x3a\x28\xfa\x6a\x05\
+\xd7\x3c\x05\x0b\x46\xb9\xd5\x85\xb8\xb8\xb0\xb1\x68\xad\xae\x3d\
+\x12\x43\xd1\x44\x7d\x28\x13\x89\xdd\xaa\x17\xd4\xd5\x0d\xb0\x7c\
+\xdb\xa1\xff\xde\xb9\x13\xc3\xd5\x1b\x7a\xfd\xc6\x0d\xfb\x18\x64\
+\xdd\x37\x8a\x14\xfd\xad\x34\x3b\x22\xf3\xac\xdb\x28\x80\x2e\x74\
+\x7e\xa9\xff\x2e\xcb\xed\x61\xfd\x47\x68\x37\xe9\x99\x1b\x7d\xd3\
+\xfd\x94\x27\xea\xda\x1c\xde\xbd\x7e\xcb\xcc\x84\xcd\xca\x35\x84\
+\xab\x9b\xe1\x28\x91\x75\xbd\x2d\xef\x75\x92\x4b\x00\x87\x0c\xf6\
+\x1d\x9c\x1e\x24\xcd\x6e\x8c\xf4\xa1\x84\x2c\xe7\x7b\xbb\x54\x1d\
+\x53\x99\xab\x37\xf6\x52\x71\xd6\xfd\xa7\x81\x3b\x0b\x2f\x6a\x0f\
+\xdb\x17\x43\x83\xce\xcb\xc9\x6e\x0e\x5d\x2b\xa2\xbe\x69\x12\xaf\
+\xa6\xa3\x44\x73\xf7\xd2\x38\xa6\xcb\xbb\xf7\x21\x58\x23\x15\x97\
+\x13\xbd\xe5\xed\xf4\x1a\xc6\x5e\x9e\x09\x25\x89\x59\x66\x7c\x96\
+\xad\xd2\x2f\xea\x90\x57\xa9\x9f\x66\x53\x90\x19\xa0\x9e\xa4\x3d\
+\xcd\x4e\x00\x95\x9d\x8e\x1e\x00\x7b\x18\xd4\xd7\x87\xec\x31\x54\
+\x82\xd9\x76\xcc\xa7\x1a\xb4\x51\x1c\xf8\xcf\xdb\x31\xe6\x9c\x59\
+\xe6\x9b\xaf\xe3\x65\x2a\x3b\xe7\x68\xd3\xe2\x81\x2c\x9a\x66\x72\
+\x21\xb0\xfc\xf2\x1c\x56\xb1\x80\x53\xd4\x6b\x97\x4e\x02\x82\x3b\
+\x3e\x3b\xa4\x1d\x13\x01\x09\x95\x0b\xbd\x25\x28\x86\xd9\xfc\x90\
+\x31\x3d\x68\xb0\xea\x46\xd9\x61\xf4\x9a\xc2\x93\x07\x2d\x16\x6f\
+\xbe\x94\x28\x8b\x08\x11\xe4\x30\xf6\xbd\x41\x09\xd3\x84\xf6\xb3\
+\xc9\xde\xec\x70\xa3\x0f\xc8\x23\xaf\x22\x97\xd9\x09\x49\x9b\xdd\
+\xba\x8f\x3f\x70\x4b\x45\x87\xa6\xcb\xb3\x92\x92\xb7\x38\x93\x01\
+\x75\xb5\x12\xd3\x3d\xf1\x76\x4e\xa8\x3c\x8b\xe3\x16\x8d\x7e\x73\
+\x44\xe8\x48\x6f\x86\xab\xa7\xf7\xa3\x4f\xfa\xa5\x43\x18\xa2\x45\
+\x92\xaa\x8b\xbd\x44\x0c\xa0\x9a\xdb\x5c\xc0\x18\x14\x3f\x4c\x69\
+\x0c\x8f\x82\x72\x73\xa8\x8d\x92\x0d\xc4\x5b\xf9\xb9\x62\xb6\x2f\
+\xb2\x3f\x57\x26\xb6\x95\xe3\xd5\x5a\x87\x8a\xab\xfd\xc2\x1b\x65\
+\x7a\xe6\xa7\x5c\x8b\x2f\x07\x0f\xd9\xd0\xb5\x40\x5b\xfe\xfc\x95\
+\x4a\x63\x86\x37\xa4\xa8\xeb\xe3\xb3\xb5\x3d\x50\xb3\x69\x2b\x51\
+\x2b\x33\xab\x72\x15\x35\x58\x90\xd7\xa6\x53\xcb\x0f\xdd\x1e\x22\
+\x03\x90\xa5\xae\x56\x65\xda\x03\x95\xfe\xa9\x6b\x9c\x96\xed\xa1\
+\x9e\x09\xca\xce\x1a\xc2\x51\x2c\x3d\x14\xe0\x67\xe8\x54\x4a\xce\
+\xe7\x65\x2a\xc8\xc2\xae\x6c\x5c\xdb\x04\x49\x60\xb5\xea\x92\x03\
+\x7e\xb8\x96\xdb\x3a\x1b\x0e\xf9\xe8\xc5\x2c\x25\x7c\xeb\x2a\xfc\
+\x66\x2a\xcb\xa2\x36\x5a\x56\x28\x40\x81\x9e\x55\x49\x8e\x33\xba\
+\x5a\xf9\xe5\x6e\x26\xcf\xf3\xea\x06\x0b\x72\x56\x47\x0a\x39\x59\
+\x7b\x32\xe0\xfa\x05\x77\xea\xe1\xfa\x2a\x50\x0f\x40\x5a\xe9\xdc\
+\x0e\x1a\x5d\x38\x1b\x3b\x4a\x66\x85\xac\xa5\x68\xc6\x70\x1b\x0b\
+\x82\xb8\x45\x03\xb1\xe8\xb8\xd8\x7d\x96\x02\x83\x0d\x6c\x8c\xa7\
+\x66\xfc\xa6\x92\x1c\xec\x2e\x90\x2d\x60\xbf\x40\x91\x15\x81\x1a\
+\x56\xa4\xce\xa2\x60\x80\xbd\xf9\x7e\xe3\xdd\xf4\x7b\x9c\xca\xf5\
+\x2c\x93\x42\x79\x7c\x1d\x71\x07\x1b\xf9\x5e\x39\xc7\x70\xcf\x9b\
+\x38\xfd\x67\xcd\x19\x75\x43\x3f\xee\x72\xea\x48\x0e\x08\x90\xb2\
+\xeb\x07\x02\xf8\xdd\xba\xa3\x54\xcc\x18\x64\xb2\xaf\x8c\x1e\x72\
+\x93\x66\x11\xc3\x9d\x59\xac\xf4\x8d\x29\xf3\x3c\x7b\x89\x7e\x60\
+\x1e\x67\x07\x24\x51\xf9\x66\x42\x65\x82\xf9\xac\x59\xea\xb3\xb8\
+\x52\xd3\xcf\xac\x51\xe5\x49\x8f\xbb\x98\x48\x8a\xf7\xe5\x90\x39\
+\xaf\x65\x87\xf7\xe8\x8c\xd1\xd1\x97\x2e\x79\x36\x50\xed\x78\xf3\
+\xfa\xa6\xab\xd0\x4c\xdb\x59\x56\x7e\x84\x5d\x41\x2b\x9e\xcd\xa2\
+\x4e\x57\x7c\xc3\x35\x91\xfb\xfe\xda\xc8\x95\x66\xf0\xdb\xbc\xfe\
+\x7c\x76\x34\xbb\xae\xd7\x4f\x43\xf5\xf6\xf1\xb3\x0f\x2e\xbe\x12\
+\x53\x88\xbd\xf2\xc2\xfd\xd6\xd1\x67\xec\x1d\x31\xfe\xfb\xa5\x4a\
+\x1d\x93\xcd\x17\x47\x70\x6f\xb8\x91\xc9\x0c\xde\x29\xd0\x2a\x19\
+\x99\xd9\x6f\x76\xbc\x8e\x73\xcd\xe2\x96\xac\x5c\x1c\x52\xfc\x26\
+\x81\x68\x51\xf0\xea\xd4\x10\x94\xd5\x85\xe5\xee\xf5\x0e\xbd\x84\
+\x91\xe6\x05\x8e\x19\x97\xb5\x87\x8a\x65\x80\x6c\x90\x1b\xca\x1d\
+\xcb\x87\xf2\x07\x36\x1c\x7a\x75\x32\xcb\x8b\x8f\x6e\x5d\xdb\x2b\
+\x6d\x46\x0d\xc7\x84\x20\x6e\xfe\xe0\x97\x27\xec\x9f\x13\xcd\x06\
+\xab\xbd\x57\xb7\xe5\x0a\xd7\xbb\x4c\x3b\xf3\x0e\xf6\x89\x0a\x34\
+\x25\x14\x7f\xd4\x2e\x77\xcb\xe0\xd9\x26\xd3\xe6\xcc\x2a\xc3\x32\
+\xea\x53\x88\x1a\x70\xc7\x9c\x33\x4b\x6e\x14\x7f\x35\x1c\xd1\x30\
+\xdc\xec\x7c\x85\xd4\xc5\xa5\xc2\x11\x4c\x28\xc6\x2b\x3c\x77\xd0\
+\xc1\xa7\x73\xd5\x1f\xcc\xaa\xd4\x00\x34\xe5\xcb\xf0\xa5\x5b\xad\
+\x4c\x67\x89\x56\x7e\x87\xdc\x1d\x69\x33\xa2\xeb\x4a\x8e\xae\x4a\
+\xb4\x76\xc9\xf3\x55\xbf\x14\x51\x74\x0d\x23\xd1\xd8\x70\x8e\xa2\
+\x54\xf3\x3b\x87\x4c\x0b\x5f\xcc\xaa\xfc\x40\xc6\xcf\x0d\xad\xc8\
+\x8a\xd7\x31\x74\x4d\x80\xad\xc6\x61\x53\xb1\xe8\xe7\x3a\x11\x05\
+\x16\xe8\x9a\xd1\x59\xac\x82\xd3\x49\x17\x9b\xbf\xe8\x00\xa6\xf3\
+\x68\x9f\x1d\x12\x4a\x89\xf9\x79\xaf\x81\xe3\x62\x9b\xcd\x2a\x90\
+\x5e\x33\xf9\x5d\x7e\x22\xb7\x48\x8e\xaf\xf5\x66\x3f\xf5\x0c\x15\
+\x74\xab\x01\x5d\xcc\x01\x89\x13\xb7\xd1\x89\x01\x43\x76\x33\x4d\
+\x37\x28\x29\xa2\x28\x45\x55\x96\xfb\xce\xc3\x8e\x7b\x43\xfe\xc8\
+\x2f\x9c\xb7\x60\xdb\x06\x6e\x22\x47\x4b\xea\x61\x0b\xf7\x07\x99\
+\x32\x4c\xac\xf9\xd2\x39\x9e\x37\xaf\xf6\x46\xc7\x90\xd9\xdd\x1a\
+\xe7\x3d\x17\xca\x06\x14\x1d\x45\x73\x4f\x3d\xde\x30\x25\xea\x99\
+\xdd\x64\xa1\x17\xbd\x8d\x0e\xf1\xe5\xbd\xa2\xcd\x66\xc8\xc3\xde\
+\xbb\x82\x5f\xd1\x0b\x7b\xdd\xf9\xe5\x45\x8b\xbd\x7e\x8a\xb3\xae\
+\x9d\x5c\x0b\xc7\x07\xf2\xfe\xc8\xab\xcf\x9e\x36\x59\x73\x82\x3b\
+\x92\x33\x02\xa9\x36\x66\x21\xc3\x30\x85\x46\x12\x9b\xed\x7c\xd7\
+\x80\xae\x30\x96\x55\xfb\x8b\xd0\xf1\xa4\x77\x06\x57\xca\x55\xe5\
+\x4b\xfc\xd2\x65\xc6\x67\xc2\xb8\xc0\x45\x87\xd1\x1d\x59\x97\xb2\
+\x9a\xec\xac\xab\xac\x2f\xdd\x6e\xbb\x1f\x87\xf4\x9a\x3f\x78\x68\
+\xf5\x76\xde\x87\xe8\x69\x16\xeb\x2d\x1e\x99\x59\x20\x7b\x09\x03\
+\xd6\xf5\xac\x6c\xb4\x79\x4e\x96\x48\x2d\xaf\x01\xd0\x5a\xa8\x90\
+\xf3\x94\x32\x73\xfd\x04\x93\x37\xb7\x7f\x6e\x6f\x23\x15\x2e\xe7\
+\xe4\xb4\xf3\x4e\x7d\x54\x78\xbf\x23\x56\x8e\xc7\xb6\xad\x55\x9c\
+\x50\x5f\x29\xd5\x37\xa5\xb9\xfe\x73\xae\xf5\x96\x14\x91\x2c\x06\
+\x12\x71\xda\xf8\xdb\x02\x07\xec\x8e\xe4\x23\x1a\xc3\xde\x9a\x2d\
+\x3a\xd0\xdc\x40\x8c\x6b\x62\xdf\x72\x31\xd6\xbd\x91\x28\x8d\x90\
+\xe8\x2f\x62\xb0\x6b\x6b\x53\x72\x86\xc3\x77\x33\x91\x27\xad\xb8\
+\xf6\x86\x06\x70\x0e\xe6\x08\x5c\x4d\xc1\x8f\xe5\x6e\x1a\xbe\xa8\
+\x68\x01\x58\xae\x0c\xe0\xb5\x93\x6c\xbc\x85\x59\xe4\x52\x88\xc5\
+\xb5\xdc\x2a\x2f\x7d\x53\x3a\x74\xa0\x2b\x1a\x6b\x66\xf2\xbe\xcb\
+\x2f\xb3\x94\x20\x39\xf2\xd6\xb3\x68\x2e\x20\x9e\xef\xa9\x9e\xab\
+\x35\x2e\x00\xdb\xcc\xde\x1e\x73\xeb\xe6\x10\x0b\x7f\x80\xda\x78\
+\x45\xd2\xe3\xc9\x6b\x2c\x1f\x32\xd7\xf6\xb4\xfe\xbb\xe8\x95\x18\
+\x56\x16\x7e\x4d\x5b\x06\x2d\x26\xa9\x8f\x2b\xf3\x38\x45\x06\xc2\
+\x68\xaa\x98\xa6\xe4\x7c\x8d\xdb\xad\x53\x35\xf7\xfd\x39\xdd\x85\
+\x68\x56\x99\xb7\x6d\x5c\x71\x77\xb2\xc4\x83\x53\xac\xc0\x68\x64\
+\x18\x51\xe4\x23\x6e\xd2\x9e\x3e\x58\x43\x66\xa9\xcd\x6a\xea\x4b\
+\xdd\x84\x75\x76\x51\x5a\x81\xa8\x78\x6c\x2c\x66\xcb\x6c\x59\x74\
+\x81\xd8\x2e\xc0\x2d\xc2\xcb\x07\xfa\x9f\x4d\x78\x8b\xec\x7b\x5f\
+\xa7\xf8\xa4\x3e\xda\x22\xdc\xb3\xcd\xda\x6b\x39\x0b\x89\xa1\xa1\
+\x4b\xdf\xe4\xbe\xb7\x8a\x3f\x77\x11\x35\xfd\x5e\x9c\x07\x15\x73\
+\x95\x8e\x4c\xa1\xc9\x03\x5b\x2b\xd1\xc9\x41\xca\x3e\x73\x86\x91\
+\x83\xa7\x46\x99\xe5\x17\xa4\x75\x28\x3f\x08\xaf\x0b\xe2\x39\x6e\
+\xdc\x01\x80\xca\xd5\x90\xd6\xc0\x28\xcb\x12\xd5\xc3\xb3\x54\xd0\
+\x00\x71\x47\x5b\x5b\x28\xcd\x27\xde\xfc\xfc\x45\x74\x37\x1c\xf2\
+\xe6\x87\xa9\x6f\x86\x39\x74\x9f\x7b\x7f\xa2\x41\x45\x6f\x68\x28\
+\x55\x84\xa9\xc2\x57\x02\x19\x97\x72\x27\xcf\xc4\x16\xe2\xd2\x98\
+\x63\xbf\x3e\xd9\x4a\x5b\xaa\xf4\xcb\x98\xce\x47\xe7\x20\xe2\xf6\
+\xbd\xc9\x2d\x95\xed\x47\x0b\x6d\x1c\xd5\xd8\x83\xd9\xfc\x94\x48\
+\x00\x74\x22\x24\x56\x30\xed\xda\xd1\x8b\x7e\xde\xfa\x2b\x39\x32\
+\x49\xc6\x4a\x05\xa6\x2c\x38\x48\x76\x8f\xcc\xec\x33\xec\xf0\xc7\
+\x4a\x44\x5c\x9b\xdb\x8c\xdf\xab\xa4\x54\xb8\xba\xee\x28\xdf\x5a\
+\x26\x3c\xaf\x5e\x68\x75\x09\x12\x59\xb6\x10\x02\x3a\x70\x40\x59\
+\x6d\xa9\x98\xbf\x39\x90\x2d\x3b\xf7\xfe\xcd\x87\xe7\xbe\xac\xa8\
+\x42\xcc\x95\x28\x93\xa9\x8a\x62\x6f\x1e\x8d\x2e\xb8\x76\x82\x3e\
+\x3b\x0f\xf9\x38\x9c\xa9\xe5\x82\xb7\x29\x57\x95\xa9\x28\x5b\xcb\
+\x48\xb8\x07\x3b\xdb\xe6\x91\xc9\x37\x86\x84\x47\x8f\x62\x6b\x54\
+\xb7\xe8\xb9\x72\x18\xdc\xc1\x1f\x7f\x93\x42\xa8\x26\xf6\x75\xb2\
+\x31\x7a\x70\x65\x22\x4a\x96\x93\x62\xa8\xd1\x6d\x3d\x40\x8a\xfc\
+\x02\x6c\x80\xd1\x32\x7d\x34\xc9\x6c\x44\x0b\xc9\x73\x45\x7c\xaa\
+\xc9\xf9\xc8\xf9\xc3\x13\xad\xf5\x91\x23\xb6\x17\xce\xeb\xeb\x7b\
+\x77\x95\x6c\x10\x57\x82\x90\xc7\xb0\x9e\xab\x7b\x35\xe8\xef\xe3\
+\xaf\x7a\xf8\xb8\x19\x09\xce\x35\x09\xbc\xa4\x27\x92\xc3\xb9\x08\
+\x06\x74\xaf\x40\xf4\xc1\xd4\x64\x9d\xca\xa0\xc9\x01\xb5\xbc\x08\
+\x28\x0d\xea\xea\xd2\xde\x97\xbb\x1d\x71\x4d\x46\x71\xe5\x8f\x95\
+\x3e\x8d\x74\x6e\x19\xea\xf0\x6a\xec\x68\x2b\xdb\x1b\x3c\x58\xc4\
+\x64\xb6\xa2\x06\x6e\x4e\x6e\x5f\xe3\x5c\x15\x6f\xc7\xff\xec\x7c\
+\x37\x30\x67\x56\x48\xea\x66\xf1\x3b\x36\xf4\xf6\xb0\x0d\xcd\x9c\
+\x0c\xef\xcd\x64\xf6\xbe\x07\xb2\x07\x20\xc0\x8f\x9f\x14\xe6\x7b\
+\x63\x57\x68\x47\xbc\x7d\x8f\xf0\x92\x36\xf2\x33\xbc\xe7\xf9\x45\
+\x97\x56\xec\xdb\x1d\x27\x4a\x00\x00\x32\x12\xd2\x2a\x25\x6d\x0d\
+\x02\xda\x2b\x7c\xcf\x52\xb4\x2c\xc4\x2d\xec\x7c\xee\xbe\xc7\x9b\
+\x9f\x84\x8d\x06\xb9\x2a\x2f\x46\x2d\x1a\xdd\xb4\x16\xf4\xa6\xc8\
+\x35\x31\x3b\x87\xb5\xef\x6d\x7e\x5b\xa6\x24\xd4\xd1\x95\xf1\x30\
+\xb5\xa4\xa1\x81\xe9\x4d\xa0\x1d\xc1\x8c\x06\x86\x1b\x3e\x00\x04\
+\x69\x75\x3d\x12\x47\x82\x61\xd2\x3c\x84\x98\xd2\x80\x5d\x56\xf1\
+\x27\x06\x37\x17\x84\x8b\xe8\xb8\xd1\x1c\xdc\xef\xf8\xa2\xae\xe6\
+\xa2\xaa\x0e\xab\xcc\x5b\x5e\xcd\x79\x17\x7f\x95\xed\x22\xff\x45\
+\x22\xef\x84\x1e\x1d\x6c\x68\x34\xce\xf4\xca\xdd\xc7\x9d\x01\x87\
+\xb8\x6e\x64\xb0\x90\xb2\x37\xd3\xfd\xe5\x1b\x97\x70\xdd\x08\xe0\
+\x0c\x35\x86\xf6\x78\xc1\x97\x26\xaf\x8e\x33\x15\xa5\xe3\x8e\xed\
+\x46\x7d\xe8\x9a\x5a\xc9\x33\x7c\xf0\x9e\x0e\x1d\x70\xb5\x14\xc5\
+\x22\x16\xa1\xc5\x9b\xde\x90\xb6\x8b\x91\xb6\xf3\x49\x28\xf6\x1d\
+\xd3\xd3\x1d\xd4\xf7\xd4\x11\x9b\x1c\x7f\xae\x78\x4f\x33\xa4\xe4\
+\xcd\xe6\xec\xd1\xc6\xa5\x4b\x6e\x84\x08\x68\x43\x7b\xfa\x90\x8a\
+\x39\x55\x58\xd6\x13\x30\x6c\x57\xa4\x3a\x4e\xfb\xdd\x98\xd6\xc0\
+\xc3\xda\x20\x43\xb1\x87\x33\x4f\x25\x68\xc1\x1e\x0e\x23\xe0\xd8\
+\x6e\xeb\x35\x23\xab\x74\x14\x9b\x04\xe1\x71\xd7\x26\x14\x6a\x17\
+\x8c\xe2\x35\x5b\xcf\x5e\x87\xb4\x0d\x6a\xe0\xe8\xde\xd6\x8b\x3e\
+\x8d\x43\xca\x2a\x3b\xe4\x1b\x08\x3d\xef\x22\x1b\x67\xa9\x4f\x99\
+\x50\x96\x93\xb8\x0a\xc6\x2b\x93\x2e\x9e\xc7\xf3\xe4\xbf\xcd\xf9\
+\xa2\x1b\x47\x8c\xc4\x13\x80\x96\x27\xb0\xd8\xa6\x31\x4f\xf5\xd7\
+\x68\xd0\xf2\xa7\x5e\x5c\xb9\xf6\x31\x7d\x61\xbb\xdf\x1a\x2c\x78\
+\x18\xbb\xba\x2a\x8f\xdc\x50\xb1\x8a\xc1\x0c\xfd\x34\x91\xcc\x5b\
+\xbe\x32\x8c\xce\x4c\x1b\x04\x06\x80\xdc\xfe\xfc\xb1\xe6\x4a\xaf\
+\xd5\x2a\x6e\x21\x19\x8b\xc2\x97\x8f\x57\x3f\xb3\x60\x78\x28\x5b\
+\xab\x50\x5b\x08\x5e\x96\x15\x4b\xb3\xe8\x59\x2d\x0a\x9a\xf3\xee\
+\xe2\xbe\x63\xec\xb0\x4f\x73\x2f\x99\xc7\xd6\x37\xdc\x15\x55\x06\
+\x52\x12\xc7\x38\x72\x44\xfa\x5a\xb5\xd3\xca\xdc\xb7\xb8\x75\x67\
+\x76\xa9\xeb\xce\xf4\xa0\xd3\x6d\x02\x35\x10\xb0\x94\x8d\x81\xff\
+\x0a\x2f\x50\xcb\xd3\x31\xef\x21\xd6\xea\xf2\x38\x21\xb5\x86\x58\
+\x01\x7e\xe7\xa4\xac\x0e\x6a\x8c\xcf\x2b\x6a\x9d\x7b\x48\x64\xfe\
+\x3a\xf7\x37\xc3\x3d\x44\xc5\x3a\x05\xe6\xc7\xad\xc8\xec\x4c\xf9\
+\x27\x44\x2a\x98\xd2\x87\x3e\xd5\x48\x0d\x86\xd2\xf3\x1c\xea\x77\
+\x7c\x3c\x70\x24\x32\x86\xb3\x5a\xc5\x0d\xb2\xa3\x11\xc5\x25\x1e\
+\x8a\x09\xc1\x3a\xd8\x42\x81\xc2\x0e\x41\x76\x05\xfa\x8f\x8c\x42\
+\xf3\x26\xcd\x86\x34\xdd\xbb\x68\x0f\x0a\xa1\x87\x8a\xd0\xf7\x4e\
+\x5c\xda\xb6\x1b\xa5\xda\x14\x5e\xcf\x27\x3f\x85\x5f\x3d\xe2\x81\
+\xa8\x8e\xb3\xba\x0a\x56\x38\xd3\xe1\x6f\x32\x5c\x8d\xaa\xdd\x77\
+\x37\x58\x1e\xa7\x71\x23\x01\x24\x2e\xde\x90\x00\xa7\x54\x4f\x66\
+\x4f\xac\x0d\x08\xc8\xaa\x6d\x09\x4d\xf8\xe0\x21\x65\xd9\xdc\x26\
+\x16\x34\x97\xd2\x2d\xef\x89\xac\xdf\x5b\x79\x34\xd0\x7d\xfe\xf2\
+\x95\x88\x62\xf1\xa2\xdb\x1a\xfb\x2b\xd7\xf2\x6f\x4f\xed\xe9\x87\
+\x55\x78\xd0\x5c\x92\x56\xdb\x92\xd6\x7d\x77\xd5\xf6\xda\x33\x5b\
+\xd4\xba\x76\x57\x5a\xf0\x5a\xed\x79\xa6\xce\x31\x41\xf8\x12\x58\
+\x01\x4a\x9b\x56\x72\xfc\x73\xe2\xcf\x0a\xed\x1b\xd7\x57\x47\x13\
+\x89\xb7\xb2\x47\xae\x8e\x56\xcb\xe0\xcf\xdb\x4f\x3d\x57\x82\xae\
+\x3f\x93\x12\x8d\x5e\xe7\xca\xa5\x58\xdb\x79\x1b\xab\xe1\xba\x59\
+\x5d\x5d\x10\x3d\xc9\x82\x7d\x78\x1f\xa0\x28\x0c\xc7\x29\x88\x4d\
+\x9e\x7f\x87\x8c\xb8\xbb\xb7\x21\x56\x6a\xab\x24\xb5\xe5\x08\x84\
+\x26\xcf\x6b\x38\xe3\x24\x27\xec\xb3\x01\x46\x7b\x62\x11\xa3\xd1\
+\xc3\xc8\x2f\x1d\xce\x4c\x46\xbd\x87\x0c\xb4\x2b\x1f\xee\xce\x11\
+\xa7\x13\xed\x85\x9c\x2d\xf7\x20\xb7\xfa\x30\xfa\xce\x26\x36\xeb\
+\x0c\xea\x5a\x4d\x55\xef\xd0\x50\x05\xad\x33\xf7\x0d\x79\x7f\x8b\
+\xc3\x48\xcd\xc2\x06\xd1\xa3\xf3\x7a\xf2\xd0\x84\xd7\xbb\x7a\x2d\
+\x02\xe2\x4b\xb3\x75\xb1\xa9\xb7\x1e\xc3\x67\xdc\x12\x4b\x23\x75\
+\x59\x4c\x9c\xbe\xfe\x8a\x0b\xde\x7d\x8b\x17\x4a\xfe\xb6\xd4\x20\
+\x76\x6d\xf4\xda\xad\x47\x7a\x24\x74\x6b\x19\x07\x77\x83\xde\xa4\
+\x17\xb2\x93\xc5\x3d\xa7\xf1\xc7\x9e\x7f\x26\xd1\x9a\xe3\x61\xb1\
+\x51\xfe\x54\x12\x47\xf0\x08\xa0\xfd\x76\x5b\xf2\x95\x02\xd6\x8d\
+\xdd\x4f\x7d\x44\x26\x90\x23\xcd\xd5\x08\x76\x22\xf3\x76\xb8\xfd\
+\xeb\xc9\x62\x2b\xeb\xc5\x2f\x4d\x51\x3f\xd7\x7a\x7c\x17\x07\xb2\
+\xeb\x08\xb0\x57\xf8\xe4\x09\x16\x62\x50\x8a\xe3\xd9\x0d\xbf\xf6\
+\xbf\xd8\x56\x42\xbd\xf1\xc5\x09\x4d\x9b\xde\x19\x24\x8a\x21\x57\
+\xcc\x6e\xf5\xf6\xd1\x24\x2e\x52\xb1\xbe\xf1\xab\xc2\x7b\x34\xc0\
+\xea\xb3\x3d\xa9\xb5\x3e\xaa\xed\x23\xb2\xe9\x97\x4e\x37\xb3\x18\
+\x4a\xb3\x07\x87\x97\x44\x43\xe3\x91\xa1\x58\x35\xf2\x77\xcd\xd7\
+\x18\xa2\x7d\x30\x1f\xaa\x02\x4b\xb4\xce\x66\x2b\x72\xd8\xbb\x6c\
+\x40\xde\x21\x75\xcb\x51\x54\x2f\x7a\xe9\x26\x3e\xb4\x6d\x9d\xac\
+\xf0\x9c\x95\x94\xde\xe8\x51\x3b\x06\xe6\x8f\x57\x53\x8d\x76\x62\
+\xcc\x98\x2d\x6f\x77\xf3\x34\x46\xa2\xbb\x8e\x4b\xdb\x19\x8a\x95\
+\xb6\xd6\x8a\x9c\x15\x46\xff\x74\xf0\x28\xb6\x65\x28\x79\x06\x05\
+\x00\x92\x86\x8a\x8a\x08\x3a\xb9\x24\x85\x7a\x57\x72\x14\x3c\x69\
+\xa1\x4f\x05\x20\x86\x38\xf7\x5a\x24\x47\x21\xa9\xed\x1e\xae\x7c\
+\x29\x96\xda\x9a\xcf\x15\x9c\x84\xc7\x3d\x4a\xbc\xfb\x4c\x28\xd8\
+\x2e\x32\x7f\x24\xbf\x84\xe9\xfc\xea\x5c\x69\x5f\x72\xf2\xc7\x77\
+\x0f\xa9\xf5\xa5\xb4\xa1\xf7\xb7\xb4\xb5\x3c\x2f\x03\x00\x60\xae\
+\xc7\x36\xda\xfb\x18\x89\x88\x73\xdb\x91\x35\x5c\xc2\x5d\xaf\xb5\
+\xb5\xea\x85\x18\xb6\xbe\x0c\xee\x19\xd5\x95\x52\x17\x92\x17\xab\
+\x1f\xd5\x6c\x5e\x37\xa6\xf9\x49\xed\x4c\x54\x3e\x94\xad\x53\x1c\
+\x54\xc9\xd7\xdd\xe2\xab\x9e\x7b\xe0\xdd\xdb\x0f\x44\xf0\x4f\x04\
+\xa3\xf2\x98\xb7\x16\x16\x68\xaa\xfb\xcd\x1e\x5a\xcd\x4e\x6e\x03\
+\x2a\xa1\x1f\x32\xb7\x4d\xef\xd9\x93\x40\x9a\x7c\x42\x76\x9f\x76\
+\xaa\x41\x78\x78\xd1\x1e\x1b\xe2\xca\x3c\xa6\xbe\x65\x99\x64\x60\
+\x58\xfa\x8a\xdc\xf2\x89\xe9\x43\x9e\x4d\x36\xac\x43\x35\x81\x7c\
+\xdc\x2b\x67\xaf\xc8\x45\xe9\x62\xf7\x56\xcd\x99\xb9\x0f\x0e\x03\
+\xc1\xaf\xee\x46\x65\x05\x5a\xf3\x3c\x0b\xec\xf7\x75\xad\x50\xba\
+\xcc\x02\x00\xf1\x9f\xf7\x3e\xde\x79\xd2\x3a\x8c\x61\x17\x37\xae\
+\x1f\x4d\xe8\xed\x39\xf8\xd2\xa7\xd1\xbf\xba\x71\x4a\x4f\x20\xf0\
+\x8e\x8d\x66\xd4\xec\xd0\x4e\xe4\xd4\x81\x2f\x8e\x87\xff\x97\xb3\
+\xe3\x68\x8f\x34\xde\x1c\x8c\xb1\xf4\x43\x48\x15\x6a\x48\xd3\x3d\
+\x78\x82\xbc\x49\x15\x3c\x1e\x4e\x71\x88\xe3\xe2\x05\xb1\x6b\x85\
+\x99\xc5\x51\x95\x2a\xb0\xdf\x26\xbc\x06\x02\x74\x6d\xb9\xaa\xae\
+\x03\x9f\x5c\xf0\x52\xce\xa3\x73\x2f\xf8\xe1\xe3\xd8\x93\x6e\x5e\
+\xb9\xe5\x4c\x9d\x50\x8e\x1e\xfc\x76\x84\x2f\x36\xc8\x13\x6f\x38\
+\x8f\x67\x3c\xaa\xd8\x52\x2e\x4e\xa3\xf6\xcb\xc8\x8c\x9c\xfa\x7e\
+\xaa\xae\xd4\x14\x21\xb7\xb7\x32\x7e\x0d\xc6\xd3\x89\x33\xd2\x9c\
+\x8a\xe5\x68\xaa\xc3\xfe\xe0\xe2\xf4\x88\x8c\x03\xb4\x84\x99\x8a\
+\xd7\x48\xc1\xe5\x99\xfb\xe8\x11\x3b\x56\x1d\x38\x9e\xca\x6e\xa6\
+\x24\xf4\xb7\xc1\x4c\xf2\xf8\x4d\x84\xd2\x5a\x18\x61\xd6\xb4\x9f\
+\x70\x59\x67\x20\xa6\xef\x1b\x14\xdd\xab\x8c\x9f\x5c\x77\x62\xbd\
+\x84\x95\x77\xe5\x5e\x60\x21\xea\x7d\x02\xd7\x56\x1b\x28\x57\xe2\
+\xa8\x63\x04\x83\x11\x38\x5c\xe1\x56\xd3\x79\x8b\x0d\x27\x6c\x3e\
+\x42\x8f\xc6\x48\x58\x62\xa7\xd0\xdb\x24\x41\x9d\x0a\x2e\x6e\x6a\
+\x16\xb7\x9b\x46\x91\xf9\x99\x6b\x8e\xac\xc2\x18\x65\xf0\xc9\xcb\
+\xcf\x93\xf5\x8b\xbd\xc9\xb3\x4a\x05\x6c\xba\xe0\x35\x28\x2b\x60\
+\xf8\xbe\xc7\x2f\xc4\x42\x47\xc5\x40\x45\x46\xba\x5c\x8d\x3f\x8d\
+\x02\x2d\x86\x4c\x72\x27\x19\x64\x9f\xa1\x95\x93\x80\xf3\x74\x6a\
+\x58\x75\x44\xd5\xe6\x95\xf5\xe7\x32\x7a\x3f\xfd\x24\x5f\xd9\xd2\
+\x8f\x9b\xf5\x9e\x03\x3a\x84\x8a\x71\xb8\xc4\x08\xab\x4a\x1c\x79\
+\x4e\xb4\xa2\x81\x90\x40\x7a\xe7\xd2\xb9\xf9\x75\x86\xe5\x8c\x23\
+\xa3\xbb\x6b\x4f\x1f\x30\x01\xf5\xb2\xae\x65\xb3\xa2\xf8\xae\x91\
+\x6e\xbb\x2e\x81\x4c\xd5\xae\xe8\x03\xc8\x6f\xb8\xee\x67\x3d\x50\
+\xff\xbc\xad\xe6\x14\xb5\xcf\x37\xfd\x86\xe3\xd9\x87\x89\x81\x69\
+\x40\x0b\xc3\xf8\xfc\x3c\x05\x81\xb5\x8c\x84\xd3\xa1\xe5\x3b\x4b\
+\x22\xce\x18\x91\x85\x6d\xdd\x03\xdd\x3d\x4c\xb8\x8c\x21\xc7\xd9\
+\xa8\xcb\x63\xd9\x0c\x87\x6a\xb5\x7c\x6e\x10\x47\x4a\x49\x55\x7f\
+\xed\xd1\x2f\xde\xe3\xfa\x6b\xbb\x17\xa5\x01\x91\x95\x33\x4e\x68\
+\x95\xe7\xe0\xfc\x2f\xb3\xdd\x24\xac\x8d\x34\x11\xf3\xd6\x39\x1b\
+\x0c\x0c\x50\x19\x5e\xd3\x2a\x39\x34\x95\xfc\x24\x8c\x4a\xbc\x2f\
+\xf6\x12\xdd\x86\x7b\x92\x0c\x3d\x87\xd1\xd6\x66\xbd\x46\x6f\x73\
+\xfe\xa6\x97\x2c\xe0\x8f\xc6\x9b\x9c\xb5\x6c\xcf\x45\x94\x89\x64\
+\xf9\x72\xbc\xe6\xd9\x5b\x70\x35\x16\x63\x0e\x5f\x49\xfe\xb4\x60\
+\x67\xfd\x78\xa4\x2c\xa0\x20\x2d\xe2\x27\x3c\xe4\x42\x2d\xe5\xe4\
+\x85\x6e\xb1\xe9\x28\x44\x10\x5e\xe3\x6f\x24\xdb\xe1\x8a\x5d\x12\
+\xbd\x9f\xe2\x21\xee\xfa\x4e\x1a\x1c\x4f\x18\x75\xee\xb0\xed\xb3\
+\xb2\x5a\x17\x0c\x65\xd5\x45\xba\x9d\xe3\x2d\x37\x44\x27\x14\x4a\
+\x91\xa7\x63\xe2\x7c\xc1\x61\x92\x26\xca\x98\xee\x66\x88\xb5\xe3\
+\xf6\x04\xfb\x2a\x13\x10\x27\x91\x31\xce\x83\x8e\x67\x0f\xd8\x86\
+\xd4\xda\xe6\xfd\xfe\xaf\x12\xe5\xa4\x09\x6f\x37\xe6\xa2\xa9\x03\
+\xde\xa7\x5c\xa8\x93\x6a\x15\x0d\xbc\x1c\x74\xa5\xe8\x6f\x34\x70\
+\x5a\x0e\xe6\xa1\xe1\xcf\xdd\xe4\x89\xee\x62\xc1\x45\xdd\x8d\x4a\
+\x3d\x8a\x29\xf3\xd3\x9a\xb9\xe9\xb1\xa6\x08\x7e\xf8\x39\xc1\x91\
+\xa3\x4a\x22\x00\x12\x87\x25\x59\x84\xeb\xcc\xb1\x6e\x9a\x34\xa3\
+\x7a\x95\x11\x38\xd3\xf5\x85\x66\x74\xbe\x53\xd4\x59\x16\x5f\xa7\
+\xb2\x52\x1d\xb8\x6c\x77\xfd\x23\x09\x25\x98\x3a\x42\xa1\x42\xa1\
+\x76\xb7\x3c\x36\xab\xd0\xf0\x90\xfa\x96\xda\x53\x64\x08\x73\x57\
+\x3f\xde\x7d\xe8\x99\x8f\xfa\x50\x30\x60\x14\x2f\xf3\x8e\x1b\x05\
+\x1d\x03\x4a\x00\x76\xc1\xe0\x2d\x14\x75\xbc\x5d\x56\x6e\x5d\xdb\
+\x1d\x25\x0b\xd8\x49\x68\x39\xf6\x63\x13\x7e\x2a\xc3\x5e\x33\x87\
+\xb4\x83\x3b\xa0\xdb\x51\xe0\x66\x5a\x09\x3c\xa2\xa9\x15\xf5\xe6\
+\x71\xec\xa2\xa2\xf9\x73\xe2\x67\x72\x42\xe1\x15\xdb\x38\x4c\x93\
+\x8b\x6c\x2a\xb4\xc0\x2b\x74\x1d\x25\x04\x28\xe4\x19\x06\x33\xe3\
+\x18\xd5\x2b\x79\xbc\x1a\x30\xe2\x08\x83\x98\x82\xcb\x8c\x80\x13\
+\xf3\xe8\x58\x27\xb8\x46\x58\xfd\xda\xa5\x68\x89\x14\x48\x36\x29\
+\xa4\xfc\x5a\xc2\x91\x12\x30\xa9\x8e\x2a\x7e\x4e\xe2\xa6\xbb\xfc\
+\x4d\x2f\x9e\x76\x6d\x0e\x02\x0c\x48\xfc\xda\x61\x41\xce\x86\xc4\
+\xba\x06\xe3\xd4\xb0\x84\x75\x7a\x90\x13\x36\x51\x80\xcc\x72\x1d\
+\xe5\xd4\xb3\xb5\x10\x46\x07\x02\xe8\x6d\xf0\xa7\x79\x53\xfd\xf1\
+\xf5\x9d\x6a\x3d\x94\x0a\x34\xe2\x1c\x3f\x59\xa0\x07\xbc\x9d\x1b\
+\xac\xdd\xfd\x98\xd5\x23\x10\xd4\xcd\x43\x4b\x09\x96\xc3\x92\x28\
+\x05\x2a\xd9\xe3\xae\xf6\x63\xbc\x79\x8e\x5f\x4a\xe0\xbf\x49\xab\
+\x7d\x25\xfe\x36\x22\x1d\x3e\xc1\x90\x54\x3e\x20\xe9\xa9\x44\x0f\
+\xba\xb5\x38\x92\xcf\x14\x4c\x7d\xad\xd5\x16\xe7\x7d\x47\x50\x14\
+\x0a\x21\x19\xc6\x47\x48\x10\x9d\x0c\xaa\x84\x37\xbb\x2d\x35\x96\
+\x39\xf3\x65\x4a\xec\x50\x26\x82\xf7\xe0\x52\x06\x13\x2e\x02\x0f\
+\x1c\xc3\xa0\xb0\xd6\x46\xa4\x30\x06\x39\x0f\xcb\x2b\x24\x10\x6d\
+\xe6\x0d\xf7\x4e\x36\x89\x32\xdd\xc1\x45\x4c\x6b\xf2\xcc\x81\xa0\
+\x0c\x9a\x51\x3e\x2d\xa2\x07\x9e\x5e\x30\xbc\xd1\x07\x5d\x1c\x4c\
+\x87\x61\x62\x88\x3f\xe6\xc9\x5d\xb9\x21\x9d\x79\x59\xd7\x9d\x15\
+\xf1\xc7\x3c\x38\xd1\xfe\xf6\x67\xbd\xe3\x82\x0c\x00\x44\x58\x5f\
+\xe9\x57\xe5\x33\x04\x9b\x7d\xc9\x1d\x37\x78\xce\x17\x7f\x65\xde\
+\x0b\x1b\xb6\xe0\x85\x7d\x34\xf7\x94\x60\x01\xf1\x1b\xe2\xdd\xaf\
+\xda\xc1\x20\x00\xea\x92\x07\x41\xc4\xa2\x07\xce\xd1\x42\x28\xc3\
+\x51\x7f\x1a\x21\xac\xbb\x80\x1c\xd6\x9d\xc7\x00\xeb\x4c\xc6\x85\
+\x2d\x86\x32\x1d\x21\xde\x21\xea\x20\xea\xfe\xd8\x76\xc1\x87\xa8\
+\x61\xc9\x9b\xe0\x68\xb1\x50\x0b\xd6\xd2\xc1\x0b\xab\xed\x22\x85\
+\xcd\x0d\x3e\x87\x53\x30\xec\x7d\x3d\x1e\xac\xfd\xa3\x3c\x6c\xb1\
+\x40\x0b\x86\xa8\x83\xa8\x7b\x92\xc7\xa2\x27\x41\xe4\xf1\xef\xad\
+\x10\xd8\xc2\x50\x04\xac\xb6\x93\x1c\xd6\xd4\xc1\x7d\xfc\x19\x41\
+\x6d\x1f\x65\x61\xe5\x8d\x34\x5f\xbf\xc3\xeb\x20\xea\x22\x70\x20\
+\xda\x42\xa3\xb1\x25\x17\xdc\xb1\x61\xe3\x79\xc2\xb0\xbe\x9e\xbb\
+\xb0\xee\xee\x1b\xb0\xba\x6e\x32\x58\x5b\xa7\x14\x6c\xa4\xc7\xf2\
+\x98\x3a\x3b\x94\x60\x79\xb5\x00\x6c\xb0\xdb\xe8\xf8\xfb\x64\xae\
+\x0c\x6c\xc1\x1d\x07\x36\xee\x87\x21\x38\xf2\x12\x77\x68\x2a\x04\
+\x0f\x56\xd7\x45\x76\xdc\xee\x1b\xe5\xd7\x83\x8f\xdb\xfc\x8c\xf2\
+\x6b\x00\x18\x34\x10\x13\x36\x16\x82\x51\xb1\xe8\x73\x66\x6a\x3e\
+\xf3\xc6\x6f\x7d\x7d\x0e\xeb\xe9\x56\x84\xd5\xc2\xdb\xcf\x0d\x06\
+\xc2\xe6\xe1\x7d\x47\xd0\xdc\x40\x20\x2c\xbf\x16\x04\x1b\xea\x7e\
+\xf0\xfd\xb7\x85\xcc\x5b\xb0\x45\x1f\xa2\xa9\xd9\x97\x68\x07\xf3\
+\x25\x9a\xdf\xfb\xda\xd1\x7d\xe5\x78\xec\xbe\x7d\xff\x46\x45\xf5\
+\xd8\xb0\xbe\x4e\x9d\xdf\x7f\x2b\x35\x84\x2d\x7a\xe2\xee\x4d\x66\
+\x83\x60\xb3\xc5\x52\xff\x72\xfb\xa9\x74\xa4\xfd\xa9\x6c\x46\xd8\
+\xa7\x7e\xe7\x63\xea\xea\x92\x3d\xc6\x3f\xd5\xef\x0d\x9b\xee\x7f\
+\x7a\x4c\x88\xcf\x08\xfc\xfd\x5d\xf7\xbe\xff\x36\x97\xa1\x70\x8c\
+\x1f\x9a\x8a\xb2\x3a\x99\x8e\x04\xab\xeb\xfc\x17\xc6\x2f\x14\xa3\
+\x6a\x22\x01\x45\x6b\x32\x17\x80\x4d\xe4\x32\xc3\x86\x7a\x0d\x60\
+\xbd\x3d\xaa\xc7\xed\xdb\x3b\x65\x60\xe3\x7d\xb6\xc7\xd4\xdd\xa9\
+\x7a\xdc\x6e\xa4\xc7\xfc\xf8\xfb\x54\x1e\x5c\x97\xe0\xba\x38\xe3\
+\x8f\xc9\x8b\xd0\x81\x99\x24\x94\x6e\xc4\x38\xcc\x37\x9a\xfe\x63\
+\xfd\x41\x94\x85\x70\x00\x7b\xf2\x2d\xf2\x1a\x82\xc7\x5c\x81\x10\
+\xac\xa5\xf3\x77\xfd\x9d\x3f\xa9\xbf\x85\x3f\xd7\xdf\x6f\x3c\x8e\
+\x71\xc0\xfb\x32\x95\x8e\x06\x1b\xc9\xc2\x80\x0d\xe4\x13\xc0\x7a\
+\xf2\x68\x4f\xad\x1f\x84\xae\xff\xd8\xf6\x64\x99\x7f\x89\x7a\x6b\
+\x3a\x11\xb9\x03\x3e\x2f\x07\xc7\x73\xfb\x12\xf5\xeb\xfa\xf5\xc0\
+\x0d\xf9\xd9\xfa\x5d\xc5\x83\xc7\x42\x48\xf0\x08\x12\xf4\x95\xfe\
+\xaa\x7c\xab\x87\x68\x83\x68\x8b\xb0\x33\xdc\x70\xd2\x05\x4e\xd8\
+\x19\xc6\xbf\xb6\x33\xff\x4a\x99\x81\x00\x98\xf0\x31\xb8\xb1\xe4\
+\x8e\x1d\xbc\xe8\x8e\x53\x34\xe7\x83\xbd\x08\xa7\xc3\x05\x4f\x1c\
+\x18\x82\xe6\xbc\xb1\xf7\xe7\xbd\xb0\xa6\x11\xef\x8e\xeb\xc0\xeb\
+\x22\xda\xfc\x7b\x51\xfc\xb3\xb2\xea\x83\x47\xb0\xe4\x8e\xa5\x0d\
+\xb7\x31\x99\x8b\xee\xd8\x5b\x70\x82\xfd\x43\xda\x42\xb4\x45\xf0\
+\x40\xf0\xfa\x4f\xe1\x46\x8c\xdb\x92\x07\x8e\x3d\x5c\xfe\xda\xbf\
+\x80\xf9\x57\xb4\x86\xe0\xf9\xbf\x39\x27\xb0\x77\x00\x12\xdc\x36\
+\xdf\x83\xcb\x9a\xfa\x3b\x98\xe6\xbd\xb1\x61\xb3\xbe\x38\xb0\xd9\
+\x67\x70\xfd\xf1\xc2\xfa\xbb\xfd\x98\x42\xc8\x40\xc8\xfa\x77\x62\
+\x5f\x84\x60\x92\x2f\xba\x63\x35\xfe\x4a\xee\x82\x07\x2e\x6c\x22\
+\x12\x0f\xd6\x9b\x43\x04\x6b\xab\x21\x86\x35\xb4\xc3\x6d\x65\x27\
+\x0d\x6c\x72\xc0\x0d\x36\x33\xe0\x0b\xab\x6d\xe1\x84\x15\x56\x81\
+\x60\xe5\x45\x60\x58\xf3\x5b\x14\xd8\x48\x18\x26\xdc\xce\xe1\xfe\
+\x49\x3f\xe0\xb2\xbc\x30\xc9\xfe\x1d\xd8\x97\x3c\x71\x05\xe0\x3c\
+\xa7\x7f\x2a\x27\x84\x19\xb6\xf8\xc1\x00\xd6\xd0\x4a\x73\xca\xc6\
+\xd7\x74\x52\xc0\xe6\x86\x82\xbe\xdb\xd9\xf9\xa1\x50\x58\x45\x13\
+\xfd\x29\x5b\xdf\x50\xcf\x79\xdc\xf6\x98\xc7\xcf\xfb\x31\xbd\xe4\
+\x8e\xc9\xff\x3f\xc2\xee\x8e\xa5\x09\xe7\xb3\xf3\x07\xde\xcf\xa9\
+\x60\x8b\xef\xf5\x61\x0b\x83\xe1\xb0\xa1\x3e\xa3\x53\xd8\x11\x34\
+\xd2\xf7\xf0\x0f\xfb\xe4\x44\xbf\x13\x7c\xaf\x3b\xbd\x77\x41\xfb\
+\x1c\xe0\x3c\xc2\xe0\xfd\xd0\xff\xca\xf3\x8f\x7d\xd8\x59\x74\xc3\
+\xd2\xf8\x1f\x60\xff\xa3\xae\xa4\x5f\x87\x2d\xf4\x07\x7f\xc7\xd5\
+\xd0\x71\xee\x34\xfe\x0e\xc6\x3f\x60\xff\x5e\xb7\x4d\xf0\x14\xfe\
+\xe6\x36\x89\xdf\xdf\x23\x78\xc2\x79\xff\x74\x2e\xfe\x61\x1f\x7e\
+\xd3\x99\xd3\xe3\xee\x45\x70\xec\x5b\x9c\xc4\x33\x3b\xf0\xfc\x78\
+\x3f\x3d\x89\x1f\xb1\xd7\xff\x0a\xff\x18\x7c\x8f\x3f\x89\xbf\xa8\
+\x1e\xf3\xab\xcf\x74\xb2\x5e\x89\xe1\xb1\xac\x1f\xe7\xe1\xef\xea\
+\xd2\xd7\xb5\x8a\x3d\x73\xaa\xbd\x1f\x19\x6c\xa1\xc9\xfe\x0f\x78\
+\xba\xba\xe4\x7f\xd0\x7b\xf2\x5f\x62\xff\x46\xe5\x4d\x54\xa7\xfa\
+\x30\xd0\xf5\x93\xfe\xc2\x65\x21\x64\xfe\xb8\x1e\x10\xd8\xfe\x0c\
+\x3b\xc2\x6e\xfd\xc1\xce\x20\xc6\xbd\xd1\xe1\xe7\xfa\xd0\xc9\x7a\
+\x0a\x7f\x53\xe7\x85\xbf\xc4\xff\xb1\x5d\xfe\x14\xfe\xa6\x36\xb1\
+\x9f\xd7\x45\xf4\xe1\x0f\xf3\x80\xd5\xf8\x67\xb6\x75\xc1\x0d\x47\
+\xff\x0f\xfa\xfe\x83\xce\x9c\xa4\x9a\x1f\x7c\x4b\xc4\x5a\xfe\x2b\
+\xfc\xe3\xbd\xf6\xa7\xf0\x97\x35\x92\xfd\xba\x3e\x42\x97\x7e\xc4\
+\x03\xdf\x1f\x7e\x86\xfd\xd8\x87\xf9\xc1\x4e\x1e\xaf\xd5\x5f\xf0\
+\x9e\xec\x77\x3b\x85\xfd\xab\x6f\x1e\xf6\x97\xf8\x17\x86\xc2\x8f\
+\x7d\xf6\x93\x7d\x40\xec\x11\xbf\xac\xff\xc7\x35\x3d\xf5\xb3\x7d\
+\x1a\xde\x2f\x87\x1f\x6d\xe4\x49\x3b\xf3\x23\x75\x77\xdf\x3c\x6d\
+\x77\x3a\x69\xfe\x06\xf6\xdf\xe6\xad\x99\xed\x14\xfe\xc1\x6e\xe3\
+\x5f\xd7\x87\x63\xf8\xd1\xb6\x22\x7c\x8d\x93\xd8\x7b\x13\x08\xa8\
+\xe1\xfb\xfd\xc1\xc9\x3a\xdd\xf9\xc4\x70\x7f\x9f\xf2\x4f\xe8\xb4\
+\xee\x54\xb6\x11\xc3\xaa\x9a\x99\xfe\x16\x7d\x68\x20\x3c\x85\xbf\
+\xa4\xe1\xcc\x9f\xd6\xef\xcc\xa6\x38\xed\x9b\x78\x61\xed\x8c\x87\
+\x63\x91\x7e\xc3\xdf\x9d\x8e\xd3\x71\xf2\xfd\x54\xf0\x1f\xe3\xce\
+\xbf\xa2\xf7\x8d\xe8\xbf\x8c\xab\xfe\xa7\x94\x0f\xa7\x89\x00\xcc\
+\x53\x7d\xe8\x8e\x43\x4d\xf9\x86\x7f\x3c\x02\x67\xf5\xd4\xbb\xc2\
+\x33\xff\x08\x3b\x82\x0a\x1b\x90\xff\xd7\xf0\x1f\xfb\x1b\xe9\xc8\
+\xa7\xf0\x8f\x07\x61\x8c\x7c\x5f\xb7\x1e\xbf\xef\x55\x0b\x1e\xd8\
+\xb0\xc6\x8f\xa4\xff\x18\x7f\x7e\x1d\xe8\x7f\x15\x7f\x51\x25\xe8\
+\x18\xdb\xf7\x3e\x78\x60\x6f\x4d\x06\x00\x18\x4b\x6e\x38\x37\x4f\
+\xf6\x6b\x2e\xea\x3c\xdc\x57\x71\xf8\x53\x82\xf6\xdb\x1d\xc7\xf2\
+\x27\x6d\xcf\xd4\x80\xf7\x3f\xa2\xa2\xfa\xdf\xf5\x0d\x91\x03\x98\
+\x1c\xf0\xfa\xcb\x36\xf3\xd1\xec\xa7\x6d\xd1\xf7\x98\xef\xc4\x6f\
+\x05\x1a\x7f\x69\x3f\xa6\x07\x9f\xfd\xb0\xef\xfe\x89\x0d\xff\x05\
+\x95\x36\x90\x9f\x1a\xdf\xb9\xc1\xa0\xbf\x6e\x07\xc7\x76\xca\x0e\
+\xc1\xb1\xc3\xa9\xf8\x94\xcd\x6f\x74\xfc\x4b\x3e\x9f\x06\x5c\xfe\
+\xe0\x2f\xff\x53\xfc\x3f\xfa\xd3\xd3\x03\xcf\xfe\xba\x1d\xdc\x0f\
+\x38\xbd\x17\xe0\x14\xc1\x9f\x23\xa7\xf0\xff\x89\xcd\xff\xbe\x87\
+\xf6\x59\xff\x80\x9f\xea\x1f\xe3\xaf\x6a\x62\x39\x85\x7f\xb2\xdf\
+\xe3\xaf\xdb\xf5\x05\xfd\xb8\x97\x8d\xcc\x05\xa1\x7f\x99\x7a\x07\
+\x86\x4d\xbf\x05\xc3\x16\x82\xf0\xfe\x96\x6c\x84\x7f\x7f\xda\x67\
+\xfe\xfb\x7b\xd7\x37\xaa\x6d\xe1\x38\x85\x7f\xa2\xcf\xe9\x6f\xb5\
+\x5b\xf4\x26\x3a\xe1\x4b\x60\x2f\x4d\x65\x80\x8e\x10\xb9\x21\x04\
+\x4d\xbf\x45\xfd\x5b\x3c\x06\x7b\xef\x9d\xc2\x5f\xdf\x49\xff\x8f\
+\xf1\xd7\xb7\xf2\x9e\xc2\x3f\xde\xfb\xe4\xef\xe1\xf7\x25\x3f\x39\
+\xfe\xbb\x53\x39\x5f\xb1\x1f\xe7\xb7\xb2\x90\xfe\xbf\xc3\x3f\x99\
+\xf5\xfb\xf8\x4f\x65\x81\xfe\xff\xd3\x9f\x74\xd0\xde\x37\xfc\x08\
+\x5a\xe8\xf3\xfb\x4b\x1e\xff\x4d\xeb\x77\x3a\x05\x69\xf1\x24\xfe\
+\xf9\x5a\xfd\xbf\xe4\xf3\xdf\x64\x3f\x11\x39\xd9\x93\xf8\x67\xf3\
+\xf8\xfe\x92\xcf\x7f\xd3\xfe\x35\x15\x8b\xea\x7d\x12\xff\x64\x1a\
+\x06\xac\xaf\x5b\xed\x2f\xe8\xce\x0f\xfe\x03\xc9\x71\x0e\xfe\x9f\
+\x50\x61\x1d\xda\x29\xff\x61\xb8\xc7\xec\x2f\xdb\xcc\x46\xfd\x90\
+\x2b\x42\xe4\x81\xa3\x81\x33\x93\x27\x6c\x10\xe2\x73\x53\x2b\xf1\
+\x7f\xbd\xff\x06\x5f\xbb\x3b\xdf\xe2\xb0\x4f\xef\x90\xf7\x4f\xce\
+\xc1\x60\x01\xce\xff\x0f\xfe\xf3\xe8\x37\xff\x7f\x24\x1d\x6d\xf0\
+\x94\x0e\xfd\xe4\xdc\xe7\xbf\x2d\x7e\xe9\x7d\x89\xfa\xea\x1b\xfe\
+\xf9\x78\x34\x06\x84\xed\x3f\xd9\x87\xa1\x3c\xc2\xe3\xfc\xc8\xaf\
+\xa8\x16\x6e\x73\x4e\xe2\xaf\xfe\x48\x09\x6b\x6e\x13\xfb\x5b\x54\
+\xde\x44\x7d\x0a\x5f\x45\x13\xed\x9f\xd6\xef\xcf\x61\x3b\x9d\x83\
+\xf0\xc4\xda\x5a\x0b\xc0\x25\x3c\x19\x03\x4f\xc7\x23\x7f\x38\x89\
+\x7f\x2a\x13\xbe\x17\xf7\xf9\xff\xd2\x16\xfc\x37\xc5\xef\xc7\x71\
+\x18\x7c\x1d\x4f\x67\x82\x0e\x4e\xf6\x61\x26\xeb\xd7\xb9\xcc\x4f\
+\xfd\xae\xff\x55\xf9\x93\xe3\x3e\xc4\xa1\xc4\x9f\x5a\x07\x88\xfd\
+\xe0\xbd\xf4\xaf\xc7\xf1\xbf\x28\x7f\x85\x28\xb0\x38\x00\x7d\xfa\
+\x1d\x78\xfd\x54\x1f\x10\x67\x9f\xb5\xf7\x7e\xca\xff\xbf\x2d\x7f\
+\x78\x9c\xc7\x7a\x89\xc2\x03\xf7\xa9\x0f\x4f\xaf\x05\xf0\x4f\xfb\
+\xf0\xdf\x96\xbf\xfd\xbe\x96\x63\x51\xf4\x26\xb3\x4f\xeb\xd1\xf1\
+\x99\xef\x0f\xba\xf4\xb3\xfc\xf9\x60\xcf\xfd\x5f\x62\xff\x63\xfe\
+\x1c\xe3\xf8\x1e\xc6\xa9\x7a\xa5\xff\xb3\xfc\xf9\x89\xb5\x10\xf9\
+\xe3\x5a\xf8\xbe\xa6\x4f\xd8\xa5\xff\xc4\xf9\x05\xe2\x2c\xe5\x9f\
+\x60\x3f\xd5\x87\x1f\xe7\x01\x41\x19\xc8\xb0\xb9\x22\xb8\xec\x81\
+\xb0\x7f\xc3\xf9\x51\xf8\xf1\x59\xd4\xaf\xce\x8f\xfe\x55\xec\xdf\
+\x0a\x42\x97\x7e\x5c\x0f\xdf\xd7\x45\x3a\x1a\x6c\xb6\x58\x02\xd6\
+\xd4\x4c\xf5\x07\x7f\xfa\xef\x9c\xdf\x2d\xfc\x2f\x9f\xdf\x7d\x2b\
+\x88\x35\xfd\x07\xbb\x74\x92\xe0\x3e\xdf\xa7\x34\x64\xd8\x70\x0e\
+\x16\xac\xb3\x12\xbe\x6f\xb7\x93\x1e\xef\x67\x53\x83\x1e\xb0\x99\
+\x41\xbf\xe3\xf3\xd3\x82\xea\xaf\xe7\xa7\x2d\x7f\xf7\xfc\xf4\x6f\
+\xae\xd5\xbf\x5b\x10\xb6\x15\xb1\x3f\xfc\xb8\xc7\xfd\x8a\x10\xfe\
+\xc8\x31\xbd\x45\x82\xcd\x06\x62\xfc\x09\xd6\xd3\x63\x8e\x38\x43\
+\xf9\x77\x9f\x5f\x9f\x2c\xc7\xfb\x34\xdc\xd7\x98\xca\xfe\x3d\x6e\
+\xfe\x2b\x42\xe4\x66\xfe\x02\xf7\x1a\xe2\xfc\xe1\x3f\x79\xa7\x63\
+\x2e\x06\x9d\x6e\x26\x16\x25\x66\xe6\x0d\xd2\xcc\x4f\xd7\xf8\xc9\
+\xb9\x78\xf7\x53\xfc\x88\x3b\x1f\x59\x4b\x6e\x58\x3a\xff\xc9\xfb\
+\x1b\x3f\x2b\x88\x39\x41\xc4\x71\x88\x58\x14\x11\x4f\x4f\x65\x80\
+\x0f\x26\x33\xe1\xba\x83\xc0\x9e\x01\x82\xcd\x84\xa2\x1f\x20\xee\
+\xcf\x20\x72\x95\xc7\x39\x4b\x37\x9c\x9b\xff\xae\xb1\x86\xc1\x20\
+\x20\x18\x0c\xfe\x3c\x00\x00\x71\xc4\x73\x15\x00\xf0\x10\xcf\x4a\
+\x00\x40\x82\x1d\xdf\x01\x04\x40\x88\xe7\x71\x65\x00\x38\x42\x3c\
+\x5d\x01\xe0\x00\xf1\x14\x07\x80\x1d\xc4\x93\x06\x00\x56\x11\x4f\
+\x3c\x00\x80\x22\x9e\x68\xbf\x3f\x2b\x11\x4f\xa4\xdf\x9f\x10\xc4\
+\x13\xf4\xc7\xe7\x7f\xba\xfc\x0a\x47\x25\xe2\x79\x02\x2f\x14\xf1\
+\x3c\xd1\x9f\x6f\xfd\xfc\xd6\xef\x6f\xe3\xf0\x6d\x5c\xbe\x8d\xd3\
+\xf7\x71\xab\xfc\x6d\x1c\xbf\x8d\xeb\xb7\x71\xfe\x6d\xdc\x11\xf7\
+\xb4\x68\xe1\x24\x01\x9c\xb8\xa7\x85\xff\xaf\xdf\xd3\x42\xdc\x41\
+\x5b\x76\xc3\xba\xb2\xe0\x86\x1d\x36\xef\x85\xd3\x30\xe5\x87\xbd\
+\x8b\xb8\x4b\x83\xa0\x99\xa7\x58\xab\xf3\x9e\xd8\x35\x88\x77\x88\
+\x3a\x7f\x76\x5f\xed\x9f\x16\xb8\x7e\x92\x20\xf8\xc2\xd7\xd4\xea\
+\xdf\xb4\x75\x08\x5a\xfd\x8a\x13\x8b\xe4\x5f\x95\x3b\x0e\x01\xd0\
+\xe1\x7c\xdc\xe0\x36\x7f\xe3\x47\xfe\x33\x01\x5f\xef\xe5\x8c\xc4\
+\x11\xc0\x86\x5f\x11\xc1\x46\x42\x31\x60\x93\x7e\x98\x3f\xc1\x71\
+\xdc\xd6\x6d\x38\x04\x31\xc3\x7f\xbf\x2c\x40\xb0\x48\xe1\xf8\x1b\
+\x4e\xf1\x0a\x63\x85\x8d\x64\x73\xc0\x9a\x9b\x49\xbe\xc7\x65\x73\
+\x03\x21\xf0\x3d\x38\xec\x78\x1f\x43\xec\xbd\x1f\xca\x40\x30\x68\
+\xb6\xe8\x71\xdd\xd3\xbe\x3d\x76\x3d\x82\xe7\xdf\x91\x3d\x0f\xc1\
+\xe2\x84\xb7\x99\xfc\xde\x3e\x80\x1a\xee\xfb\x21\xe2\x8f\x50\xf8\
+\xfe\xff\xbb\x4f\x89\xc8\x15\x7e\xf3\x03\x10\x67\xd6\xf9\x75\x5f\
+\x7d\x98\x92\x86\xb3\x5f\xe3\x2d\x78\x1b\x44\xdb\x13\x38\x26\x11\
+\xbc\xff\x4c\x36\xe2\x6e\xd2\xe2\xc9\x7b\x5c\xaf\xf8\xe1\x3e\x61\
+\xe0\xb1\x8c\xfe\x1e\x8d\xef\xb2\x1b\x3a\x98\xff\xe0\x47\x35\xb5\
+\x8a\x7c\xf7\x41\x46\x7b\x1f\x7d\xfd\xbd\x37\x10\xb6\xf8\x92\xff\
+\x14\x86\x5f\x8d\x03\x62\xbe\x4f\x8e\xf9\x42\xca\xd5\xe3\x3b\x3c\
+\xbf\xfb\xa3\xcc\xbf\xfb\x71\xbd\x26\x7f\xf4\xe3\xfa\x9c\x4e\xc4\
+\x2e\xa2\xbf\xbf\x43\xf0\x80\xf3\x3a\x39\x17\x3f\xd3\x87\xaf\xba\
+\x76\xa2\xdf\x83\xa7\x63\xd6\x6f\x63\xff\xeb\x78\xf6\xf7\xf8\xb5\
+\xa4\x91\xf8\xf4\x3b\xc4\x5d\xa4\xd3\xe3\xe0\xf6\xa3\xbe\x7d\xd7\
+\x73\xc4\x7c\xff\x36\xe6\xdf\xfb\x36\xe0\xf4\xb7\x72\xf2\x75\xad\
+\x17\x4e\xe4\x4d\x7d\x4e\xbf\x47\xcc\xc5\x77\x7d\xc0\xda\x38\xb9\
+\x36\x27\x82\xb0\x3f\x7c\xcf\xbf\x14\x32\xc1\x9a\xe1\xf1\xe2\x49\
+\xaa\xef\xa0\xff\x3d\x9e\xff\xc8\x08\x6b\x87\xc7\x8a\x3f\xa3\x9a\
+\x66\xf6\xdf\xfd\xd0\x56\xfe\x3f\xbc\x1f\x28\x10\xf8\x3e\x06\x53\
+\xcf\xb0\x52\x11\xb2\x7b\x8b\x71\x09\xe7\x7d\xbe\xfe\x36\x89\xb8\
+\xd7\xfd\x97\xf9\x34\x94\x7f\x3d\xdf\xf4\xdb\x3d\x66\x84\xac\x39\
+\x6f\xac\xa3\xde\x77\x00\xf6\xb2\x17\xd6\xd5\xef\x7d\xcf\xf9\xeb\
+\xf3\xf1\xff\x69\x3e\x12\xe1\xe7\x7e\x93\x77\x6c\xcf\xdd\xb1\xc3\
+\xbf\x8f\xc9\xc7\xc7\xc7\x77\x0b\x7f\xa4\xda\x0e\x9a\xef\xba\x87\
+\xc8\x89\xfc\x19\x7d\xcb\xdf\x22\xe6\xe2\x67\xef\x67\x3f\x3a\xfe\
+\xbe\x16\xbe\xda\xf5\x8a\xe3\xef\x81\xb4\xbf\xd4\xab\xda\xce\xaf\
+\x71\x48\xed\xdf\xc8\x87\x7f\x80\xdb\x1f\x84\xfc\xea\xe6\x73\xbf\
+\xac\x83\x90\xf5\x1b\x86\xf2\x45\x4f\xec\xa1\x79\xb8\xed\x5e\x88\
+\xe6\xfe\x65\xfd\x9a\xdf\x72\x7a\x7f\x47\x7e\x59\x23\xc5\xb1\xfc\
+\xca\x26\x86\x5f\xcb\x8f\xe2\xfe\x26\x7f\x00\xee\x03\x1f\xfb\xfd\
+\x73\x6f\x59\xff\xa4\xff\x7f\xff\x3c\xe3\x5b\x3c\x56\xd6\x48\xf9\
+\xeb\x7a\x89\xe2\xdf\xe4\xaf\x4f\xe5\x7c\xf5\xd7\xa7\xd3\x49\xfe\
+\x6f\xe4\xa7\x83\x76\x8f\x7d\xe9\x34\x9c\xff\x93\xf1\x9f\x7a\x0b\
+\x5e\xf9\x1a\xf3\xa2\xfc\x9f\xe8\xdf\x4c\x12\x72\xf7\xb7\x78\x62\
+\xac\x59\x09\x36\xdc\x67\xfc\x07\xfa\x2e\x1f\xbe\xfe\x10\xb9\x81\
+\x3f\xa3\xc2\x3a\xd4\x63\xf9\x55\xcd\x2c\x3f\x7d\xff\xa9\xcd\xec\
+\xd4\xfa\x9b\x89\x43\x76\xf8\x26\x7f\x38\x17\xfb\x3f\x6b\x7f\x3c\
+\xb0\x64\x46\x32\x01\xe2\xef\x39\xf6\x34\xa4\xff\x9c\xfd\xf5\xc2\
+\x3a\x9a\x4b\x00\x8e\x3d\xe1\xa9\x37\x48\x23\xdf\xc7\xa0\x80\x06\
+\xf6\xb1\x4b\xfc\x14\x35\x74\xfc\x9e\xcf\xac\x6f\x3f\x07\xeb\xe9\
+\x54\xff\x29\xd5\xb7\xf0\xfd\x9e\x83\xfa\x28\xfe\x87\xf7\xc3\x45\
+\xdf\xf5\x1e\x36\xe3\x83\xf5\xfa\xdb\xfe\x37\x19\x83\xca\x39\x99\
+\xf5\x5b\x4c\x99\x81\x0c\x5b\xe8\x79\x7a\x4a\x5f\xfe\x2d\xfb\x6f\
+\xdf\xaf\xf7\x5f\x44\x99\x49\x44\xae\xfa\x1e\x97\xa7\xe1\x1f\xe7\
+\xb0\x4e\xaf\xc1\xff\xa1\xff\xf1\xea\xd7\xfe\xc7\xb1\xff\x15\x07\
+\xe0\x9f\xcc\xe5\xcc\x64\x52\x9f\xc2\xf0\x6f\xf3\xbf\xe0\x3e\xde\
+\xaf\xfc\xf1\xa9\x17\x28\xdc\xf0\xb8\xf8\xe0\xd4\x38\xfc\x36\x17\
+\xff\xb2\xff\xf9\xea\xef\xf9\x9f\xdf\x31\xc4\xa0\xaa\x9c\xc4\x80\
+\xd0\x87\xb9\xe2\x2b\x70\x7e\x21\xff\xd0\xff\x36\xfe\xc7\xfe\xf7\
+\xa9\x71\x48\x3d\x9d\x57\x9b\x4e\x47\x87\x8d\xe7\x92\xc3\xda\x1a\
+\xce\x9c\x8e\x3f\x06\x7f\x88\x3f\x72\xc4\xfe\x18\x7f\xc0\xc7\xfc\
+\xef\xc6\x1f\x27\xf5\xe1\x58\x27\xb3\x7e\x92\x7b\x49\x07\x1f\xe7\
+\xf5\xa0\x69\x68\xb0\xb1\x64\xec\xaf\xf1\x97\xff\xaf\xe3\x2f\x84\
+\x6f\xff\x4f\x64\x9f\x2c\x88\xb5\x09\xc7\xd1\xf5\x67\x79\xad\xf9\
+\x3f\xc6\x7e\x6b\x08\xdb\xfa\x4f\xfb\xfc\x67\xe5\xf8\xff\x62\xb1\
+\xc8\xf6\x88\xfd\x62\xfa\x2d\xd2\x1a\x7c\x0c\x8e\x10\xb9\x7f\x44\
+\x1e\x70\xda\x17\x6b\x6d\xde\x03\xbb\x16\xe1\xcb\x21\x6c\xea\x3f\
+\x89\xbf\x61\x95\x48\xdf\xd3\x34\x3b\x00\x40\x83\x48\x27\x40\x01\
+\x00\xad\x12\x00\x90\x10\x04\x01\x00\x10\xe4\x5f\xc8\xa4\x7c\x6b\
+\xf7\x8d\x0f\x82\x27\x82\x37\x42\xc6\xf7\x54\x05\x5c\x36\x2b\xf0\
+\x7b\x8e\xe4\x7b\x9e\x02\xfe\xe9\x7f\xe3\xff\x64\xff\x6d\x05\x91\
+\x1f\x5c\xf6\xc4\x15\x42\xe4\x0a\x17\xdc\xb0\xbc\x97\x3c\xb0\xdf\
+\xc1\xe7\xf0\xff\xb5\x77\x2d\xd0\x6d\x54\x67\xda\xd6\xc3\x8e\x2d\
+\x29\x26\x21\x24\xe1\x51\xd2\xd0\xa5\x85\x6c\xa1\xd0\xf6\xb4\x50\
+\x0e\x64\xb7\x6c\x5b\x16\xda\x65\xa1\x4b\x39\xcb\x02\x05\x76\xbb\
+\xed\xe9\x02\xbb\x65\xdb\x6d\x7b\x0a\x89\x5f\x24\xce\x8b\x3c\x48\
+\xb6\xa4\x84\xc4\x90\x38\x90\xf8\x91\x84\xc4\x8f\xc4\x49\x70\xec\
+\xd8\x52\xe2\xa7\x64\x49\xb6\x4c\x82\x93\x58\x92\x65\xc9\xa1\xa1\
+\xbb\xed\x42\x21\xbe\x3b\xff\x48\xb2\xa5\x99\x91\xe6\xbf\xf3\x94\
+\x83\xee\x39\xdf\x31\x13\xec\x99\x7b\xef\x77\xdf\xf7\xff\xbf\xff\
+\xe0\xe8\x72\xab\x27\xb0\xda\xf6\x87\xe0\x2a\xdb\x45\xe6\xbf\x59\
+\xfb\x00\x40\xa8\xc2\x3a\x11\x58\x61\xfd\x28\x58\x61\x19\x1d\x2b\
+\xb7\xf4\xc0\xef\xb2\x7f\x03\x7f\xcb\xbc\x03\xde\xa5\xf7\x99\x63\
+\x36\x09\xa7\xc8\x8a\x39\xb6\x70\x49\xe1\xdf\x46\x4a\x6d\xab\x22\
+\x25\xd6\x36\x66\x8c\x08\x53\x9c\x67\xd1\x22\xcc\x7e\xa3\xc4\xb2\
+\x92\xfd\x26\xf3\x6d\xbd\xcb\xff\x69\x4b\xb0\xc6\x60\xfa\xe6\x37\
+\xc7\x4b\xad\x65\xe3\x25\xd6\x76\x86\x93\x8f\x55\xe4\x5b\x0c\x1f\
+\x43\x1e\xd8\xbc\x30\x79\x52\xf2\x7c\x36\x9b\xa6\x12\x33\x91\xe6\
+\x82\x8f\x5b\xec\x5c\xe3\xbc\x8e\x7c\x8b\xe1\x3c\xe4\x11\xf2\x0a\
+\x79\xd6\xbb\xde\xa6\x7b\xfa\x7d\xf9\x8c\x05\x31\x3f\x29\x5f\x06\
+\x70\x4b\x8b\x41\xc8\x3b\x94\x41\xef\x7a\x9c\x6e\x29\x52\x5c\xf8\
+\x65\x66\x4c\xad\xc9\x00\x0e\x15\x01\x5b\x16\xa6\x4c\x7a\xd7\x6b\
+\xa6\xa7\xb1\x72\xdb\x37\x98\x75\x5c\xbd\xde\x7c\xa9\x07\x5b\x3d\
+\x94\x51\xef\x7a\xce\xb4\xc4\xd4\xcd\x62\x06\x47\xf4\xe7\x47\x33\
+\x1c\x09\x97\x5b\xef\xd2\xbb\xde\xf5\x4e\xb1\x7b\xe9\xaa\x0c\xe0\
+\x43\x2f\x54\x29\x79\x96\x35\x5d\x12\xd8\xcb\x31\x73\xe2\xd3\x11\
+\x65\x35\x71\xa6\x2b\x3e\x80\xba\x50\xd3\x86\x30\x93\x12\xab\x55\
+\x52\x66\xed\xd6\xaa\x7e\x43\x2b\x6c\xe4\xdc\xa6\x22\x72\xea\x8d\
+\x59\x64\x68\xe7\x6c\x32\xb8\x7b\x36\xf1\xd6\x5d\x4e\xdc\x6f\x5f\
+\x49\x7c\xf5\xb7\x90\x77\xeb\xbf\x46\xdc\x75\xd7\x91\xee\x9d\x66\
+\xd2\xbb\x3d\x8f\xb8\xb6\xe5\x13\xcf\x96\x7c\xd0\x94\x03\xfb\x2b\
+\xed\xda\x01\x53\x27\x50\x37\x7a\xf3\xa3\x56\x62\xb5\x52\xca\xac\
+\x2f\x30\x65\xbd\xa8\x56\x1d\x82\xfd\xd8\xa9\xed\xb3\x48\xff\x81\
+\x39\xa4\xa7\x75\x9e\xa0\xae\x00\xdc\x35\x0b\xf9\x7d\x0c\x7b\x7f\
+\x4d\x0e\xd9\xe7\xf0\xee\x36\xc1\x8f\xac\xa5\xc1\x48\x1c\xbb\xcd\
+\xc4\xf3\x5a\x7e\x8a\xfb\x10\xc5\x70\x31\x5c\x6a\x7d\xfe\x52\x1b\
+\x0b\xa2\x76\x50\xd6\xc3\x8a\xf7\xed\x0a\x1b\x39\x5d\x79\x19\xe9\
+\xaf\x9f\x33\x65\xbf\x97\x06\xa0\x47\x08\x36\xea\xa9\xee\x79\xc1\
+\x76\x9d\xeb\x2b\x26\x04\xb8\x8f\x73\xd4\x98\x88\xf7\xd5\x7c\x26\
+\x0f\xe9\xec\xda\x25\xa3\x59\x8e\x8d\x65\x26\x25\x38\x17\x65\xca\
+\x13\x52\xac\x6e\xca\x2f\x23\xe1\xad\xb7\x91\x53\x87\x16\x93\x0e\
+\x27\x5e\x37\x04\xee\x78\x41\x57\x53\xcc\xce\x04\x34\x35\xb9\x7a\
+\x33\xe9\x50\xdf\x9a\x43\xce\x1c\xba\x9f\xcd\x53\xa4\xac\x48\xc9\
+\x36\x30\x0a\x75\xa7\x37\x7f\x52\x13\x9c\x7f\x32\x65\x58\xc2\x60\
+\x42\x91\xfa\x58\xbb\x90\xd5\xad\x0d\xbb\x57\x47\x6d\x73\x29\xfd\
+\x5d\x7d\x5e\x71\x3f\xf7\x38\xa2\x7e\x5b\x78\x7b\x9c\xa3\x8e\xcf\
+\x30\x79\xda\xc4\xe6\x0d\xf2\xc8\xe6\x55\x99\x36\x00\x75\xb7\x64\
+\xba\x9d\x25\x93\xcd\x39\xe6\xf1\x52\xcb\x36\x45\xea\x60\xc3\xe7\
+\xa3\x76\xd2\x09\x76\xbb\xce\xfe\x7b\xa9\xb8\xb7\x3b\x53\xdb\x8c\
+\xa5\x02\xf8\xba\xd1\xd8\x40\x0d\xb8\x12\xda\x97\x2f\x66\xa7\xbd\
+\xe1\x7a\x45\xda\xc1\x78\x99\x65\x2b\x29\x06\xd5\xe9\xcc\x4f\x51\
+\x5d\x36\xcb\x01\xd9\xe5\x7e\x99\xe1\xec\x9d\x67\x58\xfb\xa7\x64\
+\x6e\x36\xf2\xfc\x78\xd3\xcf\xf9\xf3\x49\xc0\xb7\x9c\x9a\xff\x51\
+\xdf\x1a\xd2\xd4\x51\x84\xe6\xff\xb0\x7d\xbe\x40\x5e\x37\xb1\x65\
+\x80\xb2\xc8\x6f\x07\x96\xfd\x7a\x6b\xf0\x8a\xa5\x0f\x8a\x67\xce\
+\x8e\xdd\xc9\x4a\x2f\xe7\x8a\x79\x24\xdc\xf4\x24\xeb\xa7\x29\xc4\
+\x8b\xc7\xfd\x10\x55\xdf\x77\xf5\x7f\x97\x9a\xfb\x38\x06\xfb\x7f\
+\x44\x35\x06\x80\xa6\x86\xe0\xbb\xa0\x2c\x8d\x4c\x99\x2a\xe6\xca\
+\x1b\x07\x98\xba\x85\x3a\xd6\x9b\x67\xa1\x34\x5e\x5e\x70\x35\x93\
+\x47\x8f\xf4\xf2\xd9\x48\xa4\xea\x6f\xd8\x39\x34\x1d\x27\xed\xce\
+\x6b\xf1\xfc\x33\xbf\x8b\xd3\x28\x48\x85\x4d\xa4\xb5\x73\x11\x9a\
+\x7f\xb0\xcd\x4f\xf7\xbe\x08\xac\x0f\xaa\xee\x8e\x96\x55\x7a\x3b\
+\xf0\x40\x5d\xeb\xcd\x77\x62\x82\x36\xc9\xe4\xcb\x2b\xb9\x4c\xeb\
+\xae\x23\x61\x07\x5f\xef\x95\x8b\xd3\xde\x9f\x51\xf5\xfd\x01\xcf\
+\xe3\x32\xb8\x8f\x7d\xd3\xf3\x1c\xd5\x18\x70\xce\x5b\x2c\xfe\x5e\
+\xa6\xac\x50\x66\x39\x6d\x20\x53\xc6\x01\x98\x93\xc0\xf7\x4a\x6a\
+\x59\xc2\xdb\xff\x0a\xa5\x81\x07\xb0\x3b\x17\xe1\xe7\xfd\xbe\xab\
+\x64\xf6\xfd\xa9\x31\x00\x7c\x2e\xd0\x76\xf8\x3d\x7f\x8d\x7b\x2f\
+\x94\xf9\x8d\xc5\x92\xdb\x00\xcc\x05\x7a\xaf\x07\x60\x9d\x2f\x79\
+\xad\x07\x3a\xc9\x07\xf1\x7b\xb2\xd0\xd0\x06\x9e\xf6\x46\x3a\xf4\
+\xba\x52\xeb\xc0\xd0\xc2\xe3\x7a\x0c\xcd\x7f\x53\x87\x8d\xdd\x9f\
+\xa2\xdf\xdf\xf4\x94\x90\xfe\x07\x12\x96\xfd\x7a\xed\x0b\x60\x4f\
+\x1a\x2e\xb3\x55\x4a\xca\xf7\xda\x05\x24\xd2\xb9\x94\x8e\x03\xf7\
+\x0f\xf0\x7d\x3f\x16\x33\x44\x29\xfe\x41\xf3\x9c\xab\x61\x24\x69\
+\x1d\x98\x02\x91\x93\x4b\xa2\x75\x22\x65\x1c\x80\xbd\xa1\x0e\xe7\
+\x03\x91\x32\xeb\x52\x49\xdc\x6f\xbc\x81\x84\x5d\x69\xf4\x9f\x52\
+\xa0\xc3\x79\x3d\x9a\xff\x13\xce\xd4\x3e\x87\x52\xd1\xd3\x73\x0f\
+\x9a\x7f\x47\xd7\xed\xf4\xdf\x60\xea\x24\xb2\xf1\x0b\x52\xe7\x83\
+\x25\x5a\x72\x3f\x5e\x62\xb9\x3b\x22\xe1\x5c\x2f\xbc\xf9\x56\x9e\
+\x0f\x34\x6a\xec\xf7\xad\x4d\xd2\x3f\x14\xc3\xd9\x01\x71\x4d\x60\
+\x5a\x80\x9e\x72\xdc\x17\x48\x0c\x0d\xed\x05\xcc\x98\xb1\x81\xfe\
+\x3b\x50\x37\x9b\x6f\x91\xc2\xff\x84\x56\x67\xc5\x70\x2f\x11\x91\
+\x72\x9e\x5f\x79\x07\x09\x0f\x4a\xa8\x13\x06\x6e\xf7\x83\x14\xe7\
+\xfc\xf4\xda\xaa\x58\x70\x35\x58\xd3\x61\xc8\xcd\xd7\xa4\x42\x81\
+\xa9\x23\xa8\x2b\x09\x6d\x60\x54\xed\x3b\xa3\x68\xbc\x0b\x09\xf7\
+\x78\xc0\xbd\x4f\xfa\x5a\xdc\xe1\xbc\x11\xcd\x7f\x97\xeb\x0e\xd5\
+\xf8\x77\xf5\x3d\x84\xe6\x3f\x49\x2b\x8d\x16\xe0\xd7\x29\xad\x0d\
+\x34\xab\x79\x77\x1c\x89\xde\xe7\xd0\x8f\xf9\x12\xfb\x7d\x1c\x6d\
+\x14\xf7\x7c\xc3\xde\x5f\xa8\xc6\xff\xc8\x40\x29\x9a\xff\x66\xfb\
+\x5c\x79\xdf\x83\x3a\x93\x32\x17\x94\x59\x5f\x50\x83\xfb\x58\x8c\
+\x21\x3a\xdb\x0d\x58\xeb\x49\x98\xef\x13\x01\x7c\xa2\xc7\x7e\x17\
+\xbd\xae\x33\x2d\x0e\x3b\xae\x44\xb7\x81\x91\x41\x84\x46\x77\x3a\
+\x80\x6f\x39\xc7\xe7\x17\x81\x8b\x4a\xdb\x11\xc5\xc6\xfd\x1e\xaa\
+\x7c\x30\xfb\x19\x29\xeb\x7c\x2e\x40\x27\x00\xbf\xee\xff\x92\xea\
+\xfc\x77\xf7\x7e\x07\xcd\xbf\xdb\xf9\x88\xfc\x6f\xc2\xbe\x80\x76\
+\x6f\x58\x66\xed\x56\x72\x1e\x08\x97\x59\x9f\xa1\xfa\x3e\x9c\x67\
+\x50\xee\xef\x53\xa1\xbd\x6f\x21\x9a\xff\x41\xf7\x13\xaa\xf3\xff\
+\x9e\xe7\xe7\x68\xfe\xdb\x3b\x6f\x55\xe4\x9b\x50\x97\xb4\x67\x44\
+\x60\x53\xaa\x04\xf7\x31\x1b\x6d\x2a\x3b\x5d\x9a\x73\xbd\xf4\xd8\
+\xc8\xde\xdf\x62\xcf\x7c\xa8\xce\xdd\x24\x02\x74\x19\xb0\x67\x41\
+\x10\xaf\x96\x7f\x27\x2c\x11\xa0\x59\x4b\x37\x0f\x7c\xa0\x84\x6d\
+\x39\x33\x96\xec\xa4\xe2\x7e\xbb\x8c\x75\x2f\x07\xc3\x03\xbf\x44\
+\xf7\xfd\x8e\xbe\xeb\x55\xe7\x3e\x0e\x7b\xd7\x6d\xf8\x35\xc0\xc0\
+\x8b\xca\x7d\x9b\xa9\x5b\xca\x36\x50\x25\x8b\xfb\xa8\x5f\x0e\xfe\
+\x7b\x70\x8f\x87\xbc\xcb\xc1\x80\xab\x17\x9e\x0e\x3d\x4e\xe5\xda\
+\x9d\x18\xfa\x9d\xff\x88\xe6\x1f\x6c\x08\x14\xfb\x36\x68\xfb\x53\
+\xde\x1b\xca\xf1\x33\x8a\x80\x8e\x1b\xfa\x5b\x36\xd4\x1d\x2e\x0d\
+\x1c\xce\x2f\xa2\xf9\x1f\x72\xa7\x8e\x5b\xa9\x34\x86\x3d\xbf\x42\
+\xf3\xdf\xd5\xa3\xdc\x3d\x14\x0b\xb8\x3b\xa6\xb3\x1f\x38\x22\x85\
+\xfb\xa8\x2f\x26\x45\x3b\xdb\xa9\x70\x39\x87\xa6\xf4\xe9\x44\x01\
+\xf7\x3d\x43\x88\x78\x3c\x0a\x01\xee\x22\xeb\x8f\xe3\xe2\xbf\xa4\
+\xd3\xcb\x93\x0a\xb0\x93\xa1\xe1\xe6\x7c\xa9\xed\x76\xfa\xbe\x6f\
+\x6b\x40\x7f\x03\x6c\xb6\x44\xec\x76\xa8\xeb\x78\x70\x03\xcb\x2b\
+\x6a\xdf\xdf\x47\x1f\x8f\x4a\x2e\xde\x71\x2c\x40\xf1\x7f\xa0\xdd\
+\xcc\xae\x19\x15\xfd\x3e\xd8\x11\x31\x75\x4e\x31\x36\xd7\xd3\x71\
+\x5f\xf8\x15\x9a\xf6\x35\xd6\xf4\x43\xb6\x4f\x28\x89\xd3\xde\x7f\
+\x47\x8f\xfd\x10\x17\x05\xd6\xfe\x5a\x02\xe2\xa8\x60\xe7\x80\x73\
+\x03\xc5\xca\xe7\xa1\xe9\x09\xba\x75\x40\x69\xe1\xad\x58\xfe\xc3\
+\xa5\xd6\x3a\xec\x7b\x47\x5e\xa6\x8f\x9d\xab\x34\x0e\x9d\x28\x40\
+\x73\x71\xa9\x20\x51\x73\x13\x03\xd0\xa0\xc0\x70\x7f\xf6\x15\xeb\
+\x22\x9a\x76\xd5\xd7\x4c\x1f\xfb\x4d\x69\x34\x74\xa8\x1b\x8b\x2d\
+\x53\x71\x7c\xaf\x09\xcd\x13\x3b\x06\xbc\x94\xff\x17\x62\xfc\x0f\
+\x54\x15\x0d\x63\xdf\xc7\xc6\xcd\xd6\x99\xfb\xe3\xfd\xf3\x75\xe7\
+\x41\x4f\x70\xe3\xec\xa5\xc3\xc0\xef\x66\xa4\xdd\x0b\xb4\xb9\x8a\
+\x66\x05\x5e\xc2\xfb\x33\x3a\x9b\xae\xd0\x9d\xff\x96\xde\xcb\x75\
+\xe7\x40\x4f\x74\xd4\xe1\xc7\x80\x91\xd5\x85\x13\x1d\x1d\x39\x05\
+\xa9\xf8\x77\xd6\xcd\x2c\xc7\xbe\x2b\xb0\x76\x26\xe9\xd0\x99\x7b\
+\xc0\xd1\x6e\xbc\x8f\xce\xa5\x08\x88\xb5\x79\x8e\xc2\x27\xdd\x55\
+\x39\xe3\xc9\x54\xfc\x9f\xd9\x64\x43\xdb\x71\x7b\xde\x16\x8f\xa9\
+\xa0\x05\x9a\x3b\xf1\x76\x99\x97\x2a\x3a\x77\x99\xd1\xfc\x9f\x5d\
+\x5d\xb8\x4f\x88\x7b\xd0\xae\x0c\x97\xe1\x62\x01\x85\xcb\x6d\xc4\
+\xd1\x8d\xb7\xc9\x50\x13\x07\x4f\xa8\x17\xc7\x76\xba\xa0\xf1\x9d\
+\xe4\x58\xc7\x69\x51\x66\x7d\x5f\x48\xa7\x34\x66\xd3\x89\x7a\xc7\
+\xf0\x6b\x97\xe9\xce\x7b\x1c\x8d\x32\xe2\x16\x5c\x4a\xf0\xfd\x76\
+\x06\x7a\x0c\x10\xb2\x15\x1d\x2f\xb1\xa2\xe7\x7e\xe7\x21\xfd\xd7\
+\x7d\x71\xa8\x1d\x47\x7c\xba\x80\x66\x2f\x08\x7a\xc5\x5c\xfe\xb1\
+\x3e\x5c\xa0\xa7\xd4\xa1\xf3\x79\x4f\x1c\x9f\xf6\xbd\x5f\x22\x40\
+\x87\x64\x74\x39\x4e\xaf\x0a\x7c\xc7\x12\xb9\x07\x1d\x73\xe6\xdf\
+\x3f\xc1\xfc\xed\xb9\xca\xeb\xd9\x58\xe6\x6a\x22\x1e\x97\x47\x0c\
+\x60\x17\xea\xeb\xff\xb1\xae\x38\xd8\x71\x19\x8a\x9f\xb6\x93\x8b\
+\x54\xcf\x4b\xa0\xf2\x66\xec\x18\xf0\x71\xa2\x76\x7d\xb8\xac\xf0\
+\x5e\xec\xd8\x11\x51\xcc\xb6\x27\x35\xda\x63\x71\xd1\x44\xfb\x7f\
+\x9f\x7a\xb6\xfe\x58\x1c\x3b\xf9\x79\xdc\xf8\xdc\x79\xb3\xea\x79\
+\x89\x1c\xc2\xdb\x08\x41\xfc\x82\xc9\xfe\x0f\xb1\x13\xb0\x7f\xd7\
+\x47\xaf\xa5\x41\x8b\xe3\x7d\xc8\x7b\x5f\xa7\xf2\x77\xab\xb4\xb0\
+\x77\x7d\x15\xc5\x7f\xcb\x89\xd4\x71\xd6\x15\x43\xdf\x32\x34\xff\
+\x10\xc3\x62\x92\xff\x68\xdc\x0c\xf1\xbf\x49\x13\x4b\x50\x51\xfe\
+\x91\xfa\x2e\x0e\xe7\x4d\xba\xf3\xdf\xd5\x7d\x37\x8a\xff\xc3\x8e\
+\xab\x34\xc9\x0f\xda\x56\x98\xe1\x7c\xaa\xff\x5b\x23\xa8\xbf\xa9\
+\xba\x5b\x1b\xfe\x91\xf7\xfe\x9d\xae\xdb\x74\xe7\xdf\xd9\xf7\x00\
+\x8a\x7f\x58\x27\x68\xc2\x7f\xd5\x37\xb1\x63\x40\x18\xb8\x8f\x69\
+\x77\xe0\xc6\x7e\x0d\xe6\x7e\x96\xff\x7e\x1c\xff\x5a\xda\xfc\xa5\
+\x02\xd6\x16\xb0\xbe\x3d\x4f\x9b\x3c\x81\x9e\x00\x92\x4f\x36\x4e\
+\x56\xa9\xed\x76\xf4\x9c\x61\x57\xd6\xbe\x4f\x08\x60\xc7\x85\xdd\
+\xff\x81\x0e\x9c\xde\xfc\x0f\xf4\x3f\x85\xde\xa3\x8d\x0d\xbd\xac\
+\x7a\x7e\x22\xf6\x5f\xa1\xf9\x87\xb8\x66\xe1\x52\xdb\x13\xe8\xfe\
+\xef\x7e\x49\xf5\xfc\x9f\x1b\x58\x8a\xe6\xdf\xdd\xff\x7d\xdd\xf9\
+\x07\x3f\x5f\x2c\xff\x10\xa7\x59\xf5\x3c\xb9\xd7\xa0\xf9\x67\xe3\
+\xe3\x95\x5a\x96\xa3\x7e\x7f\xa5\xfa\xbe\x75\x80\xf7\x28\x34\x9e\
+\x7c\x1e\xf5\xfd\x7d\xc4\x70\xda\xf3\x9f\x68\xfe\xcf\x0d\x94\x68\
+\x92\xa7\xc8\xca\xf9\xc8\x3d\x60\x34\x36\x22\x8a\xff\x57\xd4\xdf\
+\xbf\x02\x4e\x79\x9f\x46\xf3\x0f\xbf\xab\x37\xff\x89\xf1\x71\xc5\
+\x70\xc6\x2b\xae\x3f\xac\x08\xff\xbf\xbd\x09\xd7\xff\xa3\x71\x31\
+\x0f\x25\xfd\x7b\x39\x83\x65\x02\xe7\x88\x55\x48\x5d\x2b\x99\x80\
+\xb8\xdc\x58\xfe\x13\x63\xf5\xea\x05\x1a\x9f\x70\x88\x13\xae\x09\
+\xff\x0c\x57\xa8\xfe\x5f\x6a\x3d\x08\x31\x84\xe1\xbf\x43\xeb\x67\
+\x10\xff\x2e\x03\x99\x8a\x8f\x9c\x4b\x46\xb7\xe4\x45\xdb\x03\xfc\
+\xee\xee\xfb\x34\xc9\x3b\xe8\x34\xa3\xf9\x1f\x50\x7f\x3d\x2a\xce\
+\x7f\x39\x9a\xff\x61\xef\x2f\xb5\xe1\x7f\xd7\x7d\x58\xfe\xe1\xce\
+\xc7\x3d\xba\xc5\x2c\x18\x7f\x99\x8d\x4f\xcd\xb4\x89\x48\xb9\x85\
+\x84\xeb\x1e\xd0\x24\xef\x83\x9e\xc7\xd1\xfc\x63\xf4\xdc\xd5\x06\
+\xc4\x83\xc7\xf2\x0f\xbe\xc3\x9a\xf0\xcf\x70\x85\xe2\xbf\xcc\xda\
+\x1f\x5a\x57\x30\x96\x8a\xfb\xc9\x98\xf1\xdb\xcc\x24\xbc\xff\x61\
+\x4d\xf2\xee\x75\x3f\x82\xe6\x7f\x64\x50\x9b\xf5\x54\x3a\xc0\x9a\
+\x1e\xcb\xff\x29\xf7\xcf\xb4\xe1\xff\xed\x87\x91\x7b\x00\xdb\x19\
+\xff\x0e\xe3\x9f\xc5\xf8\x07\x84\x1b\xff\x49\x93\xbc\x7b\xdc\x0f\
+\xa3\xf9\x0f\x0c\x2e\xcb\x00\xfe\xd7\x50\xf0\xff\xac\x36\xf9\x6a\
+\x7c\x1c\xbb\x07\x3c\x0f\xf3\x3c\x86\xff\xb1\xa6\xbf\xd3\x24\xef\
+\xee\x7e\xbc\xd6\xd7\xe8\xe0\x2a\xdd\xf9\x0f\xf9\xd6\xa1\xf9\x1f\
+\x72\xff\x9b\x36\xf9\x3a\xf4\x2f\x58\xfe\xff\xec\xdf\x27\xce\x3d\
+\x60\xb4\x49\x9b\xf5\x7f\x96\x7f\x8d\xf9\xdf\x93\x3b\x81\xe2\xbf\
+\x5e\x82\xa6\xa5\x04\x64\xc7\x7f\x05\x40\x33\xfe\xd7\xe5\x7e\x8c\
+\xe1\x3f\xf8\xb6\xf2\x9a\xaa\x42\xc8\xae\xff\xe4\x83\x6a\xfd\x57\
+\x6d\xf8\x10\xc5\xff\x5e\xfa\x18\x3a\x52\x90\xdd\xff\x29\xc0\x3f\
+\xc5\xfe\xcf\xbf\xcb\xf0\x3f\x28\xfe\xeb\xae\xd3\x24\xef\xd9\xf3\
+\x1f\x05\xf8\xa7\x38\xff\x09\xec\x32\x8c\xa3\xf8\xaf\xd5\xe6\xfe\
+\x27\x7b\xfe\xab\x00\xff\x14\xe7\xbf\xfe\x9d\xc6\x11\x0c\xff\x81\
+\x1a\x8b\x26\x79\xcf\xde\xff\x28\xc0\x3f\xc5\xfd\x8f\xff\x75\x93\
+\x1d\xc3\xbf\xbf\xce\xa0\x49\xde\xb3\xf7\xbf\x0a\xf0\x4f\x71\xff\
+\x1b\xa8\x34\x6f\xc1\xf0\xcf\x9e\x01\xb9\x14\xd4\xb2\x4b\x81\xac\
+\xfd\x87\x4c\x50\xda\x7f\x84\xb6\x99\x7f\x84\xe6\xbf\xf5\x87\xaa\
+\xe7\x3f\x6b\xff\x25\x0f\xb4\xf6\x5f\x63\x9b\xf3\x3f\x87\xe5\x7f\
+\xb4\xe1\x2e\x4d\xea\x34\x6b\xff\x29\x03\x94\xf6\x9f\x60\x03\xec\
+\xaf\xcb\xbd\x88\xdb\x03\x68\xa3\xb3\x96\xb5\xff\x96\x0e\x5a\xfb\
+\x6f\x48\x81\xb7\x0c\x1f\xa0\xd6\x80\xb5\x66\x6d\xf8\xcf\xfa\x7f\
+\x48\xe7\x5f\x82\xff\x47\x70\xbb\xe9\x24\x7a\x0d\xd0\xfd\x2b\xf5\
+\xf9\xcf\xfa\x7f\x49\x83\x44\xff\xaf\xc0\x36\xd3\x52\x2c\xff\xa1\
+\xc6\xc5\xaa\x97\x23\xeb\xff\x29\x0d\x92\xfd\x3f\xb7\x17\x5e\x89\
+\xe5\xff\x6c\x75\x3e\x53\xef\xd7\xaa\x0b\xe4\xfc\xdf\xea\x9c\x4b\
+\x5a\x4f\x2e\xd2\x15\xf5\xc7\xf3\x90\xf3\xff\x2c\xd5\xf3\x72\xea\
+\x35\xb4\x26\x6c\x92\xff\x37\x3b\x06\xec\x36\xfc\x01\xd5\x06\xf6\
+\xe4\x92\x0e\xe4\xfc\xac\x36\xb2\xfa\x0f\x09\xfb\x0b\x19\xfa\x0f\
+\xec\x1a\xe0\x75\xd3\x71\xec\x18\x30\xd0\xa4\xbf\xee\x63\x1c\x59\
+\xfd\x97\x28\xe4\xea\xbf\x8c\x6d\x35\xfd\x1c\xcb\xff\xb9\x6a\xb3\
+\xee\xbc\xc7\x91\xd5\x7f\x8a\x42\xae\xfe\xd3\xbb\x3b\x72\x66\x62\
+\x6d\x81\xc0\x66\xec\x64\x97\xfe\xba\xbf\x80\xac\xfe\x1b\x9d\xfe\
+\x1b\x68\xfc\x09\xe9\xbf\x41\x1a\x79\xd3\x24\x6a\x0b\x1e\xc7\xd0\
+\xdb\x56\xdd\xb9\x07\x64\xf5\x1f\x29\xf5\x1f\xd7\x14\xee\x17\xe2\
+\x1e\xd2\xa9\x5d\xf9\x2b\xb0\xfc\x8f\xd4\x18\x88\x3d\x03\xf8\xcf\
+\xea\xbf\xd2\xe9\xbf\xfa\x36\x17\xfe\x7d\x2a\xfe\x09\xc9\x31\x01\
+\xaf\xe8\x75\x60\xc3\x4c\xdd\xf9\xcf\xea\x3f\xe3\xd7\x7d\xfe\x55\
+\x85\x1f\x31\x1c\x1b\x52\xf1\x0f\x69\xf8\xad\xbc\x41\xfc\x18\x60\
+\xd4\x9d\xff\x4f\xfb\x1e\x90\x46\xff\xfd\xbd\x75\x85\xbf\x4b\xc7\
+\x3d\x24\x66\x1f\xf0\x0d\x34\xff\x0c\xbc\x19\xb0\x17\xcc\xc6\x7f\
+\xc0\xe1\xf7\xe5\x33\x16\x88\xf1\x0f\xc9\xbf\xd3\x18\x40\xb7\x81\
+\x6a\x13\xb1\xf7\xde\xc0\xc6\xe0\x51\x12\xed\x48\x0d\x48\x40\x6b\
+\xf7\x42\x72\xb2\xfb\x4e\x4d\x81\x3d\xf7\x05\xb4\x75\xfe\xa5\xf2\
+\x79\xe8\xba\x93\xf8\xd7\xcf\xa5\xd9\xf3\xa3\xe2\xbf\x40\x0a\x6e\
+\xcd\x7b\x94\x66\x0c\x18\x6d\xb8\x53\xf1\xb3\xec\x61\xef\x73\x68\
+\xfe\xed\x4e\x6d\x6c\xd3\x13\x71\xa2\xfb\x2e\x34\xff\x60\x23\xaa\
+\x78\x1e\x9a\x9e\xa4\xea\xfb\x91\xe2\xc2\x2f\x63\xf9\x87\x14\x78\
+\xcb\x18\x46\xb7\x81\x3d\x06\x32\xe6\x52\xb6\x8c\xd9\xf8\x6f\x69\
+\xa0\x72\xfc\x37\x48\x63\xaf\x99\x7f\x42\x33\x06\x04\x6a\xaf\x51\
+\xbc\x8e\xb3\xf1\x1f\x85\x41\x1b\xff\x11\x62\x79\xd2\xf2\xcf\x8e\
+\x01\xbb\x0c\xef\xd3\xb4\x81\x50\x9b\xb2\xf6\xb8\xd9\xf8\xaf\x02\
+\xd0\x28\xfe\x2b\xa4\xd0\x56\xf3\xb3\x34\xfc\xfb\x6b\xcc\x24\xec\
+\x55\xce\x27\x37\x1b\xff\x99\x03\x8d\xe3\x3f\xb3\x63\xc0\x4e\xe3\
+\x19\xba\x79\x60\xbe\x72\xfd\x2c\x1b\xff\x3d\x19\x1a\xc7\x7f\x87\
+\xe4\xff\x9d\xf9\x16\xff\x5e\xdc\xbd\xd0\xd4\x7e\x40\x29\x3b\xe1\
+\x8d\xa4\x0d\xb9\x06\x04\x9b\x11\x88\x8b\xaa\x36\xf7\xb0\x96\x6b\
+\xec\xc0\xdd\x39\x34\x75\x14\x31\x7f\xb3\x49\x99\x6f\x1f\xc4\xdb\
+\xf6\xc4\xf0\x41\xb8\xd8\x32\x5f\x2e\xff\x90\x82\xaf\x9b\xaa\x69\
+\xf8\x1f\xd9\x97\x4b\xc6\xec\x3f\x55\xa4\xdc\xed\x7d\x0b\xd1\x63\
+\xc0\xa0\x5b\x7d\x7f\x20\xf0\xe1\xc5\xf6\xfd\xf6\xce\x5b\x15\xf9\
+\x66\xa4\x73\x29\x89\xbc\x38\x8b\x8a\x7f\x66\xbf\xff\xb4\x12\xdc\
+\x43\x22\xbb\x73\xf2\xfc\xbb\x0d\x7f\xa2\x5a\x0b\xd4\x9a\x48\xb8\
+\x77\x89\xec\xb2\xf7\xb8\x16\xa3\xf9\x3f\xe1\xfc\x92\xea\xfc\x77\
+\xf7\x7e\x07\xcd\xbf\xdb\xf9\x88\xfc\x6f\xba\x56\xe2\x6d\x7a\xe3\
+\x28\xb3\x76\x33\x9c\x19\x95\xe2\x1f\x52\x60\xab\xf9\x49\xaa\x31\
+\x00\xd6\x02\x35\x33\x98\xbd\x6a\x85\xac\xf2\x0f\x7b\x7f\x81\xe6\
+\xbf\xcd\xa5\xbe\x8f\xf2\x61\xc7\x95\xf8\xb9\x7f\xb0\x4c\xde\xf7\
+\xbc\x6b\x49\x64\xe3\x0d\xb4\xe3\xfe\xc5\xf1\xf2\x99\x5f\x53\x92\
+\xfb\x78\x62\xe6\x81\xa3\xb4\x6d\xc0\x5f\x63\x63\xd6\xad\xf2\x74\
+\xa3\x21\xce\x0f\xb6\x0d\x40\x7b\x51\x8b\x7b\x1a\x5f\xef\x66\xfb\
+\x5c\x79\xdf\x1b\xdc\x40\xc2\x9b\x6f\xa1\xe5\x1e\xfa\xfe\x0b\x6a\
+\x70\x0f\x89\x9d\x07\xde\x32\x9c\xa7\x6d\x03\xc1\x9a\x39\xd1\xf2\
+\x48\xac\x0b\x87\xf3\x46\x34\xff\x5d\xae\x3b\x54\xe3\xdf\xd5\xf7\
+\x10\x9a\xff\x93\xdd\x32\xf6\xa3\xcc\x1a\x33\x52\x79\x07\x3d\xf7\
+\xa5\xd6\x66\xa5\xc7\x7d\x6e\x1a\x79\x35\xef\x66\xac\xbf\x18\xb7\
+\x0d\x8c\x0d\xac\x95\x54\x1f\x6e\x37\x5e\x13\xac\xcd\xa9\x9e\x4f\
+\xc0\xb1\x13\x5f\x40\xf3\x0f\x7e\xc1\x52\xfb\xbd\x44\xee\x47\xc7\
+\x5e\xb4\xcc\x53\x93\xfb\x78\xa2\xb1\x15\xe5\xcd\x05\x12\xd6\x03\
+\x21\xdf\x5a\xb4\x4f\x00\xe0\xec\xc0\x6f\x14\xe7\xde\x3f\xb8\x8c\
+\x1c\x68\x37\xa0\xb8\x6f\x68\x2f\x60\xf6\x89\x12\xc6\x3b\x66\xbe\
+\x97\x34\xe6\x97\x5a\x27\x84\x6c\x3a\xd5\x4c\xc1\xed\xa6\x77\xa4\
+\xb4\x01\x76\x4d\x28\x61\x5f\xd0\xe1\xbc\x9e\x62\x1f\xa0\xbc\x56\
+\x59\x4f\xcf\x3d\xe8\xbe\xef\xe8\x92\xa0\x95\x07\xeb\x7c\xfa\xb5\
+\x5e\x1c\x4b\xb4\xe4\x1e\x12\xd8\x11\xf9\x77\x1a\x4f\x49\x1a\x07\
+\x98\xbd\x21\xed\xf9\x80\xc7\xfd\x03\x34\xff\x30\x56\x84\x7c\x6b\
+\x14\xe3\x7e\xcc\xb7\x1e\x7d\xe6\x03\x78\xd7\xfd\x0c\xd5\xfb\xd9\
+\xfd\x3d\xed\x1e\x6f\x72\x9f\x6f\xd9\xc6\x70\x91\xab\x35\xff\x90\
+\x82\x9b\x73\x0a\x03\x6f\x1a\xd0\x36\xc3\xdc\x33\x22\x9a\x73\x42\
+\xb8\x73\xa3\x99\x03\x7a\x5d\xca\xdd\xbb\x78\x5c\x8f\xa1\xb9\x6f\
+\xea\xb0\xd1\x9d\x43\xc2\xb9\x1e\xe5\xd9\xce\x14\x2c\xfb\xc9\xe6\
+\x1c\xb3\x1e\xdc\x27\xb4\x81\x39\x68\xdf\x31\xa1\xf9\x00\xee\x0b\
+\x90\x77\x46\x76\xe7\x22\xfc\x18\xd0\x07\xfe\xd6\x4a\x9c\x07\x6f\
+\x22\x47\x1c\xd7\xa0\xf9\xef\xec\x41\xea\xe4\x0e\xac\x97\x72\x9e\
+\x3f\xd5\xef\x4b\xac\xed\xc1\xe2\x9c\x42\x3d\xb9\x8f\x27\xd0\x10\
+\xf1\xd7\xe0\x74\x24\x85\xd7\x85\x66\xd4\xdd\xf1\x69\x0a\x6d\x28\
+\xc0\x80\xe7\x71\xd9\xfc\x9f\xf6\x3c\x87\xe6\x1e\x70\xce\x5b\x2c\
+\xfe\x5e\xb8\xc3\xa5\xbc\xc7\xe3\xc0\x03\x71\xfb\xf4\xe6\x3d\x31\
+\x05\x2b\xcd\x5f\x91\xd3\x06\xa2\x63\xc1\x35\xa2\x76\x44\xed\xce\
+\x6b\xf1\x6d\x80\xf9\x5d\x79\x63\xc0\x26\xd2\xda\xb9\x08\xcd\x7d\
+\xdb\xc9\x2f\xa6\x7f\x1f\xd8\xed\xb0\xb6\x1b\x54\xf7\xf7\x3c\xee\
+\xc7\xcb\x0b\xae\xd6\x9b\x6f\xa1\x04\xe3\x80\x9c\xb9\x80\xc5\x1e\
+\x43\xd4\x9e\x70\x50\x98\x37\x8f\xfb\x21\xaa\x31\xc0\xd5\xff\x5d\
+\xc9\xfc\xc3\xdd\x3d\x4d\xdf\x4f\xb9\xee\xf3\x6d\x8a\xda\xeb\x51\
+\xd9\x6c\x09\x8f\xf9\x99\xd6\xef\xb9\x89\x5d\x0f\x48\x5d\x13\x26\
+\xed\x13\x0b\x48\xe8\xf0\xf7\x78\xfd\x17\xd6\x56\x6d\x14\xfe\xe7\
+\xc7\x9d\xf3\x49\xc0\x47\x1f\xb3\x7a\x94\xd9\x3f\x1c\xec\xc0\xfb\
+\x16\x1d\xb6\xcf\x27\xfc\xbb\x5e\xe6\xb9\xe5\x19\x66\x5f\x77\xa3\
+\x2c\xde\xe3\x6b\xbd\x4c\x99\xef\xc5\x12\xec\x0b\xa4\xee\x0d\xf9\
+\x6b\x83\x7c\x12\x6a\xfa\x56\xd2\xf9\x31\xe8\xbe\xd1\x8c\x01\x52\
+\xec\x83\xe1\xfc\x96\xa6\xef\x0f\xb8\x12\x62\xe3\x82\xbd\xe7\xe1\
+\x9f\x90\xc8\x86\xeb\x15\xe0\x3d\xb6\xc7\x2b\xce\x31\xe9\xcd\x2b\
+\x4d\x82\xf3\x01\xa9\x67\x44\xc2\x67\x06\x66\x32\x7a\xe0\xeb\xec\
+\xfa\x00\xc6\x00\xac\x46\x14\x3b\x06\x30\x00\x5d\x69\x2c\xf7\xef\
+\x79\x7f\xc9\x70\x8a\xd7\x15\x38\xea\xf8\x0c\x93\xa7\x4d\xd1\xf9\
+\xbd\xe1\x31\xb9\x6b\xbb\x44\x4c\x44\xca\xac\x4b\xf5\xda\xdf\x2b\
+\x91\xe0\xac\x58\xca\x7d\x41\xca\x76\xb0\x0f\xe6\x86\xcb\xc9\x70\
+\xd3\x17\xa9\x74\x48\xe0\x0e\x11\xa3\x17\x1f\x18\xa8\x20\x07\xed\
+\xb3\xd1\xdc\x1f\x68\xcb\x21\x67\x9a\xef\x27\x91\x6d\xb7\x93\x48\
+\xf9\x65\x4a\xf1\x0e\x08\x69\x7d\xa6\xab\x56\x62\xef\x8c\x24\xdc\
+\x1b\x8a\xaf\x15\x73\xc9\xd9\xea\x3c\xe2\x3b\x60\x23\x5d\x8e\x39\
+\x88\xb5\xc0\x55\xc4\xef\x4b\x7d\x27\x1f\xf4\xad\x22\x47\x4f\x5c\
+\x2b\xca\xf9\xc1\xc3\xb9\xc4\x51\x63\x22\xde\x57\x99\xb9\xa9\x62\
+\xa6\x92\x9c\xc7\x71\x58\xab\xbb\x1c\xad\x12\xdc\x1d\x4b\xb1\x1f\
+\xa0\x42\xad\x81\x9c\x61\xd6\x0b\xd0\x1e\xfa\x8f\xcc\x26\x27\x04\
+\x34\x2a\x60\xde\x18\xf2\xfe\x98\xc7\xfd\xb0\xf7\xd7\xe4\x90\x7d\
+\x0e\x8f\xeb\xc6\x96\x5c\xf2\x4e\x83\x91\x38\xaa\xcd\xc4\xb3\x25\
+\x9f\x8c\xac\xc2\xfb\x5b\x4a\xc0\x45\xb8\xbf\x57\xfb\x0e\x57\xcf\
+\x04\x76\x44\xb4\xb6\x64\xb2\xe6\x8b\xba\x5c\xd6\x47\x11\xda\xc5\
+\x70\xed\x0c\x72\x7a\x4f\x21\x79\x77\x6f\x21\x19\xda\x57\x44\x4e\
+\xd5\x2f\x20\xa7\xeb\x17\x11\x4f\xdd\x42\xd2\xf5\xa6\x99\xf4\x6e\
+\xcf\x23\xce\xca\x7c\x96\xe7\xd3\x1b\x0a\x48\xb0\x02\xa7\xa7\xa4\
+\x08\xca\xac\xdd\x6a\xd9\xed\x64\x5a\x8a\x8d\x05\xd5\xb4\x76\xc5\
+\x6a\x02\x62\x5c\x42\x9c\x53\xcd\xf8\x9e\xc2\x07\xe1\x32\xeb\x33\
+\x97\x72\x9f\x4f\x95\xc0\xb6\x9c\xd6\xbf\x40\xd5\xb1\x62\xb7\x61\
+\x32\xde\xb1\x46\x7d\x7e\x67\xe4\xc5\xc2\x2b\xf5\xe6\x41\xef\x04\
+\x7e\x46\xb4\xbe\x66\x6a\x81\x8d\x79\xad\x3e\xf7\x47\x19\x2c\xd6\
+\xbb\xde\x33\x2d\x05\xb7\x98\x7f\x4c\xe5\x77\xac\xc6\x18\x50\x9b\
+\xab\x22\xef\xb6\x06\xa9\xbe\x98\x9f\xa6\x14\xda\x92\xf7\x08\x95\
+\x06\x85\xc2\x88\x2c\x53\x76\x1d\x10\x2e\xb5\xd6\xd2\xfa\xdf\x67\
+\x53\x54\x8b\xc6\xff\x86\xa9\xd9\x5f\x93\xfb\x91\xa6\xfc\x2b\xb3\
+\x06\xf0\x31\xeb\xba\xdf\x60\x35\x57\xb2\x29\x75\x82\xb3\xe4\xd0\
+\x16\xf3\x53\xc1\x1d\xa6\xfe\x11\xa4\x46\xa5\xe4\xf1\x7f\x97\x41\
+\x0e\xe7\xe7\x99\xbe\xbe\x69\xbc\x74\xe6\xd7\xa7\xf3\x99\x6d\x26\
+\x27\xd0\x29\x85\x33\x65\xd0\x2b\x96\x7d\xd7\x2c\x80\xd0\x7a\xbc\
+\x8e\x2a\x83\x4f\x20\x86\xe2\x78\x89\xb5\x7c\xbc\xc4\x72\x77\x2a\
+\x5d\xcd\x6c\x52\x2f\x81\x76\x3d\xc4\x2f\x08\x6e\x37\x75\x42\x1c\
+\x13\x39\x77\x0d\xa3\x5b\x44\x75\x34\x23\x10\x37\x83\x59\xc7\xad\
+\x0a\x97\x15\xde\xcb\xd5\x50\xcf\xa6\xcc\x48\x60\x87\x02\x71\xcd\
+\x20\xb6\x1d\xc4\x37\x84\x18\x97\x10\xe7\x14\xce\x1d\xfd\xd5\x86\
+\x8b\x70\x4e\x0c\x77\x07\xfe\xd8\x7a\xdf\x5f\x65\x22\x81\x8d\x05\
+\x1f\x07\x97\x5b\x42\x63\xe5\x96\x5e\xa6\x4f\x1f\x82\xd8\x88\xe1\
+\x52\xcb\xf2\x70\xa9\xed\x89\xf3\xa5\xb6\xdb\x33\xdd\xee\x42\x6a\
+\x22\x6c\xfa\x30\x27\x67\x01\x49\x48\x53\xff\x87\x4d\x17\xe0\xb9\
+\x68\xea\xb9\x18\x9e\x73\x27\x1f\x27\xa2\xaf\x5a\x1a\x7f\xfe\x30\
+\xfa\x3c\xf9\xc6\x33\xd1\xe7\xfc\xa4\x3f\x9f\x7a\xc1\x44\x3c\x2f\
+\x4b\x93\xfe\x7c\xf2\x05\x17\xe2\xcf\xb1\x1c\xb4\xc4\x9f\x8d\x49\
+\xaf\x9b\x7c\x21\xa7\x70\x9f\x4c\x3d\x2f\x4e\x7a\x7d\xec\x03\x17\
+\xa6\x9e\x8b\x12\x72\x3b\x99\xe3\x96\xa9\x67\x63\xd2\xe7\x62\x1f\
+\xe4\xd4\xe6\x44\xe2\xf3\xd2\xa4\xcf\xb3\x19\xe0\x3e\x7f\x98\xf8\
+\xbc\x20\x29\x3b\x6c\x86\xce\x24\x3e\xe7\xf3\x9f\x5b\x12\x9f\x8d\
+\x49\xd9\x63\x33\xc8\x7d\xce\x49\x4a\xbc\xe7\x89\xe4\xe7\xa5\xdc\
+\xe7\x4f\x92\x9f\x17\x73\x9f\x3f\x4c\x7e\x5e\xc0\x7d\xbe\x90\xfc\
+\x5c\xc4\x7d\x3e\x93\xfc\x9c\x2f\xf6\xdc\x92\xfc\x6c\xa4\x7d\x2e\
+\x4e\x7e\xce\x95\xfb\x9c\x93\x4d\xaa\xa6\xe2\xe4\x47\xd9\x7c\xb5\
+\x24\x3f\x53\xb7\x9f\x33\xc9\xcf\xf9\x62\xcf\x62\xed\x5f\xac\xff\
+\x88\xf5\x3f\xb1\xfe\x2b\xd6\xff\x45\xc7\x8f\x96\xc4\x67\xa3\xf8\
+\xf8\xc4\x1d\xcf\xb8\xe3\x9d\xd8\xf8\xc8\x1d\x4f\xb9\xe3\x2d\x6f\
+\x3c\x4e\xc8\xa0\x51\x68\x3c\xe7\x8e\xf7\xdc\xf9\x80\x3b\x5f\x70\
+\xe7\x13\xde\x7c\x33\xf9\x41\xa3\xf0\x7c\xc5\x9d\xcf\xb8\xf3\x1d\
+\x77\x3e\xe4\xcd\x97\xdc\xf9\x94\x3b\xdf\x72\xe7\x63\xde\x7c\xcd\
+\x9d\xcf\x13\xe6\xfb\x1b\x98\xff\xf3\x57\x39\xd1\x7e\x95\x9b\xf3\
+\xd9\xe8\x9b\x99\x7f\xb8\xdc\x12\x85\x56\x69\x74\x99\xf5\x0a\x66\
+\xcd\xf5\x20\xdc\x7f\x33\xd8\x11\x2e\xb7\x76\x87\x56\x58\xff\x18\
+\xaa\xb0\x4e\x84\xcb\x6d\x04\x30\xba\xdc\x7a\x31\xb4\xcc\xc2\xec\
+\xb1\x6d\x5d\xf0\x3b\xf0\xbb\xf0\x37\xc1\x62\xdb\x1c\xed\x72\xaa\
+\x4c\x82\xf3\x01\x38\x13\x64\xf6\x12\x6b\x98\x72\x38\x65\x9f\x37\
+\xc1\x3b\x4a\x6c\xab\xc3\xa5\x85\xb7\x66\xf2\xd9\x43\xb8\xf8\x0a\
+\x6b\xa4\xd4\xf2\x1c\x93\x67\x8f\x7a\xe7\xec\x56\x77\xa4\xcc\xf2\
+\x33\xf8\x96\xde\xe5\x8d\xa7\xf7\x2b\x66\x15\xc1\x79\x20\x9c\x11\
+\xa9\x58\x6e\xee\xb9\xf3\x38\x7c\x13\xbe\xad\x57\xb9\xa1\x2d\x8e\
+\x97\x58\x1e\x63\xf2\x33\xa6\x55\xb9\x05\x10\x1a\x2f\xb5\x3c\xaa\
+\x75\xbf\x18\x2b\x2e\xba\x8e\xf9\x76\x2b\x9a\xaf\x17\x6d\xe4\xec\
+\x6f\x8b\xc8\xbb\x3b\x66\x13\xcf\xbe\x39\xa4\xaf\x79\x2e\xe9\x3a\
+\x32\x9f\x78\xda\xee\x22\x43\x6d\xf7\x93\x13\x8d\x57\x93\xb6\xbd\
+\x26\x36\xde\x87\x7b\x6b\x3e\x39\xf5\x72\x01\xe8\xfb\xe1\xeb\xa1\
+\xc4\x7a\x2c\x54\x56\xb4\x50\x8b\xb2\xb3\x63\x79\xa9\xf5\x82\x68\
+\x9e\x56\xcc\x23\xc3\x3b\x16\x92\xde\xa3\x73\x49\x47\xdf\x7c\x8e\
+\xad\xd6\x35\x64\x74\x70\xca\x37\x30\xe4\x5b\x47\x5a\x39\x1a\x0c\
+\x07\x5a\x73\x48\xeb\x7e\x23\x39\xb7\xfd\x26\xac\x7f\xc5\x05\xc8\
+\x9b\x5a\xe5\x66\xe6\x62\x03\x33\xbe\xad\x10\xcd\xc7\xfa\xcf\x91\
+\xc8\xd1\x9f\x92\xc0\x60\xb1\xa0\x5f\x2b\xe8\xde\x05\x7c\x7c\xad\
+\x84\x51\xdf\x4b\x6c\x2c\x61\x9e\x9d\x5a\xbb\x85\x04\x07\x2b\xd8\
+\x77\xe2\xec\x8f\x2d\x2b\x94\xee\x0f\x60\xa3\x1e\x2e\xb3\x55\xa6\
+\xfd\xee\xaa\xab\x48\xb8\xe9\x89\xa8\x8d\x3c\xd8\xd9\x3b\xbf\x2c\
+\x68\xab\xd9\xdf\x7f\x7f\x4a\x3b\x4d\x5f\xff\xbf\x0a\xda\x65\xf6\
+\xf6\xde\x3b\x65\x7f\xcf\x7c\x23\xb2\xf2\xaa\xb4\x75\xa0\xa4\x5d\
+\x3d\xf8\xe1\x32\xef\xdc\x93\xf2\x7b\x2f\xce\x22\xe1\xbd\xff\x40\
+\xc2\xde\x29\x9d\x62\xd0\xb8\x16\xd2\x37\x84\x76\x2f\xe6\x97\x26\
+\xa4\x45\x72\xc8\x3e\x2b\x59\x6b\x1a\x7c\x4c\x99\x6f\xa6\xf3\x2f\
+\x66\xe6\x88\x3a\xb9\x75\x00\x6d\x3e\x2d\xef\xab\xae\x26\xe1\x13\
+\xbf\xe6\x95\xc3\xdd\xff\x7d\x41\xee\xdd\xfd\x0f\x8a\xda\x69\x83\
+\xbe\x8a\xa0\x0f\x56\xff\xd3\xfc\xdf\x67\xbe\x0d\xed\x2e\x6d\x3b\
+\x90\xd1\x17\xd2\xf6\xf7\x8d\x37\x92\xb0\x4b\x58\xf3\x44\x48\xdb\
+\x10\xec\xd4\x31\xfe\xe3\xe0\x6f\xd0\x6c\xbf\x82\x57\xfe\x94\x9a\
+\x83\xce\x0a\x11\x3f\x24\xcb\x0a\x29\x65\x8f\x8d\xf3\xc2\xef\x7c\
+\xfd\xce\x68\x1b\x14\xc8\x0f\xd8\x61\x0b\x71\xdf\xe5\xc4\xc7\x74\
+\x77\xf6\x3d\xc8\xb7\xc7\x3f\x6e\x64\xed\xb8\x05\xff\x06\xf4\x73\
+\x99\x3c\xa5\x6c\x07\x25\xb6\x07\x68\xca\x1e\x9b\xdf\x85\xe7\xb8\
+\x37\xee\x22\xe9\xb4\x3f\xc1\x2f\x51\xa8\xfc\xc3\xde\x9f\xa3\xcb\
+\x3f\x32\x50\x22\xd8\x07\x60\x7c\x4c\x37\x76\xa4\xa9\x83\x0b\xd8\
+\xf5\x01\xbb\x7f\x49\xb5\xb6\x81\x36\x9f\x82\xf7\x38\x84\x34\xbd\
+\xc0\x36\x1b\x5b\xf6\x38\x8e\x08\xe8\xf1\x89\x6a\x6f\x41\x3b\x48\
+\xd5\x17\x98\x35\x12\x66\x2c\x88\xad\x69\x85\xe7\x37\xa7\xb8\xc6\
+\x51\x9b\xf3\x2a\x5e\xf9\x1d\x4e\xfa\x18\xd1\x5d\xbd\xdf\xe6\x95\
+\xff\x88\x03\x11\x0f\x01\xc6\x83\x14\x63\x22\xac\x95\xd3\x95\x1d\
+\xf6\x13\xcc\xef\x85\x04\xe7\x38\x81\x71\x1e\xdb\xf7\xbd\x6e\x7a\
+\xbd\xcc\x53\xee\xff\x10\xe8\x03\xb9\xa9\xc7\x80\x44\xc0\xbc\x20\
+\x3c\x37\x86\xd2\xed\x99\x98\x39\xf3\x79\xc1\xb9\x14\xe6\x77\x44\
+\x9e\x61\x6d\x23\x54\x7e\xa1\xf5\x9e\x18\x60\x3d\x28\x3c\x06\xfc\
+\x04\xf7\x0e\x58\x1f\x08\x95\x85\xd9\x37\x0a\x95\x1d\xee\x3c\x23\
+\x42\x7b\x58\x68\xf7\x5e\x5c\x0c\x06\xd0\x69\xe5\xcf\x7b\xd2\xb5\
+\x3b\x0f\xdb\xe7\xf1\xca\x0f\x7a\x4d\xa8\xbf\x87\xb1\x40\x60\x9d\
+\xc8\xee\x9d\x05\xce\x0f\xde\xdb\x6c\x7b\x43\xa8\xbe\xdc\xfb\xc5\
+\xfd\x8f\xd2\xe1\x9d\x1e\xfe\x9a\x5e\x2b\x9c\xd8\x2d\x7c\xef\x7d\
+\x66\x4d\xc1\x9a\xc4\xb2\x37\x34\xe4\xe4\x07\xd6\xcd\x9c\xe0\xfe\
+\x9e\x7f\xdd\x4c\xd2\xe1\x92\x5e\x76\x40\x73\xa7\x45\xb7\xf2\x83\
+\x0f\xdf\xb9\x35\x7c\xbf\x9e\xb3\xab\x0b\xff\xbc\x9b\x4c\xd9\xe5\
+\xf7\x57\x15\xfe\xb3\x50\x3d\x39\x0f\x5e\x21\xab\xec\x80\x26\x47\
+\xbe\x6e\xe5\x67\xd7\x8d\x7b\x84\x63\x89\x0d\xfd\x77\xfe\x7d\x93\
+\x73\xde\x32\xeb\x7a\xee\xff\x0f\x55\xd8\x64\x73\x0f\x68\xb0\xeb\
+\x1b\xc3\x0d\xda\x80\x60\xfc\xf4\x72\xeb\xda\xc9\xf2\x97\x5a\x5d\
+\xdc\xff\xff\x6e\xd5\x6c\xd9\x65\x07\x64\x42\x1c\x73\x38\x53\xe2\
+\x95\xbf\xcc\xea\x84\xb2\xc3\xf9\xbc\x50\xfb\x38\xdb\xf2\x10\x39\
+\xed\x7d\x16\x0d\xd0\x67\xe5\xad\xfb\x98\x3d\xf0\xd9\x81\x25\xb2\
+\xd0\xd0\xc1\x8f\x03\xed\x72\x3e\x44\xf5\x0e\xff\x31\xe1\x98\x5a\
+\x70\xbf\x20\xb8\xcf\x81\xf5\x0e\xa5\xae\x6d\xaf\xeb\x6e\x45\xd6\
+\xbd\x5c\x08\x69\x54\x81\x6e\x19\xd5\x7b\x60\x2e\x14\x58\x0f\xc5\
+\xca\xbe\x84\x57\xfe\x57\xe8\x75\x16\xbb\x9d\x77\xf2\xcb\xdf\x27\
+\x5f\xb3\xb5\xf5\xe4\x8d\xbc\xf2\xf7\x3b\x1f\xa6\x7e\x0f\x94\x49\
+\xa0\x0f\xbc\xc0\xfc\xac\xe2\xfd\xfb\x5b\xc8\x35\x46\x02\x3a\x5d\
+\xb7\x09\xf0\xff\x59\xd9\xe5\x3f\xde\x79\x33\xaf\xfc\xce\xbe\x07\
+\xe8\xcb\xff\xe6\x77\x84\xca\xbf\x23\x52\x62\xeb\xe4\xfd\x7b\x3d\
+\x65\xfb\x1a\x4a\x71\xde\xe7\x94\x1f\x23\xcb\xde\xf5\x55\x5e\xf9\
+\x7b\x7b\xef\xa3\x2f\x7f\xc3\xa3\x02\x63\x80\xed\x24\xb3\x27\x1a\
+\x1e\x5b\x57\x40\x46\x5f\xcd\x23\xa1\x97\xa3\x36\xa2\xe1\x63\x74\
+\x3a\x8f\x00\x87\xf3\x26\x5e\xf9\xed\xce\xcf\xcb\x2e\xbf\xa3\xfb\
+\x1b\xbc\xf2\x77\xf5\x7c\x8b\xfe\x5d\x2d\xcf\x0a\x94\xdf\xf2\xde\
+\xe8\xe6\xbc\x3f\x26\xda\x4a\x06\x2b\xcd\x24\xdc\xf1\x5f\xf4\x3c\
+\x09\xec\xfb\x95\x88\xdf\x28\xa4\xd7\x72\xb2\x7b\x31\xfd\xbb\xda\
+\x7f\x21\xb8\x17\x00\x3b\x41\xae\xbd\xe8\x98\x03\x7f\x56\x13\x87\
+\x90\x8e\xad\xa3\xef\x26\xd9\xe5\x07\xae\xb9\xe5\x77\x74\xe1\xcf\
+\xd2\x26\x71\xf2\x79\xa1\x39\xf0\x23\xd0\xdd\xe0\x95\xbf\x83\x3e\
+\xb6\xd5\x74\x2d\xbf\x90\xdf\x41\xe8\x18\xfd\x79\xc5\x74\x6d\xff\
+\x81\xda\xdc\x8f\x79\xe5\x3f\xf2\x3d\xea\xf7\x4f\xd7\xf1\x2f\xb0\
+\xdb\xf0\xbf\x3c\x7b\xf1\x03\x5f\xa3\xe7\x69\x9a\xce\x7f\xc1\x9d\
+\xc6\x61\x6e\xf9\x83\xb5\x0b\xa8\xdf\x3f\x5d\xd7\x3f\x42\xda\x25\
+\x81\x6a\x2b\xf5\xfb\xa7\xeb\xfa\x77\xf4\xb5\xbc\x95\x3c\x9f\x89\
+\x7d\xb9\xd4\xb1\x5d\xa6\xeb\xfe\x27\xb8\x2d\xef\x06\x21\x9f\x91\
+\xa1\x43\x37\x92\x3e\xd7\xb7\xd1\x70\x08\x68\x18\x1f\x77\xcd\x23\
+\x03\xae\x27\x64\xa1\xa1\x23\x8f\x57\x7e\xd0\x22\xa6\x79\xc7\xa9\
+\x23\xf7\xa5\xdc\xff\xc2\x19\x80\xbf\xda\xf0\x7f\xdc\xf2\x0f\xd7\
+\xcc\xf8\x54\x9c\x7f\xb0\xe5\xdf\x6e\x72\xf2\xda\x40\x5d\x2e\xb1\
+\x5f\xc2\xe7\x5f\xe1\x65\xd6\xf5\xf1\xf2\x9f\xaa\xce\x7b\x41\xa8\
+\x0f\x0c\x34\xce\x94\x5d\xfe\x4c\x3d\xff\x1c\xdc\x94\x7f\x4f\xbc\
+\xfc\x84\xe4\x98\x46\x6a\x0c\x7c\x9f\xd1\x5a\x83\xec\x36\x90\x89\
+\xe7\xdf\x23\xab\x0a\xff\x04\xbe\xb7\x89\x77\x00\x23\x55\xa6\x23\
+\x42\x6d\xc0\xf7\xb6\x8d\xd5\x57\xc3\x40\x28\xae\x7b\x4b\xcf\x1c\
+\x56\x7b\x4d\x0a\x1a\x3b\xf8\x75\xd7\xd8\x51\x88\xfe\xfb\xde\x5a\
+\x61\xbb\xb1\x40\x45\x21\x2f\xae\x06\xf8\x1b\x0a\xed\x05\xfc\x75\
+\x46\x12\xf6\xac\x44\xcd\x33\xd3\xf9\xfe\x0b\x52\xe0\x75\xd3\x61\
+\x41\xff\xc9\x7d\x22\xfa\xd7\x31\x4c\xe7\xfb\x4f\xb6\xfc\x5b\x0b\
+\x3e\x23\xe8\x67\xba\x37\x97\x84\x8e\x8b\xeb\xd8\x4f\xf7\xfb\x6f\
+\x48\xa1\x6d\xe6\x57\x04\xfd\xe7\x99\x7e\x30\xd6\x23\x1e\x7f\x69\
+\x3a\xdb\x3f\xc4\xe6\x02\x43\x70\x97\xe1\x82\x50\x1d\x04\xaa\x0b\
+\x48\xd8\xbb\x3a\xed\xf7\xa7\xbb\xfd\x0b\xa4\xd1\xad\x33\x16\xa7\
+\xd2\x70\x0b\xd6\xcc\x25\xe9\xb4\xf7\xa7\xbb\xfd\x53\x3c\x05\xb6\
+\xe6\xad\x4a\xe5\x4f\xce\xd6\x81\x47\xb8\x1d\x64\xa4\xfd\x9b\x44\
+\xbb\xe8\xe0\x76\x93\x23\x55\x1d\x40\x5f\x48\x35\x1e\x5c\x0a\xf6\
+\x8f\x90\xc0\x7e\x36\x58\x95\x5a\xef\x1c\xc6\xc4\xd0\xf1\xa7\x78\
+\x79\xca\x14\xfb\x57\xb0\xdd\x95\x6b\x0b\x0e\x9a\xef\xc1\x9d\xc6\
+\x60\x4a\x7d\x05\x66\x6e\x64\xd7\x07\x09\x6b\x24\xd5\xed\x9f\xc1\
+\x1e\x49\xc4\xfe\x99\xc1\x1e\xa5\x6c\xc0\x31\xba\xf7\xd0\x16\x46\
+\xeb\xef\x20\xe1\x58\x7c\x40\xd5\xec\xdf\x1b\x9f\x4c\xcb\xf9\x24\
+\xef\x0a\xeb\xca\xb3\x7d\x21\xcd\x78\x30\x39\x2e\xd4\xe6\x91\x50\
+\xf3\x3d\x24\x30\xf0\x82\xf2\xfe\x0f\xe0\x5b\x91\xa6\xdc\xf1\xfe\
+\xae\xa6\x3f\x10\xcc\x0b\x28\x7d\xd3\x3a\x03\x39\x5b\x33\x93\xb8\
+\x9b\x2f\x23\xf6\xbe\x79\xbc\x7e\x80\xf1\x7f\x39\xb6\xdf\x48\xce\
+\xee\xc8\x0c\xff\x97\xc4\x04\xeb\x83\x54\x6b\x24\xe1\x31\x82\xd9\
+\x87\x56\x9b\xd8\x33\xa5\xa1\x7d\x56\xe2\x3d\x58\x44\x9c\xcd\xb3\
+\xc9\x60\xcb\x57\xc8\x50\xeb\xbd\xe4\x44\xd3\xd5\xa4\x6d\x9f\x91\
+\xf5\x7f\xea\xdf\x26\xcd\xff\x09\x6c\xb6\xb5\x28\x7b\x3c\xb1\xda\
+\x55\x95\xe6\xcd\x4a\x68\xe0\xc3\x9d\x2b\xba\xac\x9c\xf5\x3c\xd8\
+\x2b\xeb\xe9\x17\x0a\x7b\x26\x76\xdf\x28\x53\xbf\x2b\x7e\xf7\x8e\
+\x04\xe8\x71\x3d\xaf\xa7\xff\x23\x37\xb1\x7a\x45\xaf\x9b\xf6\x49\
+\x8d\x95\x05\xf6\x07\x88\x72\x7b\xc0\xc7\x36\x93\xfc\x5f\xb9\x89\
+\xdd\x3f\x6d\xcd\x7b\x94\x99\x2b\xba\x84\xce\x95\x53\x01\x6c\x30\
+\x84\xf7\x6c\x60\x9b\x67\x5b\x03\x3e\xd5\x99\xec\xff\x9c\x2a\xc1\
+\xfd\x02\xdc\xb1\xc0\x3d\x13\xdc\xb5\x05\xaa\x0d\x7f\xf4\xd7\x19\
+\x26\x26\x75\x8a\xea\x72\x49\x60\x4b\xde\xc4\xe8\x32\xcb\xfb\xe1\
+\x12\x6b\x77\x24\x6a\x8f\xb4\x04\xc6\x72\xb0\xcd\x53\x3b\x7f\xac\
+\x88\x40\x5c\x5c\xa0\x28\x26\x7b\x60\x4c\xd0\x16\x60\x65\x13\xe2\
+\x7a\x36\x0b\xa6\x34\x08\x5a\xe0\xa7\x71\x4a\xa3\x20\xf6\xba\xb8\
+\x86\x41\xfc\x67\x4c\x75\x21\xae\x1f\x13\xd7\x89\x89\xeb\x63\xc4\
+\x75\x61\xf2\xe3\x3f\x5b\xa2\x3f\xe3\x7a\x1c\x71\x1d\x97\xdc\x54\
+\x3f\xa9\x0a\xab\x42\x2a\x8e\xfe\x48\x99\xbf\x96\xe8\xcf\xc9\xf2\
+\x9c\x89\xfe\xcc\x8f\xff\xe4\xd6\x47\xbc\x9e\xe2\xf5\xc6\xad\xcf\
+\x78\x3d\x4f\xd6\x3b\xfb\x62\xe3\x14\x2f\x71\x9e\xe2\xbc\x4d\x6a\
+\x44\xb4\xc4\x78\x8d\xf3\x1c\xe5\xfd\xff\x01\xc6\xba\x5c\xd3\
+\x00\x00\x03\x2a\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x02\xdc\x49\x44\x41\x54\x58\x85\xed\
+\x56\x4b\x68\x14\x41\x10\xdd\x28\xa2\xe2\x6d\x06\x77\xf1\x73\x52\
+\x08\x82\x11\x94\xf5\x22\x82\x4b\x0e\xcb\xfe\x47\x14\x16\x3c\x08\
+\xa2\x07\x3d\x48\xc0\x78\x88\xf8\x81\xbd\x89\x11\xcf\x1a\xbf\x20\
+\x28\x24\x33\xe2\x49\x2f\x4a\x0e\x6a\xf0\x7b\x10\x72\x58\x0f\x0a\
+\x22\x4a\xc4\x0f\x7a\x0d\x98\x64\x7d\x6f\x53\x0d\xcd\x30\x3b\xd3\
+\x3b\x3b\xe8\x41\x0b\x8a\xde\xd9\xae\x7a\xf5\xaa\xbb\xaa\xbb\x53\
+\xa9\x08\x29\x95\x4a\xfd\xd0\x11\xe8\x44\xb9\x5c\x7e\x82\xb1\xc9\
+\x11\x3a\x8e\xdf\xc7\x8b\xc5\xe2\xc6\x28\x8c\x58\x82\x00\x83\x08\
+\xf0\x02\x63\xcb\x40\x49\x6c\x67\x22\x81\xf3\xf9\xfc\x2a\xc9\x56\
+\x0f\xf0\x1e\xff\x8d\x41\x4f\x55\x2a\x95\xc3\xf8\x3e\x03\xbd\x0a\
+\xfd\xe8\xb3\xbb\x59\xaf\xd7\x57\xc6\x0e\x0e\xf0\x75\x08\xf2\x5a\
+\x03\x9c\xac\x56\xab\x3b\x42\x5c\xfa\x60\xb3\x0b\x3a\xa5\xf9\xbc\
+\xac\xd5\x6a\x99\xb8\x99\xab\xe0\xb3\xf8\x7d\xd0\x6f\x93\xf6\xec\
+\xfd\x19\xd7\x9a\xc1\xb8\xdb\x3f\x07\x9f\x21\xe8\x2f\xf1\x7f\x96\
+\xcb\xe5\x56\x74\x45\x40\x5b\xf6\x59\xee\x7f\x90\x4d\xc6\xb3\x6e\
+\x67\x3c\xbb\x05\x12\x97\x3a\x60\x54\xa1\x73\xc4\xc1\x78\xcd\x38\
+\x38\x03\xaa\x25\x0c\xca\xdc\x94\x80\x60\x0d\x0b\xd6\x02\xb0\xb6\
+\x1b\x11\xd0\xaa\x7d\x32\xcc\xce\x84\x40\x6a\xb1\x2e\x5e\x49\x32\
+\x0f\x4d\x82\xf7\xab\xec\x23\x0a\xce\x94\x00\x31\x4b\x42\x60\xde\
+\x71\x9c\xb5\xa1\x04\x50\xf9\x27\x54\xab\x45\x91\x35\x25\x80\x56\
+\x5c\x8a\xe0\xdf\x04\xf7\x48\x28\xa8\x2a\x3e\xf6\x79\x52\x04\x74\
+\x5c\x9e\x17\xa1\x86\xaa\x87\xe1\x70\x92\xdf\x6c\xb5\xb4\x6b\x4f\
+\x60\x74\x03\xf4\x43\x9b\x80\x67\xbd\xeb\x30\x3f\xbe\xda\xb3\xf6\
+\x0a\xee\xa8\x10\xb8\x1f\xc5\xb4\xa9\x2f\x15\xc0\x3f\x2f\x06\x89\
+\xa7\x69\xd7\x7a\x23\xb8\x23\x92\xd8\xf3\x28\x02\x8f\x85\xc0\xe9\
+\xf6\x0a\xb8\xb6\x03\x12\x63\xd0\xcb\x01\xfa\xb6\x1d\xc4\xb3\x9b\
+\x81\xf3\xd8\x1a\x10\xc8\xcb\x0a\x5c\x30\x5a\x01\xde\x6a\x46\x7b\
+\x95\xea\xae\x06\x80\x77\xc7\xb4\x06\x86\x65\xa9\x3e\xe1\xb3\x2f\
+\x09\x02\xd9\x6c\x76\x19\xf0\x7e\x10\x17\x5d\x76\x20\x94\x00\x0c\
+\x36\xa8\x73\x00\x77\x7b\x2e\x09\x02\xc0\x74\x24\xa9\xb9\x42\xa1\
+\xb0\x26\x94\x00\x05\x86\x8f\x84\xc4\x54\xaf\x04\x78\x06\x00\x67\
+\x5a\x08\xb8\x91\xc1\x29\x3c\x01\x79\x76\x0b\x89\xa1\x5e\x08\xc8\
+\x5b\xa1\x25\x97\xd2\x56\x23\x02\xe2\x78\x43\x08\xf0\x4a\xad\x74\
+\x20\x70\x4b\xce\x81\x8b\x41\xf3\x58\xfa\x7d\x3c\x7e\x05\xe7\xac\
+\x71\x70\x0a\xef\x6f\xde\xe3\x8a\x04\xea\xe1\x58\xca\x57\x94\x68\
+\xb1\x3d\x6c\x41\xd5\x6a\x4a\x1a\x8d\xc6\x12\x66\xae\x05\x5f\x80\
+\xff\xb6\xae\x08\x50\xf0\x28\x49\x03\xe4\xa9\xf6\xba\xe1\xad\x56\
+\xe4\xbe\x06\xd9\xb3\xda\xa5\xe0\xa6\x35\x1f\xb5\x95\x5f\x30\x37\
+\xd0\x35\x09\x30\x5f\x0e\xe7\x2b\x1a\x10\xf7\xf3\xbb\xbc\x82\xcf\
+\xcb\xe5\xc5\x43\xc6\xc3\xf7\x4f\xcd\x66\x1e\x7a\x8e\x99\x33\x78\
+\x4f\x24\x28\x70\xcc\x02\xe0\x81\xb6\xac\x81\x2a\x81\xef\xd2\x5e\
+\xf3\x1d\x48\x84\x04\x85\x7d\xcc\x7b\x82\x27\x1a\x02\xdd\xe3\xa3\
+\x93\xc7\x2b\xf4\x3a\xb2\x3d\x04\x5d\xdf\x21\x81\xe4\x48\xc4\x15\
+\xb4\xf7\x26\x04\x9f\x11\x12\x5f\x91\xc0\x96\xff\x24\xfe\x6d\x12\
+\xfe\xc2\x44\x81\x6f\xfe\xab\x24\xf8\x18\xfa\xe3\x04\x28\xcc\x9c\
+\x37\x30\xf4\xe8\x6f\x8f\xf4\x3e\x93\x16\xa0\xb6\x14\x00\x00\x00\
+\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x09\x52\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x12\x00\x00\x0b\x12\
+\x01\xd2\xdd\x7e\xfc\x00\x00\x09\x04\x49\x44\x41\x54\x58\x85\xc5\
+\x96\x09\x50\x53\xd7\x1a\xc7\x6f\x12\x83\x61\x49\x02\x81\x8b\x59\
+\x64\x87\x10\xb6\x04\x49\x80\xb0\xef\x20\xa2\xa8\x80\xa2\xd2\xba\
+\x6f\x7d\xca\x52\x11\x11\x71\x85\x80\x55\x59\x5c\x9e\x0a\xa8\x80\
+\x0a\x62\x41\x5c\x78\x82\x16\x51\xcb\x2b\x6a\x5b\x6c\xad\x52\x77\
+\x9f\xa8\xb5\xed\xd3\xb6\x5a\x4b\xa5\x15\x93\xfc\x7b\xa8\xd3\x37\
+\x6f\x26\xf6\xd9\xce\x74\x7c\x73\xe7\x37\xe7\xce\xfd\xce\x9c\xef\
+\x37\xdf\x77\xef\xb9\x87\x02\x40\xfd\x95\xc8\x65\x8e\xe9\xfe\xbe\
+\xca\x9a\x3f\x3a\xff\x2f\x4d\x3e\x48\xea\x30\x7e\xfd\xc5\xee\x2e\
+\x28\x3d\xa4\x5b\x4c\x19\x14\xe3\xb5\x0b\x4c\x17\x73\xeb\x74\x8f\
+\x6f\xe3\xee\x67\xa7\x11\xae\x74\xdd\x47\x53\x14\xeb\xb5\x0a\xcc\
+\xb7\x31\xad\x7b\x72\xe1\x30\xd0\xfb\x3e\xee\x77\x35\x20\x5a\x66\
+\xbf\xd7\x7a\x26\x8b\xf9\xda\x04\x32\x6c\x39\x7b\x1f\xb6\x6f\xc2\
+\xf7\xa7\xb7\xa2\xff\x83\xed\xb8\xbe\xbf\x18\x93\x54\x16\x27\xad\
+\xaa\x39\xbf\xb6\xc3\x6b\x9d\x03\x43\x38\x8f\xcb\x30\x10\x48\x50\
+\x4a\xd8\xc9\x6a\x09\x9d\x20\xa5\xe8\x29\x0a\x26\x3d\x47\xc5\xa4\
+\x33\x03\x98\x74\x6e\x08\x93\x5e\x15\xc1\xa4\x8b\xa2\x99\xf4\xfa\
+\x58\x26\x5d\x1a\xc7\xb4\x2e\x8b\x67\x0a\x07\x29\x1d\xc9\x12\x6e\
+\x88\x63\x09\xdf\x89\x65\x09\x0b\xa3\x59\xc2\xa5\xc1\x94\xb3\x46\
+\x3d\xbc\xe3\x7e\xe3\x52\xdc\xdf\xbf\x18\x77\xeb\xb3\xf0\xef\xc6\
+\x45\xe8\x2e\x9b\x8b\x09\x5e\xdc\xf6\xdf\x72\xc9\x4a\xc4\x86\x02\
+\x13\x83\x6c\x8a\x1b\x26\xc5\xa2\x21\x39\x58\xb7\x3f\x25\x58\xf7\
+\x6e\x4a\xa0\xae\x71\x42\xa0\xee\xc0\x44\xb5\xae\x39\x55\xad\x3b\
+\x38\xc9\x4f\x77\x68\xb2\xef\x20\xfa\xc3\x93\x55\x04\xa5\xfe\x70\
+\xaa\xb7\xfe\xd0\x44\x85\xbe\x39\x45\xae\x6f\x1a\xef\xa5\x6f\x18\
+\xe3\xa1\x3f\x90\xac\xc2\xbd\xea\x34\x5c\xdf\x92\x8c\xcf\xcb\xc6\
+\xe1\xb3\xf5\x09\xb8\x52\x3a\x1a\xed\x4b\xe2\x30\xc6\x85\x73\xfc\
+\x77\x5b\x30\x3d\x98\xde\xfd\xe3\x89\x22\x3c\x3b\x96\x8f\xfe\xb6\
+\x25\xf8\xf9\x78\x36\x9e\x77\x64\x42\xf7\xfe\x02\xe0\x83\xf9\xc0\
+\x99\xd9\xc0\x59\xc2\xb9\xf9\x2f\xe8\x9a\x05\x74\x4e\x01\x3a\xc6\
+\x01\xad\xf1\x78\xd6\x1c\x83\x1f\xea\xa3\xf0\xb0\x2a\x08\xbd\xe5\
+\x7e\xb8\x52\xe4\x83\xf3\xf9\x0a\x74\x2e\xf2\x40\x47\xba\x14\x9d\
+\x99\x52\xd4\xbf\x29\x43\x8a\xd4\xac\xf5\xa5\x02\xe9\x11\x96\x35\
+\x5f\xed\x9d\x85\xaf\xb6\x25\xe1\xcb\xed\x89\xf8\xa6\x3a\x01\x4f\
+\xea\xe3\xd0\xdf\x14\x0d\xed\xa1\x70\xe0\x28\xe1\x78\x02\x70\x22\
+\x85\x90\x0a\xb4\x4f\x00\x8e\x8d\x01\x8e\x84\x01\xef\xca\xa1\xdd\
+\xed\x80\x9f\x2b\x45\x78\xbc\xd1\x1a\x5f\xae\xb5\xc2\xb5\x7c\x73\
+\x74\x67\x72\x71\x62\x96\x29\x0e\xa4\x72\xb0\x2f\x89\x8d\xa6\xe4\
+\x21\xf8\x7b\x02\x8d\xf1\xae\xc6\xcd\x06\x02\x4b\x63\x2d\x6a\x6e\
+\x96\xc7\xe2\xc6\xea\x11\xb8\x5d\xec\x85\xfb\x25\x6e\xf8\x66\xb3\
+\x33\x9e\x56\xd9\x41\xbf\xdb\x86\x24\x51\x90\x64\x51\x40\xdb\x78\
+\xe0\xbd\xc9\x84\x34\x22\x30\x89\x88\x91\x0a\x1c\x24\xcf\xeb\xbd\
+\x81\x1d\x42\xe8\xca\x87\xe0\x89\x86\xc2\xdd\x65\x14\x2e\x66\x52\
+\x38\x35\x8b\xc2\xbb\x13\x28\x54\xc4\x53\xa8\x8c\x67\x60\xc3\x48\
+\x6b\xcc\x19\xce\x6e\x35\x10\x28\x18\xc5\xab\xb9\x90\xef\x86\x4b\
+\x99\x7c\xdc\xc8\x33\xc3\xa7\x19\xc6\x64\x11\x53\x3c\x2f\x31\x07\
+\x2a\x65\x40\x43\x3c\x29\xf5\x1c\xe0\xfd\xe5\xa4\x05\x25\x40\xf7\
+\x56\xe0\xfc\x76\x32\x6e\x21\xed\x79\x87\xb4\x22\x87\x08\xbe\x01\
+\xd4\xf8\x43\x5f\x6c\x8a\xef\x72\x29\x7c\xbe\x90\xc2\xf1\xa9\x14\
+\xaa\x12\x29\xac\x08\x63\x22\x2f\x82\xc6\x7c\x5b\xa3\xb6\x97\xb6\
+\x60\x43\x22\xb7\xe6\xc3\x6c\x21\x3e\x5b\x40\xe1\xc6\x12\x42\x06\
+\x03\xfd\x15\x1e\xb8\xb1\x54\xf9\xf4\x40\x88\xe0\xbb\x96\x18\xe1\
+\xa3\xa3\x71\xc3\x1f\xb5\x26\x38\x3e\x6a\x4d\x94\x12\x64\x2f\x18\
+\x23\x7d\x74\x34\xc1\xf9\x51\x4b\xbc\xc3\xa3\x83\x51\x92\x6f\x4f\
+\x4d\xf5\xed\xd7\xef\x50\x03\x45\x66\xf8\x8e\xac\xf3\xc9\x3c\x0a\
+\x87\x52\x19\xd8\x3a\x96\xc6\x5c\x47\xe6\xb1\xdf\x7d\x09\xb7\x26\
+\x73\x6b\x3f\x5c\x22\x42\x4f\xd6\x8b\xf2\x7d\x9f\xc7\xc4\xf3\x1a\
+\x3f\x6c\x77\x64\x9f\x1c\x8c\x3f\xcb\xa1\x38\x03\xf9\x14\x07\x79\
+\x84\x55\x4c\x0e\xd6\xb0\x38\x58\xcd\xe0\x60\x05\xc5\xd1\x92\x67\
+\x4f\x48\x7c\x70\xde\x0e\x29\xbb\x4b\x77\x80\xbc\x9c\x15\xde\xd0\
+\x6a\x8c\xf1\xc5\xd2\x21\x38\xb5\x40\x8c\xb7\xbd\x38\xbf\xae\x23\
+\xda\x2d\x30\x95\x35\x89\x8c\x0d\x04\x76\xa5\x72\xab\x3e\xca\x13\
+\xe3\x6a\x36\xd5\xff\x70\x25\xd5\xaf\x2d\xe2\xf6\xeb\xf6\x45\xa3\
+\xca\x81\x71\xe4\xcf\x6c\x44\xb5\xee\xec\xd3\xfa\x93\xf9\xc0\xfe\
+\x24\xe8\xb6\xb9\xe0\x66\xa9\x13\x56\x84\xd2\x67\xfd\x6e\x29\x44\
+\x46\x07\x29\x57\xc9\x5e\x81\x3b\x11\xb0\x31\x10\xa8\x4b\xe3\x16\
+\x74\x2f\x13\xf7\xde\x5c\x42\xf5\xfc\xb8\x86\xea\xc1\x46\xfb\x1e\
+\x52\xbb\x3b\x15\xb6\xcc\xa6\xc1\x78\xe8\xa7\x91\x49\xb2\x4d\x8e\
+\xbb\x5e\x25\xb0\xd7\x93\x73\x1a\xe7\x2b\xc8\x57\x92\x83\x6f\x77\
+\x86\x23\x33\x82\xee\x7d\x4b\x37\x23\x4c\x7d\xc5\x23\x81\x08\x8c\
+\x96\xd4\x09\xc6\xba\x36\x0a\xd5\x06\x02\x4d\x53\xb9\x73\xce\xe7\
+\x8b\x3b\x7a\x73\xa9\x96\x01\x0d\xb3\x05\x95\xca\x16\xb4\xcd\xed\
+\x28\x95\xb0\x77\x87\x9f\x73\x0d\x9d\xd1\x96\x86\xf0\x3a\xbf\x73\
+\xaf\x14\x50\xf0\x4e\xe3\x4e\x07\xf9\x6a\x66\xeb\x36\xf8\x1a\x7f\
+\xe4\xb4\xde\xbe\x2d\xbd\x7f\xda\x22\xd5\x25\x69\x36\x11\xc8\x96\
+\xd4\x59\x2e\x75\xd9\x6f\x3d\xd1\x40\xe0\xf0\x0c\x6e\x12\x11\xd8\
+\x71\x2f\x97\xda\xac\x5d\xcb\xd9\x8c\xda\xc8\xcd\x68\x5f\x5c\xaa\
+\x99\x4e\x1f\x0e\x3b\x1d\xf6\x53\x3b\x5a\x10\x7d\x24\xa4\xeb\x55\
+\x02\x7b\xe4\xfc\xce\xa7\x8d\x39\xa8\x74\x60\x1e\x99\x7b\x4e\x2e\
+\x71\x2c\x76\xb8\x39\xef\xfb\x49\xbb\xe5\x9f\x38\xd4\x1a\x1d\xa0\
+\x6a\x25\x7b\x2c\x1b\x1c\xeb\x2c\x73\x0d\x04\xfe\x31\x93\x1b\xf9\
+\xf1\x32\xf1\xf2\x2f\x96\x50\x39\xfa\xb5\x66\x39\xd8\x33\xea\x6f\
+\x2d\x27\xd2\xea\x83\xdb\x94\xfa\xb7\x31\x1b\x55\x28\x47\x70\xb3\
+\xea\x95\x02\xcd\x7e\x82\xc2\x6a\xbb\xa1\x47\x07\xef\x03\xff\x15\
+\x24\x77\x2f\x71\x7e\x3c\xed\xc1\xb8\xcf\x5d\xcf\x8a\x7b\xd8\xfb\
+\xa9\x1e\x71\xb5\xe5\x2d\x87\x6a\xc1\x2e\x03\x81\xd6\xd9\x5c\xe5\
+\xb9\x5c\xf1\xb4\x7b\xd9\xd4\x14\x14\xf3\xc6\x1c\xa9\x56\x6c\xf4\
+\xdc\xe7\xa2\x4b\xbc\x17\x85\xe9\x3f\x8c\xc3\x0a\x64\xc1\xa7\xd1\
+\xfd\x95\x02\xff\x8d\xba\x47\xee\xef\x51\x2e\xc5\x84\xde\x18\xbd\
+\xdd\x49\x4b\xdd\x90\x3d\x94\x4e\xb4\x4d\x00\x87\x6d\x82\x93\x2f\
+\x13\x70\xe9\xcc\x16\xc7\x3c\xc8\xa0\x94\x87\x0a\x4d\x96\xdb\x6c\
+\xb6\xd6\x7a\x75\x3a\x22\xf2\x92\x12\x29\xf7\x63\x30\xff\xd9\x64\
+\x78\xec\x74\xe8\xf6\x6a\xb5\x65\xfb\x7d\xe4\xca\x0b\xfc\xd4\x93\
+\x1f\xda\xa3\xe0\x47\x5c\x1e\xc1\x8f\xbc\xa2\xe4\x47\x5e\x55\xf2\
+\x03\xae\x11\x7a\xbc\xf9\xaa\x8b\x72\xbe\x77\xa7\x0b\xdb\xb7\xd6\
+\x29\xc5\xa3\x44\x8a\xb8\x1e\x7f\x58\xb7\x98\x81\x55\x45\x41\x54\
+\x22\x80\x7d\xa9\xe0\x94\x81\xc0\xd1\x59\xdc\x61\x5d\x99\x42\x9b\
+\xf2\x79\xac\x05\xd6\xcb\xf8\xcf\xb9\x35\x2c\xd8\xb7\x98\x43\x75\
+\xc6\x05\x31\x97\x7d\x91\xfa\x60\x24\x12\xf7\x86\x6a\xe5\x65\xb2\
+\x3e\x55\x85\xa2\x2f\xa0\xc2\xb7\x2f\xa4\x32\xa0\x2f\xac\x32\xb8\
+\x2f\xac\x2a\xa8\x2f\xa8\x52\xdd\xa7\xae\x54\xf5\xf9\x90\x98\x7c\
+\x9b\x5b\x9f\xfb\x26\x97\xbe\xb0\x75\xca\x9f\x42\xab\x55\x50\x9f\
+\x91\x81\xdb\xc0\x06\xb3\x8c\x82\x70\x85\x00\x76\x85\x2f\x11\x18\
+\x24\x6f\xb6\x70\xaa\x4b\x86\xfd\x80\x20\x9b\x07\xab\x92\xa1\x10\
+\xef\xe3\xc2\xed\x98\x04\x7e\x64\x81\xa8\x1e\x15\x26\x7f\x1d\x8f\
+\x05\x4f\xd3\x90\xa3\x9d\x8b\x02\x64\xa3\x04\xab\xb0\x09\x1a\x6c\
+\x44\x21\xd6\x21\x9f\x5c\xe9\xc8\x1c\x98\x86\x99\x8f\x93\x30\xf1\
+\x7e\x2c\xe2\x6f\x06\xc2\xff\xac\x0c\x8e\x2d\x34\x8c\x2a\x18\x60\
+\x2d\x27\x02\x6f\x0b\x60\xbb\xec\x25\x02\x53\x62\x39\x89\x9e\x59\
+\x9e\xda\x98\xf5\x71\x08\x2f\x08\x45\x48\x49\x30\x02\xc8\xbe\xae\
+\x3e\xa4\x84\xff\xf1\x11\x50\xff\x53\x01\xff\xf3\x9e\xf0\xbb\xec\
+\x0e\xdf\x5b\xae\x50\xdd\x73\x82\xcf\xd7\xf6\xf0\x7e\x60\x0b\xaf\
+\x87\x12\xb8\x3f\x1c\x06\xe9\x97\xa4\xbc\xbd\x7c\x88\xaf\x98\xc0\
+\xea\x63\x36\xcc\x4f\xb2\x60\xda\xcc\x84\xd1\x4e\x06\x86\x14\x32\
+\xc0\x24\xdb\xb2\x30\x5d\x00\x9b\x45\x16\x86\x02\xd1\x41\x9c\xc9\
+\xee\x0b\x3d\x31\xba\x7c\x34\xa2\x8b\xa2\x10\xa1\x09\x43\x48\x19\
+\x91\xa8\x25\x12\xcd\x2a\xf8\xb5\x8d\x80\xef\x29\x2f\x28\xcf\xb8\
+\xc3\xa7\x5b\x0a\xef\x8b\x4e\x90\x5f\xb3\x83\xe7\xad\xe1\x70\xbb\
+\x2d\x84\xf4\x36\x0d\xa7\x9b\x16\xb0\xbd\xca\x83\xe8\x82\x09\x2c\
+\xbb\xd8\xe0\xbd\xc7\x82\x49\x23\x13\xec\xad\x44\x60\x11\x11\x20\
+\x3f\x26\x61\x86\x00\xc3\xdf\x7a\x89\xc0\x20\x63\xe3\xac\x66\xba\
+\x2e\x70\xc3\xa8\xb2\x51\x88\xd4\x84\x23\xac\x30\x04\x41\x1b\x02\
+\xa0\xae\xf2\x85\x6f\x83\x0f\x7c\x0e\xcb\xa1\x6a\x57\xc0\xa7\xd3\
+\x13\x3e\x1f\xbb\xc1\xfb\x92\x0b\x14\x57\x1d\xe1\x79\xc3\x0e\xb2\
+\x1b\x12\xb8\x5c\x1f\x06\x87\xcb\x56\x90\x5c\xe0\x83\x3e\x6b\x0a\
+\x7e\xbb\x11\x4c\x9b\x86\xc0\x68\x1b\x0b\x46\xab\x59\x60\x65\x32\
+\x21\x5a\x6c\x05\xd1\x9b\xbf\x23\x30\x48\x8c\x2f\x6b\xae\x5b\x86\
+\x07\x46\x96\x8d\x44\xb8\x86\xb4\xa2\x20\x08\x01\x45\xfe\xf0\xdb\
+\xa8\x84\x5b\x91\xab\x5e\x94\x27\xd4\x89\x96\x0f\xd3\x8a\x56\x5a\
+\x6b\x45\x6b\x08\x05\x04\x0d\xad\x15\x12\xac\x35\x96\x5a\xba\x50\
+\xa0\xa5\xd7\x58\x68\x2d\x57\x9a\x6b\x05\xf9\x3c\x2d\x3f\x97\x37\
+\xc0\xcf\xe6\x0e\xf0\x32\xb9\x03\x82\x2c\x8b\x67\x1e\xcb\x5d\xa1\
+\x98\x2e\xab\x37\x10\xd8\x92\x2c\x60\xac\x4a\x71\xfc\xf5\xb0\x38\
+\x36\xcc\xf4\x2d\x8f\x2c\x2f\xc4\x96\xc6\x20\x54\x13\x8c\xa0\x35\
+\xa4\x0a\x6b\xfc\x41\x2f\x14\xdc\xe1\x2d\x66\xd8\xf0\x56\x32\x9c\
+\xf8\x05\x4c\x67\xf3\x62\xc2\x3b\x2c\x67\x8b\x75\x2f\x30\x5f\x4b\
+\x46\x0d\x61\x35\xb9\x5f\x46\xc8\x61\x39\xf3\xd3\x59\x76\xbc\xd9\
+\x2c\x5b\xb3\x34\x96\xad\xc9\x58\xa6\x2d\x3f\x8e\x63\x2f\x89\xa3\
+\xb9\x06\x02\xab\x82\x8d\x18\x9b\x92\x9c\xfe\x73\x5a\x9d\x11\x67\
+\x9c\xee\x91\x25\x47\x74\x69\x14\x82\x0b\x03\x11\x58\xa8\x86\xd1\
+\x54\xf6\x95\x3f\xb3\x11\xfd\x11\xfe\x67\xd0\x44\x66\x92\xa5\xc8\
+\x96\x23\xaa\x34\x02\x41\xeb\x02\xc1\x79\xc3\xe8\xf5\x0a\x0c\xc2\
+\x75\x36\x5b\xac\xc8\xf4\x42\x64\x65\x38\x86\xa6\xbe\xe6\x0a\xfc\
+\x86\xb1\x35\x67\xa6\x77\x8e\x1c\x16\x89\xfc\xb3\xff\x17\x81\x41\
+\xec\x9d\xed\x17\x4a\x46\x89\x9b\xfe\x6a\x81\x5f\x00\x49\x2a\x97\
+\x61\xf6\xf5\xc8\x29\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\
+\x82\
+\x00\x00\x01\x61\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x01\x13\x49\x44\x41\x54\x58\x85\x63\
+\x60\x18\x05\x14\x80\xff\x5a\x25\x06\xff\x55\xcb\xf5\x07\xc6\x72\
+\xf5\xd2\xa4\xff\x1a\xa5\x7f\xc1\x18\xc8\x1e\x20\xcb\xcb\xfe\x43\
+\xf1\x3f\xa0\x58\xc6\x40\x58\xfe\x0f\xc1\xa6\x43\x48\x60\xb1\x3c\
+\x0b\x43\x4c\xad\x3c\x93\x6e\x96\xe3\x94\xa3\xb6\x23\x88\xb1\x80\
+\x66\x8e\x20\xc5\x60\xaa\x3b\x82\x1c\x03\xa9\xe6\x08\x4a\x0c\xa2\
+\xd8\x11\xd4\xf0\xc5\x7f\xf5\xb2\x44\xb2\xcc\xa0\x66\x3c\x62\x38\
+\x02\x29\xe7\xd0\xdc\x72\x92\x1d\xf1\x5f\xad\xc2\x14\xa5\x54\xd3\
+\x2c\x4b\xa6\xd4\x72\xb8\xd9\x40\xb3\x50\xcc\xc6\x56\x81\xfd\xd7\
+\x2c\x75\xa6\x85\xe5\x70\xf3\x91\x43\x17\xe8\x59\xec\x8a\xd4\xca\
+\x9d\xfe\x6b\x54\x18\x53\xdb\x72\xb8\xf9\x9a\xe5\x86\x38\x2d\x47\
+\x05\xc6\xac\x0c\x0c\xb2\xbe\x0c\x0c\x72\x92\x94\x5b\xab\x28\xce\
+\xc0\x20\xe3\x0e\x64\x30\x93\xa0\x49\xa6\x0d\xe8\x80\xff\x40\x7c\
+\x93\x72\x07\x80\xcc\x00\x9b\xd5\x48\x8a\x03\x56\x42\x35\x01\x31\
+\x03\x23\x05\xb6\x33\x22\xcc\x01\x99\x39\xea\x80\x51\x07\x0c\x4d\
+\x07\xc8\x86\x01\xcb\x83\x50\xf2\x30\x48\x2f\xe5\x0e\xa0\x12\x26\
+\xc9\x01\xa0\x42\x83\xda\x0e\x90\x6d\x20\xc1\x01\xa0\x62\x53\xc6\
+\x83\xfc\xa0\x47\xc7\x24\x17\xc5\x23\x08\x00\x00\xde\xad\xa4\x3a\
+\xba\x2d\xc7\x0f\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\
+\x00\x00\x01\xbd\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x01\x6f\x49\x44\x41\x54\x58\x85\xed\
+\x96\xdd\x4a\xc3\x40\x10\x85\x17\xf5\x3d\xfc\xb7\xfe\x52\x45\xf4\
+\x4d\xa5\xb9\xf0\x42\xbc\x29\x3e\x4f\x05\x41\xa4\x55\xd1\x36\x56\
+\xa9\x8f\x50\xcf\xd0\x1d\x58\xca\xce\x64\x76\x93\x5e\x99\x03\xdf\
+\x55\x76\xe6\x9c\x24\xfb\xe7\x5c\xab\x56\x71\xad\x83\x02\x0c\xc0\
+\x7e\x8d\x3e\x87\xe0\x09\xf4\xc0\x9a\xb5\x88\x06\xde\x81\xb9\xa7\
+\x04\x27\x19\xe6\x1d\xf0\x19\xf4\xe9\xbb\xc5\x8b\x55\xaa\x17\x14\
+\x31\x63\x70\x94\x60\x4e\x81\xcb\x48\x9f\x1b\x4b\xf1\x4b\xa4\x30\
+\xe5\x4b\x9c\x81\x2f\xa1\xc7\xb3\x25\x00\xfd\xb7\xb1\xd0\x60\xea\
+\x0d\x24\x75\xfd\x98\x58\x2d\x85\x3a\xb5\x04\xe0\x10\xe1\xff\x0b\
+\x99\x81\x4b\xc1\xfc\x5b\xa8\xc9\x9a\x47\xcb\x93\x68\x39\xc4\x55\
+\x30\xf6\x5c\x31\x9f\x80\xe3\x54\x73\xd6\x01\xf8\x10\x1a\xff\x82\
+\x6b\x70\x01\x7e\x14\xf3\x94\xc9\x9b\x1c\x62\xe6\x89\x3d\x7b\x07\
+\xbb\x75\xcd\x59\x5b\x60\x24\x18\xc5\x78\x6b\xd2\x9c\xb5\x09\x86\
+\x46\xf3\x9d\xa6\xcd\x59\xdb\xe0\x55\x31\x1f\xfa\xa0\x2b\x13\xcd\
+\x07\x69\x65\xf0\x5a\xcf\xd9\xb6\x1b\x31\x0f\xd7\x7c\xf6\xb2\xab\
+\x6b\xbe\x92\x10\xda\x86\x54\xba\xf8\xa1\x33\xf7\x35\x9d\xba\xe6\
+\x74\x17\x90\xf6\x00\xde\xdb\xc9\x44\x3a\x3b\x6a\x7d\x09\x8b\x39\
+\xab\x2a\x44\xf2\x6e\xa8\x99\x4f\x5d\xfc\x54\xd3\x42\x24\x6d\xc9\
+\x7b\x15\xe6\xda\x71\xac\x1d\xe5\xe6\x10\x03\xc5\xdc\x72\x9e\xd3\
+\x18\xe9\x42\xf2\x68\x09\x50\x08\xe6\xda\x9b\x5b\x43\x14\x96\x62\
+\xba\x38\xde\x07\x45\xd2\x05\xa4\x4a\xf4\x3b\x26\x41\x9f\x07\xb0\
+\x61\x2d\xa6\x10\xb7\x6e\xb1\xef\x77\x33\xcc\x59\xf4\xd5\x46\xbe\
+\x97\xe9\x46\xdc\xea\xff\xe9\x0f\x13\x25\x11\xa0\x42\x5d\x49\x97\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x07\xbf\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x12\x00\x00\x0b\x12\
+\x01\xd2\xdd\x7e\xfc\x00\x00\x07\x71\x49\x44\x41\x54\x58\x85\xb5\
+\x96\x69\x53\x55\x57\x16\x40\x0f\x0f\x19\x04\x99\x04\x94\x88\x38\
+\x1b\x08\x08\x32\x0b\xca\x3c\x3c\x10\x9f\x4c\x22\x22\xa0\x4f\x9f\
+\x32\x83\xca\xa0\x01\x01\x15\x54\x44\x01\x71\xc2\x29\xce\x76\xd4\
+\x06\x47\x44\x6d\x01\x11\x7d\x8a\x8a\x03\x6a\x07\x4d\xac\x32\x58\
+\x76\x19\xaa\x3b\x76\x25\xe9\xfe\xd0\xdd\xd5\xa9\x5e\x7d\x24\x7f\
+\x20\x7c\x78\x1f\x56\xdd\x5b\xb7\x6e\x9d\xb3\xee\xde\x67\xef\x7d\
+\x05\x20\x7e\x2f\xf6\x91\xe3\x52\xac\x94\x16\xfd\x0a\x7f\xd1\x2f\
+\x7c\x25\x3e\x12\x2f\x89\xa7\xe8\xd7\xf7\x56\xf4\xdb\x29\xed\xfa\
+\xdd\xe2\xdc\x96\x0e\x67\xcd\xdf\xfd\xe2\x27\x4c\xc2\x46\xf6\x14\
+\x1e\xca\x63\x79\x63\x3a\x71\x9b\x62\x88\xdb\x20\x29\x8f\x21\xbe\
+\x4c\x45\x5e\x43\x16\x8d\xc7\x1b\xb0\x0a\xb3\x7c\xac\x33\x01\x31\
+\x47\x68\x13\x1b\x55\x1c\xfd\xe6\x08\xdb\x3b\x37\xd3\xd0\xb9\x8d\
+\xc6\xdb\x3b\xd8\xdd\x5d\xc7\xa5\xf7\x17\x59\x52\x95\x8a\x8c\xc8\
+\x03\xdd\x09\x04\x08\x6d\xe4\xee\x20\xf6\x7c\xdb\x48\x79\x57\x09\
+\x1b\xae\x97\x52\xd5\x5a\xce\xe6\xab\x95\x9c\x7a\x75\x12\x55\xe9\
+\x5c\x1d\x0b\x04\x09\x6d\xf4\xe1\x50\xf6\xbd\xdb\x45\xd9\xe3\x42\
+\xca\xba\x8b\xa8\xb8\xb6\x8e\x0d\x97\x4b\x39\xfe\xcd\x51\xe6\x57\
+\xc6\x20\xbc\x75\x29\x10\x2c\xb4\x31\xa7\xc3\x38\xf4\x43\x13\x15\
+\x2f\x4b\x28\xed\x5d\x4d\xe9\xad\x35\x94\x5d\x2a\xe2\xf0\x8b\x43\
+\xa8\x36\xc9\x08\xf8\xe8\x52\x20\x54\x68\x55\xe7\x23\x38\xf6\xf7\
+\xc3\x54\x7d\x57\xca\xfa\xe7\x85\x94\xf4\xe4\x53\xd2\x96\x4f\xd3\
+\xb3\x7d\xcc\xdb\x1c\x85\xac\x0e\x1d\x0a\x84\x0b\x6d\xdc\x35\x25\
+\xa7\xff\x79\x8c\x2d\x03\xe5\x54\xf4\x17\x51\xdc\x9b\xcb\xea\xf6\
+\x2c\x76\x3f\x6b\x24\x66\xab\x12\x31\x4b\x97\x02\x91\x42\x9b\x70\
+\x2b\x8a\xb3\xff\x3e\x49\xcd\x87\x0a\x2a\xbe\x2d\xa6\xf8\x69\x0e\
+\x79\xb7\x34\x34\xf4\xd5\x31\xb7\x26\x42\xc7\x02\x4a\x59\x86\xf7\
+\xa2\x38\xf7\xdf\x53\xd4\x0c\x56\x50\xfe\xa6\x90\x35\xcf\xb2\xc8\
+\xea\x5a\x42\x6d\x5f\x0d\x51\x35\xe1\x08\x3f\x1d\x0a\xe8\x45\x89\
+\x3b\x8b\x7b\x63\x39\xf3\xeb\x09\xb6\x0c\x96\x51\xfa\x66\x15\xf9\
+\x4f\x35\x68\x6e\xa5\xb0\xf9\xe9\x26\x12\xf7\xaa\x50\x04\xe8\xdd\
+\x1f\x96\xc0\xb8\x88\x71\x49\x11\x79\xa1\x5d\x26\xe1\x46\x03\xfa\
+\x61\x62\x40\x3f\x52\x12\x2d\x99\x27\x89\x95\x24\x48\x92\xc4\x80\
+\x41\xb2\xf8\xde\x7a\xa5\xd9\xcf\x79\x8f\x34\x1c\xfb\xcf\x41\x36\
+\x7c\x28\xa6\xe8\x75\x36\x59\xbd\xe9\x2c\x69\x4f\x64\xfd\x83\x2f\
+\x59\x77\xb9\x88\x89\x29\xe3\x7f\x31\x0c\xd3\xff\x5e\x2f\x50\x0c\
+\xe8\xcd\x91\xf8\x89\x01\x59\x9a\x03\xc2\x5d\xe2\x26\x71\x15\x03\
+\x46\x1e\x86\x03\x9a\x82\xe5\x5d\x53\x23\xa6\xa6\x09\xcb\xd9\xe6\
+\x55\xce\x6a\x47\xe6\xb6\x84\x90\x70\x3d\x9a\x65\x77\x17\x91\xff\
+\x4c\xc3\xda\xef\xf2\xd9\xf8\x97\x12\xea\x06\xab\xd8\xf7\xb7\x7a\
+\x9a\x3e\xd6\xb3\xe7\xe3\x76\x8e\xfc\xbc\x9f\xdd\xbf\xd4\xb1\x76\
+\x20\x97\xdc\x97\x6a\xd4\x3d\x49\x24\x5f\x55\x51\xd2\x55\x48\x53\
+\xdf\x5e\xb6\xdd\xad\x66\x43\x47\x19\x15\x37\x4a\x65\xa3\x5a\xcf\
+\xc6\xab\xe5\x54\x5d\xa9\xa4\xea\xd2\x06\xaa\x2f\x6c\x62\xcb\x85\
+\x2a\x9a\xda\x77\x13\xb8\x2c\x80\xd1\xee\x56\xb5\x42\x6f\x86\x28\
+\x1f\xbf\xc8\x06\xa7\xb3\xe3\x71\xeb\x98\x4c\xf4\x93\x00\x56\xbc\
+\x5d\x44\xe9\xc7\x02\xb6\xfd\xab\x92\xdd\xff\xdb\xc6\x41\x76\x72\
+\x88\x46\xf6\xfe\xba\x9d\x1d\xff\xd8\x48\x85\xfc\xfa\xdc\xd7\x72\
+\xf3\xde\x24\x16\x76\xc5\x90\xd8\x12\x4d\xda\x89\x24\x34\x7f\x48\
+\x23\xeb\xdc\x72\xf2\x5b\x32\x59\x73\x31\x87\xe2\xcb\x05\xac\x6b\
+\x5d\xc3\xfa\xb6\x62\x29\xb4\x8e\x8d\x37\xd7\x53\xdd\x51\x41\xbd\
+\xb6\x06\xbf\x05\xde\x28\xa6\x28\xaa\x85\x70\x11\xe5\xb6\x2a\x0b\
+\x6c\x6a\x8d\xb0\x38\x26\x98\x70\xd9\x82\x99\xdd\x93\x08\x7b\xee\
+\x4d\xca\xdb\x18\x72\x07\xd3\x29\xfe\x31\x93\x92\x1f\xb3\x29\x1c\
+\xcc\x20\xef\x9d\x9a\x95\xaf\x52\x48\x7f\x12\x4f\xe2\x1d\x25\xaa\
+\xd6\x50\x54\x47\xc3\x89\xdd\xa3\x24\xbe\x29\x9a\xa4\xaf\x54\x2c\
+\x3a\x11\x47\xea\xd7\x0b\x58\x7a\x2e\x99\xe5\xcd\x8b\x59\xd9\x9c\
+\x4e\xd6\x1f\x97\x91\x7b\x76\x05\x05\x67\x32\x29\x95\xa9\x72\x9c\
+\x3f\x05\x31\x55\x48\x01\x67\x51\x6e\xa3\x34\xc3\xba\xd4\x98\x51\
+\xf5\x02\x9b\xd3\x06\x4c\x6e\x1d\x8d\x6b\xd7\x04\x7c\x1f\x3a\x12\
+\xda\xe7\x89\xaa\x3f\x88\x94\xd7\xf3\x58\xfa\x2a\x81\xb4\x17\x71\
+\x24\x3d\x8c\x66\xde\xed\x60\x22\xae\xfa\x13\x79\x62\x36\x4a\x39\
+\x1f\x62\x0e\x84\x11\x7b\x32\x92\x04\x19\x8d\x85\xad\xf3\x58\x7c\
+\x23\x8e\x74\x79\x36\xd4\x1d\x0b\xd1\x74\xa4\x90\xf1\x27\x29\xd1\
+\xa6\x26\xf7\x92\x4c\xef\x95\x55\x38\x25\x4f\x45\x38\x7d\x12\x70\
+\x92\x02\xe1\xe6\x58\xaf\x19\x89\x49\x89\xc0\x5c\x4a\x8c\x3e\xa1\
+\xcf\xf8\xf3\x66\x4c\x6f\x1b\x83\x73\xbb\x3d\x33\x3a\x1d\x70\xbd\
+\x35\x01\x77\x99\xa2\x59\x37\xbf\x20\xe0\x86\x3b\x41\x97\x3d\x09\
+\x3a\xee\x45\xf0\x2e\x5f\xc2\x0e\xfa\xa3\x3c\x33\x87\x98\x2b\xc1\
+\xc4\xb7\x47\x90\x7c\x3b\x86\x34\x6d\x3c\xea\xfb\x72\xf3\x9e\x14\
+\x56\xf6\xc8\x28\xdc\x4b\x25\xe3\x4e\x1a\x19\x9d\xe9\x14\x76\x64\
+\xe3\xb8\x74\x32\x32\xfa\x52\xe0\x73\x51\x3e\x36\x6c\x34\xd6\x6b\
+\x8d\x19\xb9\x4a\x60\xba\x4e\x30\xaa\x56\x8a\x1c\x94\x22\xa7\x14\
+\x8c\x39\x67\x88\x5d\x8b\x31\x63\x9b\x8d\xb1\x3e\x3b\x02\xf3\xe3\
+\x02\xcb\xfd\x0a\x1c\x6a\xad\x98\xb1\x75\x0a\xb3\xf7\xbb\x13\x7a\
+\xce\x97\xa8\xeb\x81\xc4\xdd\x8e\x20\xe5\xfe\x7c\xd4\x8f\x93\xc8\
+\x78\x96\x4a\xce\x73\x35\x79\x2f\xe4\x99\x78\x21\x43\xdf\xb7\x82\
+\xbc\x27\xcb\xc9\x7e\xa8\x66\xf5\xc3\x4c\x9c\x73\x64\x0a\xdc\xa4\
+\x80\xa1\x93\x61\xb9\xeb\x62\x27\xc6\xdf\xb0\xc0\xb6\xcd\x18\xdb\
+\x56\xe3\xa1\xeb\x98\x76\x23\xc6\x76\x1b\x61\x77\x4f\xf2\x40\xde\
+\xf7\x18\x61\x73\xc7\x40\x3e\x33\x61\xea\x99\x09\x98\x14\x48\xd9\
+\x72\xc1\x98\xfd\x23\x71\x39\xef\xc0\xa2\x47\xb2\x12\x5e\x17\x52\
+\xf1\xb6\x8c\x2d\xef\xab\xd8\xfe\xa1\x86\xfa\xc1\xed\xec\x1c\xac\
+\xa3\xf1\x87\x7a\x76\x7e\xa8\xa7\xe1\xfd\x0e\x76\x0c\xd4\xd2\xf0\
+\x6e\x07\x11\xd5\x01\x18\xf8\xea\x57\x8b\x31\xb3\xc6\x6c\x5a\x5e\
+\xa2\xc6\x26\xd6\x12\x93\x68\x43\x4c\xe6\x49\xe6\x4b\xe2\x24\xf1\
+\x86\x98\x26\xc8\xeb\x02\x43\x2c\x52\x4d\x71\xc8\xb0\x23\xb3\x37\
+\x13\xff\x6b\x81\x98\xae\x15\x98\x35\x08\xac\x4e\x2a\x18\x77\xc1\
+\x94\xf0\xa7\x9e\xac\x90\xa1\x9e\x5e\x32\x09\xfb\x22\x5b\xec\x0a\
+\xad\xf9\x6c\xb5\x64\x95\xa4\xc0\x1a\xbb\x5c\x49\xa6\x35\x63\x35\
+\xd6\x4c\x5c\x61\x4f\xf6\x61\x0d\x76\xd1\xb6\xdb\x84\xb1\x97\xb1\
+\xff\x68\x5f\xab\x3c\xc5\x74\xbd\x1c\x31\x4d\xe4\xc8\x94\xe4\x08\
+\x47\x89\x93\xe4\x0b\x89\xb3\xc4\x45\xe4\x28\x5c\xf5\x34\x26\xa1\
+\xc6\x6f\x62\xcf\xc6\x32\xa7\x3d\x88\x51\xd5\x02\x8b\x23\x7a\xd8\
+\x9f\x1f\x85\xd3\xcd\xcf\x98\xff\x2a\x90\xa8\x4e\xbf\x4f\xd2\x6f\
+\xe5\x9f\x93\x46\x8e\xee\x9c\x21\x82\x24\x81\x92\x39\x12\x7f\xc9\
+\x2c\x89\x8f\xc8\xb1\x08\x31\xcb\x33\xf2\x31\x9a\x3d\xbc\x59\xe0\
+\x2f\xba\xfd\x0e\xf8\x11\xd8\x1d\xc2\xa8\x9d\x02\xdb\xaf\x0d\x98\
+\xd6\x66\x8b\xc7\xdd\x29\xa4\xbe\x8b\x21\xa0\xc3\x15\x3d\xa5\x18\
+\x5e\x2b\x1e\xd6\xcb\x7e\x42\xeb\xb3\xcb\x87\xa0\xfb\x21\x98\x1f\
+\x10\x8c\x6b\x31\x1d\xaa\x12\xff\x5e\x67\x34\x83\x89\x04\x76\xba\
+\x21\xa2\x74\x39\x0d\x7d\xa5\x40\x9d\x2f\x41\x8f\x42\xb0\x3c\x22\
+\x98\x78\xc9\x02\xf7\xee\xc9\x04\xf5\xcd\x24\xfb\x63\x0a\x21\x9d\
+\x1e\xc8\x89\xa9\x43\x01\x1f\x29\xb0\x55\x0a\x3c\x0e\xc1\xea\xb8\
+\x62\xa8\x61\x79\xde\x9d\x4a\xe8\x4b\x4f\xf2\x7e\x4a\x23\xb4\xd3\
+\x53\xc7\x02\x5e\x42\xeb\x5d\x29\x05\x9e\xfc\x26\x30\xa5\xd5\x1a\
+\x2f\xed\x34\xc2\xfe\xec\x45\xfe\xcf\xe9\x84\xb6\x4b\x81\x48\x5d\
+\x0a\x78\x08\xad\xd7\x97\xbf\x09\x58\x1e\xd3\x63\xd2\x15\x2b\x3c\
+\xee\x4c\x21\xe4\x85\x07\xb9\x3f\xa5\x12\x72\x4d\x0a\x44\xe8\x52\
+\xc0\x5d\x68\x3d\x4b\x7c\x86\xce\x80\xc5\x61\x81\xc3\x45\x73\xdc\
+\xba\x26\x12\xf0\xd4\x95\xcc\x8f\xc9\x04\x5e\x9c\x89\x08\xd3\xb1\
+\x80\x4f\x89\x2c\xc3\x47\xc1\x98\x36\xc9\x2e\xd8\x62\x84\x63\xbb\
+\x1d\x3e\x8f\x3e\x47\xfd\xd7\x58\x82\x9b\x65\x04\x42\x75\x28\xa0\
+\xef\xa5\xd0\xaa\x2a\xe3\x88\x6c\x8b\x62\x7c\xad\x25\x93\x8e\x58\
+\x33\xa3\x79\x22\xb3\xae\x3b\x93\xf2\x72\x2e\x89\xcd\xd1\x18\x84\
+\x8d\x78\xa8\x33\x01\xc7\x70\xc7\x5a\x97\x38\x17\x26\xf8\xd9\x63\
+\xe6\x39\x12\xb3\x00\x63\xcc\x95\x92\xf9\xc6\x38\x2c\xb1\xc1\x3d\
+\xcb\x15\xe7\x25\x4e\xbb\x74\x26\x60\x30\xd3\xc0\x6f\xc4\x8c\x11\
+\x9f\xda\x73\xc6\x10\x2e\x12\x57\x89\x9b\x64\xa6\xc8\x30\xf4\x31\
+\xc8\x31\xf2\x36\xf2\x1f\xce\x9a\xff\x07\x70\x6d\xc5\x46\x83\xee\
+\x03\x42\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x02\xf6\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x02\xa8\x49\x44\x41\x54\x58\x85\xed\
+\x56\x3b\x68\x54\x41\x14\x8d\xda\x68\x91\x66\x17\x77\x11\x44\x90\
+\x80\x58\xf8\x83\xa8\x51\x2c\x56\x21\xb2\x6f\xbf\xa0\xb0\x56\x16\
+\x51\x02\x69\x04\x49\xfc\x16\xc2\xa2\x62\x95\x2a\x12\x50\x51\xc1\
+\x0f\x42\xf2\x1e\x68\x11\xad\x34\x8d\xbb\x1a\x49\x50\x8b\xc0\xa6\
+\x11\xac\x8c\x18\xc4\xce\x22\x41\x4d\xce\x95\x33\x30\x2e\xe4\xcd\
+\x9b\xd9\x47\x9a\x78\xe1\x30\xef\x73\xef\xb9\x67\xee\xbb\x6f\x66\
+\xda\xda\x0c\x56\x2c\x16\xb7\x17\x0a\x85\x4b\xf9\x7c\x3e\x00\xea\
+\xb9\x5c\xae\x81\xb1\x06\x8c\xe0\x7a\xc0\xf3\xbc\x0e\x13\x87\x93\
+\x21\x69\x37\x92\x4c\x01\x8b\x11\x50\x83\x98\x43\xb1\x24\x2e\x97\
+\xcb\xed\x20\x7b\xaa\x27\xc0\xfd\x0c\x30\x84\xeb\x7e\x8c\xa7\x80\
+\x73\xb8\x1e\x06\x3e\x35\x09\x79\x58\xa9\x54\x36\x38\x27\x47\xb9\
+\xb7\x80\x7c\x5a\x23\x1c\x43\x25\x76\x87\xc5\xc0\xa7\x0b\x18\xd7\
+\x62\x26\x4b\xa5\x52\xda\x75\xe6\xd3\x9c\xf1\x4f\x8c\x27\x6c\xe2\
+\x11\xd3\x0b\xcc\x33\xfe\x5d\x26\x93\x59\x6f\x25\x40\x95\x5d\x92\
+\xa3\xb1\x0e\x58\x05\xd3\xd8\x37\x0b\xac\xc4\x7d\xdb\x40\x55\x42\
+\xab\x99\x37\x1b\xe2\xfb\xc8\xf3\x07\xbc\xfb\xa3\x06\xa9\x6e\x1f\
+\x6b\x25\xb9\xc6\x57\x27\xdf\xb8\xd1\x59\xfe\x73\x6d\xf6\x7b\x62\
+\x12\x70\x44\x55\x01\x9f\x73\xb3\xc9\xf9\x32\xbf\x7d\x23\x8e\xe4\
+\x62\xd5\x6a\x75\x2d\x38\x67\xc9\x7b\x26\xd4\x19\x0e\x3e\x1d\x87\
+\xe2\x12\x20\x26\x6b\x02\x79\x1f\x98\x04\xbc\x61\xb9\xfa\xe5\x3e\
+\x15\x24\x4f\xa6\xfc\xe4\x28\x46\xdf\x01\x23\x1b\x83\xc4\x71\x0a\
+\xb8\x46\x01\x2f\x4d\x02\x1a\x14\xd0\x23\xf7\xe9\x20\xf1\x35\x1d\
+\x24\x17\x5d\x91\xf2\x13\x33\xe4\x3d\x4b\x01\x1f\x4d\x02\x5e\x53\
+\xc0\xf9\xbf\x15\xf0\x93\x65\x88\xb8\x0d\xdc\xb1\x86\x9f\xb8\x05\
+\x01\x47\x59\x81\x1b\xe4\x7d\x65\x12\x30\x4a\xc7\xe1\x50\x47\x4b\
+\x03\xdf\x13\x56\xe0\xb1\x49\xc0\x00\x05\x7c\x8e\x2b\x39\x36\xa4\
+\x75\xe0\x9b\x23\x6f\x5f\xa8\xb3\xec\xe7\xda\x3a\xd0\x15\x87\x00\
+\xf0\x78\x6a\x1d\xc0\xc6\xb4\x35\x4a\x40\x2d\xf2\xca\x65\x30\x59\
+\x03\x50\xd5\xf7\x2c\xff\xf3\x48\x41\x72\x98\xd0\xf6\xfe\xde\x56\
+\x04\x80\xe3\x82\x9a\x3d\x56\xd9\x83\x36\x81\x6a\xe1\x98\x97\xcd\
+\xc9\x25\x39\xe2\x8e\x21\xfe\x17\x79\x6e\x5a\x05\xcb\x49\x46\x0e\
+\x13\x54\xbf\x60\x6c\x9e\x7f\x6d\x0d\x12\x5e\x54\xc9\xb9\x07\xec\
+\xb3\x93\x0f\x93\x93\x0c\x82\x27\xb4\xa6\xac\x63\x56\x87\xe5\xbb\
+\x2e\x23\x5a\xba\xdd\x53\xdf\x5c\x25\xe7\xf8\x0d\xb1\x3b\xac\x45\
+\xc8\x49\x06\x84\xf7\x34\x22\xc1\x2c\x9e\x3d\x02\xae\xca\x0a\x07\
+\x5c\xe7\x7f\x3e\xa7\xf5\xce\x6f\x60\x10\x33\xdf\xa5\x36\x22\x79\
+\x8f\x67\x3b\xad\x45\x88\x21\x70\xaf\xac\xe3\x42\x1c\x76\x22\xe6\
+\xfb\x67\xe2\xaf\x62\xb9\xc5\xb7\x2e\x42\x2c\x9b\xcd\x6e\xe2\x29\
+\xe7\xae\xfc\x56\xec\x93\x17\x72\xe4\xc2\x6c\x4f\x2f\xb7\xdf\x37\
+\x8b\x90\xca\x38\x8b\x70\x35\x08\xde\x06\x7c\x61\xa5\x7e\xa0\x27\
+\x3a\xff\x8b\x10\x11\x7a\xbf\xac\x2e\x11\x7a\x63\x42\xc0\xf7\xb8\
+\x0e\xc1\xce\x22\x80\x0f\x2b\x2e\x40\x89\x40\x05\xde\x42\xc0\x95\
+\x25\x42\xfb\xfc\x91\xf0\x56\xf5\x0c\x00\x00\x00\x00\x49\x45\x4e\
+\x44\xae\x42\x60\x82\
+\x00\x00\x08\x45\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x12\x00\x00\x0b\x12\
+\x01\xd2\xdd\x7e\xfc\x00\x00\x07\xf7\x49\x44\x41\x54\x58\x85\xc5\
+\x96\x79\x54\x54\xe7\x15\xc0\xaf\x51\x59\x1c\xde\xf0\x66\xde\x9b\
+\xf7\x66\x58\x8e\x24\x11\x8c\x0b\x4b\x6d\x4f\xcf\x69\xf1\x1f\xd3\
+\x2c\x27\xa7\x8b\x08\x71\xab\xe2\x1a\xa3\x80\x0b\x18\x57\xc0\x00\
+\x0a\xb2\xc8\x22\x84\x4d\x64\x71\x69\x83\x9a\x53\x6d\xcf\x49\x1a\
+\x17\x14\x01\xb5\xb2\xaa\x55\x70\x58\x86\x75\xd8\x19\x96\x48\x5a\
+\x4c\xda\xdc\xde\x79\x43\x15\x74\x50\x3c\xcd\x39\xfd\xe3\x77\xbe\
+\x6f\x66\xbe\xf7\xdd\xdf\x77\xef\x9d\x6f\x06\x10\x11\xfe\x9f\x00\
+\xbb\xf7\x3e\xb0\xfb\x1e\xd0\x78\x0f\x6c\x77\xde\x01\xdb\x6d\x95\
+\x44\x19\xc8\xb7\xdc\x06\x66\xd3\x2d\x60\x36\xdc\x00\x66\x6d\x31\
+\xd8\xac\xbe\x0e\xcc\xca\x6b\x30\xcd\xe7\x0a\xc8\x57\x5c\x05\x61\
+\x4d\x21\x58\x7c\x58\x00\x96\x4b\xaf\x82\xd5\xb2\xa7\x58\x2e\x2d\
+\x00\x8b\x25\x97\x41\xdc\x73\x17\x84\x9d\x55\xa0\x0a\xaa\x7c\x02\
+\x47\x28\x03\x2b\x40\xbe\xbd\x1c\xde\x4e\xd0\xc2\x7b\x29\x8d\xaf\
+\x26\x20\xa3\xc0\xb0\xf8\x32\x58\xfb\x5c\xb1\xe1\x56\x5d\x73\x98\
+\xe6\x7d\x45\x12\xb0\x5c\x36\x8a\x71\x4e\x52\xd3\xbd\x2e\xfd\xf8\
+\x02\xb2\xdf\x17\x82\x15\x9d\x1e\xde\xfb\x4a\xbe\x36\xfe\x1e\x2e\
+\x89\xac\xc4\x29\x24\x63\xca\xc2\x28\x34\xb7\x20\xa9\x69\x8b\x49\
+\x60\xf7\x9d\x1f\x4f\xc0\xc6\xb7\x48\x4a\xef\x94\x0f\xbe\x92\x79\
+\x84\x55\x61\x60\x07\xa2\xd5\xda\x92\xef\x99\x65\x57\x40\xb1\xea\
+\x1a\x28\x7d\x0b\x41\xb9\x9a\x46\x9a\x2b\x56\x14\x80\xb8\x97\x4e\
+\xff\x09\x05\xdf\x59\xf9\xbf\x09\xd8\x90\x80\xcd\xfa\x12\xb0\x5e\
+\x59\x08\x53\x7e\xf3\xb5\x6c\x41\x70\x39\xfa\x77\x23\x2e\xd7\x23\
+\x4e\xdf\x54\xfa\xc8\x28\x25\x5b\x45\xa5\x59\x5d\x24\x8d\x33\x68\
+\x9d\x94\x7a\x29\xf8\xf8\xd3\xbf\xba\xc0\x66\x12\xf8\xe8\x26\x58\
+\xd3\xe6\x53\xbd\x2e\x31\x3f\x0d\xa9\xc0\xed\x74\x72\xdb\x12\xc4\
+\x35\x75\x88\x96\x1f\x97\x0e\x59\x51\x40\xd9\x1a\x2a\x0f\x95\x68\
+\x06\xad\x93\xd2\x3e\x41\x70\xf3\x02\xba\x09\x04\xb6\x96\x01\xb3\
+\xf9\x6f\x60\xbd\xae\x04\xa6\xfa\x14\x30\x0b\x42\xca\xa5\xb4\x2b\
+\x0b\x11\x85\xab\x88\x6b\x6b\x49\xc0\xaf\x7c\xd0\xca\x78\xf2\xf5\
+\x37\x60\x06\xad\x7b\x59\x70\x73\x02\xef\x26\x37\x98\x17\x90\x07\
+\x94\xc2\x8c\x8d\xb7\x60\xea\xf2\x42\xe6\x67\xa1\x15\x18\x44\xc1\
+\xf9\x22\x44\xcd\x15\x44\x35\x09\xac\x23\x01\x8b\x80\xca\x01\xab\
+\x35\x25\x20\xdb\x78\x13\xc4\x5d\xcf\x37\xdc\xcb\x04\x16\x25\x3c\
+\x84\x77\x92\xea\xc6\x0b\xc8\x49\x40\xbe\xad\x02\x64\x54\xff\xe9\
+\xab\x8b\x98\x9f\x84\x54\x62\x60\x2b\x22\x77\x0d\xd1\xee\x12\xa2\
+\xfd\xc5\x1f\x50\xbc\x8c\xe8\x5b\x4d\x37\xc8\x96\xf2\xf6\xa9\xbe\
+\xc5\xc0\xd1\x66\x7c\x60\x25\x51\xf1\x52\x38\x42\xb9\xa3\x02\x98\
+\x6d\x26\x81\x5f\x25\xd6\x3e\x23\x10\x54\x05\x32\xff\x72\xb0\x58\
+\x7f\x83\x71\x0f\xad\xc4\xed\x0d\x88\x8a\x2f\x7f\x40\xcd\x9f\x1f\
+\xa3\xc3\x85\xc7\x68\x7f\x7e\x04\x85\x0b\xdf\xe1\x8a\x0a\xc4\xd5\
+\x07\x8a\xd1\x69\x47\xa9\xc0\x7c\x7c\x1b\x58\xff\xb2\x69\xac\x7f\
+\xa9\x85\x19\x2c\x09\x6b\x36\xa0\xec\x35\x45\x40\x19\xb0\x5b\xcb\
+\xa9\xbc\xe5\x60\x43\xf3\x45\x47\x28\x03\x63\x05\x6c\xf7\xdc\x03\
+\xd9\x8e\x2a\xb0\xf8\xa8\x94\x71\xdb\x5f\x81\xdb\xee\x23\xb2\xe7\
+\x46\x50\x3c\x3b\x8c\x76\x67\x1e\x49\x68\xf2\x1f\x21\x9f\x3f\x8c\
+\xcb\x6e\x7c\x87\x8b\xd2\xea\xd0\x35\xee\x21\xce\x8e\xd5\xe2\xdc\
+\x23\xe6\x99\x17\x4f\xc4\xd4\xe2\xfc\x98\x1a\x83\xdb\xc1\xbf\x17\
+\xb9\xc6\xd4\x24\xb8\x45\xdc\x5d\x3f\x77\x7b\xb1\xe7\xe2\x0c\x9d\
+\xd5\xfb\x89\x5a\x93\x80\xed\xde\x07\xc0\xec\xba\x0b\x96\x01\xe5\
+\xcc\xbc\xe0\x0a\x0c\xa8\xfc\x1e\xe5\xa7\x1f\xa1\x90\x37\x80\x9a\
+\x13\xfd\x68\x37\x8a\x26\xaf\x1f\xf9\xdc\x7e\x5c\x59\x30\x8c\x5e\
+\x05\x23\xe8\x5d\xfc\x18\x97\x1a\x29\x99\x98\x15\xc5\x23\xb8\xe1\
+\xe6\xc8\x08\x77\x6a\xf0\xa6\x78\x6a\x20\x4b\x7d\xa2\x7f\xab\x90\
+\xdd\xe7\xe9\x91\xd6\xc2\x3a\xee\xbf\x0b\x14\xfc\x3e\xc8\xf7\xdc\
+\x07\xeb\xa0\x3b\xf2\x39\xc1\x55\xe8\x7f\xeb\x9f\xc8\x64\x19\x90\
+\x3f\xd6\x83\x22\xa1\xce\xea\x7e\x82\x48\x08\x99\xdd\xa8\x24\x14\
+\x99\x3d\x93\x86\x3b\xde\xd3\xae\x3a\xde\x57\x2c\x66\xf7\x66\x89\
+\x39\x86\xad\xea\x3c\xc3\x42\x21\xb5\x9d\x95\x53\x6c\x29\xf8\x8c\
+\xdd\x0f\x44\xe7\xd0\x2a\xf4\x2b\x1e\x46\x59\x4a\x27\x2a\x93\xdb\
+\x51\x95\xd2\x8e\x82\x19\x54\xa3\xf0\xcf\x92\x3c\xca\x67\x63\x18\
+\x7d\x4f\x95\xd2\xa1\x17\x52\x3b\xae\x8b\xa9\x1d\xe9\x62\x5a\xa7\
+\x9f\x98\xd9\xe5\x29\xa4\x75\xb2\x6c\x68\x35\x95\x20\x54\x0b\xaf\
+\x2f\xbd\x90\xbb\xe1\x3c\x9d\x2a\xba\x09\x65\x61\x75\xa8\x08\xaf\
+\x43\x65\x84\x16\x95\x61\x63\xf8\xf4\xa1\x89\x03\x4f\x51\x18\xf9\
+\x54\x6b\x22\x5c\x2b\x3d\x67\x84\x8b\x20\x0e\xd5\x22\x17\xd9\x80\
+\x5c\x14\x11\xa3\xd3\xf3\xb1\x8d\xd7\xf9\xd8\xe6\x74\x3e\xbe\xd9\
+\x8f\x4f\x68\xf5\x54\x25\xb6\xb0\xb4\x1f\x80\x22\xf4\x21\xb0\x61\
+\xb5\x33\x9d\xbd\xcf\xf5\x3b\x44\xeb\x50\xa0\x07\x99\x90\x1a\xda\
+\xbc\x7a\x42\x58\xc2\x36\xb8\x1a\xe5\x04\xb3\xff\x79\x6c\xf6\x99\
+\x60\x8c\xec\xaf\x31\xee\xa7\xb7\x0d\x7d\x78\x5d\x1e\xaa\x4d\x97\
+\x87\x69\xfd\xd8\xf0\x3a\x4f\xc5\xa1\xba\x51\x81\x10\x12\x38\xa0\
+\x05\x3e\xb2\xde\x63\xfe\xef\x3e\x1f\x9a\x75\xb4\x15\xed\x8e\x34\
+\x22\x13\x51\x8f\xca\x83\xc6\x93\x8c\xc7\xf8\x9e\xed\xc1\x5a\x74\
+\x48\xac\x47\xe7\x24\x1d\xbe\x9e\xf0\x62\x9c\xe2\x75\x38\x33\x4e\
+\xd7\xe1\x18\xdb\x50\xec\x18\x53\x9f\xe1\x10\x5d\xef\x6f\x17\x5d\
+\xe7\x29\x46\xd6\xb2\xdc\x41\xfa\x16\x28\x43\x6a\x4c\x59\x08\xaf\
+\x05\xd5\x61\x9d\xab\xab\x57\xfe\x90\x4b\xba\x1e\xed\x13\x5b\xd0\
+\x36\x52\x87\xdc\xe1\x46\xe4\xc7\x60\x7c\xcd\x46\x35\xe2\xaf\x53\
+\x3b\x70\xf9\x5f\x3a\xd1\xe7\x42\x17\xfa\x9c\x9f\x18\xef\x3f\x75\
+\xe1\x6f\xcf\x75\xfc\xeb\x83\xfc\xf6\xea\x77\xff\xa0\xcf\x7f\xfb\
+\xb4\x7e\xf7\x3b\xa7\xda\x16\xfd\x32\xb5\x45\xc9\x85\x35\x98\x04\
+\x24\x89\x30\x2d\x28\x0e\xd5\x83\x70\xa4\xd9\xdd\xd5\x3b\xff\x9b\
+\x39\x99\x1d\xe8\x98\xdc\x86\x6c\x6c\x13\x72\x71\x14\x3c\x4e\x27\
+\xc1\x51\x76\x04\x92\x93\x2d\x6e\xc3\x37\x57\x15\x34\xbc\xb5\xf1\
+\xa2\x7e\xf6\xba\x8b\x5d\xe6\x70\x59\x7f\xb1\x6f\x96\x7f\x51\xeb\
+\x5b\x5b\x0a\x2a\x5d\x3e\xb9\xf9\xc7\x39\xfb\x6e\x1f\x9c\x1f\x54\
+\xb4\x79\xc1\xbe\x5b\x0b\x17\x26\xe8\x59\x4d\x60\xd3\x18\x01\xaa\
+\x07\xa5\x17\x14\x87\x75\x20\x26\xb5\xba\xba\x2d\x39\x33\x34\x27\
+\xbb\x0b\x1d\xd2\xda\x51\x11\xdf\x8a\xd4\x38\xa8\x4a\x68\x41\x3e\
+\xb1\x15\xb9\xd4\x76\x74\xf1\xfd\xf2\xdf\x9a\xb0\xb6\x59\x9a\xc4\
+\x96\x37\x35\x49\x2d\x6e\x84\xfb\xf3\x34\x7b\x68\x12\x9b\x3d\xd4\
+\xf1\xcd\x6f\xa8\xe3\x9b\xd4\x04\x4b\xd8\x38\x24\x36\x5b\x39\x45\
+\x35\x4d\x53\xed\xa5\x5f\x43\x65\xb0\x49\x80\xba\x1a\xb8\x88\x5a\
+\x50\x46\x35\x80\x32\xb6\x09\x34\x29\x7a\x77\x37\xef\x33\x43\xb3\
+\x73\x7a\xd0\x21\xa3\x13\xb9\x64\x3d\xaa\x8e\xb6\xa1\x8a\x46\x3e\
+\xbd\x13\x9d\xd7\xfd\x15\x6d\xa3\x5b\x81\x32\x44\xd2\x8d\xa0\x88\
+\x31\x43\xb4\x79\x58\xfa\x4c\x19\xa5\x03\xe1\xa9\x40\xf5\x53\x81\
+\xc8\x7a\xe0\x68\x01\x17\xdf\x02\x9a\xb4\x0e\x57\x37\xef\x2f\x86\
+\x66\xe5\xf4\xa2\x7d\x56\x0f\xf2\x54\x77\xc1\x08\x5d\x50\x2e\x1b\
+\x2f\xd2\xeb\x76\x29\x63\x92\x74\xb4\x6e\xf2\xc4\xe8\x80\x23\x01\
+\xb5\x39\x01\x8e\x04\x78\x5a\xc4\x1f\x69\x06\x3e\xa9\x0d\xec\x32\
+\xbb\xdd\xdd\x7c\xce\x0e\x39\xe5\x19\xd0\x3e\xbb\x0f\xf9\xac\x5e\
+\x54\xd1\x75\xec\xb2\xe1\x6b\xe4\xd3\x3a\x41\xf8\xac\x1d\x94\xd4\
+\x3b\xca\xc3\x0d\xc0\x19\xa1\x67\x5f\xc6\x38\x01\xe9\xd4\x92\x40\
+\xcd\x38\x01\x55\x5c\x13\xa8\x12\x5b\x81\x4f\xe9\x00\x4d\x56\xaf\
+\xbb\xeb\x87\xe7\x86\x9c\x4e\x0e\xa0\xdd\xe9\x01\x14\x3e\x1f\xc2\
+\xd9\x9b\x2e\xa1\x2a\xb3\x1b\xe8\x66\x03\x35\x21\x65\x2e\x6a\x72\
+\x12\xe3\x04\x54\x87\x6a\x41\x11\x6c\x5e\x40\x48\x68\x01\xaa\x39\
+\x08\xe9\x5d\x20\x66\x1b\xdc\xe7\x2f\x3d\x3b\xf4\xc6\x17\xdf\xa0\
+\x78\x7c\x18\x9d\xa9\x04\xaa\xdc\x5e\x10\x8e\xd1\x67\x84\xfa\x78\
+\xf7\xa4\x33\x31\x4e\x40\x88\x69\x90\x50\x4c\x20\x20\x1c\x6d\x03\
+\xaa\x3b\xa8\x8e\xf5\x80\xfa\xc4\x80\xdb\x02\xdf\x73\xdf\xce\x0f\
+\xff\x07\x72\x5e\x77\x50\x3c\xd5\x07\xea\xdc\x1e\xd0\x64\x13\x39\
+\xc4\x89\x5e\x92\xa8\x33\x09\xbc\x40\x62\x7c\x0f\xec\xa2\x06\xda\
+\xa5\xa3\x7b\x80\xb2\x40\x37\x93\x39\x01\x91\xea\x2c\x64\x74\x81\
+\x90\xd3\x07\xb3\xf3\x07\x7f\xfe\x0b\xbf\xa2\x6f\xe5\xdb\x06\x8b\
+\x84\x34\x03\x08\x29\x7d\x20\x24\x9b\x10\x69\xae\x4e\xed\x97\x24\
+\x94\x2f\x28\xc7\x38\x01\xcd\x4e\x1d\xd1\x08\x76\x81\x8d\x92\x80\
+\x32\x6a\x02\x81\x74\x6a\xb8\xac\x1e\x98\x79\xd2\x30\x65\x5e\xee\
+\xe0\x5c\xc7\xd4\x81\x39\x62\xa6\xe1\x35\x75\x86\x01\xd4\xe9\x14\
+\x38\x9d\x46\xe3\x3c\xd3\x40\x3d\x33\x38\x46\x62\x32\x02\x41\xba\
+\x49\x09\x88\xc7\xba\xc1\x29\xaf\x0f\x9c\x4f\x0d\x80\x63\x76\x3f\
+\xa8\x69\xae\xc9\x7d\x86\x3c\x03\xd0\x9f\x17\xb0\x3f\x3d\x68\x6a\
+\x4c\x33\x59\x18\x27\xc0\x47\xe8\x24\x54\xe1\x24\x10\xa1\x95\x1e\
+\x7a\xa1\x00\x35\x9e\xf3\x09\x12\xc8\xa2\xd3\xfe\x37\x68\xce\x28\
+\x63\x25\x48\xf2\x49\x3f\xbc\xf0\x5b\x10\xae\x93\x10\xc2\x48\x20\
+\xfc\x15\x05\x72\xc6\x04\x1f\x4b\x2e\x09\x9c\x9c\x9c\xc0\x7f\x00\
+\x5f\x7f\x42\x95\x20\x3e\xe4\x57\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
+\x00\x00\x08\x2d\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x12\x00\x00\x0b\x12\
+\x01\xd2\xdd\x7e\xfc\x00\x00\x07\xdf\x49\x44\x41\x54\x58\x85\xc5\
+\x96\x79\x54\x54\xe7\x19\x87\x5f\x23\xb2\x38\xdc\x99\x3b\x73\xef\
+\xdc\x3b\xc3\x72\x24\x89\x60\x5c\x00\x6b\x7b\x7a\x4e\x8b\xff\x98\
+\xda\xe6\x78\xd2\x56\xc5\xe0\x52\xc5\x35\x46\x01\x77\x63\x5c\x40\
+\x71\x61\x17\x50\x11\x10\x91\x4d\x6d\x83\x9a\x53\x6d\xcf\x49\x1a\
+\x11\x14\x01\xb5\x22\xab\x0b\x32\x03\x0c\xeb\x30\xac\xc3\x12\x49\
+\x8b\x49\x9b\xb7\xef\x9d\x21\x8a\x0d\x7a\xf0\x84\x9e\xfe\xf1\xcc\
+\x7c\x73\xe7\xde\xfb\x7b\xde\xef\xfd\xee\x37\x03\x88\x08\xff\x4f\
+\xe0\x57\xf1\x7a\x98\x13\x57\x0d\xf2\x2d\x25\xa0\xda\x56\x0a\xdc\
+\xf6\x32\x50\x0f\x43\xd8\x51\x0e\xe2\x27\x95\x60\xbb\xf0\x1a\xd8\
+\xf9\xe5\x81\xfd\xe2\xeb\xcf\xb0\xf3\xbb\x0e\xb6\x1f\xe4\x81\xb0\
+\x32\x1f\xe4\x4b\xaf\x83\xcd\xa2\x5c\x60\x96\xdd\x00\xc7\x15\x37\
+\x81\x59\x55\x08\xcc\xda\x5b\xc0\xac\xbf\x03\xf2\x8d\x77\x41\xb1\
+\xf9\x1e\x51\x06\xcc\xf6\x0a\xb0\xdb\x51\x09\xf3\x12\xf4\xf0\x2e\
+\x65\x8f\x5a\x60\xc2\x82\x1c\xb0\xa3\x30\x29\xd4\x6e\xf1\x10\x34\
+\xb6\xf1\xcd\x05\x6e\xf9\x0d\x17\x87\x45\xb9\x8e\x30\xff\x1a\xc8\
+\x48\x64\xec\x05\x76\x55\x80\xcd\xfc\x1c\xb0\xa5\x30\xab\x84\x15\
+\xa9\xfa\x71\x14\xba\x30\xac\x0c\x57\xc5\xde\x47\xf8\xcd\x17\x72\
+\x7b\x9a\x05\xd9\x1f\xf2\xc7\x4e\x40\xbd\x83\x24\x76\x92\xc4\xee\
+\x4a\x50\x2e\xcd\x03\xd5\xf2\x1b\xa0\x5a\x41\xf8\xe7\x83\x92\xc6\
+\xcc\xe2\x5c\xb0\x5f\x55\xf4\xed\x36\x13\xe2\xcc\xd0\x72\x1c\x37\
+\xef\x0b\x99\xd4\x1e\x47\xff\x82\x57\x0a\xbc\x7f\x52\x0f\x73\x8f\
+\x8d\x46\xc0\x22\x51\x6e\x95\xa0\x56\x4c\x5c\x96\x0f\xb2\xe5\x37\
+\x41\xb6\xa2\xc0\xf2\x2e\x85\x4d\x58\x5f\xfc\x64\x89\x11\x31\xb0\
+\x03\x71\xd6\xbe\x12\x1c\xf7\xdb\x2f\x65\x0e\x74\x9e\xe3\x9a\x22\
+\x70\x1c\x41\xc0\xe1\xe3\x4a\x98\x9f\xa8\x87\x79\xc7\x47\x2b\x30\
+\x5c\x82\xda\x31\x51\x0a\xa7\x29\x96\xad\x2c\x04\x7b\x0a\xb2\xfb\
+\xa8\xb8\x7f\x65\x0d\xa2\xa2\x08\x71\x0b\xcd\xc4\x4f\x83\x4b\x71\
+\xfc\x82\x1c\xc6\x81\xce\x73\xfc\xf0\x36\xc8\x37\x3c\x17\x90\x93\
+\x00\xb3\xab\x12\x1c\x76\x3e\x00\x97\x68\xc3\x6b\x08\xfc\xb7\xc4\
+\xea\x22\x90\xad\xb9\x05\xf6\x14\x62\x17\x50\xd2\xb7\x4a\x8f\x28\
+\x5c\x47\x54\xe5\x23\x4a\xed\x98\x15\x5c\x82\xe3\x17\xe5\x31\x0e\
+\x74\x1e\xb3\xe1\xef\xa0\xd8\x64\x15\x50\xec\xa8\x00\xc5\x27\xf7\
+\x41\xbe\xeb\x01\x28\x62\x1a\x5f\x53\x60\xf8\xc2\xfc\xb8\x02\x64\
+\xeb\x6e\x83\xfd\xca\x22\xb0\x0d\x2a\xeb\x5d\x4d\x02\x1a\x12\xd0\
+\xe6\x22\xf2\x05\x88\xdb\x49\xe2\x67\x21\x34\x13\x4b\xf2\x99\x89\
+\xeb\xa8\x0d\x41\xc5\xcf\x04\xd8\xdd\xf7\x49\xe2\x01\xc8\x77\xde\
+\x7f\x2e\xc0\x6c\x26\x81\xad\x24\x40\x12\xfc\xa8\x28\x03\x8e\xa4\
+\xc7\xfb\x17\x02\x6c\x2c\x69\xf5\xaf\x42\x14\xaf\x21\x3a\x5f\xfd\
+\x0e\x9d\x72\x10\xb9\x1b\x34\x13\xcd\x88\x3f\x09\x2e\xc3\x09\x2b\
+\x0a\x18\x19\xad\x03\xf9\xe6\x52\x90\x0f\x09\xb0\xbb\x1f\x5a\x66\
+\x01\xe6\x4a\x02\x47\xab\xc1\x31\x88\xa6\x68\x53\x09\xb0\x84\x92\
+\xc6\x6c\xd0\xbd\x37\xd8\xc0\x62\x07\xc2\x8e\xb0\xfd\x21\xf7\x6c\
+\x98\x8f\xee\x82\xdb\xd6\x62\x61\xc5\xfe\x42\x5c\x5a\x4a\x2d\xb8\
+\xf2\x0d\x3a\x5f\x1e\x44\x97\x2b\x4f\x51\xfb\x97\xa7\xa8\xfc\xfc\
+\x3b\xdc\x52\x87\xe8\x1d\x52\x86\xb6\x6b\x6e\x31\xb2\xc0\x12\x5a\
+\x03\xe5\x56\x81\x3d\x8f\x2c\xb3\x00\xef\xc5\xeb\x60\xfe\x29\x83\
+\xfd\xb4\x2d\x85\x3e\x5e\x87\x2a\xd7\x78\x46\x3d\x8e\xf3\x3a\xfc\
+\xa0\x60\x46\xd4\x63\xf3\xf4\x28\x3d\x4e\x8f\xd5\xe1\xb4\xa3\x23\
+\x33\x25\x5a\x87\x9e\x31\xd5\x38\x27\xa9\x06\x17\xdf\xfa\x06\xf9\
+\xec\x01\xd4\x66\x3f\x41\xa7\x0b\x56\xc4\x8b\x03\xc8\x5e\x1a\xc4\
+\xcd\x0f\x11\xbd\xf6\x96\xa2\xed\x87\xc5\x8c\x6c\x6b\xb9\x65\x0d\
+\x58\x05\x1e\x02\xb8\xee\xad\x84\x99\x49\x4d\xac\x90\xd6\xed\xa3\
+\xc9\xea\xd9\x24\x9e\xeb\x4d\xe5\xce\xf5\xdd\x5e\x7b\x7b\x70\x70\
+\x69\xe1\x20\xfa\x15\x3d\x7d\x39\x85\x4f\xd1\x97\x58\x90\x37\x88\
+\xcb\xf2\x06\x90\xcf\xe8\x41\x6d\x66\x0f\x3a\x65\x59\xd1\x12\x42\
+\x66\x2f\xca\xcf\x3f\xc1\xa0\xb2\x6f\x71\xfa\xbe\x52\xb4\x0b\x2a\
+\x61\x18\x7a\x0c\x15\xbb\x1f\x59\xda\x00\x72\x7a\x11\x12\x5b\x59\
+\x4d\xa6\x79\xb6\x98\x6e\xde\x24\xa6\x75\xa5\xaa\xcf\x74\x17\x72\
+\x67\x3a\x5b\x95\x29\x9d\x38\x5a\x54\x29\x1d\x28\x10\x62\x6a\x07\
+\x6a\x86\x21\x9e\xee\x44\x9e\x60\x52\xcd\x18\x78\xe7\x9f\x38\x75\
+\x5f\x39\x3a\x6c\xaf\x90\xcb\xa9\x7a\x85\x24\xc0\x86\x54\x81\x90\
+\xd4\xc6\x8a\x29\xed\x3e\x62\x52\x5b\x80\x98\x68\x4a\x16\x12\x4d\
+\x37\xd5\x09\x26\x23\x7f\xa2\x15\x2d\x9c\x1c\xc6\xf7\xc7\x12\x5e\
+\x44\x3d\x84\x30\x02\xd2\x71\x15\x5d\x23\x4b\x68\xc3\x80\xc2\x01\
+\x74\x0f\x29\xc7\x89\xbb\x1e\x89\x92\x04\xa8\x0e\x54\x83\x3a\xbe\
+\x89\xe5\xe3\x9a\x7d\xf8\xd8\xc6\x00\x3e\xba\x31\x99\x8f\xae\xbf\
+\xc9\x45\x19\x8c\x5c\x78\x1d\x72\x61\xc4\x11\x3d\x72\x87\x6a\x50\
+\x79\xf0\x7b\x74\xa8\x3c\x30\xc4\xfe\x6a\x54\x0d\xe7\xc0\x10\xa1\
+\xba\xe7\x1c\xd2\x59\xae\x93\x85\xd2\xb5\x91\x0d\xb8\xf6\x72\x07\
+\xbe\xe9\x77\x25\x83\x0d\xd1\x59\x05\x94\x47\x6a\x58\xf6\x60\x8d\
+\x8f\x3c\x54\x17\x20\x0f\xd1\x25\x2b\x42\xaa\x6f\x32\xc1\x8f\x8d\
+\xcc\xde\xc7\xc8\xec\xa9\x42\xc7\x21\x98\xbd\x3f\x44\xbe\xaf\x0a\
+\x15\x04\xbb\xbf\x8a\x64\x5e\x0e\xdd\x0f\x05\x2a\xc4\x25\xd2\x80\
+\xee\xbe\x97\x7a\xd8\x50\xfd\x24\x65\x48\x35\x00\x77\x58\x07\x62\
+\x98\x9e\x75\x8a\xac\xf1\x71\x89\xac\x0d\x74\x8d\xaa\x3d\xe5\x1a\
+\x5d\x57\x38\x29\xc6\x60\x72\x8b\x35\xe0\x9b\x71\xaf\xc6\xfd\x98\
+\x01\x5d\xe2\x6b\x51\x71\x58\x8f\xaa\xc3\x35\x34\x5b\x2f\x22\x1d\
+\x63\x0e\xd5\xa2\xd3\xd1\x7a\x9c\x7c\xbc\x19\x67\xfc\xfe\xd3\x7e\
+\x3e\xac\x76\x26\xbb\x5f\x07\xca\x60\x49\x20\xb4\x0e\x7e\x99\xd8\
+\xa4\x9a\x7b\xae\x65\xce\xbb\xe7\x8d\xbb\x7e\xfd\x47\x63\xf6\xbc\
+\xec\xd6\xaa\xdf\x5d\x32\xfd\xcb\xf7\xcf\xed\xb8\xe8\xf2\x2b\xb8\
+\xd2\x8e\x4b\xfe\xda\x86\xef\x27\x9a\x90\x0d\xaf\x47\x2e\xa2\x1e\
+\xf9\x61\x48\x9f\x15\x61\x06\x74\x8e\x6f\x42\x8f\x64\x23\x7a\x2e\
+\xc8\xee\x57\x47\x18\x3c\xd9\x83\x7a\x90\xaa\x57\x05\x3f\x06\xd0\
+\x6e\x6b\x80\xd9\x71\x46\x76\xd6\x9e\x3b\xb3\x67\x6c\x2f\xd8\x30\
+\x75\xcf\xdd\xc3\x1e\x3b\x6f\xff\xe9\x9d\x8d\x79\x65\x93\x03\x0b\
+\x9a\x3d\xd6\x5c\xed\x9e\xb2\xfa\x6a\xfb\x48\xbc\xb3\xee\xaa\xf1\
+\xed\xe5\x79\x75\xb2\xf9\x2d\x28\x50\x08\x47\x55\xf2\x31\x06\x0b\
+\x5c\x4c\x3d\xb2\xd1\x0d\xe8\x7a\xa2\x05\xa7\xa6\x98\xd0\xd3\x37\
+\xfb\x2b\xe1\x68\xa3\xb7\xf2\x48\x2d\x28\x43\x75\x96\x70\x8b\x80\
+\x7a\xb7\x01\xdc\xc2\x1b\x6c\x5c\xe2\x1b\xed\x35\xb1\x0d\x8e\x04\
+\x4b\x68\x34\xb1\x8d\x6f\x69\xe3\x1b\x67\x6a\x8f\x49\x34\x79\x8f\
+\x80\x97\x36\xbe\xe9\x6d\x6d\x68\xcb\x64\x0f\xff\xcf\xff\xcd\x25\
+\xd2\xd3\x10\xdf\x8c\xea\xb8\x26\xa4\x05\x8d\xca\xd8\x66\x74\x49\
+\x6a\xc5\xa9\x69\xed\xe8\xb5\xf0\x42\xbf\x78\xac\xd9\x53\x19\x61\
+\x00\x6a\x09\x28\x0f\x54\x3f\x17\x10\x48\x40\x15\x6e\x00\x36\xaa\
+\x1e\x94\x91\x2f\x21\x6a\x04\x22\xea\x81\x2a\x04\x45\x64\x33\xb8\
+\xaf\xfe\x1b\xf2\xc9\x6d\xa8\x3e\x61\x44\xf5\xf1\x16\xe4\xe8\xdd\
+\xe5\x54\x1b\x4e\x49\xef\x44\x2f\xdf\x0b\xfd\xda\x04\xa3\xb7\x8a\
+\xce\x55\x85\xd7\x01\x77\x48\x6f\x59\xf8\xcf\x04\x34\x24\xc0\x91\
+\x80\x2a\x8a\x88\x7c\x0d\xe8\x66\x52\x45\x7c\x62\x2b\x78\xac\xbb\
+\x8a\x02\x6d\x36\xb4\x7f\x20\x4f\x38\xa7\x76\xe2\xe4\xf4\x2e\x0a\
+\xff\xac\x5f\x9b\x64\xf2\xe4\x62\x9b\x80\x23\x69\x55\x58\xed\xab\
+\x05\xb8\xc8\x51\x10\x51\x07\x2a\x09\xea\xa5\x70\xb2\x15\xf8\xa4\
+\x36\xf0\x58\xfb\x25\xaa\x69\x1b\xe6\x53\xbb\xd0\x39\xad\x1b\xdd\
+\x32\xcd\xe8\xb5\xe8\x62\xbf\x53\x4a\x87\x37\x7f\xac\x05\xf8\xa3\
+\x8d\xc0\x4b\xd7\x8e\x2c\x50\x3f\x7a\x01\x0a\xa6\xcd\xc9\x52\x89\
+\x86\x82\x69\xe7\x04\x75\x4a\x07\x4c\x59\x9f\x83\xc2\xa7\xfd\xe8\
+\x74\xbe\x17\xdd\xce\xf6\xa2\xe7\x07\x97\xfa\xb5\xa9\x5d\xde\x7c\
+\x82\x89\x36\xb9\x66\x50\xc7\x34\x8c\x81\xc0\xb0\xca\x35\x67\x3a\
+\x40\x3c\xdd\x0e\x02\xa1\xce\xe8\x02\x77\x6a\x81\x78\x66\x00\xdf\
+\xfa\xec\x2b\x9c\xe1\x77\xb1\x5f\x4c\x33\x7b\x0b\xc9\xf4\xdd\x09\
+\x23\x08\x71\x4d\x63\x20\x20\x55\x6e\x09\xaf\x01\x6d\x56\x17\x68\
+\xd3\x3b\x41\x9b\xd6\x09\x9a\x8c\x4e\x10\xcf\x75\x03\xb7\xa0\x02\
+\x67\x1c\xfc\x07\xce\xf2\xbf\xf4\xb5\x26\xab\xd7\x4b\x7d\xba\x93\
+\x7e\xe0\x4c\x20\x1c\x6f\x19\x03\x01\x29\x38\xdc\x1a\xae\x49\xec\
+\x01\x31\xa1\x1b\x84\x13\x43\x48\xe3\x24\x33\xfd\xd3\xe9\x2b\xf8\
+\x45\x40\xc1\xd7\x53\xb2\xfb\x7e\x2e\xa4\xd3\xb1\x53\xed\x20\xd2\
+\xfa\xf8\xf1\x02\x11\x86\x67\xe1\xda\xd4\x3e\xd0\xa4\x98\x41\x73\
+\x8a\x48\x96\xe8\xb6\x8c\xc5\x14\xf3\x1b\xae\x89\xbd\x53\xa7\x67\
+\xf4\x4d\x9b\x74\xd6\x3c\x4e\x48\xa5\xea\x93\xdb\xc6\x4a\xc0\xba\
+\xe0\x9c\xcf\xf7\x01\xfd\xc1\x00\x6d\xa6\x19\xb4\x19\xdd\x2f\xa0\
+\xc9\xec\x06\xd7\xb4\x1e\x70\x3f\xd7\x0b\x6e\x34\x16\x4f\x77\x8c\
+\xb1\x00\x55\xef\x44\x37\x7f\x21\x3c\x7d\x08\x49\x80\x70\x4d\x35\
+\x83\x7b\x16\x09\xd0\x82\xfc\xdf\x08\x9c\x25\x81\x0c\xf3\xf3\xe0\
+\x61\x68\xd2\x7f\x9c\xc0\x7f\x00\xae\x6d\x44\xc0\xfb\x85\x06\x9e\
+\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
+\x00\x00\x08\xc5\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x12\x00\x00\x0b\x12\
+\x01\xd2\xdd\x7e\xfc\x00\x00\x08\x77\x49\x44\x41\x54\x58\x85\xc5\
+\x97\x79\x74\xd4\xd5\x15\xc7\xef\x64\x42\x24\xcb\x4c\xb6\x49\x32\
+\x99\x99\x2c\x40\x12\x92\x10\x02\x14\x22\x06\xd0\xb0\x79\x88\xa0\
+\xb6\x22\xf4\x88\x34\x14\x51\x5a\xac\xe7\x20\x55\x0a\xb6\xc5\x8a\
+\xa7\x0b\x62\x4b\x44\x96\x8a\x08\x2e\xb4\x82\x02\x16\x64\x27\x10\
+\x96\x6a\x24\x11\xb2\x00\x25\x7b\xcc\x02\x42\xb6\x86\x06\x42\xa0\
+\x6c\xdf\x7e\xdf\x6f\x5e\x72\xa6\x2c\x2d\xfd\xab\x73\xce\xe7\xcc\
+\x9b\xf7\x7b\xef\xde\xef\xbb\xf7\xbd\xfb\x7e\x23\x00\xe4\xff\x89\
+\x98\x4d\x66\x51\x1f\x0b\x19\x49\x9e\x26\xf3\xc9\x5b\xe4\x23\xb2\
+\x85\xec\x23\x7f\x35\x89\x1c\x26\x7b\xc8\x66\xfe\x5e\x4b\x76\xb0\
+\xbd\x8d\x6c\x27\x07\x4c\xee\x31\x39\xec\x3f\x40\xbe\xf6\xf7\x91\
+\x77\x45\xac\xaf\xb2\x3d\x8d\x8c\x21\xc1\xe2\xfe\xf8\x7b\xfb\x88\
+\xbf\xb9\x87\xf8\x9a\xbd\x6f\x17\x30\x85\xcc\x21\x25\xcf\xcc\x42\
+\xf5\xb3\x33\x3b\x37\xb2\xbd\x57\x09\x90\x7b\x10\xa0\xc7\xee\x27\
+\xa7\x46\x8d\x3c\x52\xb6\xe0\x77\x78\x85\xa6\xb3\xf8\x7b\xf4\xbd\
+\x08\xc8\x20\x93\xc8\x02\x91\x36\x54\x34\xe0\xc6\xa1\x43\xa0\xb3\
+\xaa\x5d\xca\xf9\x3d\x0a\xd8\x43\xfe\xcc\xee\xd3\x73\xe7\xe2\xfa\
+\x57\x25\x4a\x00\x9e\x12\x09\x1d\xf5\xdf\x04\x04\x90\x61\x22\x5e\
+\x43\x39\x61\x65\x62\x32\x8c\xcf\x55\xe0\x48\x52\x02\x36\x88\x7c\
+\x7b\x50\x8b\xb8\x9b\x80\xae\xe7\x1c\xbb\x2f\xa7\x5f\x0a\x50\x52\
+\x0e\x94\xd7\x63\xe3\xc3\x99\xb8\x9f\x36\x47\x88\xc4\x05\xdd\x49\
+\x80\x97\x98\x8c\xce\x1e\x22\xde\x36\x0e\xfc\xf5\xc0\xc1\xc0\x47\
+\x9b\x81\xb7\x56\x93\xf7\x80\x6d\xfb\x70\x64\x60\xaa\x8a\xc4\x95\
+\x43\x7a\x85\xb7\x09\xd0\x79\x67\xba\x4e\x1e\x4e\xe9\x0f\x7c\xb2\
+\x1d\x58\xba\x06\x78\xf3\x8f\xc0\xfa\x6d\x58\xff\xe8\x13\x08\xa3\
+\x6d\x5f\x8a\x50\xbe\x7c\xcd\x3e\xe2\x47\x01\x0a\xcf\x0f\x9e\x4d\
+\xe2\xca\x97\xd0\xf1\x9c\x05\xb8\xf4\xe3\x39\xb8\x38\xf3\x45\x5c\
+\x7b\xe9\x55\x1a\xd9\x82\xa2\xf4\xa1\xf8\x54\xa4\x73\x97\xa7\x00\
+\xb2\x4d\xf3\x89\xc8\xb1\xbc\x41\x14\xbf\xe2\x7d\x5c\x7b\xf9\x57\
+\xe8\x98\xf5\x32\x3a\x9e\x7f\x09\x98\xfd\x73\x20\x7b\x35\xb2\x1f\
+\x1e\x0f\xe5\x83\x84\x78\x33\xea\xbe\x5e\xde\xdd\x02\x7c\xee\xb7\
+\x3a\x3a\x17\x3d\x3a\x05\x98\xbb\x10\x98\x3c\x03\xed\x4f\x4e\x43\
+\xdb\xc4\x2c\x37\x4f\x66\xa1\x73\xca\x4c\xe0\x37\xd9\xc8\x4f\xee\
+\x0b\x3a\xaa\xa4\x10\x59\x23\xee\x95\x6f\x75\xb7\x3f\xcf\x8d\x4b\
+\x00\xe6\xbf\x8e\xcb\x53\x7f\x84\xb6\x49\xd3\x8c\x79\x6a\xfe\x79\
+\xda\xba\xf1\xfd\x19\x5c\xd4\x2f\xb1\x30\x2d\x03\xf1\xa6\x00\x25\
+\x22\xda\x87\x22\x54\x1a\x64\x50\x50\xe4\x8a\xe2\x77\xb6\x00\xe7\
+\xaf\x01\xd3\x5f\x40\xcb\x80\x07\xd0\xf8\xc0\x68\x9c\x4b\x57\x8c\
+\xd1\xdf\xa3\xd1\x9e\x91\x09\x4c\x7b\x1e\x05\xbd\xa3\xf0\x81\x48\
+\xf9\x3b\x2a\x02\x41\x41\xea\xa8\x7d\xb6\x2b\xa6\x37\x40\xc7\x17\
+\x46\x4e\xc0\xb9\x61\x63\xf5\x3c\x37\x8d\x9c\xdb\x9a\x3e\x16\x60\
+\x3f\x7e\xf8\x02\x76\xcc\x5b\x82\xe9\x83\x33\xf2\xbb\xe3\xde\xdb\
+\xe4\x13\x36\xda\xcb\x56\x96\x68\x8f\x45\xd3\xa4\xa9\x40\x4c\x3c\
+\xce\x44\xc7\xa1\xa1\x4f\x12\xea\xe3\x92\xbb\xa9\xe5\xef\x96\x84\
+\xfe\xb8\x39\x76\x3c\x8e\xc6\x38\xb0\xcd\xff\xbe\xdc\x8d\xde\xe6\
+\xd5\xfb\xed\x76\x60\xd4\x23\x68\x4d\x18\x80\xba\x5b\xe6\x34\x28\
+\xd8\x77\xb3\x77\x22\x90\x9e\x81\x41\x41\xa1\x48\x35\x07\x5e\x9c\
+\x10\x1a\x3b\xa4\x5b\x40\x92\x8f\x85\x1b\x51\xac\x6c\x16\x7a\xdd\
+\xd7\x13\x1d\xe3\x1e\x07\x42\xc3\x50\xe9\xe7\x87\x2a\x6b\x10\xaa\
+\x02\x83\xbb\xa9\x20\xf5\x3d\xfd\x71\x25\x29\x15\x97\xf3\x8e\xa1\
+\x7d\x67\x2e\x3a\xed\x2e\x34\x58\x2c\xc6\xb3\xaa\x5b\xb1\x06\xa2\
+\xc3\x3f\x00\x88\x4f\x46\x0a\x9d\xd3\x47\x33\x4f\x5b\xea\xbf\xed\
+\xbc\xfe\xbe\x41\xc6\x11\x14\xb7\x88\xd2\x78\x3a\x6e\x19\x36\x0a\
+\x97\x4c\x82\x12\x6e\x9a\xbf\xdd\x42\x31\xa9\x22\xc8\x7a\x0e\x98\
+\xf0\x04\x2a\xe4\xce\xe3\x4e\x92\x26\x72\xc5\x66\xc3\x70\x8a\xa1\
+\xed\x0b\x64\x80\x72\x64\xf2\x14\x90\xea\x17\x24\x81\xba\xed\x10\
+\x89\x75\x8a\xd4\x3e\x18\x60\x45\x1b\x37\x55\x2d\x0d\xb0\xb2\x21\
+\x57\x73\x40\x7f\xb3\x34\xa3\x88\x1c\xd5\xed\xae\x67\x5d\xcf\xf7\
+\xeb\xe7\x6d\x7e\x16\x3c\x65\x09\x42\xb8\xc8\xd5\x5e\xac\xc6\xde\
+\xda\x8f\xd9\x53\x84\x12\x60\xd5\xed\x28\xc2\xe4\xd8\x18\xa3\xc2\
+\x89\x01\x16\x9c\xeb\x15\x8f\x2f\x68\x88\x3b\x1f\x9f\x91\xbf\x68\
+\x54\x7b\x93\xe6\xd6\x7e\x9e\x10\xf0\x3e\x40\x8d\xbf\x15\xb3\xe8\
+\x3c\x85\x61\x67\x71\x1b\x9a\xe8\xae\x35\xb7\x0b\x48\x62\x0a\x7a\
+\xea\xb6\x9d\x7c\x47\x8c\x8b\x23\x80\xa5\xb3\x70\xb6\x25\x10\xb5\
+\x51\xb1\xe0\xd9\x07\x2f\x26\xb0\xd0\xa8\x82\x74\x47\x36\x69\xa1\
+\xac\x09\x38\xe5\x17\x80\xf9\x01\x81\xa0\x9d\xd6\x4c\x91\x7e\x0f\
+\xd2\xa6\x12\xd0\x15\x01\x2f\xcf\x14\x84\xfb\x06\x75\xb7\x95\x90\
+\x04\xa2\x26\x7c\x97\x3f\x79\x31\x1d\x5e\x1b\x16\x8e\x0b\x8f\x7d\
+\x0f\x45\x3d\x7c\xb0\x9e\xc6\x37\x68\x47\x5d\x6c\xd4\xab\xde\xa0\
+\xc3\x5f\xc9\xcd\xb6\xca\x62\xc5\x33\x22\x35\x93\x45\xfa\x8e\x17\
+\xa3\xc4\x4b\x1f\xb9\xcb\xa7\xcc\x11\x25\x0c\xb3\xa8\xe2\xf2\x31\
+\x79\x9f\xf0\x6c\xcb\x2f\xc8\x73\xe4\x83\x5e\x71\x40\xeb\x65\x20\
+\xf3\x31\xc3\xc9\x1a\x1d\x8d\x2e\x3e\xd4\x7d\xef\x91\x32\x9e\xa2\
+\xf6\xd7\x16\x63\xc3\x90\x61\xe0\x8d\x9a\xb2\x90\xf3\xd5\x25\xd4\
+\x9f\xd8\xee\x26\xe0\xb0\xdd\x25\xcc\x9f\xac\xd4\xbc\x4d\xb2\xc9\
+\x4f\xc9\x3c\xde\x2d\x7b\x1d\x4e\xd4\x47\xba\xb0\x93\x0e\xd8\x8f\
+\x65\x64\x95\x07\x2c\x48\x58\x4e\xfe\x40\x58\x9e\x71\x3c\xdc\x8e\
+\x7d\xae\x28\x70\x01\x25\x3f\xa3\x0d\x8e\x97\xd5\xe4\x4f\x62\xdc\
+\x15\x46\x19\x57\xd5\x53\xbd\x67\x6c\x52\x02\xf6\xda\x9d\xaa\x8e\
+\xcb\x52\x71\xbf\x84\xd0\x90\x2c\x12\xe3\x4a\xde\xba\xc3\x11\x85\
+\xe2\x10\x9b\xb1\x3a\x8a\x53\x15\x10\x34\x64\xa4\xc2\x93\x8f\x75\
+\x34\x56\x69\x11\x27\x99\xb6\x2d\x14\x4e\x1b\x15\xca\xd6\x12\xb2\
+\x82\xac\xd2\xac\xd6\xa8\x48\xcb\x1e\x0a\xd8\xa0\x9d\x67\x6b\xe7\
+\xaf\xb1\xb6\xe7\xb8\xa2\x51\x6e\xb3\x1b\x61\x5f\xa7\x37\x99\xda\
+\xe9\x9f\x6b\xb6\xe8\x5d\xef\xf9\x7b\xb3\x16\xa8\xf6\x46\x65\x78\
+\x24\x72\x9c\x4e\xbc\xce\xbb\xe3\xb7\xda\xf6\x32\xcd\x0a\x0f\xba\
+\x05\x28\x95\x8b\xc9\x1b\x22\x47\x0f\x3a\x5d\xa8\xb2\x85\x1b\x0e\
+\x95\x63\x5e\x3a\xc6\x49\xc8\xd1\xe7\x7e\x97\xae\x01\x65\x1e\xfd\
+\x39\xba\xbd\xc3\xe3\x78\x56\x44\xd8\x71\xc0\xe5\x02\xed\x5e\x5c\
+\xac\x17\xb9\x54\x3b\x5e\xae\x91\xdd\x11\x4e\x63\xf3\xe9\x01\x27\
+\x0b\xa2\xb9\x72\x86\xbd\x6b\x65\xca\xf0\x21\xc2\xb7\x1d\xe4\x11\
+\xbe\x74\xa0\x50\x55\xc2\xa1\x23\x80\xa7\xa7\x1b\x55\x51\x3d\xff\
+\x52\x8f\x39\xa8\xe7\x6c\xd7\x54\x72\x21\xf9\x2e\x27\xe8\xf8\xca\
+\xef\xb5\x88\xe5\x9e\x02\x76\x86\x46\xc8\x87\xee\xd0\xe7\xe6\x39\
+\x22\x51\x11\x1c\x62\xac\x64\xa7\xae\x6c\xca\x30\xaf\x2e\x7c\xad\
+\x39\xa1\x9c\x87\x84\xa2\x63\xc6\x0c\xb4\xcd\x9d\xc7\xcb\x2b\x0a\
+\xd5\xec\x2b\xd0\xcf\xf3\xf5\x9c\x83\xda\x86\xb2\x55\x15\x6c\x43\
+\x9e\xc3\x01\x0a\x68\x5a\xac\xa3\xb0\xac\x4b\xc0\x56\x7f\xab\xec\
+\xb0\x85\xec\x2c\x1b\x91\x81\x52\x5f\x3f\xec\xe6\x84\x3d\x7a\x35\
+\xca\x60\xb1\x76\xaa\x30\xee\x00\x6e\xae\xa6\x58\x27\xca\x7c\xe4\
+\x44\x45\xa0\xdf\xfe\xda\x60\x3f\x20\x21\x1e\xa7\xc5\x7d\x27\x1c\
+\x17\x77\x19\x2e\xd0\x36\x94\x2d\x55\xce\xcb\x82\x83\x50\x12\x17\
+\x8f\x4f\x7d\xbc\xbf\x79\xd3\x43\x84\xec\x8e\x8e\x7b\xe3\x5a\x5d\
+\x23\x5f\xa1\x56\x1a\xf9\xdd\xa3\x43\x7d\x4c\xdc\x17\x8a\xca\x73\
+\x39\x69\x50\xce\x99\x9e\xe6\xb8\x68\x65\xbc\xb1\xdc\x2c\xae\x5a\
+\x9b\x55\x28\x32\xff\xb4\x3d\x18\xe8\x9f\x82\x66\x3d\xb6\x54\x0b\
+\x3e\xa6\x6d\x75\xed\x9b\xc6\xc4\x01\x38\xbf\x68\x29\x72\xd2\xd2\
+\xbf\xe8\x4a\x85\x7c\xf5\x50\xe6\x80\x3c\xa7\x1d\xc5\xb1\x31\x38\
+\xce\xf0\x7f\xa9\x73\x7c\x4a\xaf\xf8\x1b\xd2\xa2\x9c\xc7\xc4\xe0\
+\xef\x7d\x7b\x2b\xa3\xad\x74\xda\xaf\xd2\xc7\x4b\xea\x23\x82\x85\
+\x11\xf2\x63\x5f\x61\xad\x3d\x0c\x18\x38\x08\x9d\x1c\x5b\xab\xe7\
+\x9e\xd2\xb6\x94\xcd\x22\xa6\xad\x88\x63\x0a\x22\x42\x91\xeb\x8a\
+\x9a\x92\xdd\x2d\x60\xf8\x58\xa1\xba\x14\x9e\xe7\x4b\x45\x11\x61\
+\x38\xe3\x70\x19\x13\x55\x5e\xeb\xc9\x45\xe5\x3c\x3e\x01\xad\x7d\
+\x7b\xa9\x6b\xb6\x99\x51\x49\x29\xe6\x4d\xc2\x30\x4b\x83\x3d\x44\
+\x18\x72\x39\x61\x12\x0b\x57\x5c\x58\x1d\xca\x48\x0c\x1e\x82\x7f\
+\xea\x88\x55\x6b\x11\x67\x59\xc8\x4e\x39\x1d\xc6\xa9\xe2\x5d\x31\
+\xf1\x5d\x9d\x02\x43\xc0\x91\x87\xc6\x19\x6f\xba\x3c\x36\x69\x6a\
+\xf7\x56\x3b\xc3\x70\x3e\x32\xd2\x70\xde\xa1\x9c\xc7\xf6\xc2\x19\
+\x97\x43\x19\xba\x5e\x6e\x92\xa1\xa5\xbc\x49\x94\x80\x62\x0f\x01\
+\x27\xd9\x57\x61\x12\x1b\xc7\xd4\x56\x87\x58\x81\xb4\x21\x46\x24\
+\x94\x8d\x7f\x44\x38\x51\x1b\x1d\x65\xa4\x81\xa7\x22\x8b\xff\x19\
+\x8c\xf7\xc9\xb7\xbb\x04\xe4\x8f\xcc\x34\x4a\xa3\x82\xbb\x7e\xac\
+\xca\x59\x9d\xcd\x8a\x9b\xa9\x7c\xc3\x7d\xe4\x71\xb4\x27\xc6\xa2\
+\x86\x2f\x13\x95\x5e\x32\x86\x48\xa9\xf9\x2e\x02\x48\x95\x59\x62\
+\xb9\x07\x4a\x4f\x47\x84\x00\xc9\xc9\xb8\xc9\x23\xf8\x6d\x54\xa4\
+\x91\x02\x1e\xdf\x9f\xa8\x37\x6a\x75\xe4\xd7\x7a\x9e\x02\x4f\x01\
+\xea\x8f\x05\x8f\x51\x1a\xc3\x79\xe9\xea\xba\x75\xb8\x91\x7f\x0c\
+\x67\x45\x5a\x98\xd3\x41\x35\x74\x5c\x69\xfe\x0f\x02\xd8\x5f\xcd\
+\xfb\xb6\xc6\x4b\xac\xcc\x7f\x51\xeb\xf0\x34\x5c\x7f\x65\x81\xb1\
+\x89\xb9\x69\xb3\xb8\x30\xd9\xc5\x79\xeb\xef\x41\x80\x30\x77\x29\
+\x2d\x63\x46\xe1\xfc\x0f\xb2\x54\x18\x07\x52\x80\xd4\x78\xdf\xa3\
+\x00\x7e\x73\x8e\xa5\x29\x7d\x70\x5d\xfb\xec\x17\xd5\x66\x9c\xcc\
+\x4d\x2a\x77\x15\x50\xe0\x29\x80\x03\x0a\xdc\x02\xa4\xb9\x4f\xec\
+\x98\xc6\x68\xe7\xb8\x3a\xb6\xeb\x4c\xff\x9b\x00\x6e\x40\x39\x1b\
+\x12\x90\xd4\x14\x17\x33\x95\x47\x52\x0c\x01\xa6\x3b\x0b\xf8\x17\
+\x0f\x54\x86\xb4\x3f\x5f\xcd\x1b\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
+\x00\x00\x0a\x03\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x12\x00\x00\x0b\x12\
+\x01\xd2\xdd\x7e\xfc\x00\x00\x09\xb5\x49\x44\x41\x54\x58\x85\xb5\
+\x56\x79\x58\x55\xd5\x1e\x5d\xf7\x5e\x28\x87\x52\x2b\xad\xaf\x14\
+\x51\xd3\x54\x2c\x87\xaf\x94\x1e\x96\x36\xaa\x99\xa5\x62\x6a\x69\
+\xe2\x00\x5c\x40\x10\x07\x84\x04\x94\x41\x91\x41\x66\x64\x90\x79\
+\x30\x04\x94\x79\x48\x28\x87\x14\x73\xc2\xa7\xe2\x54\x49\x86\xd9\
+\x2b\xb5\x32\x1b\x00\x19\xee\x3d\xbf\xb7\x2e\x17\xfa\xe8\x69\xd3\
+\xfb\xea\x8f\x75\xf6\x3e\xe7\xec\xfd\x5b\xeb\xb7\xf6\x08\x11\xc1\
+\x5f\x45\xb8\x16\xaa\xd0\xa5\x40\xd1\x66\x13\xc7\x6c\x6f\x93\x57\
+\xae\x5c\xc8\x47\xa4\x03\x54\xff\x4f\xac\x3f\x6e\xa4\x08\xbe\xbf\
+\xf6\x15\xf2\x23\x3d\x51\x1c\xb7\x16\x65\xdb\xdc\x50\x99\xee\x81\
+\x34\x37\xcd\x4b\xd2\x98\x28\x4d\x97\x5d\x9b\xc2\x97\xa1\x6f\x98\
+\x2d\xd4\x67\xab\x4b\xfe\x01\x01\xff\x83\x08\x66\xba\xf1\x4d\x68\
+\x2e\x94\x8e\xbf\x28\xd2\x2c\xa2\x7c\x27\x55\x11\xbd\x52\xbe\x3e\
+\x9f\x8c\xb0\x65\x50\xff\xad\x02\x74\x6d\x6d\xa8\x3b\xfd\x11\x92\
+\xdc\xe7\x23\xcd\x73\x0e\x52\xbd\x67\x21\x33\x60\x26\xe2\xb5\xaa\
+\x17\xf5\xb7\xaa\xf4\xd2\x7c\x40\x44\xff\xa9\x34\xd6\xad\xbf\x15\
+\xb4\x00\xfd\xb6\xd0\x85\x8f\x0a\xe3\xfe\x39\x07\x22\xed\xa0\xda\
+\x30\x07\x9a\x73\xc5\x63\xeb\x45\xff\x8d\xc8\x77\x49\x22\x3f\xe4\
+\x89\xe8\x2e\x49\x59\x50\xcf\xe4\xfa\xc3\xbe\x08\x59\xf2\xd7\x5c\
+\xb8\xe3\x47\x85\x68\x6e\x68\x40\x4d\x65\x01\x22\x1c\xa7\x22\x76\
+\xc5\x0b\x88\x71\x9d\x8c\x78\x8f\x67\x11\x69\xa3\x9a\xa4\x6f\xa9\
+\x54\xa4\xb9\x4a\xe4\x9b\x64\x23\x74\xe7\xa4\xf1\x63\xaf\x16\xbf\
+\xb9\xe8\x1d\xb0\x04\xaa\xb2\x6d\x5e\x7f\xbf\x03\x61\xcc\xde\xdb\
+\x1a\xea\xf3\x3b\xc7\x7d\x29\xba\x4f\x45\xae\x85\x91\x3c\xc9\x88\
+\x1b\xe9\x22\xad\x67\xa5\xc4\xaf\x47\xe2\x27\xef\x3b\xc1\x77\xf6\
+\x9f\x77\xe1\xb7\xc7\x5f\xd7\x86\x73\x47\xcb\x90\xe0\x6e\xc5\xb1\
+\xb7\x42\xba\xef\x44\x04\x2e\x54\x8f\xd7\xff\x9c\xa7\xc8\x8f\x99\
+\x22\xff\x09\x16\xb9\x1a\x27\xf2\x75\x2c\xeb\xd1\x14\x50\x2d\x0d\
+\xa7\xdc\x5a\x7d\xe7\xe2\x1e\xbf\xf9\x7f\x7e\x49\xde\xf6\xa1\xa9\
+\xb1\x05\x87\x2a\x76\x21\x70\x99\x15\xa2\x56\x5a\x61\xc7\x46\x2b\
+\xec\x8f\x7f\x09\x15\xe1\x93\xf0\xef\xcc\xd1\x9f\x4b\xdb\x07\x22\
+\x5f\x78\x8a\x7c\x19\x44\x84\x88\x5c\x09\x65\x49\x7c\x15\x23\x72\
+\x6b\xbf\x14\x7a\x77\x8b\xc9\x0b\x79\x15\x99\xfe\xb3\x90\xe0\x31\
+\xef\x8f\x05\x14\xc4\x38\x22\x3f\x64\x3e\x8a\xb6\x4c\xc7\xee\x88\
+\x17\x70\x38\x65\x22\x3e\x2b\xb7\x46\xd3\x19\x77\xdc\xba\xb0\x01\
+\xee\x33\x60\x1a\x30\x1f\xbd\xe3\x6c\x34\x4b\x75\x5f\x05\xea\xe5\
+\x3a\x33\xff\xcc\x8b\x22\x7c\x45\x2e\xfb\x8b\xd4\x6f\x22\x36\x8b\
+\x5c\x62\xd9\x50\x22\x3f\x55\x2f\x6a\x0d\x99\xaf\xb2\x0c\x5e\x8c\
+\x7b\x57\x4d\xc3\x5d\x75\x45\x6f\xe0\x50\xf2\x1c\x7c\xb0\x75\x1e\
+\xca\xa3\x17\xa1\x34\x5a\x8b\xd2\x78\x57\x54\x24\x79\x1a\x05\xd4\
+\x96\x3a\x61\xd3\x42\x98\x6e\x5e\x80\xfb\xa2\x6c\xd5\xcf\xa6\x3a\
+\x9b\xba\x15\x7b\xf5\xcc\x3f\x18\x35\xf0\xd2\xe5\xd2\xe7\x7f\x6e\
+\x3a\x6d\xdf\xaa\xbf\x1e\xa8\x93\x9b\xa9\x22\xd7\x03\x45\xea\x9c\
+\x88\x35\x84\x3b\xf1\x0e\x41\x31\x75\xeb\x09\x0a\xba\x48\x7c\x9b\
+\x29\xca\xb7\xc9\xa2\xbb\xe2\xaf\x6f\x3c\xb8\xb0\xb5\x3e\xe7\xc9\
+\x9f\x0e\x87\xf4\xab\x2d\xf1\xea\x9e\x95\xe9\xac\x71\x88\xb5\x53\
+\x8f\x0b\xb5\x41\x9f\x4d\x6f\x42\x5d\x19\xbf\x06\xc8\xf7\xea\xb6\
+\xbe\xf9\x8c\x5d\xb3\xae\xce\x4b\x2f\xdf\xd3\xd2\x9f\xd2\x44\x9a\
+\xb2\x98\x4d\x86\xc8\xcd\x78\x4e\x36\x5a\x7d\x99\x24\x17\x57\x8a\
+\x9c\x5d\x2c\x72\xde\x5e\xe4\x13\x47\x91\x8f\x9d\x09\x57\x62\x35\
+\xe1\x26\x72\xc1\x83\xa0\xa0\x0b\x3e\x1c\x96\x44\xf6\xcb\xe5\x12\
+\xe5\x4a\x69\x38\xca\xa1\x39\x29\xd2\x78\x42\xe4\xfb\x4a\xd1\xd7\
+\xa7\x28\xba\x5a\x1f\x7d\xe3\xee\xe9\x8d\x21\xf3\xd4\xcf\xa1\xdc\
+\xef\xde\x1d\x72\x65\x2d\x3b\xb1\xf3\xb9\x85\x22\x47\x67\x8a\xd4\
+\xbc\x4a\x4c\x17\x39\x36\x55\xe4\xf8\x34\xd6\x67\x88\x9c\xb2\x16\
+\x39\x3d\x8f\x60\x9b\x5a\x1b\x62\x19\x05\x69\x59\x2e\x67\x3f\x8a\
+\xa9\xa5\xc0\x5a\x3a\x73\x9e\x62\x4e\xb1\x7e\x92\xe2\x4e\xb8\x30\
+\x06\xff\x1d\x63\x9b\x23\x44\x35\xc5\x9f\xa0\x73\x1f\x47\x8a\xfe\
+\xc0\xdb\x12\xf4\xba\xda\x16\x01\x4b\x31\xa4\xd2\xd3\xf4\x84\xbe\
+\x72\xaa\x28\x67\x6c\xd9\xe0\x0d\x36\x7e\x89\xa4\x06\x21\xb3\xf9\
+\x6e\x6d\xc4\x29\xd6\x4f\xb2\xac\xe1\xff\x9a\x39\x0c\xca\xfa\xf1\
+\x59\x14\xcc\xef\x47\x0c\x7d\x0c\x25\xbf\x7d\x44\x54\xf3\xfb\xfe\
+\xd7\x44\xf6\x4e\x11\xf9\x60\x92\x48\xc5\x44\x91\xe2\x27\xf8\x3e\
+\x53\x94\x83\x0e\xd2\x92\x68\xa1\xa4\x39\xaa\x76\x38\xbf\x80\x07\
+\x11\xe3\x82\x47\xfc\x16\xc3\xb2\xcc\xdb\xe4\xb8\xae\x62\x8a\x28\
+\x27\x68\xef\xc9\xb7\x19\xec\x65\x82\x99\x1f\x65\xa0\xc3\x74\xe2\
+\x30\x03\x1d\x18\x2f\xf2\xe1\x93\x0c\x3a\x8e\xc1\x1e\x67\x39\x4a\
+\xe4\x7d\x0b\x91\xaa\x11\x46\x54\x90\xa4\x92\xff\x2a\x27\xf0\x3b\
+\xdb\xbf\x4f\x27\xf7\x30\x46\x25\x85\x1c\xb1\x17\xa5\xda\x43\x5a\
+\x93\x9e\x52\x12\x1d\x91\xeb\xab\xc5\x68\xcf\x29\x18\x80\x58\x17\
+\x74\x8b\x76\x81\x39\x9d\x18\x4f\x11\x47\x74\x25\x93\x45\x39\x4e\
+\xab\x8e\xcd\x25\xc9\x13\x46\x82\x4a\x03\x1e\x63\xdd\x80\x91\x24\
+\x63\x59\x49\xc2\xdd\xac\xbf\x47\x54\xb0\x5e\x3e\x5c\xa4\x64\xa8\
+\x48\xd1\xa3\x22\xf9\x83\x44\x76\x9a\x89\xe4\x0e\x10\xc9\x33\x67\
+\xbb\x97\x45\xd9\xbb\x42\x5a\x93\x1f\x57\xa2\xed\x55\x19\x3e\x4b\
+\x60\x16\xb7\x1a\x0f\xbd\x33\x15\x6a\x6c\x75\x81\x01\x77\x47\x3b\
+\x63\xa0\x2f\x9d\x28\xf2\x30\x39\xd8\x56\x6c\x21\xfa\x7d\x54\xbd\
+\xf7\x29\x06\x67\xe0\xdd\x16\x1d\x18\xd9\x85\x94\x28\x27\xca\x48\
+\x5e\x6a\x20\x27\x8a\xf8\x5e\x44\x71\xf9\xc4\xce\x61\x22\x39\x83\
+\x29\x62\x88\x28\x45\xcf\x48\x6b\xc2\x00\x25\x42\x8b\xe4\xf5\xcb\
+\x30\x38\xce\x15\x7d\xc2\x96\x42\xbd\x79\xe1\x04\xe0\x40\xbe\xab\
+\x41\x80\xca\x20\x82\x30\xf7\xb7\x85\x65\x81\x87\xe9\xbe\xb6\xfc\
+\x51\x8a\xec\x79\x8e\x64\x23\x8c\x24\x5d\x51\xda\x01\x03\x69\xf1\
+\x70\x23\x69\xa1\x81\x98\xa4\xbb\x88\x3c\x3a\x91\x43\x27\x72\xe8\
+\x44\xe1\xd3\xcc\x7c\x98\xc2\x4b\x4c\xac\x8f\x2d\x06\xc5\xad\x44\
+\x9f\xc4\x55\x50\xf9\xbc\x66\xdc\x2d\x51\xbd\xcb\x0d\xfb\x72\xb5\
+\xed\x22\xe2\x5c\xd0\x9d\xc3\x61\xb6\x71\x19\x9e\xde\xb5\x56\xb3\
+\xbb\x25\x6f\xa4\x5e\xca\x46\x19\x49\x3a\x51\xd4\x85\xb0\xa0\x0b\
+\xe9\xce\x0e\xe2\x5c\x12\xef\x20\xde\x1d\xc2\xf7\xe1\xd2\x14\x6f\
+\xae\x0b\x75\x50\x45\xfa\x68\x31\x34\x7e\x05\xee\x0f\xb1\x81\x2a\
+\x62\xe9\x08\xf8\xcc\x1e\x63\xdc\x88\xf6\x64\xbb\x13\x4e\xd8\x93\
+\x65\xd3\x2e\x22\xd6\xe0\xc4\x0a\x0c\x5a\x6f\x83\x31\x15\xeb\x7a\
+\xd4\x48\x09\x6d\x2d\x60\xc0\x82\x61\x46\x74\x12\xb6\x93\x0e\xed\
+\x20\xed\xc8\xb8\x93\x78\x3b\x91\x35\x58\xf4\x99\x83\x84\x1b\x5f\
+\xf2\x06\x5b\xf4\x4f\x70\xc5\x43\xc1\x36\xd0\x44\x6a\x2d\x7e\xbd\
+\x15\xdf\xbc\xfe\x05\x76\xa7\x3a\xa1\x32\x63\x11\xaa\x32\xde\x6a\
+\x9f\x13\x54\x7a\x97\xaf\x1d\x7a\x1d\xf4\xbd\xe7\xa4\x94\x5b\x18\
+\x49\xf2\xba\x90\x75\x12\x76\x92\x66\x0f\x31\x12\x93\x54\x32\x89\
+\x0c\x5a\x9f\x4e\x64\x3d\x26\xc9\xae\x9a\xd8\x40\x27\x98\x86\x2f\
+\x80\x3a\xc2\x61\xf4\x9d\x0f\xa3\x6b\xf5\xb5\x28\x89\x5b\x80\xb2\
+\xa4\xb9\xdc\xa3\xad\x0d\x02\xd4\x3e\x8b\xd1\xfd\x62\x68\xbf\x1b\
+\xed\x13\x2b\xab\x83\xcc\x40\xd4\x49\xd6\x25\xd3\x5f\x91\xa6\x11\
+\x29\x9c\xf9\x49\x03\xda\xff\xef\x71\xef\x59\xed\xe7\x04\x0d\x2f\
+\x52\xbf\x73\x1a\xf2\xe2\x79\xf5\xb3\x1a\x14\xc6\xcc\x44\x49\xc2\
+\x74\x70\x08\xd4\xbe\x4b\xd0\xaf\x21\xa1\x7f\x4b\xfb\xd8\xa6\x0f\
+\x36\x12\x75\x92\xd1\xda\x76\xc2\xae\xa4\xa9\xe6\x46\xe2\xe4\x81\
+\x22\x89\x44\x02\x05\xa4\x3f\xca\xe3\xa1\xf7\x4d\x4f\x47\x98\xba\
+\x3d\xff\x3b\x02\x14\x0a\xb8\x52\x77\x0c\x39\xe1\xaf\x60\x57\xf4\
+\x8b\x88\xe2\x5c\x08\xb2\x87\x95\x2e\xe5\x51\xbd\x6c\x27\x61\x3a\
+\x03\x67\x98\x1b\x89\xd2\xcc\x8d\x64\x9d\x84\x29\x24\x4b\x32\x90\
+\x72\xdd\x6f\x23\x12\x88\x78\x92\x47\xf6\xe7\xf7\x41\x3c\x5e\xfa\
+\xb6\xf8\xd8\xa1\xbb\xfb\xf3\x77\xbe\x23\xb4\x5f\x3c\x2f\x9d\xd9\
+\x8f\xed\xfe\x33\xb0\x6b\xcb\x14\x14\x46\x4d\x46\xd8\x72\xa8\xe2\
+\x1d\x55\x2e\x4a\x06\x6d\x4f\x1b\x68\xcc\x2a\x99\x64\xdb\x18\x38\
+\xd1\x10\xb8\x7f\x87\xa0\xc1\x46\x11\xa9\x06\xd2\x47\x44\x62\x1f\
+\x12\x89\x7e\x98\x25\xff\x47\xf3\x7d\xeb\x00\x69\x0b\x19\xa0\xf7\
+\xb1\x87\x99\xef\x9c\xdf\x72\x40\xd1\xb7\xcf\x81\x8b\x35\xf9\xf8\
+\xbc\xb6\x18\xb1\xcb\xa1\xde\xe4\x00\x75\xc1\x2a\x93\x1c\xc9\x1c\
+\x6a\xcc\x28\xce\x10\xf4\x41\x12\x33\x68\x26\x97\x61\xea\x48\x69\
+\x8d\x32\x97\xa3\xef\xf4\xb8\x76\xce\xbb\xf7\xcf\xfa\x70\xce\x85\
+\x24\x6e\xcd\xc9\xdc\x1b\x62\x48\xbe\xa5\x0f\xd1\x57\x24\xea\x61\
+\x51\x22\x06\x0a\x97\xe1\x5c\xbf\x45\xbc\xce\xcf\xbc\xd3\x24\x54\
+\x14\x5c\xad\x3f\x8d\xdc\x90\xd9\x28\x8c\x9e\x86\xad\xcb\x01\x2a\
+\xd6\x1c\x5e\xd7\xfd\xa2\xc1\x42\x89\x7a\x80\x99\x33\xcb\x6c\x2b\
+\x4e\xaa\x67\x44\x17\x32\x4a\x8e\xaf\xec\xd9\x18\x6d\xa7\xda\xe6\
+\xb6\x14\x33\xd6\x69\xf1\x46\x92\x93\xba\xe4\x53\xf7\xfb\x5b\xf5\
+\xa1\xa3\x39\x5c\x2f\xb2\x1d\xcf\x82\x70\x8a\x0e\xec\xce\xa1\x30\
+\x93\x6c\x47\x24\x6e\x71\x05\xd6\x5a\xdd\x7e\x57\x6c\x7f\xdc\xb8\
+\x7a\x09\x45\xb1\x0b\x51\x9e\x6c\xcd\x1b\x30\xb0\xde\x1e\x77\x5f\
+\xde\xd0\xbb\x41\xe2\x98\x71\xfa\x58\x92\x4f\x11\x7d\xd4\x38\x39\
+\xb3\xba\x47\x53\xac\x56\x95\xe1\xe5\x80\x29\xa1\x2e\x18\xc3\xd5\
+\x32\x92\x13\x76\x64\x90\x23\xc6\x78\xda\xc2\x3a\xd5\x59\x55\x75\
+\xc5\xb5\x4f\x9b\x12\xca\x03\x29\x93\xa7\x69\x1c\x37\xb1\x2d\xfd\
+\x64\x9f\xa3\xfa\xa2\xe7\x1a\xa8\xd7\x3c\x7b\xfb\x3c\xe0\x43\xc1\
+\x8f\x37\xbe\x46\x45\x8a\x23\xf6\x6c\x5f\x82\x98\x15\x50\x05\xd8\
+\xc2\xac\x65\x53\xdf\x36\xd9\x4e\xf2\x84\x09\x72\xc9\xa3\x57\x4b\
+\x92\x1d\xf2\x7c\x1c\x30\x2b\x70\x39\x9e\xe0\x66\x35\x84\xb8\x97\
+\x7b\x86\x09\xa1\xe6\x0e\xda\x2b\x6a\x05\x1e\xf3\x71\xc2\x28\x6f\
+\x2d\xde\x7a\xd7\x46\x75\xb2\x61\xd5\x3d\x7a\x65\x2b\x9d\x48\x1d\
+\x23\xdf\xac\xec\xd6\xba\x6e\x25\x34\x6b\xff\x75\xfb\x3c\x30\x5e\
+\x44\x1b\x7e\xc0\x87\xb9\xde\x38\x54\xe8\x66\x38\x9e\x35\x5b\x1c\
+\x61\xf1\xed\xfa\xbe\x0d\x3f\xf8\x99\x35\x67\x69\xd5\x65\xfe\x5a\
+\xbc\x19\xb4\x1c\x4f\x93\x6c\x58\xbc\x0b\xfa\x18\x48\xb7\x3a\x43\
+\xb5\x2b\x62\x22\x27\xae\x65\xfb\xe6\x45\x41\x6a\xfe\xbb\x8f\xfd\
+\x87\x79\xd3\x1d\x37\x5b\xd8\xe4\x2c\x56\x5d\x6e\xf3\x18\xa8\xff\
+\xc2\xb5\x5b\xb3\xef\x6a\x98\xac\xb6\x84\xe6\x8e\x02\xda\x9a\x9b\
+\x71\xac\x22\x12\x27\xaa\x82\x0d\xc1\x4c\x23\x79\x47\x08\x77\x82\
+\x35\x85\xbc\x1d\xec\xdc\x4e\x3c\x22\xd6\x15\xf7\x31\x53\x13\x9e\
+\x62\xaa\x9d\x91\xaf\x73\xd5\x4c\x43\x31\x87\x6d\xc7\xe6\x67\x90\
+\x1b\x3c\x01\x39\xc1\x63\x3b\xcf\x13\x0d\x85\x3c\x10\xed\x8a\xe1\
+\x5e\x2b\xf0\xf8\x3a\x07\xd8\xf8\x3b\x60\x72\xcc\x1a\x5e\x52\x2d\
+\x61\x72\x47\x01\x7a\x9d\x1e\x67\x0f\xe5\xe0\xc2\x91\x54\x43\x10\
+\x8d\xc1\x5e\x66\x62\x66\x00\xeb\xfd\x38\xce\xa6\x3c\xcd\xd4\xef\
+\xa5\x2c\x47\x7e\x98\xfd\x2f\x9d\x5b\x1a\x1b\x70\x6a\x6f\x0e\x32\
+\x7c\x26\x21\x3b\xc0\x12\x3b\x02\xc6\x22\x7b\xf3\xa8\x5f\x84\x10\
+\x0f\xc4\x1b\x87\xeb\xc1\xc4\xd5\xe8\x7e\xa7\xcd\xe8\xbf\xc0\xc4\
+\xc2\x54\x1c\x7d\x20\x2b\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
+\x60\x82\
+\x00\x00\x04\x95\
+\x89\
+\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
+\x00\x00\x20\x00\x00\x00\x20\x08\x06\x00\x00\x00\x73\x7a\x7a\xf4\
+\x00\x00\x00\x09\x70\x48\x59\x73\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x04\x47\x49\x44\x41\x54\x58\x85\xad\
+\x56\x5b\x6f\x1b\x55\x10\xf6\x1b\x20\x01\x6f\x48\x20\xde\x90\xe0\
+\x0d\x24\x7e\x4c\x52\x52\xe7\x6c\x12\x1e\xb8\x48\x20\xb5\xf0\x46\
+\x11\x02\x15\x25\x10\xb5\x34\x57\x7b\x37\x76\x54\x21\x92\xb6\x12\
+\x82\x22\xb9\x08\xa9\xc4\x88\x00\x4d\xda\x34\xe0\xa6\xb9\x38\xdd\
+\xda\x59\xdb\x4d\xda\x6c\x9c\xc6\xcd\x95\x38\x89\x32\x3d\xdf\xb8\
+\x71\x7d\xd9\xf5\xd9\x14\x8e\x34\xd2\xee\x9c\xef\x9b\x99\xb3\x73\
+\x66\x76\x7c\x3e\x8f\xcb\xec\xf4\x3f\x6f\x05\xb5\x06\xcb\x10\x21\
+\x4b\x17\x63\x29\x5d\x2c\xa5\x0c\xb1\xc3\x22\x9f\xa1\xb3\x74\xad\
+\xcf\x32\x1a\xdf\x8a\x87\xdf\x7e\xce\xab\x5d\xe5\x4a\xf6\x89\xd7\
+\x52\xba\xd6\x2f\x1d\x6f\xa6\x0c\x8d\xbc\x08\xb0\x96\xa1\x85\x13\
+\xc1\xe6\x57\x9f\xd8\x71\xe6\x74\xdd\x33\xd2\xd8\x29\x69\x68\xd7\
+\xab\xe3\x6a\x11\x3b\x92\xdf\x6e\x9d\x6d\x7a\xfa\x50\xce\x11\xb9\
+\x24\x4e\x3e\xb9\xe3\x0a\xd1\xc5\x68\xca\xf0\xbf\xe4\xc9\xb9\x15\
+\x10\x6f\x16\xf2\xfb\x3f\x39\x3f\x48\x8b\xae\xdd\x49\x86\xb4\x37\
+\x94\x27\x3f\x8c\xf3\xb5\xe9\xa8\x94\xa1\x43\x05\x61\xf5\x34\xbd\
+\xe8\x7c\x72\x99\x27\x09\xba\xe1\x46\x5e\xfa\xb5\x87\xb2\xd1\x40\
+\x79\x00\x99\x69\x96\x52\x5d\x36\x1a\x64\xac\x7b\x10\x62\x1c\xf7\
+\xab\x2a\x00\x5c\xb8\x5a\xd1\xdf\x9f\xb8\x4c\xfb\x7b\x3b\x34\x7f\
+\xfe\xe3\xa2\xee\x41\x7a\x8a\xe5\xe0\x1d\x7b\xc0\x00\xab\xf8\x12\
+\x5f\x94\x39\x47\xa9\xa9\x6e\x7b\xac\xf7\x1d\xda\xdd\xde\xa4\xf5\
+\xe4\x75\xd7\x00\x36\xe6\xae\xd3\x5e\xfe\x5f\x8a\x05\xdf\x53\x94\
+\xa9\xb6\x5e\x96\x0a\xd4\xb9\x2a\x7f\xc9\xa0\xa0\x44\x74\x80\xb0\
+\xec\x9f\xdb\x0b\x01\xa4\xa6\x58\xf0\xbc\x18\xf9\x8a\xf7\x12\xd1\
+\xef\x18\xab\xbe\x13\x22\xc0\xce\xb9\xc3\x39\x34\x99\xc5\x48\x1b\
+\xed\x6d\xe6\x68\x65\xf4\x1c\xa5\x43\x2d\xac\xbb\xd1\x25\x68\x6b\
+\x65\x91\xd6\xe6\xfe\xe6\xf7\xa9\x0b\x5f\xb2\xe0\x79\x5d\xea\xb0\
+\x07\x0c\xde\xc1\x01\x17\x36\x16\x23\xad\x4e\x69\xd8\xe0\x8e\x89\
+\xf6\xea\x14\xa1\x19\x7a\x97\x96\x6f\x8f\xf3\xa9\x76\x72\x77\xc9\
+\xfe\xe5\x34\xcd\xe9\x82\xae\xf6\x7e\x40\xb1\xf0\x71\xc6\xcc\x74\
+\xfb\x59\x38\x45\xa1\x8f\x78\x0f\x18\x60\xc1\xc1\x82\x0d\xd8\x72\
+\xf2\x21\xb1\x47\x7c\xe8\xed\x6e\x9f\xfc\x4a\x5b\x3d\xfd\x33\x70\
+\x92\x36\x97\xe7\xd9\xd8\xca\xc8\x20\xdd\x0e\x34\x92\xd9\xdb\x58\
+\x85\xbf\x25\x75\xd8\x03\x06\x0b\x1c\x70\x61\xc3\x2d\x25\xd2\xb7\
+\xe1\xe3\x1f\x4b\x8d\x5c\x4d\x77\x1d\xa5\xe1\xd6\x7a\x9a\x89\x04\
+\xc9\x3c\x77\x42\x99\xdb\x5b\x83\x27\x18\x0b\x0e\xb8\x35\xf1\xb2\
+\x43\xca\x2f\xa0\x65\x55\x46\x65\xbe\x68\xe2\xcc\x51\x9a\xed\xf1\
+\x2b\x03\x00\x06\x58\x70\xd4\x17\x51\xb3\x51\x01\xf9\xca\x8d\xb5\
+\xc9\xcb\x54\xb9\xa0\xf3\x60\xb0\x50\x8e\x89\x51\x8f\x7c\xb1\xed\
+\x18\xc0\xcc\xe0\xa7\x64\xfd\xf5\x63\x99\x40\xe7\x35\x80\xf8\x85\
+\x93\x1e\xf9\x32\x00\xa7\x14\xcc\xca\x9b\x3d\x7e\xea\x48\x99\xcc\
+\x76\xab\x3f\x7f\xf1\x00\xde\xf9\xb6\xf2\x12\xa6\x8c\x26\xca\xfe\
+\xa6\xd3\xee\xea\x12\x2d\xff\x1e\x56\x3a\x5f\x1e\xee\x67\x2c\x38\
+\xe0\xaa\x2f\xa1\x1c\xa3\xdc\x00\xf7\x2e\x7e\x4e\xdb\x76\x82\x73\
+\xb8\x3a\x6f\x52\xfc\xec\x31\xf5\xe7\x97\x18\x60\xb1\xc0\x85\x8d\
+\x1a\x01\xe8\x3e\xcc\x70\x4e\x9b\xe8\x84\x44\xfb\x94\x5f\x5f\xa1\
+\xc9\x8b\x9d\xf4\x47\x6b\x1d\xd7\x79\x6e\xec\x7b\xba\x7f\x65\xa0\
+\x0a\x8f\xfa\xc7\x1e\x30\xc0\x82\x03\x2e\x6c\x38\x75\x42\x48\xda\
+\x10\x75\x3e\xbb\xa7\xee\x59\xb4\xc5\xca\x4d\x33\xfc\x3e\xcd\x5c\
+\x32\x68\xf8\x6b\x3f\xdd\xec\x68\x60\xdd\xdd\x1f\x3e\x93\xf6\xf6\
+\xc9\xbe\xf6\x53\xa1\x5a\x4a\xe6\x01\xe8\xb0\x07\x0c\xde\xc1\x01\
+\x17\x36\x60\xab\xd2\x3e\x7c\xc2\x77\x61\x16\x90\x03\x64\x25\x20\
+\xc9\xb5\xdf\xc0\xad\xf5\x40\xb7\xb5\x10\xa7\xfc\xc6\x03\x8a\x75\
+\x17\xfe\x0d\xa5\xf3\x40\xac\xab\x99\xb6\xe5\x89\xb7\xee\x99\xc5\
+\xdc\x83\x0b\x1b\x49\x87\x9e\x80\xd4\x97\x4f\x42\x3c\x62\xbb\xe7\
+\x36\x3b\x14\xe0\xbc\xc6\x23\x81\x62\x6b\x2d\xfd\x1d\x43\x17\xbf\
+\x54\xc0\x64\x87\x7a\x15\x97\x4f\xcb\xa7\x03\x2d\xaf\x94\x4f\x44\
+\x72\x7a\xad\x45\xca\xc5\xff\xa4\xd5\x85\x04\x4d\x74\x3c\x6e\xaf\
+\x95\xf3\xc0\x44\x87\x9f\x31\xc0\x2a\x2e\x6b\x9b\xf3\x48\xc6\xd3\
+\xab\x33\xe9\xda\x37\xf2\xe7\xd4\x5e\x5e\xcb\x39\xeb\x26\x4b\xa9\
+\x0e\x98\xb1\x33\x35\xe7\x81\x11\xb3\xf3\xc3\xa7\x9c\xe7\x42\x39\
+\xa5\xc8\x54\x64\x9c\x88\xc8\x67\xe9\x7d\xe0\x13\x7f\xfb\x09\x8b\
+\x0a\xf7\x38\xef\x62\x21\x13\xd4\x5e\x76\x74\x5e\x1c\xcf\xe4\xe8\
+\x8c\xe9\x55\x55\xef\x10\x74\x37\xef\x1d\x52\x64\x32\x46\xf3\xeb\
+\x35\x9d\x1f\x2c\xb3\xbf\xe5\x05\x49\x18\xf6\x66\xd8\x93\x8c\xb8\
+\x8e\xe3\xae\x41\xc8\x3c\x61\x7a\x75\xea\x11\x9e\x05\x3f\x3a\x5d\
+\xb4\xba\xe6\xdc\xcb\x7a\x74\x2f\x02\x87\x09\x04\x58\x4c\x3b\x55\
+\xa5\xf6\x5f\x16\xba\x16\x66\x38\xf4\x6f\xe9\xe4\xaa\x14\xbb\x70\
+\x42\xfe\x9d\xdb\x8f\x74\xc1\x74\x9f\x56\x5f\xec\x70\x1e\xd6\x43\
+\xaf\x38\xa0\xbf\x65\x66\x0d\x46\x00\x00\x00\x00\x49\x45\x4e\x44\
+\xae\x42\x60\x82\
+"
+
+qt_resource_name = b"\
+\x00\x05\
+\x00\x6f\xa6\x53\
+\x00\x69\
+\x00\x63\x00\x6f\x00\x6e\x00\x73\
+\x00\x0b\
+\x00\xb5\x45\xe7\
+\x00\x77\
+\x00\x61\x00\x72\x00\x6e\x00\x69\x00\x6e\x00\x67\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x10\
+\x01\xa2\x2c\x07\
+\x00\x62\
+\x00\x6f\x00\x6f\x00\x6b\x00\x6d\x00\x61\x00\x72\x00\x6b\x00\x5f\x00\x6f\x00\x66\x00\x66\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0f\
+\x02\x3f\xdf\x1f\
+\x00\x61\
+\x00\x70\x00\x70\x00\x6c\x00\x69\x00\x63\x00\x61\x00\x74\x00\x69\x00\x6f\x00\x6e\x00\x2e\x00\x69\x00\x63\x00\x6f\
+\x00\x0a\
+\x04\x11\x7b\x87\
+\x00\x7a\
+\x00\x6f\x00\x6f\x00\x6d\x00\x69\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x05\x78\x4f\x27\
+\x00\x72\
+\x00\x65\x00\x6c\x00\x6f\x00\x61\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x08\
+\x06\x38\x5a\xa7\
+\x00\x68\
+\x00\x6f\x00\x6d\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x09\
+\x06\x98\x83\x27\
+\x00\x63\
+\x00\x6c\x00\x6f\x00\x73\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x07\
+\x07\xa7\x57\x87\
+\x00\x61\
+\x00\x64\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0b\
+\x07\xc5\x9b\xc7\
+\x00\x7a\
+\x00\x6f\x00\x6f\x00\x6d\x00\x6f\x00\x75\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0c\
+\x08\x37\xcd\x47\
+\x00\x70\
+\x00\x72\x00\x65\x00\x76\x00\x69\x00\x6f\x00\x75\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0b\
+\x08\x5d\x84\xe7\
+\x00\x66\
+\x00\x6f\x00\x72\x00\x77\x00\x61\x00\x72\x00\x64\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0a\
+\x09\xb2\x67\xc7\
+\x00\x63\
+\x00\x61\x00\x6e\x00\x63\x00\x65\x00\x6c\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0f\
+\x0a\x27\xe0\xe7\
+\x00\x62\
+\x00\x6f\x00\x6f\x00\x6b\x00\x6d\x00\x61\x00\x72\x00\x6b\x00\x5f\x00\x6f\x00\x6e\x00\x2e\x00\x70\x00\x6e\x00\x67\
+\x00\x0e\
+\x0e\xfd\xdf\x87\
+\x00\x70\
+\x00\x72\x00\x6f\x00\x63\x00\x65\x00\x73\x00\x73\x00\x69\x00\x6e\x00\x67\x00\x2e\x00\x70\x00\x6e\x00\x67\
+"
+
+qt_resource_struct_v1 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0e\x00\x00\x00\x02\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x00\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x04\xfa\
+\x00\x00\x00\x52\x00\x01\x00\x00\x00\x01\x00\x00\x07\x42\
+\x00\x00\x00\x76\x00\x00\x00\x00\x00\x01\x00\x00\x6a\xf6\
+\x00\x00\x00\x90\x00\x00\x00\x00\x00\x01\x00\x00\x6e\x24\
+\x00\x00\x00\xaa\x00\x00\x00\x00\x00\x01\x00\x00\x77\x7a\
+\x00\x00\x00\xc0\x00\x00\x00\x00\x00\x01\x00\x00\x78\xdf\
+\x00\x00\x00\xd8\x00\x00\x00\x00\x00\x01\x00\x00\x7a\xa0\
+\x00\x00\x00\xec\x00\x00\x00\x00\x00\x01\x00\x00\x82\x63\
+\x00\x00\x01\x08\x00\x00\x00\x00\x00\x01\x00\x00\x85\x5d\
+\x00\x00\x01\x26\x00\x00\x00\x00\x00\x01\x00\x00\x8d\xa6\
+\x00\x00\x01\x42\x00\x00\x00\x00\x00\x01\x00\x00\x95\xd7\
+\x00\x00\x01\x5c\x00\x00\x00\x00\x00\x01\x00\x00\x9e\xa0\
+\x00\x00\x01\x80\x00\x00\x00\x00\x00\x01\x00\x00\xa8\xa7\
+"
+
+qt_resource_struct_v2 = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x0e\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x10\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\x7b\xba\x05\xf9\xd8\
+\x00\x00\x00\x2c\x00\x00\x00\x00\x00\x01\x00\x00\x04\xfa\
+\x00\x00\x01\x7b\xba\x05\xf9\xd8\
+\x00\x00\x00\x52\x00\x01\x00\x00\x00\x01\x00\x00\x07\x42\
+\x00\x00\x01\x7b\xba\x05\xf9\xd8\
+\x00\x00\x00\x76\x00\x00\x00\x00\x00\x01\x00\x00\x6a\xf6\
+\x00\x00\x01\x7b\xba\x05\xf9\xd8\
+\x00\x00\x00\x90\x00\x00\x00\x00\x00\x01\x00\x00\x6e\x24\
+\x00\x00\x01\x7b\xba\x05\xf9\xd8\
+\x00\x00\x00\xaa\x00\x00\x00\x00\x00\x01\x00\x00\x77\x7a\
+\x00\x00\x01\x7b\xba\x05\xf9\xd8\
+\x00\x00\x00\xc0\x00\x00\x00\x00\x00\x01\x00\x00\x78\xdf\
+\x00\x00\x01\x7b\xba\x05\xf9\xd8\
+\x00\x00\x00\xd8\x00\x00\x00\x00\x00\x01\x00\x00\x7a\xa0\
+\x00\x00\x01\x7b\xba\x05\xf9\xd8\
+\x00\x00\x00\xec\x00\x00\x00\x00\x00\x01\x00\x00\x82\x63\
+\x00\x00\x01\x7b\xba\x05\xf9\xd8\
+\x00\x00\x01\x08\x00\x00\x00\x00\x00\x01\x00\x00\x85\x5d\
+\x00\x00\x01\x7b\xba\x05\xf9\xd8\
+\x00\x00\x01\x26\x00\x00\x00\x00\x00\x01\x00\x00\x8d\xa6\
+\x00\x00\x01\x7b\xba\x05\xf9\xd8\
+\x00\x00\x01\x42\x00\x00\x00\x00\x00\x01\x00\x00\x95\xd7\
+\x00\x00\x01\x7b\xba\x05\xf9\xd8\
+\x00\x00\x01\x5c\x00\x00\x00\x00\x00\x01\x00\x00\x9e\xa0\
+\x00\x00\x01\x7b\xba\x05\xf9\xd8\
+\x00\x00\x01\x80\x00\x00\x00\x00\x00\x01\x00\x00\xa8\xa7\
+\x00\x00\x01\x7b\xba\x05\xf9\xd8\
+"
+
+qt_version = [int(v) for v in QtCore.qVersion().split('.')]
+if qt_version < [5, 8, 0]:
+    rcc_version = 1
+    qt_resource_struct = qt_resource_struct_v1
+else:
+    rcc_version = 2
+    qt_resource_struct = qt_resource_struct_v2
+
+def qInitResources():
+    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
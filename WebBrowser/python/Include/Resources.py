@@ -0,0 +1,31 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : Resources.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Shared icons from compiled Qt resources
+# -------------------------------------------------------------------------------------------------------------------- #
+# Resource_rc.py is generated from Resource/Resource.qrc, run after adding or changing a file in Resource:
+#   python -m PyQt5.pyrcc_main Resource/Resource.qrc -o Include/Resource_rc.py
+import os
+from typing import Dict
+from PyQt5.QtGui import QIcon
+try:
+    import Resource_rc  # registers ':/icons/...'
+    RESOURCE_PREFIX = ':/icons'
+except ImportError:
+    RESOURCE_PREFIX = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Resource')
+
+_icons: Dict[str, QIcon] = dict()
+
+
+def resourcePath(name: str) -> str:
+    return RESOURCE_PREFIX + '/' + name
+
+
+def getIcon(name: str) -> QIcon:
+    # QIcon is implicitly shared: every user gets the same instance (and pixmap cache), decoded once
+    icon = _icons.get(name)
+    if icon is None:
+        icon = QIcon(resourcePath(name))
+        _icons[name] = icon
+    return icon
@@ -0,0 +1,206 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : SessionJournal.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Append-only journal of open windows and tabs (session restore)
+# -------------------------------------------------------------------------------------------------------------------- #
+import os
+import json
+import tempfile
+from typing import Dict, List, Union
+from Common import ensurePathExist
+
+
+class SessionJournal:
+    # every change is appended as a single json line (flushed, not fsync'ed) and applied to an in-memory state.
+    # when the journal grows beyond 'compact_threshold' records it is rewritten as a snapshot of the state.
+    # nothing is written before start() (called once the previous session is restored), until then changes are
+    # kept in memory only and the journal of the previous session stays intact
+    # records: window / close_window / tabs (order and current tab of window) / tab (partial update) / close_tab
+    _instance: Union['SessionJournal', None] = None
+
+    def __init__(self, path: str, compact_threshold: int = 2000):
+        self._path = path
+        self._compact_threshold = compact_threshold
+        self._fp = None
+        self._records = 0
+        self._next_id = 1
+        self._closed = False
+        self._started = False
+        self._windows: Dict[int, dict] = dict()
+        self._tabs: Dict[int, dict] = dict()
+        self._window_ids: Dict[object, int] = dict()
+        self._tab_ids: Dict[object, int] = dict()
+
+    @classmethod
+    def instance(cls) -> 'SessionJournal':
+        if cls._instance is None:
+            curpath = os.path.dirname(os.path.abspath(__file__))
+            path = os.path.join(os.path.dirname(curpath), 'Config', 'session.journal')
+            cls._instance = SessionJournal(path)
+        return cls._instance
+
+    def restore(self) -> List[dict]:
+        # returns windows of previous session: [{'tabs': [{'url', 'title', 'icon_url', ...}, ...], 'current': int}]
+        windows, tabs = dict(), dict()
+        if os.path.isfile(self._path):
+            with open(self._path, 'r', encoding='utf-8') as fp:
+                for line in fp:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # partially written line (crash)
+                    self.apply(windows, tabs, record)
+        session, restored = list(), set()
+        for window in windows.values():
+            window['tabs'] = [x for x in window['tabs'] if x in tabs and x not in restored]
+            restored.update(window['tabs'])
+            tab_list = [tabs[x] for x in window['tabs']]
+            if not tab_list:
+                continue
+            current = window['tabs'].index(window['current']) if window['current'] in window['tabs'] else 0
+            session.append({'tabs': tab_list, 'current': min(current, len(tab_list) - 1)})
+        return session
+
+    @staticmethod
+    def apply(windows: Dict[int, dict], tabs: Dict[int, dict], record: dict):
+        op = record.get('op')
+        if op == 'window':
+            windows.setdefault(record['win'], {'tabs': list(), 'current': None})
+        elif op == 'close_window':
+            window = windows.pop(record['win'], None)
+            if window is not None:
+                for tab_id in window['tabs']:
+                    tabs.pop(tab_id, None)
+        elif op == 'tabs':
+            window = windows.setdefault(record['win'], {'tabs': list(), 'current': None})
+            window['tabs'] = list(record['tabs'])
+            window['current'] = record.get('current')
+        elif op == 'tab':
+            tab = tabs.setdefault(record['tab'], {'url': '', 'title': '', 'icon_url': ''})
+            for key, value in record.items():
+                if key not in ['op', 'tab']:
+                    tab[key] = value
+        elif op == 'close_tab':
+            tabs.pop(record['tab'], None)
+            for window in windows.values():
+                if record['tab'] in window['tabs']:
+                    window['tabs'].remove(record['tab'])
+
+    def append(self, record: dict):
+        if self._closed:
+            return
+        self.apply(self._windows, self._tabs, record)
+        if not self._started:
+            return
+        try:
+            if self._fp is None:
+                self.compact()
+            else:
+                self._fp.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+                self._fp.flush()
+                self._records += 1
+                if self._records >= self._compact_threshold:
+                    self.compact()
+        except OSError:
+            pass
+
+    def start(self):
+        # the journal of the previous session is replaced by the current state, later changes are appended
+        if self._closed or self._started:
+            return
+        self._started = True
+        try:
+            self.compact()
+        except OSError:
+            pass
+
+    def compact(self):
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+        dir_name = os.path.dirname(self._path)
+        ensurePathExist(dir_name)
+        records = list()
+        for win_id, window in self._windows.items():
+            records.append({'op': 'window', 'win': win_id})
+            records.append({'op': 'tabs', 'win': win_id, 'tabs': window['tabs'], 'current': window['current']})
+        for tab_id, tab in self._tabs.items():
+            record = {'op': 'tab', 'tab': tab_id}
+            record.update(tab)
+            records.append(record)
+        temp_fd, temp_path = tempfile.mkstemp(prefix='.session.', suffix='.tmp', dir=dir_name)
+        with os.fdopen(temp_fd, 'w', encoding='utf-8') as fp:
+            for record in records:
+                fp.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(temp_path, self._path)
+        self._fp = open(self._path, 'a', encoding='utf-8')
+        self._records = len(records)
+
+    def close(self):
+        # keep the current session for the next start, ignore changes made while shutting down
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+        self._closed = True
+        # windows and tabs are not tracked any more (no references to released widgets are kept)
+        self._window_ids.clear()
+        self._tab_ids.clear()
+
+    def newId(self) -> int:
+        self._next_id += 1
+        return self._next_id - 1
+
+    def windowCount(self) -> int:
+        return len(self._window_ids)
+
+    def registerWindow(self, window: object):
+        if not self._closed and window not in self._window_ids:
+            self._window_ids[window] = self.newId()
+            self.append({'op': 'window', 'win': self._window_ids[window]})
+
+    def windowClosed(self, window: object):
+        win_id = self._window_ids.get(window)
+        if win_id is None:
+            return
+        if len(self._window_ids) == 1:
+            self.close()  # last window: the session is restored next time
+        else:
+            del self._window_ids[window]
+            closed = set(self._windows.get(win_id, {'tabs': list()})['tabs'])
+            self._tab_ids = {k: v for k, v in self._tab_ids.items() if v not in closed}
+            self.append({'op': 'close_window', 'win': win_id})
+
+    def windowTabsChanged(self, window: object, widgets: List[object], current: object):
+        win_id = self._window_ids.get(window)
+        if win_id is None:
+            return
+        tabs = [self._tab_ids[x] for x in widgets if x in self._tab_ids]
+        current_id = self._tab_ids.get(current)
+        state = self._windows.get(win_id)
+        if state is not None and state['tabs'] == tabs and state['current'] == current_id:
+            return
+        self.append({'op': 'tabs', 'win': win_id, 'tabs': tabs, 'current': current_id})
+
+    def tabAdded(self, widget: object, url: str, title: str, icon_url: str = ''):
+        if self._closed or widget in self._tab_ids:
+            return  # closed, or moved from another window
+        self._tab_ids[widget] = self.newId()
+        self.append({'op': 'tab', 'tab': self._tab_ids[widget], 'url': url, 'title': title, 'icon_url': icon_url})
+
+    def tabChanged(self, widget: object, **kwargs):
+        tab_id = self._tab_ids.get(widget)
+        if tab_id is None:
+            return
+        tab = self._tabs.get(tab_id, dict())
+        changed = {k: v for k, v in kwargs.items() if tab.get(k) != v}
+        if changed:
+            changed.update({'op': 'tab', 'tab': tab_id})
+            self.append(changed)
+
+    def tabClosed(self, widget: object):
+        tab_id = self._tab_ids.pop(widget, None)
+        if tab_id is not None:
+            self.append({'op': 'close_tab', 'tab': tab_id})
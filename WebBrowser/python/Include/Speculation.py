@@ -0,0 +1,176 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : Speculation.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Speculative preloading of likely next navigations in hidden web views
+# -------------------------------------------------------------------------------------------------------------------- #
+import time
+from functools import partial
+from collections import OrderedDict
+from typing import Dict, List, Union
+from PyQt5.QtCore import QObject, QTimer, QUrl
+from WebPageWidget import WebView
+from ProfileManager import ProfileManager
+from NetworkLog import NetworkLog
+from TabLifecycle import TabLifecycleManager
+from BookMarkWidget import normalizeUrl
+from LoadTiming import percentile
+from Common import readProcessRss
+
+
+def speculationKey(url: str) -> str:
+    # typed text without scheme is loaded as http (see WebView.load)
+    url = url.strip()
+    return normalizeUrl(url if '://' in url else 'http://' + url)
+
+
+class Speculation:
+    def __init__(self, url: str, profile: str, view: WebView, source: str):
+        self.url = url
+        self.profile = profile
+        self.view = view
+        self.source = source  # 'url' (suggestion) or 'bookmark'
+        self.started = time.monotonic()
+        self.requested = self.started
+        self.finished: Union[float, None] = None
+        self.rss_base: Dict[int, int] = dict()  # rss of the renderers of open tabs at start (pid: bytes)
+
+
+class SpeculationPool(QObject):
+    # hidden views loading urls the user is likely to open next (top url suggestion, hovered bookmark). a request
+    # starts 'delay_ms' after the last one (typing and moving over bookmarks replace it), at most 'max_views' are
+    # kept (the least recently requested is cancelled), and a speculation is cancelled when it fails, is not used
+    # in 'ttl_sec' or its renderer grows by more than 'max_rss_mb'. take() hands the view over to a tab
+    _instance: Union['SpeculationPool', None] = None
+    enabled: bool = False  # opt-in (--speculative_preload)
+    max_views: int = 2
+    delay_ms: int = 250
+    ttl_sec: float = 30.
+    max_rss_mb: float = 512.
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._entries: Dict[str, Speculation] = OrderedDict()
+        self._request: Union[tuple, None] = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.onRequestTimer)
+        self._timerExpire = QTimer(self)
+        self._timerExpire.setInterval(5000)
+        self._timerExpire.timeout.connect(self.expire)
+        self.commits = 0
+        self.hits = 0
+        self.cancelled = 0
+        self.saved_ms: List[float] = list()
+
+    @classmethod
+    def instance(cls) -> 'SpeculationPool':
+        if cls._instance is None:
+            cls._instance = SpeculationPool()
+        return cls._instance
+
+    def request(self, url: str, profile: str = '', source: str = 'url'):
+        # empty url withdraws the pending request (speculations already started are kept)
+        if not self.enabled or not url.startswith(('http://', 'https://')):
+            self._request = None
+            self._timer.stop()
+            return
+        self._request = (url, profile, source)
+        self._timer.start(self.delay_ms)
+
+    def onRequestTimer(self):
+        request, self._request = self._request, None
+        if request is not None:
+            self.start(*request)
+
+    def start(self, url: str, profile: str = '', source: str = 'url'):
+        key = speculationKey(url)
+        spec = self._entries.get(key)
+        if spec is not None and spec.profile == profile:
+            spec.requested = time.monotonic()
+            self._entries.move_to_end(key)
+            return
+        if spec is not None:
+            self.cancel(key)
+        while len(self._entries) >= self.max_views:
+            self.cancel(next(iter(self._entries)))
+        view = WebView(profile=ProfileManager.instance().profile(profile))
+        NetworkLog.instance().detachPage(view.page())  # does not take requests of the tabs (see NetworkLog)
+        spec = Speculation(url, profile, view, source)
+        pids = set([x.renderProcessPid() for x in TabLifecycleManager.instance().tabs()]) - {0}
+        spec.rss_base = {pid: readProcessRss(pid) for pid in pids}
+        self._entries[key] = spec
+        view.loadFinished.connect(partial(self.onLoadFinished, spec))
+        view.load(QUrl(url))
+        self._timerExpire.start()
+
+    def onLoadFinished(self, spec: Speculation, result: bool):
+        key = speculationKey(spec.url)
+        if self._entries.get(key) is not spec:
+            return
+        if not result:
+            self.cancel(key)
+            return
+        spec.finished = time.monotonic()
+        if self.rssMb(spec) > self.max_rss_mb:
+            self.cancel(key)
+
+    @staticmethod
+    def rssMb(spec: Speculation) -> float:
+        # growth of the renderer since the speculation started: a same-site speculation may share the renderer of
+        # open tabs (their memory is not counted), a renderer of its own counts as a whole
+        pid = spec.view.page().renderProcessPid()
+        if pid <= 0:
+            return 0.
+        return max(0, readProcessRss(pid) - spec.rss_base.get(pid, 0)) / 1024 / 1024
+
+    def expire(self):
+        now = time.monotonic()
+        for key, spec in list(self._entries.items()):
+            if now - spec.requested > self.ttl_sec or self.rssMb(spec) > self.max_rss_mb:
+                self.cancel(key)
+        if not self._entries:
+            self._timerExpire.stop()
+
+    def cancel(self, key: str):
+        spec = self._entries.pop(key)
+        spec.view.loadFinished.disconnect()
+        spec.view.stop()
+        spec.view.release()
+        self.cancelled += 1
+
+    def clear(self):
+        self._request = None
+        self._timer.stop()
+        for key in list(self._entries.keys()):
+            self.cancel(key)
+
+    def take(self, url: str, profile: str = '') -> Union[Speculation, None]:
+        # the user navigates to 'url': a matching speculation is removed from the pool (the caller owns its view)
+        if not self.enabled:
+            return None
+        self.commits += 1
+        self._request = None
+        self._timer.stop()
+        key = speculationKey(url)
+        spec = self._entries.get(key)
+        if spec is None or spec.profile != profile:
+            return None
+        del self._entries[key]
+        spec.view.loadFinished.disconnect()
+        self.hits += 1
+        # a finished load is saved completely, a running one as far as it got
+        end = spec.finished if spec.finished is not None else time.monotonic()
+        self.saved_ms.append((end - spec.started) * 1000)
+        return spec
+
+    def statistics(self) -> dict:
+        return {
+            'commits': self.commits,
+            'hits': self.hits,
+            'hit_rate': self.hits / self.commits if self.commits else 0.,
+            'cancelled': self.cancelled,
+            'saved_ms_total': sum(self.saved_ms),
+            'saved_ms_p50': percentile(self.saved_ms, 50),
+            'pool': len(self._entries)
+        }
@@ -0,0 +1,69 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : StartupTrace.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Startup time tracing (--trace-startup)
+# -------------------------------------------------------------------------------------------------------------------- #
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, List, Union
+
+
+class StartupTrace:
+    # collects durations of startup phases and time points since 'origin' (process start if set by main.py).
+    # nothing is recorded when tracing is disabled or after the report is printed
+    _instance: Union['StartupTrace', None] = None
+
+    def __init__(self):
+        self.enabled = False
+        self.origin = time.perf_counter()
+        self._records: List[tuple] = list()  # (kind, name, milliseconds)
+        self._finished = False
+        self.callbacks: List[Callable[[], None]] = list()  # called after the report
+
+    @classmethod
+    def instance(cls) -> 'StartupTrace':
+        if cls._instance is None:
+            cls._instance = StartupTrace()
+        return cls._instance
+
+    def isActive(self) -> bool:
+        return self.enabled and not self._finished
+
+    def elapsed(self) -> float:
+        return (time.perf_counter() - self.origin) * 1000
+
+    def addSpan(self, name: str, milliseconds: float):
+        if self.isActive():
+            self._records.append(('span', name, milliseconds))
+
+    def mark(self, name: str):
+        # time point (ms since origin), only the first mark of a name is kept
+        if self.isActive() and not self.hasMark(name):
+            self._records.append(('mark', name, self.elapsed()))
+
+    def hasMark(self, name: str) -> bool:
+        return name in [x[1] for x in self._records if x[0] == 'mark']
+
+    @contextmanager
+    def section(self, name: str):
+        if not self.isActive():
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.addSpan(name, (time.perf_counter() - start) * 1000)
+
+    def report(self):
+        if not self.isActive():
+            return
+        self._finished = True
+        for kind, name, value in self._records:
+            prefix = '+' if kind == 'span' else '@'
+            print(f'[startup] {prefix} {name:<28} {value:>9.1f} ms', file=sys.stderr)
+        sys.stderr.flush()
+        for callback in self.callbacks:
+            callback()
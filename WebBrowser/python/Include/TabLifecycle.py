@@ -0,0 +1,90 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : TabLifecycle.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Background tab freezing and discarding policy (shared by all browser windows)
+# -------------------------------------------------------------------------------------------------------------------- #
+import time
+from collections import OrderedDict
+from typing import Dict, List, Union
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from PyQt5.QtWebEngineWidgets import QWebEnginePage
+from WebPageWidget import WebPageWidget
+from Common import readProcessRss
+
+
+class TabLifecycleManager(QObject):
+    # tabs are kept in least-recently-activated order.
+    # background tabs are frozen after 'freeze_after' seconds, least recently used background tabs are discarded
+    # while more than 'max_live_tabs' tabs are alive or renderer processes use more than 'max_memory_mb'
+    # (0 disables a limit). discarded tabs are reloaded by the page when they are activated again
+    _instance: Union['TabLifecycleManager', None] = None
+    sig_unregistered = pyqtSignal(object)  # closed tab (widget is released)
+
+    def __init__(self, freeze_after: float = 300., max_live_tabs: int = 20, max_memory_mb: int = 0,
+                 interval_ms: int = 10000, parent=None):
+        super().__init__(parent=parent)
+        self.freeze_after = freeze_after
+        self.max_live_tabs = max_live_tabs
+        self.max_memory_mb = max_memory_mb
+        self._tabs: Dict[WebPageWidget, None] = OrderedDict()
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.applyPolicy)
+
+    @classmethod
+    def instance(cls) -> 'TabLifecycleManager':
+        if cls._instance is None:
+            cls._instance = TabLifecycleManager()
+        return cls._instance
+
+    def tabs(self) -> List[WebPageWidget]:
+        return list(self._tabs.keys())
+
+    def register(self, widget: WebPageWidget):
+        if widget not in self._tabs:
+            self._tabs[widget] = None
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def unregister(self, widget: WebPageWidget):
+        if widget not in self._tabs:
+            return
+        del self._tabs[widget]
+        if not self._tabs:
+            self._timer.stop()
+        self.sig_unregistered.emit(widget)
+
+    def activated(self, widget: WebPageWidget):
+        if widget in self._tabs:
+            self._tabs.move_to_end(widget)
+        widget.activate()
+
+    def residentMemory(self) -> int:
+        pids = set([x.renderProcessPid() for x in self._tabs.keys()])
+        return sum([readProcessRss(pid) for pid in pids if pid > 0])
+
+    def applyPolicy(self):
+        now = time.monotonic()
+        live = list()
+        for widget in self._tabs.keys():
+            state = widget.lifecycleState()
+            if state == QWebEnginePage.Discarded:
+                continue
+            live.append(widget)
+            if state == QWebEnginePage.Active and now - widget.lastActivated() >= self.freeze_after:
+                widget.freeze()
+
+        # discard from the least recently used one
+        excess = len(live) - self.max_live_tabs if self.max_live_tabs > 0 else 0
+        for widget in live:
+            if excess <= 0:
+                break
+            if widget.discard():
+                excess -= 1
+
+        if self.max_memory_mb > 0 and self.residentMemory() > self.max_memory_mb * 1024 * 1024:
+            # memory usage of renderer is updated lazily, so discard only one tab per check
+            for widget in live:
+                if widget.lifecycleState() != QWebEnginePage.Discarded and widget.discard():
+                    break
@@ -0,0 +1,450 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : UrlCompleter.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Frecency ranked url autocomplete (visited urls, titles and bookmarks)
+# -------------------------------------------------------------------------------------------------------------------- #
+import os
+import re
+import json
+import math
+import time
+import queue
+import tempfile
+import threading
+import traceback
+from array import array
+from bisect import bisect_left
+from heapq import nlargest
+from typing import Callable, Dict, Iterable, List, Set, Tuple, Union
+from PyQt5.QtCore import Qt, QObject, QTimer, pyqtSignal, QAbstractListModel, QModelIndex
+from Common import ensurePathExist
+
+# frecency: every visit has weight 1 decaying by half in HALF_LIFE_DAYS. the rank is log of the decayed weight
+# sum at time 0, so ranks of entries never need to be recomputed when time passes (order does not change)
+HALF_LIFE_DAYS = 30.
+DECAY = math.log(2) / (HALF_LIFE_DAYS * 86400)
+BOOKMARK_WEIGHT = math.log(5)  # a bookmark ranks at least like 5 visits now
+TOKEN_SPLIT = re.compile(r'[\W_]+')
+URL_PREFIX = re.compile(r'^(?:[a-z][a-z0-9+.-]*://)?(?:www\.)?')
+RECORDED_SCHEMES = ('http://', 'https://', 'file://', 'ftp://')
+
+
+def urlKey(url: str) -> str:
+    # 'https://www.Example.com/a' -> 'example.com/a'
+    return URL_PREFIX.sub('', url.lower(), count=1)
+
+
+def visitRank(rank: float, when: float) -> float:
+    # rank after a visit at 'when' (epoch seconds)
+    value = when * DECAY
+    if rank == -math.inf:
+        return value
+    high, low = max(rank, value), min(rank, value)
+    return high + math.log1p(math.exp(low - high))
+
+
+class UrlIndex:
+    # entries are (url, title, rank) addressed by id. 'keys' is a sorted list of url keys and words of url and
+    # title ('key_ids' are their entries) for prefix lookup, 'order' is ids by rank at build time.
+    # entries added (or retitled) after the build are scanned linearly ('delta'), entries visited after the build
+    # are 'dirty' (their rank only grew), so a query is exact without re-sorting. bookmarks have keys and an order
+    # of their own (their score grows with time, see score), bookmarked after the build are 'bookmark_delta'.
+    # the index is rebuilt (off the GUI thread) when these sets grow
+    scan_limit: int = 3000
+
+    def __init__(self, urls: List[str] = None, titles: List[str] = None, ranks: Iterable[float] = None,
+                 bookmarks: Iterable[str] = ()):
+        self.urls: List[str] = urls if urls is not None else list()
+        self.titles: List[str] = titles if titles is not None else list()
+        self.ranks = array('d', ranks if ranks is not None else [])
+        self.url_ids: Dict[str, int] = {url: i for i, url in enumerate(self.urls)}
+        self.haystacks: List[str] = list()
+        self.keys: List[str] = list()
+        self.key_ids = array('i')
+        self.order = array('i')
+        self.delta: Set[int] = set()
+        self.dirty: Set[int] = set()
+        self.bookmarks: Set[int] = set()
+        self.bookmark_keys: List[str] = list()
+        self.bookmark_key_ids = array('i')
+        self.bookmark_order = array('i')
+        self.bookmark_delta: Set[int] = set()
+        bookmarks = list(bookmarks)
+        for url in bookmarks:
+            self.entry(url)  # bookmarks never visited are in the keys too (not in 'delta')
+        self.build()
+        self.setBookmarks(bookmarks)
+
+    @staticmethod
+    def entryKeys(url: str, title: str) -> List[str]:
+        key = urlKey(url)
+        words = TOKEN_SPLIT.split(f'{key} {title.lower()}')
+        return [key] + list(dict.fromkeys([x for x in words if x and x != key]))
+
+    def build(self):
+        words: Dict[str, str] = dict()  # shares equal words
+        pairs = list()
+        self.haystacks = list()
+        for i, (url, title) in enumerate(zip(self.urls, self.titles)):
+            keys = [words.setdefault(x, x) for x in self.entryKeys(url, title)]
+            self.haystacks.append(' ' + ' '.join(keys))
+            pairs.extend([(x, i) for x in keys])
+        pairs.sort()
+        self.keys = [x[0] for x in pairs]
+        self.key_ids = array('i', [x[1] for x in pairs])
+        self.order = array('i', sorted(range(len(self.urls)), key=self.ranks.__getitem__, reverse=True))
+        self.delta = set()
+        self.dirty = set()
+
+    def snapshot(self) -> tuple:
+        return list(self.urls), list(self.titles), array('d', self.ranks), [self.urls[x] for x in self.bookmarks]
+
+    def pendingCount(self) -> int:
+        return len(self.delta) + len(self.dirty) + len(self.bookmark_delta)
+
+    def entry(self, url: str, title: str = '') -> int:
+        entry_id = self.url_ids.get(url)
+        if entry_id is None:
+            entry_id = len(self.urls)
+            self.urls.append(url)
+            self.titles.append(title)
+            self.ranks.append(-math.inf)
+            self.haystacks.append(' ' + ' '.join(self.entryKeys(url, title)))
+            self.url_ids[url] = entry_id
+            self.delta.add(entry_id)
+        return entry_id
+
+    def visit(self, url: str, title: str, when: float):
+        entry_id = self.entry(url, title)
+        self.ranks[entry_id] = visitRank(self.ranks[entry_id], when)
+        if entry_id not in self.delta:
+            self.dirty.add(entry_id)
+        if title:
+            self.setTitle(url, title)
+
+    def setTitle(self, url: str, title: str):
+        # words of the old title stay in the sorted keys until the next build (filtered by haystack)
+        entry_id = self.url_ids.get(url)
+        if entry_id is not None and title and self.titles[entry_id] != title:
+            self.titles[entry_id] = title
+            self.haystacks[entry_id] = ' ' + ' '.join(self.entryKeys(url, title))
+            self.delta.add(entry_id)
+
+    def setBookmarks(self, urls: Iterable[str]):
+        self.bookmarks = set([self.entry(x) for x in urls])
+        self.buildBookmarks()
+
+    def buildBookmarks(self):
+        # order of bookmarks tied at the bookmark weight (shortest url first) is the one at build time
+        now = time.time()
+        pairs = sorted([(x, i) for i in self.bookmarks for x in self.haystacks[i].split()])
+        self.bookmark_keys = [x[0] for x in pairs]
+        self.bookmark_key_ids = array('i', [x[1] for x in pairs])
+        self.bookmark_order = array('i', sorted(self.bookmarks, key=lambda x: (self.score(x, now), -len(self.urls[x])),
+                                                reverse=True))
+        self.bookmark_delta = set()
+
+    def addBookmark(self, url: str):
+        entry_id = self.entry(url)
+        if entry_id not in self.bookmarks:
+            self.bookmarks.add(entry_id)
+            self.bookmark_delta.add(entry_id)
+
+    def removeBookmark(self, url: str):
+        # keys of a removed bookmark stay until the next build (filtered by 'bookmarks')
+        entry_id = self.url_ids.get(url)
+        self.bookmarks.discard(entry_id)
+        self.bookmark_delta.discard(entry_id)
+
+    def score(self, entry_id: int, now: float) -> float:
+        if entry_id in self.bookmarks:
+            return max(self.ranks[entry_id], BOOKMARK_WEIGHT + now * DECAY)
+        return self.ranks[entry_id]
+
+    def query(self, text: str, k: int = 10, now: Union[float, None] = None) -> List[Tuple[str, str]]:
+        # entries having a word (or the url key) starting with every term of 'text', best 'k' by frecency
+        terms = [urlKey(x) for x in text.lower().split()]
+        terms = [x for x in terms if x]
+        if not terms:
+            return []
+        now = time.time() if now is None else now
+        needles = [' ' + x for x in terms]
+        haystacks = self.haystacks
+
+        def matches(i: int) -> bool:
+            haystack = haystacks[i]
+            for needle in needles:
+                if needle not in haystack:
+                    return False
+            return True
+
+        # candidates of the most selective term
+        lo, hi = self.keyRange(self.keys, terms)
+        extra = [x for x in self.delta | self.dirty | self.bookmark_delta if matches(x)]
+        if hi - lo <= self.scan_limit:
+            candidates = set([x for x in self.key_ids[lo:hi] if matches(x)])
+            candidates.update(extra)
+        else:
+            # many candidates: the best ones come first in the build time order (a bookmark scores at least its
+            # rank), bookmarks ranked by the bookmark weight come first in their own order
+            candidates = set(extra)
+            self.scanOrder(self.order, self.delta | self.dirty, matches, k, candidates)
+            lo, hi = self.keyRange(self.bookmark_keys, terms)
+            if hi - lo <= self.scan_limit:
+                bookmarks = self.bookmarks
+                candidates.update([x for x in self.bookmark_key_ids[lo:hi] if x in bookmarks and matches(x)])
+            else:
+                self.scanOrder(self.bookmark_order, self.bookmark_delta, matches, k, candidates, self.bookmarks)
+        best = nlargest(k, candidates, key=lambda x: (self.score(x, now), -len(self.urls[x])))
+        return [(self.urls[x], self.titles[x]) for x in best]
+
+    @staticmethod
+    def keyRange(keys: List[str], terms: List[str]) -> Tuple[int, int]:
+        # range of the sorted 'keys' starting with the most selective term
+        lo, hi = 0, len(keys) + 1
+        for term in terms:
+            lo_, hi_ = bisect_left(keys, term), bisect_left(keys, term + '\uffff')
+            if hi_ - lo_ < hi - lo:
+                lo, hi = lo_, hi_
+        return lo, hi
+
+    @staticmethod
+    def scanOrder(order: array, skip: Set[int], matches: Callable[[int], bool], k: int, candidates: Set[int],
+                  only: Union[Set[int], None] = None):
+        found = 0
+        for i in order:
+            if i not in skip and (only is None or i in only) and matches(i):
+                candidates.add(i)
+                found += 1
+                if found >= k:
+                    break
+
+
+class UrlIndexWorker(QObject):
+    # runs jobs (load, append, rebuild) in order on a worker thread
+    sig_built = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self.run, name='UrlIndexWorker', daemon=True)
+        self._thread.start()
+
+    def request(self, job: Union[Callable[[], None], None]):
+        self._queue.put(job)
+
+    def stop(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def run(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            try:
+                job()
+            except Exception:
+                traceback.print_exc()
+
+
+class UrlHistoryIndex(QObject):
+    # visits are recorded in the in-memory index immediately and appended to a jsonl log shortly after
+    # (one line per visit or title change). the log is read and compacted (one line per url) on the worker thread
+    # at start, index rebuilds run there too: changes made meanwhile are replayed on the new index
+    _instance: Union['UrlHistoryIndex', None] = None
+    rebuild_threshold: int = 2000
+
+    def __init__(self, path: str, parent=None):
+        super().__init__(parent=parent)
+        self._path = path
+        self._index = UrlIndex()
+        self._loaded = False
+        self._building = False
+        self._replay: List[tuple] = list()  # changes after the snapshot of a running build
+        self._lines: List[str] = list()  # not written yet
+        self._bookmarks: Set[str] = set()
+        self._worker = UrlIndexWorker(self)
+        self._worker.sig_built.connect(self.onBuilt)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(1000)
+        self._timer.timeout.connect(self.flush)
+
+    @classmethod
+    def instance(cls) -> 'UrlHistoryIndex':
+        if cls._instance is None:
+            curpath = os.path.dirname(os.path.abspath(__file__))
+            path = os.path.join(os.path.dirname(curpath), 'Config', 'url_history.jsonl')
+            cls._instance = UrlHistoryIndex(path)
+            cls._instance.load()
+        return cls._instance
+
+    def load(self):
+        self._building = True
+        bookmarks = list(self._bookmarks)
+        self._worker.request(lambda: self.loadJob(bookmarks))
+
+    def loadJob(self, bookmarks: List[str]):
+        urls: Dict[str, list] = dict()  # url: [title, rank]
+        lines = 0
+        if os.path.isfile(self._path):
+            with open(self._path, 'r', encoding='utf-8') as fp:
+                for line in fp:
+                    try:
+                        record = json.loads(line)
+                        url = record['u']
+                    except (ValueError, KeyError, TypeError):
+                        continue  # partially written line (crash)
+                    lines += 1
+                    entry = urls.setdefault(url, ['', -math.inf])
+                    if record.get('t'):
+                        entry[0] = record['t']
+                    if 'r' in record:
+                        entry[1] = record['r']
+                    elif 'v' in record:
+                        entry[1] = visitRank(entry[1], record['v'])
+        if lines > 2 * len(urls) + 100:
+            self.compact(urls)
+        index = UrlIndex(list(urls.keys()), [x[0] for x in urls.values()], [x[1] for x in urls.values()], bookmarks)
+        self._worker.sig_built.emit(index)
+
+    def compact(self, urls: Dict[str, list]):
+        dir_name = os.path.dirname(self._path)
+        temp_fd, temp_path = tempfile.mkstemp(prefix='.url_history.', suffix='.tmp', dir=dir_name)
+        with os.fdopen(temp_fd, 'w', encoding='utf-8') as fp:
+            for url, (title, rank) in urls.items():
+                record = {'u': url, 't': title, 'r': rank}
+                fp.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+        os.replace(temp_path, self._path)
+
+    def rebuild(self):
+        if self._building:
+            return
+        self._building = True
+        urls, titles, ranks, bookmarks = self._index.snapshot()
+        self._worker.request(lambda: self._worker.sig_built.emit(UrlIndex(urls, titles, ranks, bookmarks)))
+
+    def onBuilt(self, index: UrlIndex):
+        for op in self._replay:
+            if op[0] == 'visit':
+                index.visit(op[1], op[2], op[3])
+            elif op[0] == 'title':
+                index.setTitle(op[1], op[2])
+            elif op[0] == 'bookmark':
+                index.addBookmark(op[1])
+            elif op[0] == 'unbookmark':
+                index.removeBookmark(op[1])
+            elif op[0] == 'bookmarks':
+                index.setBookmarks(op[1])
+        self._index = index
+        self._replay = list()
+        self._loaded = True
+        self._building = False
+        if index.pendingCount() > self.rebuild_threshold:
+            self.rebuild()
+
+    def isLoaded(self) -> bool:
+        return self._loaded
+
+    def count(self) -> int:
+        return len(self._index.urls)
+
+    def recordVisit(self, url: str, title: str = '', when: Union[float, None] = None):
+        if not url.startswith(RECORDED_SCHEMES):
+            return
+        when = time.time() if when is None else when
+        self._index.visit(url, title, when)
+        if self._building:
+            self._replay.append(('visit', url, title, when))
+        self.appendLine({'u': url, 't': title, 'v': when} if title else {'u': url, 'v': when})
+        if self._index.pendingCount() > self.rebuild_threshold:
+            self.rebuild()
+
+    def setTitle(self, url: str, title: str):
+        index = self._index
+        entry_id = index.url_ids.get(url)
+        if entry_id is None or not title or index.titles[entry_id] == title:
+            return
+        index.setTitle(url, title)
+        if self._building:
+            self._replay.append(('title', url, title))
+        self.appendLine({'u': url, 't': title})
+
+    def setBookmarks(self, urls: List[str]):
+        self._bookmarks = set(urls)
+        self._index.setBookmarks(self._bookmarks)
+        if self._building:
+            self._replay.append(('bookmarks', list(self._bookmarks)))
+        if self._index.pendingCount() > self.rebuild_threshold:
+            self.rebuild()
+
+    def addBookmarks(self, urls: List[str]):
+        # bookmarks changed one at a time are applied as a delta (see UrlIndex.bookmark_delta)
+        for url in urls:
+            self._bookmarks.add(url)
+            self._index.addBookmark(url)
+            if self._building:
+                self._replay.append(('bookmark', url))
+        if self._index.pendingCount() > self.rebuild_threshold:
+            self.rebuild()
+
+    def removeBookmarks(self, urls: List[str]):
+        for url in urls:
+            self._bookmarks.discard(url)
+            self._index.removeBookmark(url)
+            if self._building:
+                self._replay.append(('unbookmark', url))
+
+    def query(self, text: str, k: int = 10) -> List[Tuple[str, str]]:
+        return self._index.query(text, k)
+
+    def appendLine(self, record: dict):
+        self._lines.append(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self, wait: bool = False):
+        self._timer.stop()
+        lines, self._lines = self._lines, list()
+        if lines:
+            self._worker.request(lambda: self.writeLines(lines))
+        if wait:
+            done = threading.Event()
+            self._worker.request(done.set)
+            done.wait()
+
+    def writeLines(self, lines: List[str]):
+        ensurePathExist(os.path.dirname(self._path))
+        with open(self._path, 'a', encoding='utf-8') as fp:
+            fp.writelines(lines)
+
+    def close(self):
+        self.flush()
+        self._worker.stop()
+
+
+class UrlCompletionModel(QAbstractListModel):
+    # rows are (url, title), the url is inserted into the line edit (edit role)
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._rows: List[Tuple[str, str]] = list()
+
+    def setRows(self, rows: List[Tuple[str, str]]):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        url, title = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return f'{title}  -  {url}' if title else url
+        elif role == Qt.EditRole:
+            return url
+        elif role == Qt.ToolTipRole:
+            return url
+        return None
@@ -0,0 +1,51 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : ViewEventDispatcher.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Single application-wide event filter routing input events to the web view owning the target
+# -------------------------------------------------------------------------------------------------------------------- #
+from typing import Dict, Union
+from PyQt5.QtCore import QObject, QEvent
+from PyQt5.QtWidgets import QApplication
+
+
+class ViewEventDispatcher(QObject):
+    # web engine delivers input to a (non-python) child widget of the view, so the owner is found by parent().
+    # registered views must implement 'dispatchEvent(event) -> bool' (True: event is consumed)
+    _instance: Union['ViewEventDispatcher', None] = None
+    event_types = (QEvent.MouseButtonPress, QEvent.Wheel)
+
+    def __init__(self, parent=None):
+        super().__init__(parent=parent)
+        self._views: Dict[QObject, None] = dict()
+        self._installed = False
+
+    @classmethod
+    def instance(cls) -> 'ViewEventDispatcher':
+        if cls._instance is None:
+            cls._instance = ViewEventDispatcher()
+        return cls._instance
+
+    def count(self) -> int:
+        return len(self._views)
+
+    def register(self, view: QObject):
+        self._views[view] = None
+        if not self._installed:
+            QApplication.instance().installEventFilter(self)
+            self._installed = True
+
+    def unregister(self, view: QObject):
+        self._views.pop(view, None)
+        if not self._views and self._installed:
+            QApplication.instance().removeEventFilter(self)
+            self._installed = False
+
+    def eventFilter(self, a0: QObject, a1: QEvent) -> bool:
+        # cheap type check first: most events (paint, move, timer, ...) are never routed
+        if a1.type() not in self.event_types:
+            return False
+        view = a0.parent()
+        if view is None or view not in self._views:
+            return False
+        return view.dispatchEvent(a1)
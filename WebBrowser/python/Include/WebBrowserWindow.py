@@ -4,64 +4,147 @@
 # Author       : Yogyui
 # Description  : Implementation of web browser window
 # -------------------------------------------------------------------------------------------------------------------- #
-import os
 from typing import Union, List
 from functools import partial
-from PyQt5.QtCore import Qt, QSize, QUrl
-from PyQt5.QtGui import QIcon, QCloseEvent, QKeyEvent, QResizeEvent
+from PyQt5.QtCore import Qt, QSize, QUrl, QTimer
+from PyQt5.QtGui import QIcon, QCloseEvent, QKeyEvent, QResizeEvent, QPaintEvent
 from PyQt5.QtWidgets import QMainWindow, QTabBar, QPushButton, QApplication, QWidget, QAction, QSplitter
 from PyQt5.QtWidgets import QMenuBar, QMenu, QMessageBox
 from WebPageWidget import WebPageWidget, WebView
 from CustomTabWidget import CustomTabWidget
 from NavigationWidget import NavigationToolBar
-from BookMarkWidget import BookMarkToolBar, BookMarkManager
+from BookMarkWidget import BookMarkToolBar, BookMarkManager, BookMarkFolder, BookMarkItem
 from ConfigUtil import WebBrowserConfig
+from FaviconLoader import FaviconLoader
+from TabLifecycle import TabLifecycleManager
+from SessionJournal import SessionJournal
+from ProfileManager import ProfileManager
+from LoadTiming import LoadTimingRecorder
 from DeveloperWidget import DeveloperWidget
 from Common import makeQAction
+from Resources import getIcon
+from StartupTrace import StartupTrace
+from UrlCompleter import UrlHistoryIndex
+from BrowsingHistory import HistoryStore, HistoryWidget
+from Speculation import SpeculationPool
+from ContentBlocker import ContentBlocker
+from NetworkLog import NetworkLog
 
 
 class WebBrowserWindow(QMainWindow):
     _mb_show_navbar: QAction
     _mb_show_bookmark: QAction
     _mb_show_devtool: QAction
+    _mb_allow_content: QAction
 
-    def __init__(self, parent=None, init_url: Union[str, QUrl, None] = 'about:blank'):
+    def __init__(self, parent=None, init_url: Union[str, QUrl, None] = 'about:blank', profile: str = ''):
         super().__init__(parent=parent)
-        path_ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        if os.getcwd() != path_:
-            os.chdir(path_)
-
-        self._bookMarkManager = BookMarkManager()
-        self._config = WebBrowserConfig(self._bookMarkManager)
-
-        self._navBar = NavigationToolBar(self)
-        self._bookmarkBar = BookMarkToolBar(self._bookMarkManager, self)
-
-        self._splitter = QSplitter(Qt.Horizontal, self)
-        self._tabWidget = CustomTabWidget()
-        self._devWidget = DeveloperWidget()
-
-        self.initControl()
-        self.initLayout()
-        self._menuBar = QMenuBar(self)
-        self.initMenuBar()
-        self.setWindowTitle('YOGYUI Browser')
-        self.setWindowIcon(QIcon('./Resource/application.ico'))
-        if init_url is not None:
-            if init_url == 'home':
-                self.addWebPageTab(self._config.url_home)
+        trace = StartupTrace.instance()
+
+        with trace.section('window: config load'):
+            if isinstance(parent, WebBrowserWindow):
+                # child windows share bookmarks, configuration and web engine profile of the window opened them
+                self._bookMarkManager = parent._bookMarkManager
+                self._config = parent._config
+                self._profile_name = profile or parent._profile_name
             else:
-                self.addWebPageTab(init_url)
+                self._bookMarkManager = BookMarkManager()
+                self._config = WebBrowserConfig(self._bookMarkManager)
+                self._profile_name = profile
+                ProfileManager.instance().setOptions(self._config.profiles)
+                # filter lists are compiled (or read from cache) on a worker thread
+                if ContentBlocker.instance().start():
+                    ProfileManager.instance().addRequestHandler(ContentBlocker.instance().interceptRequest)
+                if NetworkLog.enabled:
+                    ProfileManager.instance().addRequestObserver(NetworkLog.instance().onRequest)
+            self._config.retain(self)
+
+        with trace.section('window: widgets'):
+            # bookmark buttons (favicons), menus and dev tool are built after the first paint (initDeferred)
+            self._navBar = NavigationToolBar(self)
+            self._bookmarkBar = BookMarkToolBar(self._bookMarkManager, self, deferred=True)
+
+            self._splitter = QSplitter(Qt.Horizontal, self)
+            self._tabWidget = CustomTabWidget()
+            self._devWidget: Union[DeveloperWidget, None] = None
+            self._historyWidget: Union[HistoryWidget, None] = None
+            self._deferred_init = False
+
+            self.initControl()
+            self.initLayout()
+            self._menuBar = QMenuBar(self)
+            self.setMenuBar(self._menuBar)
+            self.setWindowTitle('YOGYUI Browser')
+            self.setWindowIcon(getIcon('application.ico'))
+        with trace.section('window: first tab'):
+            SessionJournal.instance().registerWindow(self)
+            if init_url is not None:
+                self.addStartPageTab(init_url)
+
+    def paintEvent(self, a0: QPaintEvent) -> None:
+        super().paintEvent(a0)
+        if not self._deferred_init:
+            self._deferred_init = True
+            StartupTrace.instance().mark('first frame')
+            QTimer.singleShot(0, self.initDeferred)
+
+    def initDeferred(self):
+        trace = StartupTrace.instance()
+        with trace.section('deferred: menus'):
+            self.initMenuBar()
+        with trace.section('deferred: bookmark bar'):
+            self._bookmarkBar.drawItems()
+        with trace.section('deferred: url completion'):
+            # url history is read on a worker thread, suggestions are available when it is loaded
+            self._navBar.setCompletionSource(UrlHistoryIndex.instance().query)
+            if not isinstance(self.parent(), WebBrowserWindow):
+                # single changes are passed as a delta, a reset (bulk load) replaces all bookmarks
+                self._bookMarkManager.sig_inserted.connect(self.onBookmarkInserted)
+                self._bookMarkManager.sig_removed.connect(self.onBookmarkRemoved)
+                self._bookMarkManager.sig_reset.connect(self.onBookmarksChanged)
+                self.onBookmarksChanged()
+        trace.mark('deferred init done')
+        self.checkStartupDone()
+
+    def checkStartupDone(self):
+        trace = StartupTrace.instance()
+        if trace.hasMark('deferred init done') and trace.hasMark('first loadFinished'):
+            trace.report()
+
+    def devWidget(self) -> DeveloperWidget:
+        if self._devWidget is None:
+            self._devWidget = DeveloperWidget()
+            self._devWidget.sig_run_js.connect(self.runJavaScript)
+            self._devWidget.sig_load_source.connect(self.loadPageSource)
+            self._splitter.addWidget(self._devWidget)
+            self._devWidget.hide()
+            self.updateNetworkPage()
+        return self._devWidget
+
+    def updateNetworkPage(self):
+        # network panel follows the current tab (and its view, which speculative preloading may swap)
+        if self._devWidget is None:
+            return
+        curwgt = self._tabWidget.currentWidget()
+        if isinstance(curwgt, WebPageWidget) and curwgt.isMaterialized():
+            self._devWidget.setNetworkPage(curwgt.view().page())
+        else:
+            self._devWidget.setNetworkPage(None)
 
     def release(self):
+        SessionJournal.instance().windowClosed(self)
         self.closeWebPageAll()
-        self._config.save_to_xml()
+        self._config.release(self)
+        FaviconLoader.instance().saveCache()
+        UrlHistoryIndex.instance().flush(wait=True)
+        HistoryStore.instance().flush(wait=True)
+        SpeculationPool.instance().clear()
+        if self._historyWidget is not None:
+            self._historyWidget.close()
 
     def initLayout(self):
         self.setCentralWidget(self._splitter)
         self._splitter.addWidget(self._tabWidget)
-        self._splitter.addWidget(self._devWidget)
-        self._devWidget.hide()
 
     def initControl(self):
         self._splitter.setStyleSheet("QSplitter:handle:horizontal {background:rgb(204,206,219); margin:1px 1px}")
@@ -74,10 +157,12 @@ class WebBrowserWindow(QMainWindow):
         self._navBar.sig_stop.connect(self.onNavBarStop)
         self._navBar.sig_go_home.connect(self.onNavBarGoHome)
         self._navBar.sig_toggle_bookmark.connect(self.onNavBarToggleBookmark)
+        self._navBar.sig_predict_url.connect(partial(self.onSpeculationCandidate, source='url'))
 
         self.addToolBarBreak(Qt.TopToolBarArea)
         self.addToolBar(Qt.TopToolBarArea, self._bookmarkBar)
         self._bookmarkBar.sig_navitage.connect(self.onNavBarNavitageUrl)
+        self._bookmarkBar.sig_hover.connect(partial(self.onSpeculationCandidate, source='bookmark'))
 
         self._tabWidget.sig_add_tab.connect(self.addWebPageTab)
         self._tabWidget.sig_new_window.connect(self.onTabNewWindow)
@@ -85,11 +170,9 @@ class WebBrowserWindow(QMainWindow):
         self._tabWidget.sig_close_others.connect(self.onTabCloseViewOthers)
         self._tabWidget.sig_close_right.connect(self.onTabCloseRight)
         self._tabWidget.currentChanged.connect(self.onTabWidgetCurrentChanged)
-
-        self._devWidget.sig_run_js.connect(self.runJavaScript)
+        self._tabWidget.tabBar().tabMoved.connect(self.journalTabs)
 
     def initMenuBar(self):
-        self.setMenuBar(self._menuBar)
         menuFile = QMenu('File', self._menuBar)
         self._menuBar.addAction(menuFile.menuAction())
         mb_close = makeQAction(parent=self, text='Close', triggered=self.close)
@@ -109,6 +192,21 @@ class WebBrowserWindow(QMainWindow):
         menuView.addAction(self._mb_show_devtool)
         menuView.aboutToShow.connect(self.onMenuViewAboutToShow)
 
+        menuTools = QMenu('Tools', self._menuBar)
+        self._menuBar.addAction(menuTools.menuAction())
+        mb_history = makeQAction(parent=self, text='History', triggered=self.showHistory)
+        menuTools.addAction(mb_history)
+        menuTools.addSeparator()
+        self._mb_allow_content = makeQAction(parent=self, text='Allow Content on This Site', checkable=True,
+                                             triggered=self.toggleContentAllowed)
+        menuTools.addAction(self._mb_allow_content)
+        menuTools.addSeparator()
+        menuTools.aboutToShow.connect(self.onMenuToolsAboutToShow)
+        mb_cache_info = makeQAction(parent=self, text='Cache Info', triggered=self.showCacheInfo)
+        menuTools.addAction(mb_cache_info)
+        mb_clear_cache = makeQAction(parent=self, text='Clear Cache', triggered=self.clearCache)
+        menuTools.addAction(mb_clear_cache)
+
         menuAbout = QMenu('About', self._menuBar)
         self._menuBar.addAction(menuAbout.menuAction())
         mb_about_page = makeQAction(parent=self, text='Page Info', triggered=self.showAboutPage)
@@ -117,17 +215,38 @@ class WebBrowserWindow(QMainWindow):
     def onMenuViewAboutToShow(self):
         self._mb_show_navbar.setChecked(self._navBar.isVisible())
         self._mb_show_bookmark.setChecked(self._bookmarkBar.isVisible())
-        self._mb_show_devtool.setChecked(self._devWidget.isVisible())
+        self._mb_show_devtool.setChecked(self._devWidget is not None and self._devWidget.isVisible())
+
+    def onMenuToolsAboutToShow(self):
+        curwgt = self._tabWidget.currentWidget()
+        host = curwgt.url().host() if isinstance(curwgt, WebPageWidget) else ''
+        blocker = ContentBlocker.instance()
+        self._mb_allow_content.setEnabled(blocker.isReady() and len(host) > 0)
+        self._mb_allow_content.setChecked(len(host) > 0 and blocker.isAllowed(host.lower()))
+
+    def toggleContentAllowed(self):
+        curwgt = self._tabWidget.currentWidget()
+        if isinstance(curwgt, WebPageWidget) and curwgt.url().host():
+            ContentBlocker.instance().setAllowed(curwgt.url().host(), self._mb_allow_content.isChecked())
+            curwgt.view().reload()
 
     def onNavBarNavitageUrl(self, url: str):
         curwgt = self._tabWidget.currentWidget()
         if isinstance(curwgt, WebPageWidget):
-            curwgt.load(url)
+            spec = SpeculationPool.instance().take(url, self._profile_name)
+            if spec is not None:
+                curwgt.swapView(spec.view, loading=spec.finished is None)
+                self.refreshNavBarState()
+            else:
+                curwgt.load(url)
+
+    def onSpeculationCandidate(self, url: str, source: str):
+        SpeculationPool.instance().request(url, self._profile_name, source)
 
     def onNavBarGoBackward(self):
         curwgt = self._tabWidget.currentWidget()
         if isinstance(curwgt, WebPageWidget):
-            curwgt.view().back()
+            curwgt.goBack()
 
     def onNavBarGoForward(self):
         curwgt = self._tabWidget.currentWidget()
@@ -165,20 +284,25 @@ class WebBrowserWindow(QMainWindow):
         curwgt = self._tabWidget.currentWidget()
         if isinstance(curwgt, WebPageWidget):
             history = curwgt.view().history()
-            self._navBar.btnBackward.setEnabled(history.canGoBack())
+            self._navBar.btnBackward.setEnabled(curwgt.canGoBack())
             self._navBar.btnForward.setEnabled(history.canGoForward())
 
-            bookmark_url_list = self._bookMarkManager.urlList()
-            self._navBar.setBookMarkStatus(curwgt.view().url().toString() in bookmark_url_list)
+            self._navBar.setBookMarkStatus(self._bookMarkManager.isExist(curwgt.view().url().toString()))
 
     def addWebPageTab(self, url: Union[str, QUrl] = 'about:blank'):
-        view = WebPageWidget(parent=self, url=url)
+        view = WebPageWidget(parent=self, url=url, profile=self._profile_name)
         self.setWebPageViewSignals(view)
         self.addTabCommon(view)
 
+    def addStartPageTab(self, url: Union[str, QUrl]):
+        if url == 'home':
+            self.addWebPageTab(self._config.url_home)
+        else:
+            self.addWebPageTab(url)
+
     def addWebPageView(self, view: Union[WebView, None]):
         if view is None:
-            widget = WebPageWidget(parent=self)
+            widget = WebPageWidget(parent=self, profile=self._profile_name)
         else:
             widget = WebPageWidget(parent=self, view=view)
         self.setWebPageViewSignals(widget)
@@ -201,28 +325,63 @@ class WebBrowserWindow(QMainWindow):
         view.sig_load_finished.connect(partial(self.onPageLoadFinished, view))
         view.sig_js_result.connect(self.onJavaScriptResult)
 
-    def addTabCommon(self, widget: WebPageWidget):
+    def addTabCommon(self, widget: WebPageWidget, select: bool = True):
         index = self._tabWidget.count() - 1
-        title = widget.view().title()
+        title = widget.title()
         if len(title) == 0:
             title = 'Empty'
         self._tabWidget.insertTab(index, widget, title)
+        icon = widget.icon()
+        if icon is not None and not icon.isNull():
+            self._tabWidget.setTabIcon(index, icon)
         # add close button in tab
         index = self._tabWidget.indexOf(widget)
         btn = QPushButton()
-        btn.setIcon(QIcon('./Resource/close.png'))
+        btn.setIcon(getIcon('close.png'))
         btn.setFlat(True)
         btn.setFixedSize(16, 16)
         btn.setIconSize(QSize(14, 14))
         btn.clicked.connect(partial(self.closeWebPageTab, widget))
         self._tabWidget.tabBar().setTabButton(index, QTabBar.RightSide, btn)
-        self._tabWidget.setCurrentIndex(index)
+        TabLifecycleManager.instance().register(widget)
+        SessionJournal.instance().tabAdded(widget, widget.url().toString(), widget.title())
+        if select:
+            self._tabWidget.setCurrentIndex(index)
+        self.journalTabs()
+
+    def restoreTabs(self, tabs: List[dict], current: int = 0):
+        # restored tabs are placeholders, web view is created when the tab is selected first
+        journal = SessionJournal.instance()
+        self._tabWidget.blockSignals(True)
+        try:
+            for tab in tabs:
+                icon_url = tab.get('icon_url', '')
+                icon = FaviconLoader.instance().icon(icon_url) if icon_url else None
+                widget = WebPageWidget(parent=self, url=tab.get('url', 'about:blank'), lazy=True,
+                                       title=tab.get('title', ''), icon=icon, profile=self._profile_name)
+                self.setWebPageViewSignals(widget)
+                self.addTabCommon(widget, select=False)
+                journal.tabChanged(widget, **{k: v for k, v in tab.items() if k not in ['url', 'title']})
+            self._tabWidget.setCurrentIndex(max(0, min(current, self._tabWidget.count() - 2)))
+        finally:
+            self._tabWidget.blockSignals(False)
+        self.onTabWidgetCurrentChanged()
+
+    def webPageWidgets(self) -> List[WebPageWidget]:
+        widgets = [self._tabWidget.widget(i) for i in range(self._tabWidget.count())]
+        return [x for x in widgets if isinstance(x, WebPageWidget)]
+
+    def journalTabs(self):
+        SessionJournal.instance().windowTabsChanged(self, self.webPageWidgets(), self._tabWidget.currentWidget())
 
     def closeWebPageTab(self, view: QWidget):
         if isinstance(view, WebPageWidget):
             index = self._tabWidget.indexOf(view)
             self._tabWidget.removeTab(index)
+            TabLifecycleManager.instance().unregister(view)
+            SessionJournal.instance().tabClosed(view)
             view.release()
+            self.journalTabs()
 
     def closeWebPageTabs(self, views: List[QWidget]):
         for view in views:
@@ -234,6 +393,7 @@ class WebBrowserWindow(QMainWindow):
             idx = self._tabWidget.indexOf(view)
             if isinstance(view, WebPageWidget):
                 self._tabWidget.removeTab(idx)
+                TabLifecycleManager.instance().unregister(view)
                 view.release()
 
     def setWebPageTitle(self, view: WebPageWidget, title: str):
@@ -242,22 +402,41 @@ class WebBrowserWindow(QMainWindow):
             self._navBar.setEditUrlFocused()
         self._tabWidget.setTabText(index, title)
         self._tabWidget.setTabToolTip(index, title)
+        SessionJournal.instance().tabChanged(view, title=title)
+        UrlHistoryIndex.instance().setTitle(view.url().toString(), title)
+        HistoryStore.instance().setTitle(view.url().toString(), title)
 
     def setWebPageIcon(self, view: WebPageWidget, icon: QIcon):
         index = self._tabWidget.indexOf(view)
         self._tabWidget.setTabIcon(index, icon)
+        webview = view.view()
+        icon_url = webview.iconUrl().toString()
+        FaviconLoader.instance().storeIcon(icon_url, webview.icon())
+        SessionJournal.instance().tabChanged(view, icon_url=icon_url)
 
     def setWebPageUrl(self, view: WebPageWidget, url: str):
         if self._tabWidget.currentWidget() == view:
             self._navBar.editUrl.setText(url)
+            self.updateNetworkPage()
+        # title of the new page arrives later (sig_page_title, setWebPageTitle), view.title() is still the old one
+        UrlHistoryIndex.instance().recordVisit(url, '')
+        HistoryStore.instance().addVisit(url)
+        # back/forward entries are recorded for reference, the page itself is restored from its url
+        history = view.view().history()
+        items = [[x.url().toString(), x.title()] for x in history.items()][-50:]
+        SessionJournal.instance().tabChanged(
+            view, url=url, history=items, history_index=min(history.currentItemIndex(), len(items) - 1))
 
     def onPageLoadStarted(self, view: WebPageWidget):
         curwgt = self._tabWidget.currentWidget()
         if curwgt == view:
             self._navBar.setIsLoading(True)
             self.refreshNavBarState()
+            self.updateNetworkPage()
 
     def onPageLoadFinished(self, view: WebPageWidget):
+        StartupTrace.instance().mark('first loadFinished')
+        self.checkStartupDone()
         curwgt = self._tabWidget.currentWidget()
         if curwgt == view:
             self._navBar.setIsLoading(False)
@@ -303,13 +482,17 @@ class WebBrowserWindow(QMainWindow):
                 self._tabWidget.setCurrentIndex(self._tabWidget.count() - 2)
         curwgt = self._tabWidget.currentWidget()
         if isinstance(curwgt, WebPageWidget):
+            TabLifecycleManager.instance().activated(curwgt)
             self._navBar.editUrl.setText(curwgt.url().toString())
         else:
             self._navBar.editUrl.clear()
+        self.updateNetworkPage()
+        self.journalTabs()
 
     def onTabNewWindow(self, index: int):
         widget = self._tabWidget.widget(index)
         self._tabWidget.removeTab(index)
+        self.journalTabs()
         newwnd = WebBrowserWindow(self, init_url=None)
         if isinstance(widget, WebPageWidget):
             newwnd.addWebPageWidget(widget)
@@ -352,10 +535,11 @@ class WebBrowserWindow(QMainWindow):
             self._bookmarkBar.show()
 
     def toggleDevTool(self):
-        if self._devWidget.isVisible():
-            self._devWidget.hide()
+        devWidget = self.devWidget()
+        if devWidget.isVisible():
+            devWidget.hide()
         else:
-            self._devWidget.show()
+            devWidget.show()
 
     def showAboutPage(self):
         curwgt = self._tabWidget.currentWidget()
@@ -365,8 +549,63 @@ class WebBrowserWindow(QMainWindow):
             msg += f'\nTitle: {page.title()}'
             msg += f'\nIcon URL: {page.iconUrl().toString()}'
             print(msg)
+            # load time summary of recent navigations (ms), current host first
+            summary = LoadTimingRecorder.instance().summary()
+            host = LoadTimingRecorder.hostOf(page.url().toString())
+            hosts = sorted(summary.keys(), key=lambda x: (x != host, -summary[x]['count']))[:10]
+            if hosts:
+                msg += '\n\nLoad Time (p50 / p95, ms)'
+            for name in hosts:
+                stat = summary[name]
+                msg += f'\n{name or "(local)"} (n={stat["count"]}): '
+                msg += f'load {stat["load_p50"]:.0f} / {stat["load_p95"]:.0f}, '
+                msg += f'DOMContentLoaded {stat["dcl_p50"]:.0f} / {stat["dcl_p95"]:.0f}'
+            blocker = ContentBlocker.instance()
+            if blocker.isReady():
+                site = page.url().host().lower()
+                msg += f'\n\nBlocked Requests: {blocker.site_hits[site]} on this site, {blocker.blocked_total} of '
+                msg += f'{blocker.checked_total} in total ({blocker.ruleCount()} rules)'
+                if blocker.isAllowed(site):
+                    msg += ', this site is allowed'
+            if SpeculationPool.enabled:
+                stat = SpeculationPool.instance().statistics()
+                msg += f'\n\nSpeculative Preload: {stat["hits"]} / {stat["commits"]} hits ({stat["hit_rate"]:.0%}), '
+                msg += f'saved {stat["saved_ms_total"] / 1000:.1f} s (p50 {stat["saved_ms_p50"]:.0f} ms), '
+                msg += f'{stat["cancelled"]} cancelled'
             QMessageBox.information(self, 'Page Info', msg)
 
+    def showCacheInfo(self):
+        stat = ProfileManager.instance().cacheStatistics(self._profile_name)
+        msg = f'Profile: {stat["name"]}'
+        msg += f'\nCache Type: {stat["cache_type"]}'
+        msg += f'\nCache Path: {stat["path"]}'
+        msg += f'\nMax Size: {stat["max_bytes"] / 1024 / 1024:.1f} MB' if stat['max_bytes'] > 0 else '\nMax Size: auto'
+        msg += f'\nUsage: {stat["bytes"] / 1024 / 1024:.1f} MB ({stat["files"]} files)'
+        QMessageBox.information(self, 'Cache Info', msg)
+
+    def showHistory(self):
+        if self._historyWidget is None:
+            self._historyWidget = HistoryWidget(parent=self)
+            self._historyWidget.setWindowFlags(Qt.Window)
+            self._historyWidget.sig_navigate.connect(self.addWebPageTab)
+            self._historyWidget.resize(900, 600)
+        self._historyWidget.reload()
+        self._historyWidget.show()
+        self._historyWidget.raise_()
+        self._historyWidget.activateWindow()
+
+    def onBookmarksChanged(self):
+        UrlHistoryIndex.instance().setBookmarks(self._bookMarkManager.urlList())
+
+    def onBookmarkInserted(self, folder: BookMarkFolder, index: int, node: Union[BookMarkItem, BookMarkFolder]):
+        UrlHistoryIndex.instance().addBookmarks(BookMarkManager.nodeUrls(node))
+
+    def onBookmarkRemoved(self, folder: BookMarkFolder, index: int, node: Union[BookMarkItem, BookMarkFolder]):
+        UrlHistoryIndex.instance().removeBookmarks(BookMarkManager.nodeUrls(node))
+
+    def clearCache(self):
+        ProfileManager.instance().clearCache(self._profile_name)
+
     def resizeEvent(self, a0: QResizeEvent) -> None:
         w, h = self.size().width(), self.size().height()
         self._splitter.resize(w, h)
@@ -377,7 +616,17 @@ class WebBrowserWindow(QMainWindow):
             curwgt.runJavaScript(script)
 
     def onJavaScriptResult(self, obj: object):
-        self._devWidget.setJsResult(obj)
+        self.devWidget().setJsResult(obj)
+
+    def loadPageSource(self):
+        # html is serialized by the renderer and answered asynchronously
+        curwgt = self._tabWidget.currentWidget()
+        if isinstance(curwgt, WebPageWidget):
+            url = curwgt.url().toString()
+            curwgt.view().page().toHtml(partial(self.onPageSource, url))
+
+    def onPageSource(self, url: str, html: str):
+        self.devWidget().setPageSource(html, url)
 
 
 if __name__ == '__main__':
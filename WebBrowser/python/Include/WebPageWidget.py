@@ -4,22 +4,59 @@
 # Author       : Yogyui
 # Description  : Implementation of basic web page (viewer) widget
 # -------------------------------------------------------------------------------------------------------------------- #
-import os
+import time
+import json
+import reprlib
+from functools import partial
 from typing import Union
-from PyQt5.QtCore import Qt, QUrl, QObject, QEvent, pyqtSignal, QVariant
+from PyQt5.QtCore import Qt, QUrl, QEvent, pyqtSignal, QVariant, QPointF
 from PyQt5.QtGui import QIcon, QKeyEvent, QMouseEvent
 from PyQt5.QtWidgets import QWidget
 from PyQt5.QtWidgets import QVBoxLayout, QApplication
-from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEnginePage
+from PyQt5.QtWebEngineWidgets import QWebEngineView, QWebEnginePage, QWebEngineProfile
+from ViewEventDispatcher import ViewEventDispatcher
+from ProfileManager import ProfileManager
+from LoadTiming import LoadTimingRecorder
+from NetworkLog import NetworkLog
+from Resources import getIcon
+
+# console print of javascript results is bounded (a result may be a huge object)
+JS_RESULT_REPR = reprlib.Repr()
+JS_RESULT_REPR.maxstring = 200
+JS_RESULT_REPR.maxother = 200
+
+
+class WebPage(QWebEnginePage):
+    last_error: tuple = (0., '')  # (time.perf_counter(), message) of the last console error
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._interceptor = NetworkLog.instance().installInterceptor(self)
+
+    def javaScriptConsoleMessage(self, level: QWebEnginePage.JavaScriptConsoleMessageLevel, message: str,
+                                 line: int, source: str):
+        if level == QWebEnginePage.ErrorMessageLevel:
+            self.last_error = (time.perf_counter(), message)
+        super().javaScriptConsoleMessage(level, message, line, source)
+
+    def acceptNavigationRequest(self, url: QUrl, navigation_type: QWebEnginePage.NavigationType,
+                                is_main_frame: bool) -> bool:
+        # requests blocked by the profile are told apart from other tabs by the main frame url (see NetworkLog)
+        if is_main_frame:
+            NetworkLog.instance().navigate(self, url, navigation_type == QWebEnginePage.NavigationTypeReload)
+        return super().acceptNavigationRequest(url, navigation_type, is_main_frame)
 
 
 class WebView(QWebEngineView):
     sig_new_tab = pyqtSignal(QWebEngineView)
     sig_new_window = pyqtSignal(QWebEngineView)
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, profile: Union[QWebEngineProfile, None] = None, **kwargs):
         super().__init__(*args, **kwargs)
-        QApplication.instance().installEventFilter(self)
+        if profile is None:
+            profile = ProfileManager.instance().profile()
+        self.setPage(WebPage(profile, self))
+        ViewEventDispatcher.instance().register(self)
 
     def load(self, *args):
         if isinstance(args[0], QUrl):
@@ -30,42 +67,46 @@ class WebView(QWebEngineView):
         return super().load(*args)
 
     def release(self):
+        ViewEventDispatcher.instance().unregister(self)
+        NetworkLog.instance().removePage(self.page())
         self.deleteLater()
         self.close()
 
-    def eventFilter(self, a0: QObject, a1: QEvent) -> bool:
-        if a0.parent() == self:
-            if a1.type() == QEvent.MouseButtonPress:
-                if a1.button() == Qt.ForwardButton:
-                    self.forward()
-                elif a1.button() == Qt.BackButton:
-                    self.back()
-            elif a1.type() == QEvent.Wheel:
-                modifier = QApplication.keyboardModifiers()
-                if modifier == Qt.ControlModifier:
-                    y_angle = a1.angleDelta().y()
-                    factor = self.zoomFactor()
-                    if y_angle > 0:
-                        self.setZoomFactor(factor + 0.1)
-                        return True
-                    elif y_angle < 0:
-                        self.setZoomFactor(factor - 0.1)
-                        return True
+    def dispatchEvent(self, a0: QEvent) -> bool:
+        # called by ViewEventDispatcher for events of the child (render) widget
+        if a0.type() == QEvent.MouseButtonPress:
+            if a0.button() == Qt.ForwardButton:
+                self.forward()
+            elif a0.button() == Qt.BackButton:
+                self.back()
+        elif a0.type() == QEvent.Wheel:
+            modifier = QApplication.keyboardModifiers()
+            if modifier == Qt.ControlModifier:
+                y_angle = a0.angleDelta().y()
+                factor = self.zoomFactor()
+                if y_angle > 0:
+                    self.setZoomFactor(factor + 0.1)
+                    return True
+                elif y_angle < 0:
+                    self.setZoomFactor(factor - 0.1)
+                    return True
         return False
 
     def createWindow(self, windowType):
+        # new views share the profile (cache, cookies) of this view
+        profile = self.page().profile()
         if windowType == QWebEnginePage.WebBrowserTab:
-            view = WebView()
+            view = WebView(profile=profile)
             self.sig_new_tab.emit(view)
             return view
         elif windowType == QWebEnginePage.WebBrowserWindow:
-            view = WebView()
+            view = WebView(profile=profile)
             self.sig_new_window.emit(view)
             return view
         # open tab when ctrl key is pressed
         modifier = QApplication.keyboardModifiers()
         if modifier == Qt.ControlModifier:
-            view = WebView()
+            view = WebView(profile=profile)
             self.sig_new_tab.emit(view)
             return view
         return QWebEngineView.createWindow(self, windowType)
@@ -73,6 +114,7 @@ class WebView(QWebEngineView):
 
 class WebPageWidget(QWidget):
     _is_loading: bool = False
+    print_js_result: bool = False  # print results of runJavaScript to console (--print_js_result)
 
     sig_page_icon = pyqtSignal(QIcon)
     sig_page_title = pyqtSignal(str)
@@ -86,24 +128,96 @@ class WebPageWidget(QWidget):
     sig_edit_url_focus = pyqtSignal()
     sig_js_result = pyqtSignal(object)
 
-    def __init__(self, parent=None, url: Union[str, QUrl] = 'about:blank', view: WebView = None):
+    def __init__(self, parent=None, url: Union[str, QUrl] = 'about:blank', view: WebView = None,
+                 lazy: bool = False, title: str = '', icon: Union[QIcon, None] = None, profile: str = ''):
+        # lazy widget is a lightweight placeholder (title and icon only) until its view is requested
         super().__init__(parent=parent)
-        path_ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        if os.getcwd() != path_:
-            os.chdir(path_)
-        self._webview = WebView() if view is None else view
-        self.initControl()
+        self._webview: Union[WebView, None] = None
+        self._previous_view: Union[WebView, None] = None  # replaced by swapView, restored by goBack
+        self._profile_name = profile
+        self._pending_url = url
+        self._title = title
+        self._icon = icon
+        self._last_activated = time.monotonic()
+        self._saved_scroll: Union[QPointF, None] = None
+        self._load_timing: Union[dict, None] = None  # current navigation (see LoadTimingRecorder)
         self.initLayout()
-        self.load(url)
+        if view is not None or not lazy:
+            self.ensureView(view)
 
     def release(self):
-        self._webview.release()
+        self.flushLoadTiming()
+        if self._webview is not None:
+            self._webview.release()
+        if self._previous_view is not None:
+            self._previous_view.release()
+            self._previous_view = None
+
+    def ensureView(self, view: WebView = None) -> WebView:
+        if self._webview is None:
+            if view is None:
+                view = WebView(profile=ProfileManager.instance().profile(self._profile_name))
+            self.attachView(view)
+            self.load(self._pending_url)
+        return self._webview
+
+    def attachView(self, view: WebView):
+        self._webview = view
+        NetworkLog.instance().attachPage(view.page())
+        self.initControl()
+        self.layout().addWidget(self._webview)
+        view.show()
+
+    def detachView(self) -> WebView:
+        view, self._webview = self._webview, None
+        for signal in [view.loadStarted, view.loadProgress, view.loadFinished, view.titleChanged,
+                       view.iconChanged, view.sig_new_tab, view.sig_new_window]:
+            signal.disconnect()
+        self.layout().removeWidget(view)
+        view.hide()
+        NetworkLog.instance().detachPage(view.page())
+        return view
+
+    def swapView(self, view: WebView, loading: bool = False):
+        # a view loaded in background (speculative preload) replaces the current one. the replaced view is kept
+        # discarded (one step): goBack() returns to it when the new view has no history of its own
+        self.flushLoadTiming()
+        if self._webview is not None:
+            if self._previous_view is not None:
+                self._previous_view.release()
+            self._previous_view = self.detachView()
+            self._previous_view.page().setLifecycleState(QWebEnginePage.Discarded)
+        self.attachView(view)
+        self._is_loading = loading
+        if loading:
+            self.sig_load_started.emit()
+        else:
+            self.sig_load_finished.emit()
+            self.sig_page_url.emit(view.url().toString())
+            self.sig_page_title.emit(view.title())
+            self.sig_page_icon.emit(view.icon())
+
+    def canGoBack(self) -> bool:
+        return self.view().history().canGoBack() or self._previous_view is not None
+
+    def goBack(self):
+        view = self.view()
+        if view.history().canGoBack() or self._previous_view is None:
+            view.back()
+            return
+        self.flushLoadTiming()
+        self.detachView().release()
+        previous, self._previous_view = self._previous_view, None
+        self.attachView(previous)
+        previous.page().setLifecycleState(QWebEnginePage.Active)  # reloaded
+
+    def isMaterialized(self) -> bool:
+        return self._webview is not None
 
     def initLayout(self):
         vbox = QVBoxLayout(self)
         vbox.setContentsMargins(0, 0, 0, 0)
         vbox.setSpacing(4)
-        vbox.addWidget(self._webview)
 
     def initControl(self):
         self.setWebViewSignals()
@@ -118,25 +232,48 @@ class WebPageWidget(QWidget):
         self._webview.sig_new_window.connect(self.sig_new_window.emit)
 
     def load(self, url: Union[str, QUrl]):
-        if isinstance(url, QUrl):
+        if self._webview is None:
+            self._pending_url = url
+        elif isinstance(url, QUrl):
             self._webview.load(url)
         else:
             self._webview.load(QUrl(url))
 
     def onWebViewLoadStarted(self):
         self._is_loading = True
+        self.flushLoadTiming()  # previous navigation, page timing was not received
+        self._load_timing = {'started': time.time(), 't0': time.monotonic(), 'first_progress_ms': None}
         self.sig_load_started.emit()
-        # self.sig_page_icon.emit(QIcon('./Resource/processing.png'))
+        # self.sig_page_icon.emit(getIcon('processing.png'))
 
     def onWebViewLoadProgress(self, progress: int):
         """
         if 0 < progress < 100:
             self.sig_page_title.emit(f'Loading...({progress})')
         """
+        timing = self._load_timing
+        if timing is not None and progress > 0 and timing['first_progress_ms'] is None:
+            timing['first_progress_ms'] = (time.monotonic() - timing['t0']) * 1000
 
     def onWebViewLoadFinished(self, result: bool):
         self._is_loading = False
+        timing = self._load_timing
+        if timing is not None:
+            timing['load_ms'] = (time.monotonic() - timing['t0']) * 1000
+            timing['ok'] = result
+            timing['url'] = self._webview.url().toString()
+            if result:
+                # navigation and resource timing entries are added when the page answers
+                recorder = LoadTimingRecorder.instance()
+                self._webview.page().runJavaScript(recorder.script(), partial(self.onLoadTimingResult, timing))
+            else:
+                self.flushLoadTiming()
         self.sig_load_finished.emit()
+        if result and self._saved_scroll is not None:
+            # restore scroll position of discarded page
+            pos = self._saved_scroll
+            self._saved_scroll = None
+            self._webview.page().runJavaScript(f'window.scrollTo({pos.x()}, {pos.y()});')
 
         url: QUrl = self._webview.url()
         self.sig_page_url.emit(url.toString())
@@ -144,13 +281,34 @@ class WebPageWidget(QWidget):
         if result:
             self.sig_page_icon.emit(self._webview.icon())
         else:
-            self.sig_page_icon.emit(QIcon('./Resource/warning.png'))
+            self.sig_page_icon.emit(getIcon('warning.png'))
+
+    def onLoadTimingResult(self, timing: dict, value: object):
+        if timing is not self._load_timing:
+            return  # already recorded
+        try:
+            entries = json.loads(value) if isinstance(value, str) else dict()
+        except ValueError:
+            entries = dict()
+        navigation = entries.get('navigation')
+        if isinstance(navigation, dict):
+            timing['dom_content_loaded_ms'] = navigation.get('domContentLoadedEventEnd')
+        timing.update(entries)
+        self.flushLoadTiming()
+
+    def flushLoadTiming(self):
+        timing, self._load_timing = self._load_timing, None
+        if timing is None or 'load_ms' not in timing:
+            return  # not finished
+        del timing['t0']
+        timing['host'] = LoadTimingRecorder.hostOf(timing['url'])
+        LoadTimingRecorder.instance().record(timing)
 
     def onClickBtnStopRefresh(self):
         if self._is_loading:
-            self._webview.stop()
+            self.view().stop()
         else:
-            self._webview.reload()
+            self.view().reload()
 
     def keyPressEvent(self, a0: QKeyEvent) -> None:
         modifier = QApplication.keyboardModifiers()
@@ -167,31 +325,88 @@ class WebPageWidget(QWidget):
             if modifier == Qt.ControlModifier:
                 self.sig_home.emit()
         elif a0.key() == Qt.Key_F5:
-            self._webview.reload()
+            self.view().reload()
         elif a0.key() == Qt.Key_F6:
             self.sig_edit_url_focus.emit()
         elif a0.key() == Qt.Key_Escape:
-            self._webview.stop()
+            self.view().stop()
         elif a0.key() == Qt.Key_Backspace:
-            self._webview.back()
+            self.goBack()
 
     def mousePressEvent(self, a0: QMouseEvent) -> None:
         pass
 
     def url(self) -> QUrl:
+        if self._webview is None:
+            return self._pending_url if isinstance(self._pending_url, QUrl) else QUrl(self._pending_url)
         return self._webview.url()
 
+    def title(self) -> str:
+        if self._webview is None:
+            return self._title
+        return self._webview.title()
+
+    def icon(self) -> Union[QIcon, None]:
+        if self._webview is None:
+            return self._icon
+        return self._webview.icon()
+
     def view(self) -> WebView:
-        return self._webview
+        return self.ensureView()
 
     def isLoading(self) -> bool:
-        return self.isLoading()
+        return self._is_loading
+
+    def lifecycleState(self) -> QWebEnginePage.LifecycleState:
+        if self._webview is None:
+            return QWebEnginePage.Discarded
+        return self._webview.page().lifecycleState()
+
+    def lastActivated(self) -> float:
+        return self._last_activated
+
+    def renderProcessPid(self) -> int:
+        if self._webview is None:
+            return 0
+        return self._webview.page().renderProcessPid()
+
+    def activate(self):
+        self._last_activated = time.monotonic()
+        page = self.view().page()
+        if page.lifecycleState() != QWebEnginePage.Active:
+            page.setLifecycleState(QWebEnginePage.Active)
+
+    def freeze(self) -> bool:
+        # recommended state is 'Active' when page is visible or playing audio etc.
+        if self._webview is None:
+            return False
+        page = self._webview.page()
+        if page.lifecycleState() != QWebEnginePage.Active or page.isVisible():
+            return False
+        if page.recommendedState() == QWebEnginePage.Active:
+            return False
+        page.setLifecycleState(QWebEnginePage.Frozen)
+        return True
+
+    def discard(self) -> bool:
+        # url, title and history are kept by the page, scroll position is restored after reloading
+        if self._webview is None:
+            return False
+        page = self._webview.page()
+        if page.lifecycleState() == QWebEnginePage.Discarded or page.isVisible():
+            return False
+        if page.recommendedState() != QWebEnginePage.Discarded:
+            return False  # e.g. unsaved form input would be lost
+        self._saved_scroll = page.scrollPosition()
+        page.setLifecycleState(QWebEnginePage.Discarded)
+        return True
 
     def runJavaScript(self, script: str):
         self.view().page().runJavaScript(script, self.jsCallback)
 
     def jsCallback(self, v: QVariant):
-        print(v, type(v))
+        if self.print_js_result:
+            print(JS_RESULT_REPR.repr(v), type(v))
         self.sig_js_result.emit(v)
 
 
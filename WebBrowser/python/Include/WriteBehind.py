@@ -0,0 +1,87 @@
+# -------------------------------------------------------------------------------------------------------------------- #
+# File Name    : WriteBehind.py
+# Project Name : WebBrowser
+# Author       : Yogyui
+# Description  : Debounced write-behind persistence (disk I/O on a worker thread)
+# -------------------------------------------------------------------------------------------------------------------- #
+import time
+import threading
+import traceback
+from typing import Callable, Union
+from PyQt5.QtCore import QObject, QTimer
+
+
+class WriteBehindSaver(QObject):
+    # 'snapshot' runs on the GUI thread and returns a job (callable) which is run on the worker thread.
+    # dirty marks are coalesced: a flush happens 'delay_ms' after the last mark (at most 'max_delay_ms' after
+    # the first one), and while the worker is busy only the latest job is kept
+    def __init__(self, snapshot: Callable[[], Union[Callable[[], None], None]],
+                 delay_ms: int = 1000, max_delay_ms: int = 5000, parent=None):
+        super().__init__(parent=parent)
+        self._snapshot = snapshot
+        self._delay_ms = delay_ms
+        self._max_delay_ms = max_delay_ms
+        self._dirty_since: Union[float, None] = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+
+        self._cond = threading.Condition()
+        self._job: Union[Callable[[], None], None] = None
+        self._busy = False
+        self._stopped = False
+        self.write_count = 0
+        self._thread = threading.Thread(target=self.run, name='WriteBehindSaver', daemon=True)
+        self._thread.start()
+
+    def markDirty(self):
+        now = time.monotonic()
+        if self._dirty_since is None:
+            self._dirty_since = now
+        remain = self._max_delay_ms - (now - self._dirty_since) * 1000
+        self._timer.start(int(max(0, min(self._delay_ms, remain))))
+
+    def isDirty(self) -> bool:
+        return self._dirty_since is not None
+
+    def flush(self, wait: bool = False):
+        self._timer.stop()
+        self._dirty_since = None
+        job = self._snapshot()
+        if job is not None:
+            with self._cond:
+                self._job = job
+                self._cond.notify_all()
+        if wait:
+            self.wait()
+
+    def wait(self, timeout: Union[float, None] = None) -> bool:
+        with self._cond:
+            return self._cond.wait_for(lambda: self._job is None and not self._busy, timeout)
+
+    def stop(self):
+        if self._stopped:
+            return
+        self.flush(wait=True)
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._job is not None or self._stopped)
+                if self._job is None:
+                    return
+                job, self._job = self._job, None
+                self._busy = True
+            try:
+                job()
+                self.write_count += 1
+            except Exception:
+                traceback.print_exc()
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
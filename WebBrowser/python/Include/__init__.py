@@ -1,7 +1,16 @@
 import os
 import sys
 CURPATH = os.path.dirname(os.path.abspath(__file__))
-sys.path.extend([CURPATH])
-sys.path = list(set(sys.path))
+if CURPATH not in sys.path:
+    sys.path.append(CURPATH)
 
 from WebBrowserWindow import WebBrowserWindow
+from ConfigUtil import WebBrowserConfig
+from SessionJournal import SessionJournal
+from StartupTrace import StartupTrace
+from LoadTiming import LoadTimingRecorder
+from WebPageWidget import WebPageWidget
+from BrowsingHistory import HistoryStore
+from Speculation import SpeculationPool
+from ContentBlocker import ContentBlocker
+from NetworkLog import NetworkLog
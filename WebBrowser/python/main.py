@@ -1,10 +1,19 @@
 if __name__ == '__main__':
+    import time
+    time_start = time.perf_counter()
     import sys
     from PyQt5.QtCore import Qt
     from PyQt5.QtWidgets import QApplication
-    from Include import WebBrowserWindow
+    from Include import WebBrowserWindow, WebBrowserConfig, SessionJournal, StartupTrace, LoadTimingRecorder
+    from Include import WebPageWidget, HistoryStore, SpeculationPool, ContentBlocker, NetworkLog
 
+    trace = StartupTrace.instance()
+    trace.origin = time_start
+    trace_exit = False
     maximized = False
+    profile_ = ''
+    restore_session = None  # default: previous session is restored unless a start page is given
+    start_page = False
     # url_ = 'home'
     url_ = 'about:blank'
     for argv in sys.argv:
@@ -14,15 +23,74 @@ if __name__ == '__main__':
         if '--start_page' in argv:
             splt = argv.split('=')
             url_ = splt[-1]
+            start_page = True
+        if '--config_backend' in argv:
+            splt = argv.split('=')
+            WebBrowserConfig.backend_default = splt[-1]
+        if '--restore_session' in argv:
+            splt = argv.split('=')
+            restore_session = bool(int(splt[-1]))
+        if '--profile' in argv:
+            splt = argv.split('=')
+            profile_ = splt[-1]
+        if '--load_timing_log' in argv:
+            # every page load is appended to this file as a json line
+            splt = argv.split('=')
+            LoadTimingRecorder.instance().setOutputPath(splt[-1])
+        if '--print_js_result' in argv:
+            splt = argv.split('=')
+            WebPageWidget.print_js_result = bool(int(splt[-1]))
+        if '--history_retention_days' in argv:
+            splt = argv.split('=')
+            HistoryStore.retention_days = int(splt[-1])
+        if '--speculative_preload' in argv:
+            # preload the top url suggestion or hovered bookmark in a hidden view
+            splt = argv.split('=')
+            SpeculationPool.enabled = bool(int(splt[-1]))
+        if '--content_blocker' in argv:
+            # filter lists are the *.txt files of Config/filters
+            splt = argv.split('=')
+            ContentBlocker.enabled = bool(int(splt[-1]))
+        if '--network_log' in argv:
+            # requests kept per tab for the developer panel, 0: not logged
+            splt = argv.split('=')
+            NetworkLog.capacity = int(splt[-1])
+            NetworkLog.enabled = NetworkLog.capacity > 0
+        if '--trace-startup' in argv:
+            # --trace-startup=exit: quit after the report, without touching the session journal (benchmark)
+            trace.enabled = True
+            trace_exit = argv.split('=')[-1] == 'exit'
+    trace.addSpan('imports', trace.elapsed())
 
-    app = QApplication([])
-    QApplication.setStyle('fusion')
-    mainwnd = WebBrowserWindow(init_url=url_)
+    with trace.section('QApplication'):
+        app = QApplication([])
+        QApplication.setStyle('fusion')
+    if trace_exit:
+        SessionJournal.instance().close()
+        trace.callbacks.append(app.quit)
+    if restore_session is None:
+        restore_session = not start_page
+    # journal is rewritten (start) only after the previous session has been restored
+    session = SessionJournal.instance().restore() if restore_session else []
+    if session:
+        mainwnd = WebBrowserWindow(init_url=None, profile=profile_)
+        mainwnd.restoreTabs(session[0]['tabs'], session[0]['current'])
+        if start_page:
+            mainwnd.addStartPageTab(url_)
+    else:
+        mainwnd = WebBrowserWindow(init_url=url_, profile=profile_)
     if maximized:
         mainwnd.setWindowState(Qt.WindowMaximized)
     else:
         mainwnd.resize(1024, 1024)
     mainwnd.show()
+    trace.mark('window shown')
+    for window in session[1:]:
+        subwnd = WebBrowserWindow(mainwnd, init_url=None)
+        subwnd.restoreTabs(window['tabs'], window['current'])
+        subwnd.resize(mainwnd.size())
+        subwnd.show()
+    SessionJournal.instance().start()
     app.exec_()
     QApplication.quit()
     sys.exit()